@@ -18,8 +18,10 @@ from sqlalchemy import engine_from_config, pool  # isort:skip
 # Do not import the models like this: UserModel, BoughtItemModel, ...
 from db.models.user import User  # isort:skip
 from db.models.user_time import UserTime  # isort:skip
+from db.models.user_time_summary import UserTimeSummary  # isort:skip
 from db.models.project import Project  # isort:skip
 from db.models.bought_item import BoughtItem  # isort:skip
+from db.models.bought_item_filter import BoughtItemFilter  # isort:skip
 from db.models.api_key import APIKey  # isort:skip
 from db.models.email_notification import EmailNotification  # isort:skip
 
@@ -0,0 +1,76 @@
+"""
+    API middlewares.
+"""
+
+from time import perf_counter
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+from utilities.metrics import RequestStats
+from utilities.metrics import metrics
+from utilities.metrics import request_stats
+
+# the lines of a stream must reach the client as soon as they're sent, a compressor would hold them back
+STREAMED_CONTENT_TYPES = ("text/event-stream", "application/x-ndjson")
+
+
+class MetricsMiddleware:
+    """Counts the requests of an api per route template, measures their latency and counts their queries.
+    Requests that don't match a route are counted as `unmatched`, to keep the number of routes finite.
+    """
+
+    def __init__(self, app: ASGIApp, api: str) -> None:
+        self.app = app
+        self.api = api
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        metrics.request_started(self.api)
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            request_stats.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            metrics.request_finished(self.api, scope["method"], route, status_code, perf_counter() - start, stats)
+
+
+class StreamingGZipMiddleware(GZipMiddleware):
+    """Compresses the responses like the GZipMiddleware, but sends streamed responses (server sent events and newline
+    delimited json, see `STREAMED_CONTENT_TYPES`) uncompressed.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await super().__call__(scope, receive, send)
+            return
+
+        responder = _StreamingGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        await responder(scope, receive, send)
+
+
+class _StreamingGZipResponder(GZipResponder):
+    async def send_with_compression(self, message: Message) -> None:
+        await super().send_with_compression(message)
+        if message["type"] == "http.response.start":  # the start is held back until the first body is sent
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.content_type_is_excluded = content_type.startswith(STREAMED_CONTENT_TYPES)
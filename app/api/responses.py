@@ -6,11 +6,24 @@ from typing import Any
 from typing import Dict
 
 from fastapi import status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 ResponseType = Dict[int | str, Dict[str, Any]]
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by the native serializer of pydantic-core instead of the standard json module.
+    Used as default response class of all apis. Routes may return it directly with a schema instance as content,
+    this skips the validation of the return value against the `response_model`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
 class ResponseModelDetail(BaseModel):
     detail: str
 
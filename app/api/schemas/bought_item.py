@@ -148,3 +148,28 @@ class BoughtItemExcelExportSchema(BoughtItemBaseSchema):
     expected_delivery_date: Optional[date]
     delivery_date: Optional[date]
     storage_place: Optional[str]
+
+
+class BoughtItemStatsSchema(BaseModel):
+    """Aggregated bought items of one group."""
+
+    key: Optional[str]
+    count: int
+    quantity: float
+    open: int
+    delivered: int
+    late: int
+    late_rate: float
+
+
+class BoughtItemLeadTimeStatsSchema(BaseModel):
+    """Lead time (ordered to delivered) in days of the delivered bought items of one group."""
+
+    key: Optional[str]
+    count: int
+    mean: float
+    min: float
+    p50: float
+    p90: float
+    p95: float
+    max: float
@@ -0,0 +1,16 @@
+"""
+    Log schema.
+"""
+
+from typing import List
+
+from pydantic import BaseModel
+
+
+class LogPageSchema(BaseModel):
+    """A page of the lines of a log file."""
+
+    lines: List[str]
+    offset: int  # byte offset of the first line
+    next_offset: int  # byte offset to continue with, after the last read line
+    eof: bool  # whether the end of the file is reached
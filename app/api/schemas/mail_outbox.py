@@ -0,0 +1,37 @@
+"""
+    Mail outbox schema.
+"""
+
+from datetime import datetime
+from typing import List
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class MailOutboxBaseSchema(BaseModel):
+    """Shared properties."""
+
+    receivers: List[str] = Field(..., min_length=1)
+    message: str = Field(...)
+
+
+class MailOutboxCreateSchema(MailOutboxBaseSchema):
+    """Properties to receive on creation."""
+
+
+class MailOutboxUpdateSchema(MailOutboxBaseSchema):
+    """Properties to receive on update."""
+
+
+class MailOutboxStatsSchema(BaseModel):
+    """The queue depth of the outbox and the counters of the worker since the server start."""
+
+    pending: int  # mails that are not sent yet, including mails that wait for their next attempt
+    due: int  # pending mails that can be sent right now
+    failed: int  # mails that failed too often, kept in the outbox
+    oldest: Optional[datetime]  # creation of the oldest pending mail
+    sent_total: int
+    failed_total: int  # failed attempts
+    running: bool  # whether the worker thread is running
@@ -2,13 +2,34 @@
     Stock cut schema.
 """
 
+from typing import Optional
+
+from const import TIME_LIMIT_MAX_MS
+from pydantic import BaseModel
+from pydantic import Field
 from tools.stock_cut_1d.models import JobModel
+from tools.stock_cut_1d.models import MultiStockJobModel
+from tools.stock_cut_1d.models import MultiStockResultModel
 from tools.stock_cut_1d.models import ResultModel
 
 
 class StockCut1DJobSchema(JobModel):
-    ...
+    time_limit_ms: Optional[int] = Field(default=None, gt=0, le=TIME_LIMIT_MAX_MS)
+
+
+class StockCut1DResultSchema(ResultModel): ...
+
+
+class StockCut1DMultiStockJobSchema(MultiStockJobModel): ...
+
+
+class StockCut1DMultiStockResultSchema(MultiStockResultModel): ...
+
 
+class StockCut1DBatchResultSchema(BaseModel):
+    """One line of the streamed response of a batch: The result or the error of the job at the index of the batch."""
 
-class StockCut1DResultSchema(ResultModel):
-    ...
+    index: int
+    status_code: int
+    result: Optional[StockCut1DResultSchema] = None
+    detail: Optional[str] = None
@@ -0,0 +1,17 @@
+"""
+    Stock cut 2D schema.
+"""
+
+from typing import Optional
+
+from const import TIME_LIMIT_MAX_MS
+from pydantic import Field
+from tools.stock_cut_2d.models import JobModel
+from tools.stock_cut_2d.models import ResultModel
+
+
+class StockCut2DJobSchema(JobModel):
+    time_limit_ms: Optional[int] = Field(default=None, gt=0, le=TIME_LIMIT_MAX_MS)
+
+
+class StockCut2DResultSchema(ResultModel): ...
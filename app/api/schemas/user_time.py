@@ -2,6 +2,7 @@
     DB user time schema.
 """
 
+from datetime import date
 from datetime import datetime
 from typing import Optional
 
@@ -54,3 +55,35 @@ class UserTimeNoLogoutSchema(UserTimeSchema):
 
 class UserTimeInDBSchema(UserTimeInDBBaseSchema):
     """Additional properties stored in DB."""
+
+
+class UserTimePunchSchema(BaseModel):
+    """Result of a punch of a time-clock terminal: The user and their created or closed entry."""
+
+    user_id: int
+    full_name: str
+    logged_in: bool
+    entry: UserTimeSchema
+
+
+class UserTimePresentSchema(BaseModel):
+    """A user who is logged in right now and their open entry, see PresenceIndex."""
+
+    user_id: int
+    username: str
+    full_name: str
+    entry_id: int
+    login: datetime
+
+
+class UserTimeSummarySchema(BaseModel):
+    """Worked time of a user in a period (day, week or month), see CRUDUserTime.get_summary."""
+
+    user_id: int
+    period_from: date
+    period_to: date
+    days: int
+    entries: int
+    worked_minutes: float
+    target_minutes: Optional[float]
+    overtime_minutes: Optional[float]
@@ -0,0 +1,42 @@
+"""
+    Runs the solvers of the tools in the solver pool, for the routes of the tools.
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from const import SOLVER_TIMEOUT
+from exceptions import SolverCancelledError
+from exceptions import SolverPoolSaturatedError
+from exceptions import SolverTimeoutError
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from multilog import log
+from tools.pool import solver_pool
+
+
+async def run_solver(fn: Callable, *args: Any, is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None) -> Any:
+    """Runs a solver in the solver pool. Errors are raised as HTTPException."""
+    try:
+        return await solver_pool.run(fn, *args, timeout=SOLVER_TIMEOUT, is_disconnected=is_disconnected)
+    except (OverflowError, MemoryError) as e:
+        raise HTTPException(status_code=507, detail=str(e) or "Input too large") from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    except SolverPoolSaturatedError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+    except BrokenProcessPool as e:
+        # the worker died, e.g. killed by the OOM killer, the pool restarts its workers with the next job
+        log.error(f"Solver worker died while running {getattr(fn, '__name__', fn)!r}: {e}")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Solver worker died") from e
+    except (SolverTimeoutError, TimeoutError) as e:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e)) from e
+    except SolverCancelledError as e:
+        # nobody is listening anymore, 499 is the nginx code for a closed client connection
+        raise HTTPException(status_code=499, detail=str(e)) from e
+    except Exception as e:
+        log.exception(f"Solver {getattr(fn, '__name__', fn)!r} failed: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Solver failed") from e
@@ -5,6 +5,7 @@
 from api.v1.key.endpoints import bought_items
 from api.v1.key.endpoints import login
 from api.v1.key.endpoints import projects
+from api.v1.key.endpoints import user_time
 from api.v1.key.endpoints import users
 from fastapi.routing import APIRouter
 
@@ -13,3 +14,4 @@ api_router.include_router(login.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(bought_items.router, prefix="/items/bought", tags=["bought-items"])
+api_router.include_router(user_time.router, prefix="/user-time", tags=["user-time"])
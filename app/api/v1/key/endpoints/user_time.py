@@ -0,0 +1,53 @@
+"""
+    Handles all routes to the user-time-resource KEY-API.
+"""
+
+from typing import Any
+
+from api.deps import verify_api_key
+from api.responses import HTTP_401_RESPONSE
+from api.responses import ResponseModelDetail
+from api.schemas.user_time import UserTimePunchSchema
+from config import cfg
+from crud.user import crud_user
+from crud.user_time import crud_user_time
+from db.session import get_db
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from fastapi.param_functions import Depends
+from fastapi.routing import APIRouter
+from locales import lang
+from sqlalchemy.orm import Session
+
+router = APIRouter()
+
+
+@router.post(
+    "/punch/rfid/{rfid}",
+    response_model=UserTimePunchSchema,
+    responses={
+        **HTTP_401_RESPONSE,
+        status.HTTP_403_FORBIDDEN: {"model": ResponseModelDetail, "description": "Account inactive"},
+        status.HTTP_405_METHOD_NOT_ALLOWED: {"model": ResponseModelDetail, "description": "RFID login is disabled"},
+    },
+)
+def punch_rfid(
+    rfid: str,
+    verified: bool = Depends(verify_api_key),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Time-clock terminal punch: Logs in the user of the rfid if they are logged out, logs them out if they are logged
+    in. Replaces the rfid login and the user time login or logout of the user in one request.
+    """
+    if not cfg.security.allow_rfid_login:
+        raise HTTPException(status_code=status.HTTP_405_METHOD_NOT_ALLOWED, detail="RFID login is disabled")
+
+    user = crud_user.authenticate_rfid(db, rfid=rfid)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=lang(user).API.LOGIN.INCORRECT_CREDS)
+    if not crud_user.is_active(user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=lang(user).API.LOGIN.INACTIVE_ACCOUNT)
+
+    entry = crud_user_time.punch(db, db_obj_user=user)
+    return {"user_id": user.id, "full_name": user.full_name, "logged_in": entry.logout is None, "entry": entry}
@@ -7,6 +7,7 @@ from api.v1.web.endpoints import bought_items
 from api.v1.web.endpoints import host
 from api.v1.web.endpoints import login
 from api.v1.web.endpoints import logs
+from api.v1.web.endpoints import metrics
 from api.v1.web.endpoints import projects
 from api.v1.web.endpoints import tools_stock_cut_1d
 from api.v1.web.endpoints import tools_stock_cut_2d
@@ -19,6 +20,7 @@ api_router.include_router(login.router, tags=["login"])
 api_router.include_router(api_key.router, prefix="/api-keys", tags=["api-keys"])
 api_router.include_router(host.router, prefix="/host", tags=["host"])
 api_router.include_router(logs.router, prefix="/logs", tags=["logs"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(user_time.router, prefix="/user-time", tags=["user-time"])
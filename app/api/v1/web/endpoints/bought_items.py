@@ -9,21 +9,26 @@ import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Literal
 
 from api.deps import get_current_active_user
 from api.deps import verify_token
 from api.responses import HTTP_401_RESPONSE
+from api.responses import FastJSONResponse
 from api.responses import ResponseModelDetail
 from api.schemas import PageSchema
 from api.schemas.bought_item import BoughtItemCreateWebSchema
+from api.schemas.bought_item import BoughtItemLeadTimeStatsSchema
 from api.schemas.bought_item import BoughtItemSchema
+from api.schemas.bought_item import BoughtItemStatsSchema
 from api.schemas.bought_item import BoughtItemUpdateWebSchema
 from config import cfg
 from const import ROOT
 from const import TEMPLATES
 from crud.bought_item import crud_bought_item
+from crud.bought_item_filter import crud_bought_item_filter
 from db.models import BoughtItemModel
 from db.models import UserModel
 from db.session import get_db
@@ -31,6 +36,7 @@ from excel.xlsx_export.bought_item import BoughtItemExcelExport
 from excel.xlsx_import.bought_item import BoughtItemExcelImport
 from exceptions import BoughtItemAlreadyPlannedError
 from exceptions import BoughtItemCannotChangeToOpenError
+from exceptions import BoughtItemFilterInvalidError
 from exceptions import BoughtItemOfAnotherUserError
 from exceptions import BoughtItemRequiredFieldNotSetError
 from exceptions import BoughtItemUnknownStatusError
@@ -58,6 +64,60 @@ class RequiredFieldName(str, Enum):
     manufacturer = "manufacturer"
 
 
+class StatsGroupBy(str, Enum):
+    project = "project"
+    product = "product"
+    supplier = "supplier"
+    manufacturer = "manufacturer"
+    group_1 = "group-1"
+    status = "status"
+    unit = "unit"
+
+
+def stats_filter_params(
+    id: str | None = None,  # pylint: disable=W0622
+    status: str | None = None,
+    project_number: str | None = None,
+    product_number: str | None = None,
+    project_customer: str | None = None,
+    project_description: str | None = None,
+    quantity: float | None = None,
+    unit: str | None = None,
+    partnumber: str | None = None,
+    order_number: str | None = None,
+    manufacturer: str | None = None,
+    supplier: str | None = None,
+    group_1: str | None = None,
+    note_general: str | None = None,
+    note_supplier: str | None = None,
+    creator_id: int | None = None,
+    created_from: datetime.date | None = None,
+    created_to: datetime.date | None = None,
+    changed_from: datetime.date | None = None,
+    changed_to: datetime.date | None = None,
+    desired_from: datetime.date | None = None,
+    desired_to: datetime.date | None = None,
+    requester_id: int | None = None,
+    requested_from: datetime.date | None = None,
+    requested_to: datetime.date | None = None,
+    orderer_id: int | None = None,
+    ordered_from: datetime.date | None = None,
+    ordered_to: datetime.date | None = None,
+    expected_from: datetime.date | None = None,
+    expected_to: datetime.date | None = None,
+    delivered_from: datetime.date | None = None,
+    delivered_to: datetime.date | None = None,
+    receiver_id: int | None = None,
+    storage_place: str | None = None,
+    high_priority: bool | None = None,
+    ignore_delivered: bool | None = None,
+    ignore_canceled: bool | None = None,
+    ignore_lost: bool | None = None,
+) -> Dict[str, Any]:
+    """Filter params of the stats routes, same as the filter params of the read route."""
+    return locals()
+
+
 class OptionalFieldName(str, Enum):
     supplier = "supplier"
     group_1 = "group-1"
@@ -126,12 +186,13 @@ def read_bought_items(
     kwargs = locals()
     kwargs.pop("verified")
     count, bought_items = crud_bought_item.get_multi(**kwargs)
-    return PageSchema(
+    page = PageSchema[BoughtItemSchema](
         items=[BoughtItemSchema.model_validate(i) for i in bought_items],
         total=count,
         limit=limit if limit else count,
         skip=skip if skip else 0,
     )
+    return FastJSONResponse(page)
 
 
 @router.get(
@@ -226,6 +287,87 @@ def read_bought_items_excel_template(current_user: UserModel = Depends(get_curre
     )
 
 
+@router.get(
+    "/stats/{group_by}",
+    response_model=List[BoughtItemStatsSchema],
+    responses={**HTTP_401_RESPONSE},
+)
+def read_bought_items_stats(
+    group_by: StatsGroupBy,
+    db: Session = Depends(get_db),
+    filters: Dict[str, Any] = Depends(stats_filter_params),
+    verified: bool = Depends(verify_token),
+) -> Any:
+    """
+    Retrieve the number of items, the summed up quantity and the number of open, delivered and late items per group.
+    The items can be filtered like in the read route.
+    """
+    return crud_bought_item.get_stats(db, group_by=group_by.value, **filters)
+
+
+@router.get(
+    "/stats/{group_by}/lead-time",
+    response_model=List[BoughtItemLeadTimeStatsSchema],
+    responses={**HTTP_401_RESPONSE},
+)
+def read_bought_items_lead_time_stats(
+    group_by: StatsGroupBy,
+    db: Session = Depends(get_db),
+    filters: Dict[str, Any] = Depends(stats_filter_params),
+    verified: bool = Depends(verify_token),
+) -> Any:
+    """
+    Retrieve the lead time (ordered to delivered) in days of the delivered items per group.
+    The items can be filtered like in the read route.
+    """
+    return crud_bought_item.get_lead_time_stats(db, group_by=group_by.value, **filters)
+
+
+@router.get(
+    "/filters/{filter_name}/items",
+    response_model=PageSchema[BoughtItemSchema],
+    responses={
+        **HTTP_401_RESPONSE,
+        sc.HTTP_404_NOT_FOUND: {"model": ResponseModelDetail, "description": "Filter not found"},
+        sc.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ResponseModelDetail,
+            "description": "Filter contains invalid values",
+        },
+    },
+)
+def read_bought_items_by_filter(
+    filter_name: str,
+    skip: int | None = None,
+    limit: int | None = None,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Retrieve bought items by a saved filter. The filter is executed on the server,
+    if no limit is given the limit of the filter is used.
+    """
+    bought_item_filter = crud_bought_item_filter.get_by_name(db, name=filter_name)
+    if not bought_item_filter:
+        raise HTTPException(
+            status_code=sc.HTTP_404_NOT_FOUND,
+            detail=lang(current_user).API.BOUGHTITEM.FILTER_NOT_FOUND,
+        )
+    try:
+        count, bought_items = crud_bought_item_filter.get_items(db, db_obj=bought_item_filter, skip=skip, limit=limit)
+    except BoughtItemFilterInvalidError as e:
+        raise HTTPException(
+            status_code=sc.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=lang(current_user).API.BOUGHTITEM.FILTER_INVALID,
+        ) from e
+    page = PageSchema[BoughtItemSchema](
+        items=[BoughtItemSchema.model_validate(i) for i in bought_items],
+        total=count,
+        limit=limit if limit else bought_item_filter.params.get("limit") or count,
+        skip=skip if skip else 0,
+    )
+    return FastJSONResponse(page)
+
+
 @router.get(
     "/{item_id}",
     response_model=BoughtItemSchema,
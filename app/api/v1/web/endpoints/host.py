@@ -21,20 +21,25 @@ from api.schemas.host import HostConfigSchema
 from api.schemas.host import HostInfoSchema
 from api.schemas.host import HostTimeSchema
 from api.schemas.host import HostVersionSchema
+from api.schemas.mail_outbox import MailOutboxStatsSchema
 from config import Config
 from config import ConfigMailing
 from config import cfg
 from const import VERSION
+from crud.bought_item_filter import crud_bought_item_filter
 from db.models import UserModel
+from db.session import get_db
+from exceptions import BoughtItemFilterAlreadyExistsError
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
 from fastapi.routing import APIRouter
 from locales import lang
+from mail.outbox import outbox
 from mail.send import send_test_mail
 from multilog import log
 from pydantic import EmailStr
-from utilities.config_editor.bought_items import bought_item_config
+from sqlalchemy.orm import Session
 from utilities.disc_space import get_disc_space
 from utilities.system import get_hostname
 from utilities.system import get_os
@@ -110,6 +115,18 @@ def post_send_test_mail(receiver: EmailStr, verified: bool = Depends(deps.verify
     return get_host_config_mailing(verified=verified)
 
 
+@router.get(
+    "/config/mailing/outbox",
+    response_model=MailOutboxStatsSchema,
+    responses={**HTTP_401_RESPONSE},
+)
+def get_host_config_mailing_outbox(
+    db: Session = Depends(get_db), verified: bool = Depends(deps.verify_token_adminuser)
+) -> Any:
+    """Returns the queue depth of the mail outbox and the counters of the outbox worker."""
+    return outbox.stats(db)
+
+
 @router.get(
     "/config/items/bought/status",
     response_model=HostConfigItemsBoughtStatusSchema,
@@ -135,9 +152,11 @@ def get_host_config_items_bought_units(verified: bool = Depends(deps.verify_toke
     response_model=Dict[str, HostConfigItemsBoughtFilterSchema],
     responses={**HTTP_401_RESPONSE},
 )
-def get_host_config_items_bought_filter(verified: bool = Depends(deps.verify_token)) -> Any:
+def get_host_config_items_bought_filter(
+    db: Session = Depends(get_db), verified: bool = Depends(deps.verify_token)
+) -> Any:
     """Returns available bought items filters."""
-    return bought_item_config.filters
+    return crud_bought_item_filter.get_all(db)
 
 
 @router.get(
@@ -161,20 +180,22 @@ def get_host_config_items_bought_filter_default(verified: bool = Depends(deps.ve
 def post_host_config_items_bought_filter(
     filter_name: str,
     filter_in: HostConfigItemsBoughtFilterAddSchema,
+    db: Session = Depends(get_db),
     current_user: UserModel = Depends(get_current_active_adminuser),
 ) -> Any:
     """Saves the given filter for bought items."""
-    if filter_name in bought_item_config.filters:
+    try:
+        crud_bought_item_filter.create(db, name=filter_name, obj_in=filter_in)
+    except BoughtItemFilterAlreadyExistsError as e:
         raise HTTPException(
             status_code=status.HTTP_406_NOT_ACCEPTABLE,
             detail=lang(current_user).API.HOST.CONFIGURATION_ALREADY_EXISTS,
-        )
-    bought_item_config.add_filter(name=filter_name, filter=filter_in)
+        ) from e
     log.info(
         f"User {current_user.username} ({current_user.full_name}, ID={current_user.id}) "
         f"added a bought item filter: {filter_name}"
     )
-    return bought_item_config.filters
+    return crud_bought_item_filter.get_all(db)
 
 
 @router.put(
@@ -188,20 +209,22 @@ def post_host_config_items_bought_filter(
 def update_host_config_items_bought_filter(
     filter_name: str,
     filter_in: HostConfigItemsBoughtFilterAddSchema,
+    db: Session = Depends(get_db),
     current_user: UserModel = Depends(get_current_active_adminuser),
 ) -> Any:
     """Updates the given filter for bought items."""
-    if filter_name not in bought_item_config.filters:
+    bought_item_filter = crud_bought_item_filter.get_by_name(db, name=filter_name)
+    if not bought_item_filter:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=lang(current_user).API.HOST.CONFIGURATION_NOT_FOUND,
         )
-    bought_item_config.add_filter(name=filter_name, filter=filter_in)
+    crud_bought_item_filter.update(db, db_obj=bought_item_filter, obj_in=filter_in)
     log.info(
         f"User {current_user.username} ({current_user.full_name}, ID={current_user.id}) "
         f"updated a bought item filter: {filter_name!r}"
     )
-    return bought_item_config.filters
+    return crud_bought_item_filter.get_all(db)
 
 
 @router.delete(
@@ -213,17 +236,19 @@ def update_host_config_items_bought_filter(
     },
 )
 def delete_host_config_items_bought_filter(
-    filter_name: str, current_user: UserModel = Depends(get_current_active_adminuser)
+    filter_name: str,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_active_adminuser),
 ) -> Any:
     """Deletes the given filter for bought items."""
-    if filter_name not in bought_item_config.filters:
+    if not crud_bought_item_filter.get_by_name(db, name=filter_name):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=lang(current_user).API.HOST.CONFIGURATION_NOT_FOUND,
         )
-    bought_item_config.remove_filter(name=filter_name)
+    crud_bought_item_filter.delete(db, name=filter_name)
     log.info(
         f"User {current_user.username} ({current_user.full_name}, ID={current_user.id}) "
         f"deleted a bought item filter: {filter_name!r}"
     )
-    return bought_item_config.filters
+    return crud_bought_item_filter.get_all(db)
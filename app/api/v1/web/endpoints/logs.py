@@ -2,20 +2,32 @@
     Handles all routes to the logs-resource.
 """
 
+import json
 from typing import Any
+from typing import AsyncIterator
+from typing import Literal
 
 from api.deps import get_current_active_adminuser
 from api.responses import HTTP_401_RESPONSE
 from api.responses import ResponseModelDetail
+from api.schemas.log import LogPageSchema
+from const import LOG_PAGE_SIZE
 from db.models import UserModel
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
+from fastapi.param_functions import Query
+from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
 from locales import lang
 from starlette.requests import Request
+from utilities.log_files import LOG_LEVELS
+from utilities.log_files import follow_logfile
 from utilities.log_files import gather_logs
+from utilities.log_files import get_logfile_path
 from utilities.log_files import read_logfile
+from utilities.log_files import read_logfile_page
+from utilities.log_files import read_logfile_tail
 
 router = APIRouter()
 
@@ -49,3 +61,71 @@ def get_log(
     if file_content:
         return file_content
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=lang(current_user).API.LOGS.FILE_NOT_FOUND)
+
+
+@router.get(
+    "/{logfile}/page",
+    response_model=LogPageSchema,
+    responses={
+        **HTTP_401_RESPONSE,
+        status.HTTP_404_NOT_FOUND: {"model": ResponseModelDetail, "description": "Log not found"},
+    },
+)
+def get_log_page(
+    logfile: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(LOG_PAGE_SIZE, ge=1),
+    tail: int | None = Query(None, ge=1),
+    level: Literal[*LOG_LEVELS] | None = None,  # type: ignore
+    search: str | None = None,
+    current_user: UserModel = Depends(get_current_active_adminuser),
+) -> Any:
+    """
+    Returns a page of the lines of a given logfile, from the byte offset on or the last `tail` lines. Continue with the
+    `next_offset` of the page for the next page. The lines can be filtered by their minimum level and a substring.
+    """
+    if tail:
+        page = read_logfile_tail(logfile, tail, level=level, search=search)
+    else:
+        page = read_logfile_page(logfile, offset=offset, limit=limit, level=level, search=search)
+    if page is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=lang(current_user).API.LOGS.FILE_NOT_FOUND)
+    return page
+
+
+@router.get(
+    "/{logfile}/follow",
+    response_class=StreamingResponse,
+    responses={
+        **HTTP_401_RESPONSE,
+        status.HTTP_404_NOT_FOUND: {"model": ResponseModelDetail, "description": "Log not found"},
+    },
+)
+async def follow_log(
+    request: Request,
+    logfile: str,
+    offset: int | None = Query(None, ge=0),
+    level: Literal[*LOG_LEVELS] | None = None,  # type: ignore
+    search: str | None = None,
+    current_user: UserModel = Depends(get_current_active_adminuser),
+) -> Any:
+    """
+    Stream the new lines of a given logfile as server-sent events, from the byte offset on or from the end of the file.
+    Compressed log files don't grow and can't be followed.
+    """
+    path = get_logfile_path(logfile)
+    if path is None or path.suffix == ".gz":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=lang(current_user).API.LOGS.FILE_NOT_FOUND)
+    return StreamingResponse(
+        _log_events(request, logfile, offset, level, search),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _log_events(
+    request: Request, logfile: str, offset: int | None, level: str | None, search: str | None
+) -> AsyncIterator[str]:
+    """Yields the new lines of the log file as server-sent events, until the client disconnects."""
+    async for page in follow_logfile(logfile, offset, level, search, request.is_disconnected):
+        yield ": keep-alive\n\n" if page is None else f"data: {json.dumps(page)}\n\n"
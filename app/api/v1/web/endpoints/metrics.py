@@ -0,0 +1,38 @@
+"""
+    Handles all routes to the metrics-resource.
+"""
+
+from typing import Any
+
+from api import deps
+from api.responses import HTTP_401_RESPONSE
+from db.session import get_db
+from fastapi.param_functions import Depends
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRouter
+from mail.outbox import outbox
+from sqlalchemy.orm import Session
+from utilities.metrics import metrics
+from utilities.presence import presence
+
+router = APIRouter()
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    responses={**HTTP_401_RESPONSE},
+)
+def get_metrics(db: Session = Depends(get_db), verified: bool = Depends(deps.verify_token_adminuser)) -> Any:
+    """Returns the request and database metrics, the mail outbox and the logged in users in the Prometheus text
+    format."""
+    outbox_stats = outbox.stats(db)
+    gauges = [
+        ("mail_outbox_pending", "Mails in the outbox that are not sent yet.", outbox_stats["pending"]),
+        ("mail_outbox_due", "Pending mails that can be sent right now.", outbox_stats["due"]),
+        ("mail_outbox_failed", "Mails that failed too often, kept in the outbox.", outbox_stats["failed"]),
+        ("users_present", "Users who are logged in to the user time.", len(presence.present())),
+    ]
+    return PlainTextResponse(metrics.render(gauges), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -8,6 +8,7 @@ from typing import List
 from api.deps import get_current_active_user
 from api.deps import verify_token
 from api.responses import HTTP_401_RESPONSE
+from api.responses import FastJSONResponse
 from api.responses import ResponseModelDetail
 from api.schemas import PageSchema
 from api.schemas.project import ProjectCreateSchema
@@ -51,12 +52,13 @@ def read_projects(
     kwargs = locals()
     kwargs.pop("verified")
     count, projects = crud_project.get_multi(**kwargs)
-    return PageSchema(
+    page = PageSchema[ProjectSchema](
         items=[ProjectSchema.model_validate(i) for i in projects],
         total=count,
         limit=limit if limit else count,
         skip=skip if skip else 0,
     )
+    return FastJSONResponse(page)
 
 
 @router.post(
@@ -1,43 +1,148 @@
-"""
-    Handles all routes to the tools-resource.
-"""
-
-from typing import Any
-
-from api import deps
-from api.schemas.stock_cut_1d import StockCut1DJobSchema
-from api.schemas.stock_cut_1d import StockCut1DResultSchema
-from fastapi.exceptions import HTTPException
-from fastapi.param_functions import Depends
-from fastapi.routing import APIRouter
-from tools.stock_cut_1d.models import JobModel
-from tools.stock_cut_1d.models import ResultModel
-from tools.stock_cut_1d.solver import distribute
-
-router = APIRouter()
-
-
-@router.post("/1d/solve", response_model=StockCut1DResultSchema)
-def post_1d_solve(
-    job_in: StockCut1DJobSchema,
-    verified: bool = Depends(deps.verify_token),
-) -> Any:
-    """Solves the one dimensional stock cutting problem."""
-
-    job = JobModel(**job_in.model_dump())
-    try:
-        job.assert_valid()
-    except ValueError as e:
-        raise HTTPException(status_code=406, detail=str(e)) from e
-
-    try:
-        solved: ResultModel = distribute(job)
-    except OverflowError as e:
-        raise HTTPException(status_code=507, detail=str(e)) from e
-
-    try:
-        solved.assert_valid()
-    except ValueError as e:
-        raise HTTPException(status_code=507, detail=str(e)) from e
-
-    return solved
+"""
+    Handles all routes to the tools-resource.
+"""
+
+import asyncio
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from api import deps
+from api.schemas.stock_cut_1d import StockCut1DBatchResultSchema
+from api.schemas.stock_cut_1d import StockCut1DJobSchema
+from api.schemas.stock_cut_1d import StockCut1DMultiStockJobSchema
+from api.schemas.stock_cut_1d import StockCut1DMultiStockResultSchema
+from api.schemas.stock_cut_1d import StockCut1DResultSchema
+from api.solver import run_solver
+from const import BATCH_MAX_JOBS
+from fastapi import status
+from fastapi.exceptions import HTTPException
+from fastapi.param_functions import Body
+from fastapi.param_functions import Depends
+from fastapi.requests import Request
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
+from tools.pool import solver_pool
+from tools.stock_cut_1d.cache import result_cache
+from tools.stock_cut_1d.models import JobModel
+from tools.stock_cut_1d.models import MultiStockJobModel
+from tools.stock_cut_1d.models import MultiStockResultModel
+from tools.stock_cut_1d.models import ResultModel
+from tools.stock_cut_1d.solver import distribute
+from tools.stock_cut_1d.solver import distribute_multi_stock
+
+router = APIRouter()
+
+
+@router.post("/1d/solve", response_model=StockCut1DResultSchema)
+async def post_1d_solve(
+    request: Request,
+    job_in: StockCut1DJobSchema,
+    verified: bool = Depends(deps.verify_token),
+) -> Any:
+    """
+    Solves the one dimensional stock cutting problem. If a time limit is given, the solution is improved until the
+    time limit is reached or the solution is optimal. The solver runs in the solver pool, the job is cancelled if the
+    client disconnects while it waits for a worker. Solved jobs are cached, a cached result is marked as such.
+    """
+
+    return await _solve(job_in, is_disconnected=request.is_disconnected)
+
+
+@router.post("/1d/solve-multi-stock", response_model=StockCut1DMultiStockResultSchema)
+async def post_1d_solve_multi_stock(
+    request: Request,
+    job_in: StockCut1DMultiStockJobSchema,
+    verified: bool = Depends(deps.verify_token),
+) -> Any:
+    """
+    Solves the one dimensional stock cutting problem with stocks of different lengths, each with a quantity (or
+    unlimited) and a cost. Minimizes the total cost or the total waste, remnants can be preferred. The solver runs in
+    the solver pool.
+    """
+
+    job = MultiStockJobModel(**job_in.model_dump())
+    try:
+        job.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e)) from e
+
+    solved: MultiStockResultModel = await run_solver(
+        distribute_multi_stock, job, is_disconnected=request.is_disconnected
+    )
+    try:
+        solved.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=507, detail=str(e)) from e
+    return solved
+
+
+@router.post("/1d/solve-batch", response_class=StreamingResponse)
+async def post_1d_solve_batch(
+    jobs_in: List[StockCut1DJobSchema] = Body(..., max_length=BATCH_MAX_JOBS),
+    verified: bool = Depends(deps.verify_token),
+) -> StreamingResponse:
+    """
+    Solves a batch of one dimensional stock cutting problems, as many in parallel as the solver pool has workers.
+    The results are streamed as newline delimited json in the order they finish, one StockCut1DBatchResultSchema per
+    line. A job that fails has the status code and the detail of the error instead of the result. If the client
+    disconnects, the remaining jobs are cancelled.
+    """
+
+    return StreamingResponse(_solve_batch(jobs_in), media_type="application/x-ndjson")
+
+
+async def _solve(
+    job_in: StockCut1DJobSchema, is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+) -> ResultModel:
+    """Solves a job in the solver pool, or returns the cached result. Errors are raised as HTTPException."""
+    job = JobModel(**job_in.model_dump(exclude={"time_limit_ms"}))
+    try:
+        job.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e)) from e
+
+    # the cache may read from or write to its file, this must not block the event loop
+    cached = await run_in_threadpool(result_cache.get, job, job_in.time_limit_ms)
+    if cached is not None:
+        return cached
+
+    solved: ResultModel = await run_solver(distribute, job, job_in.time_limit_ms, is_disconnected=is_disconnected)
+    try:
+        solved.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=507, detail=str(e)) from e
+
+    await run_in_threadpool(result_cache.put, job, job_in.time_limit_ms, solved)
+    return solved
+
+
+async def _solve_batch(jobs_in: List[StockCut1DJobSchema]) -> AsyncIterator[str]:
+    """Yields the results of the jobs as json lines, as soon as they are solved."""
+    # a batch doesn't take more workers than there are, so single requests still get a place in the pool
+    slots = asyncio.Semaphore(solver_pool.workers)
+
+    async def solve(index: int, job_in: StockCut1DJobSchema) -> StockCut1DBatchResultSchema:
+        async with slots:
+            try:
+                result = await _solve(job_in)
+            except HTTPException as e:
+                return StockCut1DBatchResultSchema(index=index, status_code=e.status_code, detail=e.detail)
+        return StockCut1DBatchResultSchema(
+            index=index,
+            status_code=status.HTTP_200_OK,
+            result=StockCut1DResultSchema.model_validate(result.model_dump()),
+        )
+
+    tasks = [asyncio.create_task(solve(i, job_in)) for i, job_in in enumerate(jobs_in)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield (await finished).model_dump_json() + "\n"
+    finally:
+        # the response is cancelled if the client disconnects
+        for task in tasks:
+            task.cancel()
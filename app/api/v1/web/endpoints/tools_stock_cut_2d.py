@@ -5,23 +5,60 @@
 from typing import Any
 
 from api import deps
-from fastapi import status
+from api.schemas.stock_cut_2d import StockCut2DJobSchema
+from api.schemas.stock_cut_2d import StockCut2DResultSchema
+from api.solver import run_solver
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
+from fastapi.requests import Request
+from fastapi.responses import Response
 from fastapi.routing import APIRouter
+from tools.stock_cut_2d.models import JobModel
+from tools.stock_cut_2d.models import ResultModel
+from tools.stock_cut_2d.solver import distribute
+from tools.stock_cut_2d.svg import render_svg
 
 router = APIRouter()
 
 
-@router.post("/2d/solve")
-def post_2d_solve(verified: bool = Depends(deps.verify_token)) -> Any:
-    """DEPRECATED! Solves the two dimensional stock cutting problem. Returns the result of the solver."""
+@router.post("/2d/solve", response_model=StockCut2DResultSchema)
+async def post_2d_solve(
+    request: Request,
+    job_in: StockCut2DJobSchema,
+    verified: bool = Depends(deps.verify_token),
+) -> Any:
+    """
+    Solves the two dimensional stock cutting problem: Packs rectangular pieces onto as few sheets as possible, with
+    MaxRects or, if the layout must be cut with edge to edge cuts, with guillotine cuts. Pieces may be rotated, every
+    piece consumes the cut width. If a time limit is given, the layout is improved until the time limit is reached or
+    the lower bound is met. The solver runs in the solver pool.
+    """
 
-    raise HTTPException(status_code=status.HTTP_410_GONE, detail="This feature is not available in this release")
+    job = JobModel(**job_in.model_dump(exclude={"time_limit_ms"}))
+    try:
+        job.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e)) from e
 
+    solved: ResultModel = await run_solver(
+        distribute, job, job_in.time_limit_ms, is_disconnected=request.is_disconnected
+    )
+    try:
+        solved.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=507, detail=str(e)) from e
+    return solved
 
-@router.post("/2d/generate")
-def post_2d_generate(verified: bool = Depends(deps.verify_token)) -> Any:
-    """DEPRECATED! Returns a pdf or svg file for the given result of the 2d stock cutting problem."""
 
-    raise HTTPException(status_code=status.HTTP_410_GONE, detail="This feature is not available in this release")
+@router.post("/2d/generate", response_class=Response)
+def post_2d_generate(
+    result_in: StockCut2DResultSchema,
+    verified: bool = Depends(deps.verify_token),
+) -> Response:
+    """Returns the layout of the given result of the 2d stock cutting problem as svg file."""
+
+    try:
+        result_in.assert_valid()
+    except ValueError as e:
+        raise HTTPException(status_code=406, detail=str(e)) from e
+    return Response(content=render_svg(result_in), media_type="image/svg+xml")
@@ -2,21 +2,32 @@
     Handles all routes to the users-time-resource.
 """
 
+import json
+from datetime import date
 from datetime import datetime
+from datetime import timedelta
 from enum import Enum
 from typing import Any
+from typing import AsyncIterator
+from typing import List
 
+from api.deps import get_current_active_adminuser
 from api.deps import get_current_active_user
 from api.responses import HTTP_401_RESPONSE
+from api.responses import FastJSONResponse
 from api.responses import ResponseModelDetail
 from api.schemas import PageSchema
 from api.schemas.user_time import UserTimeCreateSchema
+from api.schemas.user_time import UserTimePresentSchema
 from api.schemas.user_time import UserTimeSchema
+from api.schemas.user_time import UserTimeSummarySchema
 from api.schemas.user_time import UserTimeUpdateSchema
 from crud.user_time import crud_user_time
 from db.models import UserModel
 from db.models import UserTimeModel
 from db.session import get_db
+from excel.csv_export.user_time import UserTimeCsvExport
+from excel.xlsx_export.user_time import UserTimeExcelExport
 from exceptions import AlreadyLoggedInError
 from exceptions import AlreadyLoggedOutError
 from exceptions import EntryOverlapsError
@@ -29,9 +40,13 @@ from exceptions import NotSameDayError
 from fastapi import status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
+from fastapi.requests import Request
+from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
 from locales import lang
 from sqlalchemy.orm import Session
+from utilities.presence import presence
 
 router = APIRouter()
 
@@ -40,6 +55,12 @@ class OptionalFieldName(str, Enum):
     note = "note"
 
 
+class SummaryGroupBy(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+
 @router.get(
     "/",
     response_model=PageSchema[UserTimeSchema],
@@ -62,12 +83,13 @@ def read_user_time_entries(
     kwargs = locals()
 
     count, entries = crud_user_time.get_multi(**kwargs)
-    return PageSchema(
+    page = PageSchema[UserTimeSchema](
         items=[UserTimeSchema.model_validate(i) for i in entries],
         total=count,
         limit=limit if limit else count,
         skip=skip if skip else 0,
     )
+    return FastJSONResponse(page)
 
 
 @router.get(
@@ -91,6 +113,158 @@ def read_user_time_login_entry(
     return logged_in_entry
 
 
+@router.get(
+    "/summary",
+    response_model=List[UserTimeSummarySchema],
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+def read_user_time_summary(
+    group_by: SummaryGroupBy = SummaryGroupBy.week,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_active_user),
+) -> Any:
+    """
+    Retrieve the worked, target and overtime minutes of the current user per day, week or month.
+    Defaults to the current year until today.
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or date_to.replace(month=1, day=1)
+    return crud_user_time.get_summary(
+        db, group_by=group_by.value, date_from=date_from, date_to=date_to, user_id=current_user.id
+    )
+
+
+@router.get(
+    "/summary/all",
+    response_model=List[UserTimeSummarySchema],
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+def read_user_time_summary_all(
+    group_by: SummaryGroupBy = SummaryGroupBy.week,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    user_id: int | None = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_active_adminuser),
+) -> Any:
+    """
+    Retrieve the worked, target and overtime minutes of all users (or the given user) per day, week or month.
+    Defaults to the current year until today. Requires an admin user.
+    """
+    date_to = date_to or date.today()
+    date_from = date_from or date_to.replace(month=1, day=1)
+    return crud_user_time.get_summary(
+        db, group_by=group_by.value, date_from=date_from, date_to=date_to, user_id=user_id
+    )
+
+
+@router.get(
+    "/present",
+    response_model=List[UserTimePresentSchema],
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+def read_user_time_present(current_user: UserModel = Depends(get_current_active_user)) -> Any:
+    """
+    Retrieve all users who are logged in right now, ordered by their login time.
+    Read from the presence index, not from the database.
+    """
+    return presence.present()
+
+
+@router.get(
+    "/present/stream",
+    response_class=StreamingResponse,
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+async def read_user_time_present_stream(
+    request: Request, current_user: UserModel = Depends(get_current_active_user)
+) -> Any:
+    """
+    Stream all users who are logged in right now as server-sent events. The users are sent immediately, on every
+    login and logout, and at least every 15 seconds.
+    """
+    return StreamingResponse(
+        _present_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _present_events(request: Request) -> AsyncIterator[str]:
+    """Yields the logged in users as server-sent events, until the client disconnects."""
+    async for present in presence.changes(request.is_disconnected):
+        data = [UserTimePresentSchema.model_validate(item).model_dump(mode="json") for item in present]
+        yield f"data: {json.dumps(data)}\n\n"
+
+
+@router.get(
+    "/export/xlsx",
+    response_class=FileResponse,
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+def read_user_time_export_xlsx(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    user_id: int | None = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_active_adminuser),
+) -> Any:
+    """
+    Retrieve the timesheet of all users (or the given user) as xlsx, with a sheet per user.
+    Defaults to the previous month. Requires an admin user.
+    """
+    date_from, date_to = _export_dates(date_from, date_to)
+    path = UserTimeExcelExport(db, date_from=date_from, date_to=date_to, user_id=user_id).save()
+    return FileResponse(
+        path=str(path),
+        headers={"Content-Disposition": f'attachment; filename="{path.name}"'},
+    )
+
+
+@router.get(
+    "/export/csv",
+    response_class=StreamingResponse,
+    responses={
+        **HTTP_401_RESPONSE,
+    },
+)
+def read_user_time_export_csv(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    user_id: int | None = None,
+    current_user: UserModel = Depends(get_current_active_adminuser),
+) -> Any:
+    """
+    Retrieve the timesheet of all users (or the given user) as one csv, streamed while it is read from the database.
+    Defaults to the previous month. Requires an admin user.
+    """
+    date_from, date_to = _export_dates(date_from, date_to)
+    export = UserTimeCsvExport(date_from=date_from, date_to=date_to, user_id=user_id)
+    return StreamingResponse(
+        iter(export),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{export.name}"'},
+    )
+
+
+def _export_dates(date_from: date | None, date_to: date | None) -> tuple[date, date]:
+    """Returns the given dates, the first and the last day of the previous month if not given."""
+    last_of_previous_month = date.today().replace(day=1) - timedelta(days=1)
+    return date_from or last_of_previous_month.replace(day=1), date_to or last_of_previous_month
+
+
 @router.post(
     "/",
     response_model=UserTimeSchema,
@@ -73,6 +73,15 @@ class ConfigServerStatic:
             self.url = ""
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ConfigServerCompression:
+    web: bool
+    pat: bool
+    key: bool
+    minimum_size: int
+    level: int
+
+
 @dataclass(slots=True, kw_only=True)
 class ConfigServer:
     host: str
@@ -81,6 +90,7 @@ class ConfigServer:
     api: ConfigServerAPI
     static: ConfigServerStatic
     ssl: ConfigServerSSL
+    compression: ConfigServerCompression
     headers_server: bool
     headers_proxy: bool
     forwarded_allowed_ips: str | None
@@ -89,6 +99,7 @@ class ConfigServer:
         self.api = ConfigServerAPI(**dict(self.api))  # type: ignore
         self.static = ConfigServerStatic(**dict(self.static))  # type: ignore
         self.ssl = ConfigServerSSL(**dict(self.ssl))  # type: ignore
+        self.compression = ConfigServerCompression(**dict(self.compression))  # type: ignore
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -174,9 +185,11 @@ class ConfigDirectoriesElement:
 class ConfigFilesystem:
     disc_space_warning: float
     db_backup: ConfigDirectoriesElement
+    timesheets: ConfigDirectoriesElement
 
     def __post_init__(self) -> None:
         self.db_backup = ConfigDirectoriesElement(**dict(self.db_backup))  # type: ignore
+        self.timesheets = ConfigDirectoriesElement(**dict(self.timesheets))  # type: ignore
 
 
 @dataclass(slots=True, kw_only=True)
@@ -224,6 +237,8 @@ class ConfigSchedules:
     backup_db_hour: int
     delete_temp_hour: int
     delete_uploads_hour: int
+    timesheet_export_day: int
+    timesheet_export_hour: int
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -245,6 +260,20 @@ class ConfigTemplates:
     mail_welcome: str
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ConfigToolsStockCut1D:
+    cache_size: int
+    cache_persist: bool
+
+
+@dataclass(slots=True, kw_only=True)
+class ConfigTools:
+    stock_cut_1d: ConfigToolsStockCut1D
+
+    def __post_init__(self) -> None:
+        self.stock_cut_1d = ConfigToolsStockCut1D(**dict(self.stock_cut_1d))  # type: ignore
+
+
 @dataclass(slots=True, kw_only=True)
 class Config:
     debug: bool
@@ -257,6 +286,7 @@ class Config:
     excel: ConfigExcel
     mailing: ConfigMailing
     templates: ConfigTemplates
+    tools: ConfigTools
     init: ConfigInit
 
     def __post_init__(self) -> None:
@@ -269,6 +299,7 @@ class Config:
         self.excel = ConfigExcel(**dict(self.excel))  # type: ignore
         self.mailing = ConfigMailing(**dict(self.mailing))  # type: ignore
         self.templates = ConfigTemplates(**dict(self.templates))  # type: ignore
+        self.tools = ConfigTools(**dict(self.tools))  # type: ignore
         self.init = ConfigInit(**dict(self.init))  # type: ignore
 
 
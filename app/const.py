@@ -14,7 +14,7 @@ NAME = "glados"
 SYSTEM_USER = "system"
 
 # DB
-ALEMBIC_VERSION = "44bf23b4a684"
+ALEMBIC_VERSION = "a6d4e2f81c57"
 SERVER_DEFAULT_LANGUAGE = "enGB"
 SERVER_DEFAULT_THEME = "dark"
 
@@ -26,16 +26,54 @@ CONFIG_BOUGHT_ITEMS = Path(ROOT, "config_files/bought_items.json")
 TEMP = Path(ROOT, "temp")
 DB_DEVELOPMENT = Path(ROOT, "database/dev.db")
 DB_PRODUCTION = Path(ROOT, "database/glados.db")
+DB_STOCK_CUT_1D_CACHE = Path(ROOT, "database/stock_cut_1d_cache.db")
 LOGS = Path(ROOT, "logs")
 UPLOADS = Path(ROOT, "uploads")
 TEMPLATES = Path(ROOT, "templates")
 
+# User Time
+TIMESHEET_YIELD_PER = 1000  # entries fetched at once by the timesheet export
+PRESENCE_POLL_INTERVAL = 0.5  # seconds between two checks of the presence index by a stream
+PRESENCE_KEEP_ALIVE = 15  # seconds, the present users are sent at least this often by a stream
+
+# Mail
+MAIL_TIMEOUT = 30  # seconds, per SMTP command
+MAIL_RETRIES = 3  # attempts per mail
+MAIL_RETRY_DELAY = 2  # seconds before the second attempt, doubled after each failed attempt
+MAIL_OUTBOX_BATCH_SIZE = 50  # mails loaded at once by the outbox worker
+MAIL_OUTBOX_RATE = 5  # mails per second, at most
+MAIL_OUTBOX_POLL_INTERVAL = 30  # seconds, the outbox worker looks for due mails at least this often
+MAIL_OUTBOX_MAX_ATTEMPTS = 6  # runs per mail, after that the mail is marked as failed and kept
+MAIL_OUTBOX_RETRY_DELAY = 60  # seconds before the second run, doubled after each failed run
+
+# Metrics
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+DB_SLOW_QUERY_THRESHOLD = 0.5  # seconds, slower queries are logged
+
+# Logs
+LOG_PAGE_SIZE = 1000  # lines per page if the client doesn't limit them
+LOG_SCAN_MAX_BYTES = 16 * 1024 * 1024  # bytes read at most per page, a filtered page may be shorter
+LOG_TAIL_WINDOW = 64 * 1024  # bytes read from the end of a log file first, grows until enough lines are read
+LOG_FOLLOW_POLL_INTERVAL = 1  # seconds, a followed log file is checked for new lines this often
+LOG_FOLLOW_KEEP_ALIVE = 15  # seconds, a keep-alive is sent if there are no new lines
+
 # Tools/Stock Cut 1D
-N_MAX_PRECISE = 9  # 10 takes ~30s, 9 only 1.2s
-N_MAX = 500  # around 1 million with n^2
+N_MAX_EXACT = 100  # bin completion, falls back to BFD on timeout
+N_MAX = 50000  # BFD with segment tree, O(n log n)
+EXACT_SOLVER_TIMEOUT = 2  # seconds
+LOWER_BOUND_TIMEOUT = 0.5  # seconds, for the gap of heuristic results
+TIME_LIMIT_MAX_MS = 5000  # maximum time limit of the anytime solver, must be below SOLVER_TIMEOUT
+N_MAX_MULTI_STOCK = 5000  # greedy best fill with stocks of different lengths
+BATCH_MAX_JOBS = 1000  # maximum number of jobs per batch request
+
+# Tools/Stock Cut 2D
+N_MAX_2D = 1000  # pieces, every placement prunes the free rectangles of its sheet
+PACK_TIME_LIMIT_2D = 5  # seconds, the 2D passes stop and keep the best layout, must be below SOLVER_TIMEOUT
 
-# Tool/Stock Cut 2D
-SOLVER_TIMEOUT = 10  # seconds
+# Tools/Solver Pool
+SOLVER_TIMEOUT = 10  # seconds, per job
+SOLVER_WORKERS = max(1, (os.cpu_count() or 1) // 2)  # worker processes
+SOLVER_QUEUE_SIZE = 2 * SOLVER_WORKERS  # jobs waiting for a worker, more are rejected
 
 # Security
 # Non-persistent-key: generating a new secret_key on every application start ensures that all users
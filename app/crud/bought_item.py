@@ -5,9 +5,12 @@
 # pylint: disable=R0914
 
 from datetime import date
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Type
 
 from api.schemas.bought_item import BoughtItemCreatePatSchema
 from api.schemas.bought_item import BoughtItemCreateWebSchema
@@ -15,6 +18,7 @@ from api.schemas.bought_item import BoughtItemUpdateWebSchema
 from api.schemas.email_notification import EmailNotificationCreateSchema
 from config import cfg
 from crud.base import CRUDBase
+from crud.cache import CommitCache
 from crud.email_notification import crud_email_notification
 from crud.project import crud_project
 from db.models import BoughtItemModel
@@ -31,13 +35,29 @@ from exceptions import ProjectNotFoundError
 from fastapi.encoders import jsonable_encoder
 from multilog import log
 from sqlalchemy import asc
+from sqlalchemy import case
 from sqlalchemy import desc
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 from sqlalchemy.sql import text
 from sqlalchemy.sql.elements import TextClause
 from utilities.helper import get_changelog
 
+# The columns by which the bought item statistics can be grouped.
+STATS_GROUP_COLUMNS: Dict[str, InstrumentedAttribute] = {
+    "project": ProjectModel.number,
+    "product": ProjectModel.product_number,
+    "supplier": BoughtItemModel.supplier,
+    "manufacturer": BoughtItemModel.manufacturer,
+    "group-1": BoughtItemModel.group_1,
+    "status": BoughtItemModel.status,
+    "unit": BoughtItemModel.unit,
+}
+
 
 class CRUDBoughtItem(
     CRUDBase[
@@ -48,6 +68,10 @@ class CRUDBoughtItem(
 ):
     """CRUDBoughtItem class. Descendent of the CRUDBase class."""
 
+    def __init__(self, model: Type[BoughtItemModel]):
+        super().__init__(model)
+        self._stats: CommitCache[List[Dict[str, Any]]] = CommitCache(BoughtItemModel, ProjectModel)
+
     def get_multi(
         self,
         db: Session,
@@ -95,6 +119,73 @@ class CRUDBoughtItem(
         ignore_lost: bool | None = None,
     ) -> Tuple[int, List[BoughtItemModel]]:
         """Returns a list of bought items by the given filter params."""
+        if created_from is None:
+            created_from = date(2000, 1, 1)
+        if created_to is None:
+            created_to = date.today()
+
+        if changed_from is None:
+            changed_from = date(2000, 1, 1)
+        if changed_to is None:
+            changed_to = date.today()
+
+        filters = locals()
+        for key in ("self", "db", "skip", "limit"):
+            filters.pop(key)
+        statement = self.get_multi_statement(**filters)
+
+        items: List[BoughtItemModel] = list(db.scalars(statement.offset(skip).limit(limit)))
+        # log.debug(f"Items: {[i.__dict__ for i in items]}")
+        total: int = db.scalar(select(func.count()).select_from(statement.order_by(None).subquery()))
+        return total, items
+
+    def get_multi_statement(
+        self,
+        *,
+        sort_by: str | None = None,
+        id: str | None = None,  # pylint: disable=W0622
+        status: str | None = None,
+        project_number: str | None = None,
+        project_customer: str | None = None,
+        project_description: str | None = None,
+        product_number: str | None = None,
+        quantity: float | None = None,
+        unit: str | None = None,
+        partnumber: str | None = None,
+        order_number: str | None = None,
+        manufacturer: str | None = None,
+        supplier: str | None = None,
+        group_1: str | None = None,
+        note_general: str | None = None,
+        note_supplier: str | None = None,
+        creator_id: int | None = None,
+        created_from: date | None = None,
+        created_to: date | None = None,
+        changed_from: date | None = None,
+        changed_to: date | None = None,
+        desired_from: date | None = None,
+        desired_to: date | None = None,
+        requester_id: int | None = None,
+        requested_from: date | None = None,
+        requested_to: date | None = None,
+        orderer_id: int | None = None,
+        ordered_from: date | None = None,
+        ordered_to: date | None = None,
+        expected_from: date | None = None,
+        expected_to: date | None = None,
+        delivered_from: date | None = None,
+        delivered_to: date | None = None,
+        receiver_id: int | None = None,
+        storage_place: str | None = None,
+        high_priority: bool | None = None,
+        ignore_delivered: bool | None = None,
+        ignore_canceled: bool | None = None,
+        ignore_lost: bool | None = None,
+    ) -> Select:
+        """
+        Returns the statement that selects the bought items by the given filter params, ordered by `sort_by`.
+        Contrary to `get_multi` no default values are applied, a date range is only limited if given.
+        """
 
         def build_order_by(keyword: str | None) -> TextClause:
             """
@@ -126,21 +217,8 @@ class CRUDBoughtItem(
             output_list.append(desc(self.model.id))
             return text(",".join(str(i) for i in output_list))
 
-        if created_from is None:
-            created_from = date(2000, 1, 1)
-        if created_to is None:
-            created_to = date.today()
-
-        if changed_from is None:
-            changed_from = date(2000, 1, 1)
-        if changed_to is None:
-            changed_to = date.today()
-
-        # order_by = text(sort_by or str(desc(self.model.id)))
-        order_by = build_order_by(sort_by)
-
-        query = (
-            db.query(self.model)
+        statement = (
+            select(self.model)
             .filter_by(
                 deleted=False,
                 status=status if status else self.model.status,
@@ -167,10 +245,10 @@ class CRUDBoughtItem(
                 self.model.group_1.ilike(f"%{group_1}%") if group_1 else text(""),
                 self.model.note_general.ilike(f"%{note_general}%") if note_general else text(""),
                 self.model.note_supplier.ilike(f"%{note_supplier}%") if note_supplier else text(""),
-                self.model.created >= created_from,
-                self.model.created <= created_to,
-                self.model.changed >= changed_from,
-                self.model.changed <= changed_to,
+                self.model.created >= created_from if created_from else text(""),
+                self.model.created <= created_to if created_to else text(""),
+                self.model.changed >= changed_from if changed_from else text(""),
+                self.model.changed <= changed_to if changed_to else text(""),
                 self.model.desired_delivery_date >= desired_from if desired_from else text(""),
                 self.model.desired_delivery_date <= desired_to if desired_to else text(""),
                 self.model.requester_id == requester_id if requester_id else text(""),
@@ -187,12 +265,102 @@ class CRUDBoughtItem(
                 self.model.storage_place.ilike(f"%{storage_place}%") if storage_place else text(""),
             )
             .join(ProjectModel, self.model.project)
+            .order_by(build_order_by(sort_by))
         )
+        return statement
 
-        items: List[BoughtItemModel] = query.order_by(order_by).offset(skip).limit(limit).all()
-        # log.debug(f"Items: {[i.__dict__ for i in items]}")
-        total: int = query.count()
-        return total, items
+    def get_stats(self, db: Session, *, group_by: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Returns the number of items, the sum of their quantities, the number of open, delivered and late items per
+        group. An item is late, if its status is late or if it has been delivered after the expected delivery date.
+        The items are filtered like in `get_multi_statement`, the result is cached until bought items or projects
+        are written.
+
+        Args:
+            db (Session): DB session.
+            group_by (str): The group, one of `STATS_GROUP_COLUMNS`.
+            filters: The filter params of `get_multi_statement`.
+
+        Returns:
+            List[Dict[str, Any]]: The stats of each group, ordered by the group key.
+        """
+        key = STATS_GROUP_COLUMNS[group_by]
+
+        def compute() -> List[Dict[str, Any]]:
+            status = cfg.items.bought.status
+            late = or_(self.model.status == status.late, self.model.delivery_date > self.model.expected_delivery_date)
+            statement = (
+                self.get_multi_statement(**filters)
+                .order_by(None)
+                .with_only_columns(
+                    key.label("key"),
+                    func.count(self.model.id).label("count"),
+                    func.coalesce(func.sum(self.model.quantity), 0).label("quantity"),
+                    func.sum(
+                        case((self.model.status.not_in([status.delivered, status.canceled, status.lost]), 1), else_=0)
+                    ).label("open"),
+                    func.sum(case((self.model.status == status.delivered, 1), else_=0)).label("delivered"),
+                    func.sum(case((late, 1), else_=0)).label("late"),
+                )
+                .group_by(key)
+                .order_by(key)
+            )
+            return [{**row._asdict(), "late_rate": row.late / row.count} for row in db.execute(statement)]
+
+        return self._stats.get(("stats", group_by, tuple(sorted(filters.items()))), compute)
+
+    def get_lead_time_stats(self, db: Session, *, group_by: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Returns the lead time (ordered date to delivery date) in days of the delivered items per group: The mean, the
+        minimum, the maximum and the 50th, 90th and 95th percentile (nearest rank). Items without ordered date or
+        delivery date are ignored. The items are filtered like in `get_multi_statement`, the result is cached until
+        bought items or projects are written.
+
+        Args:
+            db (Session): DB session.
+            group_by (str): The group, one of `STATS_GROUP_COLUMNS`.
+            filters: The filter params of `get_multi_statement`.
+
+        Returns:
+            List[Dict[str, Any]]: The lead time stats of each group, ordered by the group key.
+        """
+        key = STATS_GROUP_COLUMNS[group_by]
+
+        def compute() -> List[Dict[str, Any]]:
+            lead_time = func.julianday(self.model.delivery_date) - func.julianday(self.model.ordered_date)
+            lead_times = (
+                self.get_multi_statement(**filters)
+                .order_by(None)
+                .with_only_columns(
+                    key.label("key"),
+                    lead_time.label("lead_time"),
+                    func.row_number().over(partition_by=key, order_by=lead_time).label("rank"),
+                    func.count().over(partition_by=key).label("total"),
+                )
+                .where(self.model.ordered_date.is_not(None), self.model.delivery_date.is_not(None))
+                .subquery()
+            )
+
+            def percentile(p: float) -> Any:
+                return func.min(case((lead_times.c.rank >= p * lead_times.c.total, lead_times.c.lead_time)))
+
+            statement = (
+                select(
+                    lead_times.c.key,
+                    func.count().label("count"),
+                    func.avg(lead_times.c.lead_time).label("mean"),
+                    func.min(lead_times.c.lead_time).label("min"),
+                    percentile(0.5).label("p50"),
+                    percentile(0.9).label("p90"),
+                    percentile(0.95).label("p95"),
+                    func.max(lead_times.c.lead_time).label("max"),
+                )
+                .group_by(lead_times.c.key)
+                .order_by(lead_times.c.key)
+            )
+            return [row._asdict() for row in db.execute(statement)]
+
+        return self._stats.get(("lead-time", group_by, tuple(sorted(filters.items()))), compute)
 
     def create(
         self,
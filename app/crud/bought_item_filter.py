@@ -0,0 +1,219 @@
+"""
+    Create-Read-Update-Delete: Bought Item Filter
+
+    Saved filters are executed on the server: The select statement of a filter is built once and kept until the filter
+    changes, the ids of the matching items are kept until the next write to bought items or projects is committed
+    (see crud.cache).
+"""
+
+from dataclasses import asdict
+from datetime import date
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from api.schemas.host import HostConfigItemsBoughtFilterAddSchema
+from api.schemas.host import HostConfigItemsBoughtFilterUpdateSchema
+from crud.base import CRUDBase
+from crud.bought_item import crud_bought_item
+from crud.cache import CommitCache
+from db.models import BoughtItemFilterModel
+from db.models import BoughtItemModel
+from db.models import ProjectModel
+from exceptions import BoughtItemFilterAlreadyExistsError
+from exceptions import BoughtItemFilterInvalidError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from utilities.config_editor.bought_items import ConfigBoughtItemsFilter
+
+# Maps the filter keys of the web client to the params of `crud_bought_item.get_multi_statement`.
+FILTER_KEYS_STR = {
+    "sortBy": "sort_by",
+    "id": "id",
+    "status": "status",
+    "project": "project_number",
+    "productNumber": "product_number",
+    "unit": "unit",
+    "partnumber": "partnumber",
+    "orderNumber": "order_number",
+    "manufacturer": "manufacturer",
+    "supplier": "supplier",
+    "group1": "group_1",
+    "noteGeneral": "note_general",
+    "noteSupplier": "note_supplier",
+    "storagePlace": "storage_place",
+}
+FILTER_KEYS_INT = {
+    "creatorId": "creator_id",
+    "requesterId": "requester_id",
+    "ordererId": "orderer_id",
+    "takeOverId": "receiver_id",
+}
+FILTER_KEYS_DATE = {
+    "createdDate": "created_from",
+    "changedDateFrom": "changed_from",
+    "desiredDate": "desired_from",
+    "requestedDate": "requested_from",
+    "orderedDate": "ordered_from",
+    "expectedDate": "expected_from",
+    "deliveredDate": "delivered_from",
+}
+FILTER_KEYS_BOOL = {
+    "highPriority": "high_priority",
+    "ignoreDelivered": "ignore_delivered",
+    "ignoreCanceled": "ignore_canceled",
+    "ignoreLost": "ignore_lost",
+}
+
+# SQLite allows only a limited number of host parameters per statement.
+ID_CHUNK_SIZE = 500
+
+
+class CRUDBoughtItemFilter(
+    CRUDBase[
+        BoughtItemFilterModel,
+        HostConfigItemsBoughtFilterAddSchema,
+        HostConfigItemsBoughtFilterUpdateSchema,
+    ]
+):
+    """CRUDBoughtItemFilter class. Descendent of the CRUDBase class."""
+
+    def __init__(self, model: Type[BoughtItemFilterModel]):
+        super().__init__(model)
+        self._statements: Dict[str, Tuple[datetime, Select]] = {}
+        self._result_ids: CommitCache[List[int]] = CommitCache(BoughtItemModel, ProjectModel)
+
+    def get_by_name(self, db: Session, *, name: str) -> Optional[BoughtItemFilterModel]:
+        """
+        Retrieves a filter by its name.
+        """
+        return db.query(self.model).filter(self.model.name == name).first()
+
+    def get_all(self, db: Session) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns all filters as dict: The filter name is the key, the filter keys are the value.
+        """
+        return {f.name: f.params for f in db.query(self.model).order_by(self.model.id).all()}
+
+    def create(  # type: ignore[override]
+        self, db: Session, *, name: str, obj_in: HostConfigItemsBoughtFilterAddSchema
+    ) -> BoughtItemFilterModel:
+        """
+        Creates a new filter.
+
+        Raises:
+            BoughtItemFilterAlreadyExistsError: A filter with this name exists.
+        """
+        if self.get_by_name(db, name=name):
+            raise BoughtItemFilterAlreadyExistsError(f"Cannot create filter {name!r}: The name is already in use.")
+
+        now = datetime.now()
+        db_obj = self.model(name=name, params=asdict(obj_in), created=now, changed=now)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(  # type: ignore[override]
+        self, db: Session, *, db_obj: BoughtItemFilterModel, obj_in: HostConfigItemsBoughtFilterUpdateSchema
+    ) -> BoughtItemFilterModel:
+        """
+        Updates a filter. The cached statement of the filter is dropped.
+        """
+        setattr(db_obj, self.model.params.name, asdict(obj_in))
+        setattr(db_obj, self.model.changed.name, datetime.now())
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        self._statements.pop(db_obj.name, None)
+        return db_obj
+
+    def delete(self, db: Session, *, name: str) -> Optional[BoughtItemFilterModel]:  # type: ignore[override]
+        """
+        Deletes a filter by its name.
+        """
+        obj = self.get_by_name(db, name=name)
+        if obj:
+            db.delete(obj)
+            db.commit()
+            self._statements.pop(name, None)
+        return obj
+
+    def get_statement(self, db_obj: BoughtItemFilterModel) -> Select:
+        """
+        Returns the statement that selects the ids of all items matching the filter, in the order of the filter.
+        The statement is built once per filter and reused until the filter changes. Because the same statement object
+        is executed every time, its compiled form is taken from the compiled cache of SQLAlchemy.
+
+        Raises:
+            BoughtItemFilterInvalidError: The filter contains values that cannot be converted.
+        """
+        cached = self._statements.get(db_obj.name)
+        if cached and cached[0] == db_obj.changed:
+            return cached[1]
+
+        statement = crud_bought_item.get_multi_statement(**self.get_query_params(db_obj)).with_only_columns(
+            BoughtItemModel.id
+        )
+        self._statements[db_obj.name] = (db_obj.changed, statement)
+        return statement
+
+    def get_items(
+        self,
+        db: Session,
+        *,
+        db_obj: BoughtItemFilterModel,
+        skip: int | None = None,
+        limit: int | None = None,
+    ) -> Tuple[int, List[BoughtItemModel]]:
+        """
+        Executes the filter and returns the total number of matching items and the requested page of items.
+        If no limit is given, the limit of the filter is used.
+
+        Raises:
+            BoughtItemFilterInvalidError: The filter contains values that cannot be converted.
+        """
+        statement = self.get_statement(db_obj)
+        ids = self._result_ids.get((db_obj.name, db_obj.changed), lambda: list(db.scalars(statement)))
+
+        skip = skip if skip else 0
+        limit = limit if limit else db_obj.params.get("limit")
+        page_ids = ids[skip : skip + limit] if limit else ids[skip:]
+
+        items: Dict[int, BoughtItemModel] = {}
+        for i in range(0, len(page_ids), ID_CHUNK_SIZE):
+            chunk = page_ids[i : i + ID_CHUNK_SIZE]
+            items.update(
+                {item.id: item for item in db.scalars(select(BoughtItemModel).where(BoughtItemModel.id.in_(chunk)))}
+            )
+        return len(ids), [items[i] for i in page_ids if i in items]
+
+    @staticmethod
+    def get_query_params(db_obj: BoughtItemFilterModel) -> Dict[str, Any]:
+        """
+        Converts the keys of the filter (as stored by the web client) to the params of `get_multi_statement`.
+        Date values are the lower limit of the date range.
+
+        Raises:
+            BoughtItemFilterInvalidError: The filter contains unknown keys or values that cannot be converted.
+        """
+        try:
+            data = asdict(ConfigBoughtItemsFilter(**db_obj.params))
+            params: Dict[str, Any] = {}
+            params.update({p: data[k] for k, p in FILTER_KEYS_STR.items() if data[k]})
+            params.update({p: int(data[k]) for k, p in FILTER_KEYS_INT.items() if data[k]})
+            params.update({p: date.fromisoformat(data[k]) for k, p in FILTER_KEYS_DATE.items() if data[k]})
+            params.update({p: data[k] for k, p in FILTER_KEYS_BOOL.items() if data[k] is not None})
+            if data["quantity"]:
+                params["quantity"] = float(data["quantity"])
+        except (TypeError, ValueError) as e:
+            raise BoughtItemFilterInvalidError(f"Cannot execute filter {db_obj.name!r}: {e}") from e
+        return params
+
+
+crud_bought_item_filter = CRUDBoughtItemFilter(BoughtItemFilterModel)
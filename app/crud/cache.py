@@ -0,0 +1,88 @@
+"""
+    Caches for query results, that are valid until the queried models are written.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Hashable
+from typing import List
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+from db.base import Base
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+SESSION_INFO_KEY = "commit_caches"
+
+
+class CommitCache(Generic[T]):
+    """
+    Thread safe key-value cache, that is cleared as soon as a transaction is committed, which wrote (created, updated
+    or deleted) an instance of one of the given models. Holds at most `maxsize` values, the least recently used value
+    is dropped first.
+    """
+
+    def __init__(self, *models: Type[Base], maxsize: int = 128) -> None:
+        self.models: Tuple[Type[Base], ...] = models
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._generation = 0
+        self._values: OrderedDict[Hashable, T] = OrderedDict()
+        caches.append(self)
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Returns the cached value of the key. If nothing is cached, the value is computed and stored, as long as the
+        cache hasn't been cleared during the computation (this would store an outdated value).
+        """
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return self._values[key]
+            generation = self._generation
+
+        value = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._values[key] = value
+                if len(self._values) > self.maxsize:
+                    self._values.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drops all cached values."""
+        with self._lock:
+            self._generation += 1
+            self._values.clear()
+
+
+caches: List[CommitCache] = []
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_caches(session: Session, _flush_context: Any) -> None:
+    """Remembers the caches of all models, that are written within the current transaction."""
+    written = session.info.setdefault(SESSION_INFO_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        written.update(id(c) for c in caches if isinstance(obj, c.models))
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_written_caches(session: Session) -> None:
+    """Clears the caches of all models, that have been written by the committed transaction."""
+    written = session.info.pop(SESSION_INFO_KEY, set())
+    for cache in caches:
+        if id(cache) in written:
+            cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_written_caches(session: Session) -> None:
+    session.info.pop(SESSION_INFO_KEY, None)
@@ -2,13 +2,17 @@
     Create-Read-Update-Delete: Email Notification
 """
 
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from api.schemas.email_notification import EmailNotificationCreateSchema
 from api.schemas.email_notification import EmailNotificationUpdateSchema
 from crud.base import CRUDBase
+from db.models import BoughtItemModel
 from db.models import EmailNotificationModel
+from db.models import UserModel
 from multilog import log
 from sqlalchemy.orm import Session
 
@@ -30,6 +34,20 @@ class CRUDEmailNotification(
         """Returns all pending email notifications for a specific user."""
         return db.query(self.model).filter_by(receiver_id=receiver_id).all()
 
+    def get_pending(
+        self, db: Session
+    ) -> List[Tuple[EmailNotificationModel, Optional[UserModel], Optional[BoughtItemModel]]]:
+        """Returns all pending email notifications with their receiver and their item, ordered by the receiver.
+        Runs as a single query, the receiver or the item is None if it doesn't exist (anymore).
+        """
+        return (
+            db.query(self.model, UserModel, BoughtItemModel)
+            .outerjoin(UserModel, UserModel.id == self.model.receiver_id)
+            .outerjoin(BoughtItemModel, BoughtItemModel.id == self.model.bought_item_id)
+            .order_by(self.model.receiver_id, self.model.id)
+            .all()
+        )
+
     def get_distinct_receiver_ids(self, db: Session) -> Optional[List[int]]:
         """Returns a list of all distinct user ids."""
         query = db.query(self.model.receiver_id).distinct().all()
@@ -53,5 +71,15 @@ class CRUDEmailNotification(
         log.info(f"Deleted email notification with ID={id}.")
         return db_obj
 
+    def delete_multi(self, db: Session, *, ids: Iterable[int]) -> int:
+        """Deletes the email notifications with the given ids in one statement, returns the number of deleted rows."""
+        ids = list(ids)
+        if not ids:
+            return 0
+        count = db.query(self.model).filter(self.model.id.in_(ids)).delete()
+        db.commit()
+        log.info(f"Deleted {count} email notifications.")
+        return count
+
 
 crud_email_notification = CRUDEmailNotification(EmailNotificationModel)
@@ -0,0 +1,88 @@
+"""
+    Create-Read-Update-Delete: Mail Outbox
+"""
+
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from api.schemas.mail_outbox import MailOutboxCreateSchema
+from api.schemas.mail_outbox import MailOutboxUpdateSchema
+from const import MAIL_OUTBOX_MAX_ATTEMPTS
+from const import MAIL_OUTBOX_RETRY_DELAY
+from crud.base import CRUDBase
+from db.models import MailOutboxModel
+from multilog import log
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+
+class CRUDMailOutbox(CRUDBase[MailOutboxModel, MailOutboxCreateSchema, MailOutboxUpdateSchema]):
+    """CRUDMailOutbox class. Descendent of the CRUDBase class."""
+
+    def get_due(self, db: Session, *, limit: int) -> List[MailOutboxModel]:
+        """Returns the pending mails whose next attempt is due, the longest waiting first."""
+        return (
+            db.query(self.model)
+            .filter(self.model.failed.is_(None), self.model.next_attempt <= datetime.now())
+            .order_by(self.model.next_attempt, self.model.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """Returns the queue depth of the outbox in one query: pending, due and failed mails, and the creation of the
+        oldest pending mail.
+        """
+        pending = self.model.failed.is_(None)
+        row = db.query(
+            func.count(case((pending, 1))),
+            func.count(case((pending & (self.model.next_attempt <= datetime.now()), 1))),
+            func.count(self.model.failed),
+            func.min(case((pending, self.model.created))),
+        ).one()
+        return {"pending": row[0], "due": row[1], "failed": row[2], "oldest": row[3]}
+
+    def create(self, db: Session, *, obj_in: MailOutboxCreateSchema) -> MailOutboxModel:
+        """Queues a mail, it's due immediately."""
+        now = datetime.now()
+        db_obj = self.model(
+            created=now, next_attempt=now, attempts=0, receivers=obj_in.receivers, message=obj_in.message
+        )
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        log.info(f"Queued mail to {obj_in.receivers!r}, ID={db_obj.id}.")
+        return db_obj
+
+    def defer(self, db: Session, *, db_obj: MailOutboxModel, error: str) -> MailOutboxModel:
+        """Reschedules a mail after a failed attempt, the delay doubles with every attempt. After
+        `MAIL_OUTBOX_MAX_ATTEMPTS` the mail is marked as failed and isn't sent anymore.
+        """
+        now = datetime.now()
+        db_obj.attempts += 1
+        db_obj.last_error = error
+        if db_obj.attempts >= MAIL_OUTBOX_MAX_ATTEMPTS:
+            db_obj.failed = now
+            log.error(f"Gave up sending mail ID={db_obj.id} to {db_obj.receivers!r} after {db_obj.attempts} attempts.")
+        else:
+            db_obj.next_attempt = now + timedelta(seconds=MAIL_OUTBOX_RETRY_DELAY * 2 ** (db_obj.attempts - 1))
+            log.warning(f"Failed sending mail ID={db_obj.id}, next attempt at {db_obj.next_attempt:%H:%M:%S}.")
+        db.commit()
+        return db_obj
+
+    def delete_multi(self, db: Session, *, ids: Iterable[int]) -> int:
+        """Deletes the mails with the given ids in one statement, returns the number of deleted rows."""
+        ids = list(ids)
+        if not ids:
+            return 0
+        count = db.query(self.model).filter(self.model.id.in_(ids)).delete()
+        db.commit()
+        return count
+
+
+crud_mail_outbox = CRUDMailOutbox(MailOutboxModel)
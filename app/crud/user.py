@@ -22,8 +22,11 @@ from exceptions import UsernameAlreadyExistsError
 from locales import Locales
 from mail.presets import MailPreset
 from multilog import log
+from security.pwd import LOOKUP_HASH_PREFIX
 from security.pwd import get_hash
+from security.pwd import get_lookup_hash
 from security.pwd import verify_hash
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 
@@ -68,6 +71,9 @@ class CRUDUser(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
 
     def get_by_rfid(self, db: Session, *, rfid: str) -> Optional[UserModel]:
         """Returns a user by their rfid id.
+        The user is looked up by the keyed hash of the rfid. Only users without a lookup hash (set before the lookup
+        hash existed, or with a previous secret key) are verified against their salted hash, the lookup hash of the
+        found user is set and flushed, it's committed by the caller.
 
         Args:
             db (Session): DB session.
@@ -76,9 +82,21 @@ class CRUDUser(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
         Returns:
             Optional[UserModel]: The user as model.
         """
-        users = db.query(self.model).filter(self.model.hashed_rfid != None, self.model.is_active).all()
+        rfid_lookup = get_lookup_hash(rfid)
+        user = db.query(self.model).filter(self.model.rfid_lookup == rfid_lookup, self.model.is_active).first()
+        if user:
+            return user
+
+        users = db.query(self.model).filter(
+            self.model.hashed_rfid != None,
+            self.model.is_active,
+            or_(self.model.rfid_lookup == None, self.model.rfid_lookup.not_like(f"{LOOKUP_HASH_PREFIX}%")),
+        )
         for user in users:
             if verify_hash(rfid, user.hashed_rfid):
+                user.rfid_lookup = rfid_lookup
+                db.flush()
+                log.info(f"Set the rfid lookup hash of user #{user.id} ({user.username}).")
                 return user
 
     def create(self, db: Session, *, current_user: UserModel, obj_in: UserCreateSchema) -> UserModel:
@@ -117,6 +135,7 @@ class CRUDUser(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
             if data["rfid"] is not None:
                 hashed_rfid = get_hash(data["rfid"])
                 data["hashed_rfid"] = hashed_rfid
+                data["rfid_lookup"] = get_lookup_hash(data["rfid"])
             del data["rfid"]
 
         # The systemuser can only be created by another systemuser!
@@ -226,6 +245,7 @@ class CRUDUser(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
                     )
                 hashed_rfid = get_hash(data["rfid"])
                 data["hashed_rfid"] = hashed_rfid
+                data["rfid_lookup"] = get_lookup_hash(data["rfid"])
             del data["rfid"]
 
         # Handle missing data
@@ -310,8 +330,10 @@ class CRUDUser(CRUDBase[UserModel, UserCreateSchema, UserUpdateSchema]):
         return user
 
     def authenticate_rfid(self, db: Session, *, rfid: str) -> Optional[UserModel]:
-        """Authenticates a user by the rfid id"""
-        return self.get_by_rfid(db, rfid=rfid)
+        """Authenticates a user by the rfid id, commits the lookup hash if it was set"""
+        user = self.get_by_rfid(db, rfid=rfid)
+        db.commit()
+        return user
 
     def is_active(self, user: UserModel) -> bool:
         """Checks if the user is active."""
@@ -5,15 +5,26 @@ Create-Read-Update-Delete: User Time
 from datetime import UTC
 from datetime import date
 from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from itertools import groupby
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 
 from api.schemas.user_time import UserTimeCreateSchema
 from api.schemas.user_time import UserTimeUpdateSchema
+from const import TIMESHEET_YIELD_PER
 from crud.base import CRUDBase
 from db.models import UserModel
 from db.models import UserTimeModel
+from db.models import UserTimeSummaryModel
 from exceptions import AlreadyLoggedInError
 from exceptions import AlreadyLoggedOutError
 from exceptions import EntryOverlapsError
@@ -25,9 +36,24 @@ from exceptions import MustBeLoggedOut
 from fastapi.encoders import jsonable_encoder
 from multilog import log
 from sqlalchemy import desc
+from sqlalchemy import func
+from sqlalchemy import select
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from utilities.presence import presence
+
+# first day of the period of a day of the summary table, as iso date string
+SUMMARY_PERIODS = {
+    "day": func.date(UserTimeSummaryModel.day),
+    "week": func.date(UserTimeSummaryModel.day, "weekday 0", "-6 days"),
+    "month": func.date(UserTimeSummaryModel.day, "start of month"),
+}
+
+# serializes the punches of the terminals, a punch reads the open entry and toggles it
+PUNCH_LOCK = Lock()
 
 
 class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateSchema]):
@@ -111,6 +137,7 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         obj_out: List[Tuple[UserModel, UserTimeModel]] = []
         entries = (
             db.query(self.model)
+            .options(joinedload(self.model.user))
             .filter_by(user_id=db_obj_user.id if db_obj_user else self.model.user_id, logout=None)
             .all()
         )
@@ -145,6 +172,174 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         """
         return db.query(self.model).filter_by(user_id=db_obj_user.id).order_by(desc(self.model.logout)).first()
 
+    def get_summary(
+        self,
+        db: Session,
+        *,
+        group_by: str,
+        date_from: date,
+        date_to: date,
+        user_id: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Returns the worked time of each user per day, week or month, aggregated from the summary table.
+        Only closed entries are counted, the minutes between the two entries of an automatic break are no working
+        time. The target time is the weekly work hours of the user, spread over the workdays (monday to friday) of the
+        period within the given dates. Like the workdays without entries of the timesheet, periods without entries
+        are reported with zero worked minutes if they have a target time. Users without entries within the given dates
+        are omitted.
+
+        Args:
+            db (Session): The DB session.
+            group_by (str): The period, one of `SUMMARY_PERIODS`.
+            date_from (date): The first day to summarize.
+            date_to (date): The last day to summarize.
+            user_id (int | None, optional): The user to summarize. Defaults to None (all users).
+
+        Returns:
+            List[Dict[str, Any]]: The summary of each user and period, ordered by user and period.
+        """
+        summary = UserTimeSummaryModel
+        period = SUMMARY_PERIODS[group_by].label("period")
+        statement = (
+            select(
+                summary.user_id,
+                UserModel.work_hours_per_week,
+                period,
+                func.count(summary.day).label("days"),
+                func.sum(summary.entries).label("entries"),
+                func.sum(summary.worked_minutes).label("worked_minutes"),
+            )
+            .join(UserModel, UserModel.id == summary.user_id)
+            .where(summary.day >= date_from, summary.day <= date_to)
+            .group_by(summary.user_id, period)
+            .order_by(summary.user_id, period)
+        )
+        if user_id is not None:
+            statement = statement.where(summary.user_id == user_id)
+
+        rows = {(row.user_id, date.fromisoformat(row.period)): row for row in db.execute(statement)}
+        work_hours = {summary_user_id: row.work_hours_per_week for (summary_user_id, _), row in rows.items()}
+
+        obj_out: List[Dict[str, Any]] = []
+        for summary_user_id, work_hours_per_week in work_hours.items():
+            for period_start, start, end in self._summary_periods(group_by, date_from, date_to):
+                row = rows.get((summary_user_id, period_start))
+                target_minutes = None
+                if work_hours_per_week is not None:
+                    workdays = sum((start + timedelta(days=i)).weekday() < 5 for i in range((end - start).days + 1))
+                    target_minutes = work_hours_per_week * 60 / 5 * workdays
+                if row is None and not target_minutes:
+                    continue
+
+                worked_minutes = row.worked_minutes if row else 0
+                obj_out.append(
+                    {
+                        "user_id": summary_user_id,
+                        "period_from": start,
+                        "period_to": end,
+                        "days": row.days if row else 0,
+                        "entries": row.entries if row else 0,
+                        "worked_minutes": worked_minutes,
+                        "target_minutes": target_minutes,
+                        "overtime_minutes": None if target_minutes is None else worked_minutes - target_minutes,
+                    }
+                )
+        return obj_out
+
+    def iterate_timesheet(
+        self,
+        db: Session,
+        *,
+        date_from: date,
+        date_to: date,
+        user_id: int | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields the timesheet rows of each user within the given dates, ordered by user and login.
+        The entries are fetched in chunks of `TIMESHEET_YIELD_PER` and only one day of one user is held in memory, so
+        the timesheet of the whole company can be exported with constant memory.
+
+        Every closed entry is a row. The last row of a day holds the worked, target and overtime minutes of the day.
+        Workdays (monday to friday) without entries are a row of their own, if the user has weekly work hours.
+        Users without entries within the given dates are omitted.
+
+        Args:
+            db (Session): The DB session.
+            date_from (date): The first day of the timesheet.
+            date_to (date): The last day of the timesheet.
+            user_id (int | None, optional): The user of the timesheet. Defaults to None (all users).
+
+        Yields:
+            Iterator[Dict[str, Any]]: The rows of the timesheet.
+        """
+        statement = (
+            select(
+                self.model.user_id,
+                UserModel.username,
+                UserModel.full_name,
+                UserModel.work_hours_per_week,
+                self.model.login,
+                self.model.logout,
+                self.model.duration_minutes,
+                self.model.note,
+            )
+            .join(UserModel, UserModel.id == self.model.user_id)
+            .where(
+                self.model.login >= datetime.combine(date_from, time()),
+                self.model.login < datetime.combine(date_to + timedelta(days=1), time()),
+                self.model.logout.is_not(None),
+            )
+            .order_by(self.model.user_id, self.model.login)
+            .execution_options(yield_per=TIMESHEET_YIELD_PER)
+        )
+        if user_id is not None:
+            statement = statement.where(self.model.user_id == user_id)
+
+        for _, user_entries in groupby(db.execute(statement), key=lambda row: row.user_id):
+            day = date_from
+            for login_day, day_entries in groupby(user_entries, key=lambda row: row.login.date()):
+                entries = list(day_entries)
+                user = entries[0]
+                yield from self._timesheet_workdays(user, day, login_day)
+
+                worked_minutes = sum(entry.duration_minutes or 0 for entry in entries)
+                for entry in entries[:-1]:
+                    yield self._timesheet_row(user, login_day, entry=entry)
+                yield self._timesheet_row(user, login_day, entry=entries[-1], worked_minutes=worked_minutes)
+                day = login_day + timedelta(days=1)
+            yield from self._timesheet_workdays(user, day, date_to + timedelta(days=1))
+
+    def overlaps(
+        self,
+        db: Session,
+        *,
+        db_obj_user: UserModel,
+        login: datetime,
+        logout: datetime | None = None,
+        exclude_id: int | None = None,
+    ) -> bool:
+        """Returns whether the time from login to logout overlaps with an entry of the given user. Without logout only
+        the login time is checked. Open entries (no logout) never overlap, entries may touch each other.
+        Runs as a single EXISTS query on the (user_id, login, logout) index.
+
+        Args:
+            db (Session): The DB session.
+            db_obj_user (UserModel): The user whose entries are checked.
+            login (datetime): The start of the time to check.
+            logout (datetime | None, optional): The end of the time to check. Defaults to None.
+            exclude_id (int | None, optional): An entry to skip, the entry that is updated. Defaults to None.
+
+        Returns:
+            bool: True if an entry overlaps.
+        """
+        query = db.query(self.model).filter(
+            self.model.user_id == db_obj_user.id,
+            self.model.login < (logout or login),
+            self.model.logout > login,
+        )
+        if exclude_id is not None:
+            query = query.filter(self.model.id != exclude_id)
+        return db.query(query.exists()).scalar()
+
     def create(self, db: Session, *, db_obj_user: UserModel, obj_in: UserTimeCreateSchema) -> UserTimeModel:
         """Creates a user time entry for the given user.
 
@@ -175,18 +370,7 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         if not obj_in.logout and obj_in.login.date() != date.today():
             raise LoginNotTodayError("Cannot create user time entry: Login must be today when no logout is provided.")
 
-        if db.query(self.model).filter_by(user_id=db_obj_user.id).filter(
-            obj_in.login > self.model.login, obj_in.login < self.model.logout
-        ).all() or (
-            obj_in.logout
-            and db.query(self.model)
-            .filter_by(user_id=db_obj_user.id)
-            .filter(
-                obj_in.logout < self.model.logout,
-                obj_in.logout > self.model.login,
-            )
-            .all()
-        ):
+        if self.overlaps(db, db_obj_user=db_obj_user, login=obj_in.login, logout=obj_in.logout):
             raise EntryOverlapsError("Cannot create user time entry: Overlaps with existing entry.")
 
         data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
@@ -200,6 +384,8 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        presence.update(db_obj_user, db_obj)
+        self._refresh_summary(db, user_id=db_obj_user.id, days=[obj_in.login.date()])
 
         log.info(f"Created user time entry (ID={db_obj.id}, USER={db_obj_user.id}).")
         return db_obj
@@ -236,15 +422,7 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         if obj_in.logout and obj_in.logout < obj_in.login:
             raise LogoutBeforeLoginError("Cannot update user time entry: Login time is before logout.")
 
-        if db.query(self.model).filter_by(user_id=db_obj_user.id).filter(
-            self.model.id != db_obj.id, obj_in.login > self.model.login, obj_in.login < self.model.logout
-        ).all() or (
-            obj_in.logout
-            and db.query(self.model)
-            .filter_by(user_id=db_obj_user.id)
-            .filter(self.model.id != db_obj.id, obj_in.logout < self.model.logout, obj_in.logout > self.model.login)
-            .all()
-        ):
+        if self.overlaps(db, db_obj_user=db_obj_user, login=obj_in.login, logout=obj_in.logout, exclude_id=db_obj.id):
             raise EntryOverlapsError("Cannot create user time entry: Overlaps with existing entry.")
 
         if obj_in.login and obj_in.logout:
@@ -257,7 +435,10 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
         data["duration_minutes"] = duration_minutes
 
+        login_before = db_obj.login.date() if db_obj.login else None
         user_time = super().update(db, db_obj=db_obj, obj_in=data)
+        presence.update(db_obj_user, user_time)
+        self._refresh_summary(db, user_id=db_obj_user.id, days=[login_before, obj_in.login.date()])
         log.info(
             f"Updated user time entry #{user_time.id} "
             f"by {db_obj_user.username} (Name={db_obj_user.full_name}, ID={db_obj_user.id})."
@@ -325,7 +506,10 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
                 f"User #{db_obj_user.id} ({db_obj_user.full_name}) tried to delete an entry of another user."
             )
 
+        login = db_obj.login.date() if db_obj.login else None
         deleted_entry = super().delete(db, id=db_obj.id)
+        presence.remove(db_obj)
+        self._refresh_summary(db, user_id=db_obj_user.id, days=[login])
         log.info(f"User #{db_obj_user.id} ({db_obj_user.full_name}) deleted the the time entry #{db_obj.id}.")
         return deleted_entry
 
@@ -351,8 +535,14 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
 
         db_obj = UserTimeModel(**{"user_id": db_obj_user.id, "login": timestamp})
         db.add(db_obj)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            # logged in by a simultaneous request, the open entry index is unique
+            db.rollback()
+            raise AlreadyLoggedInError(f"User #{db_obj_user.id} tried to login, but is already logged in.") from e
         db.refresh(db_obj)
+        presence.update(db_obj_user, db_obj)
 
         log.info(f"Logged in user #{db_obj_user.id} ({db_obj_user.full_name}) at {timestamp}.")
         return db_obj
@@ -380,6 +570,106 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
         if not db_obj:
             raise AlreadyLoggedOutError(f"User #{db_obj_user.id} tried to logout, but is already logged out.")
 
+        user_time = self._close(db, db_obj_user=db_obj_user, db_obj=db_obj, timestamp=timestamp)
+        db.commit()
+        db.refresh(user_time)
+        presence.remove(db_obj)
+        self._refresh_summary(db, user_id=db_obj_user.id, days=[user_time.login.date()])
+        log.info(
+            f"Logged out user #{db_obj_user.id} ({db_obj_user.full_name}) at {user_time.logout}"
+            f"{' with automatic break' if user_time is not db_obj else ''}."
+        )
+        return user_time
+
+    def punch(self, db: Session, *, db_obj_user: UserModel, timestamp: datetime | None = None) -> UserTimeModel:
+        """Logs in the user if they are logged out, logs out the user if they are logged in.
+        The toggle is a single transaction, punches are serialized by the `PUNCH_LOCK`: Simultaneous punches of a user
+        toggle one after another.
+
+        Args:
+            db (Session): The DB session.
+            db_obj_user (UserModel): The user to log in or out.
+            timestamp (datetime | None, optional): The punch-time. If None, UTC-now will be used. Defaults to None.
+
+        Returns:
+            UserTimeModel: The created entry (logged in) or the closed entry (logged out).
+        """
+        with PUNCH_LOCK:
+            if not timestamp:
+                timestamp = datetime.now(UTC)
+
+            db_obj = db.query(self.model).filter_by(user_id=db_obj_user.id, logout=None).first()
+            if db_obj:
+                user_time = self._close(db, db_obj_user=db_obj_user, db_obj=db_obj, timestamp=timestamp)
+                self._refresh_summaries(db, keys={(db_obj_user.id, db_obj.login.date())})
+            else:
+                user_time = UserTimeModel(user_id=db_obj_user.id, login=timestamp)
+                db.add(user_time)
+            db.commit()
+            db.refresh(user_time)
+            presence.update(db_obj_user, db_obj or user_time)
+
+        log.info(
+            f"Logged {'in' if user_time.logout is None else 'out'} user #{db_obj_user.id} ({db_obj_user.full_name}) "
+            f"at {timestamp} by punch."
+        )
+        return user_time
+
+    def rollover(self, db: Session, *, today: date) -> Tuple[int, int]:
+        """Logs out all users who are logged in since a day before today, at the end of their login day. Users without
+        automatic logout, who logged in yesterday, are logged in again at midnight of today.
+        Runs as a single transaction: The open entries are loaded with their users in one query, closed (split by the
+        automatic break) and reopened in the session, the summary rows of the closed days are refreshed in bulk.
+
+        Args:
+            db (Session): The DB session.
+            today (date): The day to roll over to.
+
+        Returns:
+            Tuple[int, int]: The number of logged out users and the number of users logged in again.
+        """
+        midnight = datetime.combine(today, time())
+        entries = (
+            db.query(self.model)
+            .options(joinedload(self.model.user))
+            .filter(self.model.logout.is_(None), self.model.login < midnight)
+            .all()
+        )
+
+        closed_days = set()
+        reopened = 0
+        for entry in entries:
+            login_day = entry.login.date()
+            logout = entry.login.replace(hour=23, minute=59, second=59, microsecond=0)
+            self._close(db, db_obj_user=entry.user, db_obj=entry, timestamp=logout)
+            closed_days.add((entry.user_id, login_day))
+            log.info(f"Logged out user #{entry.user_id} ({entry.user.full_name}) at {logout}.")
+
+            if not entry.user.auto_logout and login_day == today - timedelta(days=1):
+                db.add(UserTimeModel(user_id=entry.user_id, login=midnight))
+                reopened += 1
+                log.info(f"Logged in user #{entry.user_id} ({entry.user.full_name}) at {midnight}.")
+
+        self._refresh_summaries(db, keys=closed_days)
+        db.commit()
+        presence.rebuild(self.get_logged_in(db))
+        return len(entries), reopened
+
+    def _close(
+        self, db: Session, *, db_obj_user: UserModel, db_obj: UserTimeModel, timestamp: datetime
+    ) -> UserTimeModel:
+        """Sets the logout time of the open entry, splits the entry if the user has an automatic break set.
+        The changes are added to the session, but not committed.
+
+        Args:
+            db (Session): The DB session.
+            db_obj_user (UserModel): The user to log out.
+            db_obj (UserTimeModel): The open entry of the user.
+            timestamp (datetime): The logout-time.
+
+        Returns:
+            UserTimeModel: The closed entry, the entry after the automatic break if the entry was split.
+        """
         login_time = db_obj.login.replace(tzinfo=UTC)
         logout_time = timestamp.replace(tzinfo=UTC)
         if logout_time.date() != logout_time.date():
@@ -411,15 +701,8 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
 
             if login_time < auto_break_from and logout_time > auto_break_to:
                 # Duration for time before auto-break (update db entry)
-                duration_minutes_bb = (auto_break_from - login_time).total_seconds() / 60
-                user_time_before_break = super().update(
-                    db,
-                    db_obj=db_obj,
-                    obj_in={
-                        "logout": auto_break_from,
-                        "duration_minutes": duration_minutes_bb,
-                    },
-                )
+                db_obj.logout = auto_break_from
+                db_obj.duration_minutes = (auto_break_from - login_time).total_seconds() / 60
 
                 # Duration for time after auto-break (new db entry)
                 duration_minutes_ab = (logout_time - auto_break_to).total_seconds() / 60
@@ -432,20 +715,122 @@ class CRUDUserTime(CRUDBase[UserTimeModel, UserTimeCreateSchema, UserTimeUpdateS
                     }
                 )
                 db.add(user_time_after_break)
-                db.commit()
-                db.refresh(user_time_after_break)
-                log.info(
-                    f"Logged out user #{db_obj_user.id} ({db_obj_user.full_name}) at {logout_time} with "
-                    "automatic break."
-                )
                 return user_time_after_break
 
-        duration_minutes = (logout_time - login_time).total_seconds() / 60
-        user_time = super().update(
-            db, db_obj=db_obj, obj_in={"logout": logout_time, "duration_minutes": duration_minutes}
-        )
-        log.info(f"Logged out user #{db_obj_user.id} ({db_obj_user.full_name}) at {logout_time}.")
-        return user_time
+        db_obj.logout = logout_time
+        db_obj.duration_minutes = (logout_time - login_time).total_seconds() / 60
+        return db_obj
+
+    @staticmethod
+    def _timesheet_row(
+        user: Any, day: date, *, entry: Any | None = None, worked_minutes: float | None = None
+    ) -> Dict[str, Any]:
+        """Returns a row of the timesheet, with the totals of the day if the worked minutes are given."""
+        target_minutes = None
+        if worked_minutes is not None and user.work_hours_per_week is not None:
+            target_minutes = user.work_hours_per_week * 60 / 5 if day.weekday() < 5 else 0
+        return {
+            "user_id": user.user_id,
+            "username": user.username,
+            "full_name": user.full_name,
+            "day": day,
+            "login": entry.login if entry else None,
+            "logout": entry.logout if entry else None,
+            "duration_minutes": entry.duration_minutes if entry else None,
+            "note": entry.note if entry else None,
+            "worked_minutes": worked_minutes,
+            "target_minutes": target_minutes,
+            "overtime_minutes": None if target_minutes is None else worked_minutes - target_minutes,
+        }
+
+    def _summary_periods(self, group_by: str, date_from: date, date_to: date) -> Iterator[Tuple[date, date, date]]:
+        """Yields the start of every period of the summary that overlaps the given dates, and the first and last day
+        of the period within the given dates."""
+        if group_by == "month":
+            period_start = date_from.replace(day=1)
+        else:
+            period_start = date_from - timedelta(days=date_from.weekday() if group_by == "week" else 0)
+        while period_start <= date_to:
+            if group_by == "month":
+                next_start = (period_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+            else:
+                next_start = period_start + timedelta(days=7 if group_by == "week" else 1)
+            yield period_start, max(period_start, date_from), min(next_start - timedelta(days=1), date_to)
+            period_start = next_start
+
+    def _timesheet_workdays(self, user: Any, start: date, end: date) -> Iterator[Dict[str, Any]]:
+        """Yields a row for every workday from start (inclusive) to end (exclusive), the user has no entries on."""
+        if user.work_hours_per_week is None:
+            return
+        for i in range((end - start).days):
+            day = start + timedelta(days=i)
+            if day.weekday() < 5:
+                yield self._timesheet_row(user, day, worked_minutes=0)
+
+    def _refresh_summary(self, db: Session, *, user_id: int, days: Iterable[date | None]) -> None:
+        """Recomputes the rows of the summary table of the given days from the closed entries of the user.
+
+        Args:
+            db (Session): The DB session.
+            user_id (int): The user whose entries changed.
+            days (Iterable[date | None]): The login dates of the changed entries, before and after the change.
+        """
+        self._refresh_summaries(db, keys={(user_id, day) for day in days if day is not None})
+        db.commit()
+
+    def _refresh_summaries(self, db: Session, *, keys: Set[Tuple[int, date]]) -> None:
+        """Recomputes the rows of the summary table of the given users and days from the closed entries, with one
+        query for the entries and one for the summary rows. The changes are added to the session, but not committed.
+
+        Args:
+            db (Session): The DB session.
+            keys (Set[Tuple[int, date]]): The user IDs and the login dates of the changed entries.
+        """
+        if not keys:
+            return
+        db.flush()
+
+        user_ids = {user_id for user_id, _ in keys}
+        first_day = min(day for _, day in keys)
+        last_day = max(day for _, day in keys)
+        login_day = func.date(self.model.login)
+
+        totals = {
+            (user_id, date.fromisoformat(day)): (entries, worked_minutes)
+            for user_id, day, entries, worked_minutes in db.query(
+                self.model.user_id,
+                login_day,
+                func.count(self.model.id),
+                func.coalesce(func.sum(self.model.duration_minutes), 0),
+            )
+            .filter(
+                self.model.user_id.in_(user_ids),
+                self.model.login >= datetime.combine(first_day, time()),
+                self.model.login < datetime.combine(last_day + timedelta(days=1), time()),
+                self.model.logout.is_not(None),
+            )
+            .group_by(self.model.user_id, login_day)
+        }
+        summaries = {
+            (summary.user_id, summary.day): summary
+            for summary in db.query(UserTimeSummaryModel).filter(
+                UserTimeSummaryModel.user_id.in_(user_ids),
+                UserTimeSummaryModel.day >= first_day,
+                UserTimeSummaryModel.day <= last_day,
+            )
+        }
+
+        for key in keys:
+            summary = summaries.get(key)
+            if key not in totals:
+                if summary:
+                    db.delete(summary)
+            elif summary:
+                summary.entries, summary.worked_minutes = totals[key]
+            else:
+                user_id, day = key
+                entries, worked_minutes = totals[key]
+                db.add(UserTimeSummaryModel(user_id=user_id, day=day, entries=entries, worked_minutes=worked_minutes))
 
 
 crud_user_time = CRUDUserTime(UserTimeModel)
@@ -12,7 +12,11 @@ Required if you use alembic for db migrations.
 
 from db.base import Base  # isort: skip
 from db.models.user import User  # isort: skip
+from db.models.user_time import UserTime  # isort: skip
+from db.models.user_time_summary import UserTimeSummary  # isort: skip
 from db.models.bought_item import BoughtItem  # isort: skip
+from db.models.bought_item_filter import BoughtItemFilter  # isort: skip
 from db.models.api_key import APIKey  # isort: skip
 from db.models.email_notification import EmailNotification  # isort: skip
+from db.models.mail_outbox import MailOutbox  # isort: skip
 from db.models.project import Project  # isort:skip
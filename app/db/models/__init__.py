@@ -8,7 +8,10 @@
 
 from db.models.api_key import APIKey as APIKeyModel
 from db.models.bought_item import BoughtItem as BoughtItemModel
+from db.models.bought_item_filter import BoughtItemFilter as BoughtItemFilterModel
 from db.models.email_notification import EmailNotification as EmailNotificationModel
+from db.models.mail_outbox import MailOutbox as MailOutboxModel
 from db.models.project import Project as ProjectModel
 from db.models.user import User as UserModel
 from db.models.user_time import UserTime as UserTimeModel
+from db.models.user_time_summary import UserTimeSummary as UserTimeSummaryModel
@@ -0,0 +1,31 @@
+"""
+    DB bought item filter model.
+"""
+
+# pylint: disable=C0115,R0903
+
+from datetime import datetime
+from typing import Any
+from typing import Dict
+
+from db.base import Base
+from sqlalchemy import JSON
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class BoughtItemFilter(Base):
+    __tablename__ = "bought_item_filter_table"
+
+    # data handled by the server
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, unique=True, nullable=False)
+    created: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    changed: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # data given on creation
+    name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    # the filter keys as sent by the web client, see ConfigBoughtItemsFilter
+    params: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
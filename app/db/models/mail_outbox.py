@@ -0,0 +1,39 @@
+"""
+    DB mail outbox model.
+"""
+
+# pylint: disable=C0115,R0903
+
+from datetime import datetime
+from typing import List
+from typing import Optional
+
+from db.base import Base
+from sqlalchemy import JSON
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import Text
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class MailOutbox(Base):
+    """
+    A mail waiting to be sent by the outbox worker, see mail.outbox. Sent mails are deleted, mails that failed too
+    often are kept with the failed timestamp.
+    """
+
+    __tablename__ = "mail_outbox_table"
+
+    # data handled by the server
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, unique=True, nullable=False)
+    created: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    next_attempt: Mapped[datetime] = mapped_column(DateTime, index=True, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    failed: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # data given on creation
+    receivers: Mapped[List[str]] = mapped_column(JSON, nullable=False)  # to, cc and bcc
+    message: Mapped[str] = mapped_column(Text, nullable=False)  # the complete message, as sent to the server
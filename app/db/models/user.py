@@ -54,6 +54,8 @@ class User(Base):
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     hashed_rfid: Mapped[str] = mapped_column(String, unique=True, nullable=True)
+    # keyed hash of the rfid for the lookup by index, the salted hash is verified only if this isn't set (yet)
+    rfid_lookup: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True, nullable=True)
 
     language: Mapped[str] = mapped_column(String, nullable=False, server_default=SERVER_DEFAULT_LANGUAGE)
     theme: Mapped[str] = mapped_column(String, nullable=True, server_default=SERVER_DEFAULT_THEME)
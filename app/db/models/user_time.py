@@ -12,8 +12,10 @@ from db.base import Base
 from sqlalchemy import DateTime
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
+from sqlalchemy import text
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
@@ -27,6 +29,12 @@ if TYPE_CHECKING:
 
 class UserTime(Base):
     __tablename__ = "user_time_table"
+    __table_args__ = (
+        # overlap checks and listings of a user by login time, covers the overlap check with the logout
+        Index("ix_user_time_table_user_id_login", "user_id", "login", "logout"),
+        # the open entry of a user (logged in), there is at most one per user
+        Index("ix_user_time_table_user_id_logged_in", "user_id", unique=True, sqlite_where=text("logout IS NULL")),
+    )
 
     # data handled by the server
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, unique=True, nullable=False)
@@ -0,0 +1,39 @@
+"""
+    DB user time summary model.
+"""
+
+# pylint: disable=C0115,R0903
+
+from datetime import date
+
+from db.base import Base
+from sqlalchemy import Date
+from sqlalchemy import Float
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class UserTimeSummary(Base):
+    """
+    The closed user time entries of a user per day, kept up to date by CRUDUserTime on every change of an entry.
+    The summaries of weeks and months are aggregated from these rows instead of from all entries.
+    """
+
+    __tablename__ = "user_time_summary_table"
+    __table_args__ = (UniqueConstraint("user_id", "day", name="uq_user_time_summary_table_user_id_day"),)
+
+    # data handled by the server
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, unique=True, nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    entries: Mapped[int] = mapped_column(Integer, nullable=False)  # an automatic break splits a day into two entries
+    worked_minutes: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # relations
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("user_table.id", name="fk_user_time_summary_table_user_id_user_table"),
+        nullable=False,
+    )
@@ -22,11 +22,13 @@ from sqlalchemy import Column
 from sqlalchemy import Table
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from utilities.metrics import instrument_engine
 
 engine = create_engine(
     f"sqlite:///{DB_DEVELOPMENT if cfg.debug else DB_PRODUCTION}",
     connect_args={"check_same_thread": False},
 )
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,39 @@
+import csv
+import io
+from datetime import date
+from typing import Iterator
+
+from crud.user_time import crud_user_time
+from db.session import SessionLocal
+from excel.xlsx_export.user_time import TIMESHEET_COLUMNS
+
+CSV_COLUMNS = ("username", "full_name", *TIMESHEET_COLUMNS)
+
+
+class UserTimeCsvExport:
+    """Timesheet export of all users into one CSV, streamed line by line."""
+
+    def __init__(self, date_from: date, date_to: date, user_id: int | None = None) -> None:
+        self.date_from = date_from
+        self.date_to = date_to
+        self.user_id = user_id
+        self.name = f"timesheet_{date_from:%Y%m%d}_{date_to:%Y%m%d}.csv"
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the header and the rows of the timesheet as CSV lines.
+        Uses its own DB session: The response is streamed after the request's session is closed.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+
+        with SessionLocal() as db:
+            rows = crud_user_time.iterate_timesheet(
+                db, date_from=self.date_from, date_to=self.date_to, user_id=self.user_id
+            )
+            for row in rows:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow({k: round(v, 2) if isinstance(v, float) else v for k, v in row.items()})
+        yield buffer.getvalue()
@@ -6,16 +6,25 @@
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 from typing import Generic
+from typing import Iterable
 from typing import List
+from typing import Sequence
 from typing import Type
 from typing import TypeVar
 
+from config import cfg
 from const import TEMP
 from db.base import Base
 from excel.style import style_worksheet
 from fastapi.encoders import jsonable_encoder
 from multilog import log
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment
+from openpyxl.styles import Font
+from openpyxl.styles import PatternFill
+from openpyxl.utils import get_column_letter
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import BaseModel
@@ -84,3 +93,78 @@ class BaseExcelExport(Generic[ModelType, SchemaType]):
         self.wb.save(str(path))
         log.info(f"Saved EXCEL file at {str(path)!r}.")
         return path
+
+
+class BaseExcelStreamExport:
+    """Excel export with a write-only workbook, for exports that are too large for the generic excel export.
+    Rows are styled as they are written and flushed to the file right away, the memory doesn't grow with the rows.
+    """
+
+    INVALID_TITLE_CHARS = "[]:*?/\\"
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        """Inits the class.
+
+        Args:
+            columns (Sequence[str]): The column names, underscores are converted to spaces in the header.
+        """
+        self.columns = columns
+        self.name = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.wb: Workbook = Workbook(write_only=True)
+
+        style = cfg.excel.style
+        self._header_font = Font(name=style.font, size=style.size, bold=True, color=style.header_color)
+        self._header_fill = PatternFill(
+            start_color=style.header_bg_color, end_color=style.header_bg_color, fill_type="solid"
+        )
+        self._data_fonts = (
+            Font(name=style.font, size=style.size, color=style.data_color_1),
+            Font(name=style.font, size=style.size, color=style.data_color_2),
+        )
+        self._data_fills = (
+            PatternFill(start_color=style.data_bg_color_1, end_color=style.data_bg_color_1, fill_type="solid"),
+            PatternFill(start_color=style.data_bg_color_2, end_color=style.data_bg_color_2, fill_type="solid"),
+        )
+        self._alignment = Alignment(horizontal="left", vertical="center")
+        self._rows = 0
+
+    def add_sheet(self, title: str, widths: Iterable[float] | None = None) -> Worksheet:
+        """Adds a worksheet with the header row. Following rows are written to this sheet.
+
+        Args:
+            title (str): The title of the sheet, invalid characters are removed.
+            widths (Iterable[float] | None, optional): The widths of the columns. Defaults to the header lengths.
+        """
+        title = "".join(c for c in title if c not in self.INVALID_TITLE_CHARS)[:31] or self.name
+        self.ws: Worksheet = self.wb.create_sheet(title=title)  # type: ignore
+        headers = [" ".join(i.capitalize() for i in str(col).split("_")) for col in self.columns]
+
+        for index, width in enumerate(widths or [len(header) * 1.1 for header in headers]):
+            self.ws.column_dimensions[get_column_letter(index + 1)].width = max(width, 2)
+        self.ws.append([self._cell(header, font=self._header_font, fill=self._header_fill) for header in headers])
+        self._rows = 0
+        return self.ws
+
+    def write_row(self, values: Sequence[Any]) -> None:
+        """Writes a data row to the current sheet, with the alternating data style."""
+        font, fill = self._data_fonts[self._rows % 2], self._data_fills[self._rows % 2]
+        self.ws.append([self._cell(value, font=font, fill=fill) for value in values])
+        self._rows += 1
+
+    def _cell(self, value: Any, font: Font, fill: PatternFill) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.ws, value=value)
+        cell.font = font
+        cell.fill = fill
+        cell.alignment = self._alignment
+        return cell
+
+    def save(self) -> Path:
+        """Saves the created excel file to the temp folder and returns the path."""
+        if not self.wb.worksheets:
+            self.add_sheet(self.name)
+
+        TEMP.mkdir(exist_ok=True)
+        path = Path(TEMP, f"{self.name}.xlsx")
+        self.wb.save(str(path))
+        log.info(f"Saved EXCEL file at {str(path)!r}.")
+        return path
@@ -0,0 +1,52 @@
+from datetime import date
+from typing import Any
+from typing import Dict
+
+from crud.user_time import crud_user_time
+from excel.xlsx_export.base import BaseExcelStreamExport
+from sqlalchemy.orm import Session
+
+TIMESHEET_COLUMNS = (
+    "day",
+    "login",
+    "logout",
+    "duration_minutes",
+    "note",
+    "worked_minutes",
+    "target_minutes",
+    "overtime_minutes",
+)
+TIMESHEET_WIDTHS = (12, 20, 20, 18, 40, 16, 16, 18)
+
+
+class UserTimeExcelExport(BaseExcelStreamExport):
+    """Timesheet export with a sheet per user. The last row of each sheet holds the totals of the user."""
+
+    def __init__(self, db: Session, date_from: date, date_to: date, user_id: int | None = None) -> None:
+        super().__init__(columns=TIMESHEET_COLUMNS)
+        self.name = f"timesheet_{date_from:%Y%m%d}_{date_to:%Y%m%d}_{self.name}"
+
+        totals: Dict[str, Any] | None = None
+        for row in crud_user_time.iterate_timesheet(db, date_from=date_from, date_to=date_to, user_id=user_id):
+            if totals is None or totals["user_id"] != row["user_id"]:
+                self._write_totals(totals)
+                self.add_sheet(title=row["username"], widths=TIMESHEET_WIDTHS)
+                totals = {"user_id": row["user_id"], "worked_minutes": 0.0, "target_minutes": None}
+
+            if row["worked_minutes"] is not None:
+                totals["worked_minutes"] += row["worked_minutes"]
+            if row["target_minutes"] is not None:
+                totals["target_minutes"] = (totals["target_minutes"] or 0) + row["target_minutes"]
+            self.write_row([_round(row[column]) for column in TIMESHEET_COLUMNS])
+        self._write_totals(totals)
+
+    def _write_totals(self, totals: Dict[str, Any] | None) -> None:
+        if totals is None:
+            return
+        worked, target = totals["worked_minutes"], totals["target_minutes"]
+        overtime = None if target is None else worked - target
+        self.write_row(["Total", None, None, None, None, _round(worked), _round(target), _round(overtime)])
+
+
+def _round(value: Any) -> Any:
+    return round(value, 2) if isinstance(value, float) else value
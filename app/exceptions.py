@@ -100,6 +100,15 @@ class BoughtItemOfAnotherUserError(InsufficientPermissionsError): ...
 class BoughtItemAlreadyPlannedError(InsufficientPermissionsError): ...
 
 
+class BoughtItemFilterError(BaseError): ...
+
+
+class BoughtItemFilterAlreadyExistsError(BoughtItemFilterError): ...
+
+
+class BoughtItemFilterInvalidError(BoughtItemFilterError): ...
+
+
 class ExcelImportError(BaseError): ...
 
 
@@ -113,3 +122,15 @@ class ExcelImportDataInvalidError(ExcelImportError): ...
 
 
 class PasswordCriteriaError(BaseError): ...
+
+
+class SolverError(BaseError): ...
+
+
+class SolverPoolSaturatedError(SolverError): ...
+
+
+class SolverTimeoutError(SolverError): ...
+
+
+class SolverCancelledError(SolverError): ...
@@ -34,6 +34,8 @@ class deAT:
             IMPORT_COLUMN_X_NOT_FOUND = Template("Spalte `$x` nicht gefunden")
             IMPORT_PROJECT_X_NOT_FOUND = Template("Ein Projekt mit der Nummer `$x` existiert nicht")
             IMPORT_PROJECT_X_NOT_ACTIVE = Template("Das Projekt `$x` ist nicht aktiv")
+            FILTER_NOT_FOUND = "Dieser Filter existiert nicht"
+            FILTER_INVALID = "Dieser Filter enthält ungültige Werte"
 
         class HOST:
             CONFIGURATION_ALREADY_EXISTS = "Eine Konfiguration mit diesem Namen existiert bereits"
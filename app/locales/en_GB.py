@@ -38,6 +38,8 @@ class enGB:
             IMPORT_COLUMN_X_NOT_FOUND = Template("Column `$x` not found")
             IMPORT_PROJECT_X_NOT_FOUND = Template("A project with the number `$x` doesn't exist")
             IMPORT_PROJECT_X_NOT_ACTIVE = Template("The project `$x` is inactive")
+            FILTER_NOT_FOUND = "This filter doesn't exist"
+            FILTER_INVALID = "This filter contains invalid values"
 
         class LOGIN:
             INCORRECT_CREDS = "Incorrect credentials"
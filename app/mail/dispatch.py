@@ -0,0 +1,68 @@
+"""
+    Mail dispatch submodule: Sends the pending notifications of the database over a single SMTP session.
+"""
+
+from itertools import groupby
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from config import cfg
+from crud.email_notification import crud_email_notification
+from fastapi.encoders import jsonable_encoder
+from mail import Mail
+from mail import Receiver
+from mail.render import SAMPLE_ITEM_NOTIFICATION
+from mail.render import render_template
+from mail.send import MailSession
+from multilog import log
+from sqlalchemy.orm import Session
+
+
+def send_item_notifications(db: Session, session: Optional[MailSession] = None) -> Tuple[int, int]:
+    """Sends a mail per receiver with all their pending bought item notifications.
+    The notifications are loaded in one query and deleted in bulk. Notifications of a failed mail are kept and sent
+    with the next run, notifications of users or items that don't exist anymore are deleted.
+
+    Args:
+        db (Session): The DB session.
+        session (Optional[MailSession], optional): The SMTP session, closed when done. Defaults to a session of the \
+            mailing config.
+
+    Returns:
+        Tuple[int, int]: The number of sent mails and the number of failed mails.
+    """
+    pending = crud_email_notification.get_pending(db)
+    log.info(f"There are {len(pending)} pending notifications.")
+    if not pending:
+        return 0, 0
+
+    done: List[int] = []
+    sent, failed = 0, 0
+    with session or MailSession() as mail_session:
+        for receiver_id, group in groupby(pending, key=lambda row: row[0].receiver_id):
+            rows = list(group)
+            ids = [notification.id for notification, _, _ in rows]
+            user = rows[0][1]
+            items = [jsonable_encoder(item) for _, _, item in rows if item]
+            if not user or not items:
+                log.warning(f"Dropped {len(ids)} notifications of user #{receiver_id}: User or items not found.")
+                done.extend(ids)
+                continue
+
+            log.info(f"Sending email notification to {user.email!r}...")
+            body = render_template(
+                cfg.templates.mail_item_notification,
+                SAMPLE_ITEM_NOTIFICATION,
+                items=items,
+                user=jsonable_encoder(user),
+            )
+            mail = Mail(subject="Glados Notification Service", body=body)
+            if mail_session.send(Receiver(to=[user.email]), mail):
+                done.extend(ids)
+                sent += 1
+            else:
+                failed += 1
+
+    crud_email_notification.delete_multi(db, ids=done)
+    return sent, failed
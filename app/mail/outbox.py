@@ -0,0 +1,165 @@
+"""
+    Mail outbox submodule: Mails are queued in the outbox table and sent by a single background thread.
+
+    The worker wakes up when a mail is queued and at least every `MAIL_OUTBOX_POLL_INTERVAL` seconds. It loads the due
+    mails in batches, sends them over one SMTP session with at most `MAIL_OUTBOX_RATE` mails per second and deletes
+    the sent mails. A failed mail is retried with a doubling delay, until it has failed `MAIL_OUTBOX_MAX_ATTEMPTS` times.
+    If the mail server is unreachable, the rest of the batch is deferred without trying. Stopping the worker interrupts
+    the delays between two attempts, a mail interrupted this way stays due.
+    Queued mails survive a restart of the server.
+"""
+
+from threading import Event
+from threading import Lock
+from threading import Thread
+from time import monotonic
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from api.schemas.mail_outbox import MailOutboxCreateSchema
+from const import MAIL_OUTBOX_BATCH_SIZE
+from const import MAIL_OUTBOX_POLL_INTERVAL
+from const import MAIL_OUTBOX_RATE
+from const import MAIL_TIMEOUT
+from crud.mail_outbox import crud_mail_outbox
+from db.models import MailOutboxModel
+from db.session import SessionLocal
+from mail.send import MailSession
+from multilog import log
+from sqlalchemy.orm import Session
+
+
+class MailOutbox:
+    """The outbox worker. Counts the sent mails and the failed attempts since the start of the server."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._last_sent = 0.0
+        self.sent_total = 0
+        self.failed_total = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the worker thread, if it isn't running yet."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._wake.set()  # sends the mails that were queued while the server was down
+        self._thread = Thread(target=self._run, name="mail-outbox", daemon=True)
+        self._thread.start()
+        log.info("Mail outbox worker started.")
+
+    def stop(self, timeout: float = MAIL_TIMEOUT) -> None:
+        """Stops the worker thread after the mail that is being sent. Unsent mails stay in the outbox."""
+        if not self.running:
+            return
+        assert self._thread
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            log.warning("Mail outbox worker is still sending, it stops after the current mail.")
+            return
+        self._thread = None
+        self._stop.clear()
+        log.info("Mail outbox worker stopped.")
+
+    def enqueue(self, db: Session, receivers: List[str], message: str) -> MailOutboxModel:
+        """Queues the message and wakes up the worker, see `prepare_message`.
+
+        Args:
+            db (Session): The DB session.
+            receivers (List[str]): All receivers (to, cc and bcc).
+            message (str): The message as string.
+
+        Returns:
+            MailOutboxModel: The queued mail.
+        """
+        db_obj = crud_mail_outbox.create(db, obj_in=MailOutboxCreateSchema(receivers=receivers, message=message))
+        self._wake.set()
+        return db_obj
+
+    def send_pending(self, db: Session, session: Optional[MailSession] = None) -> Tuple[int, int]:
+        """Sends all due mails, batch by batch over a single SMTP session.
+
+        Args:
+            db (Session): The DB session.
+            session (Optional[MailSession], optional): The SMTP session, closed when done. Defaults to a session of \
+                the mailing config.
+
+        Returns:
+            Tuple[int, int]: The number of sent mails and the number of failed attempts.
+        """
+        sent, failed = 0, 0
+        with session or MailSession(stop=self._stop) as mail_session:
+            if not mail_session.enabled:
+                if crud_mail_outbox.get_due(db, limit=1):
+                    log.warning("Mailing is disabled: Mails stay in the outbox.")
+                return sent, failed
+
+            # A failed mail isn't due until its next attempt, the loop ends when all due mails are handled.
+            while not self._stop.is_set() and (due := crud_mail_outbox.get_due(db, limit=MAIL_OUTBOX_BATCH_SIZE)):
+                done: List[int] = []
+                for k, db_obj in enumerate(due):
+                    if self._stop.is_set():
+                        break
+                    self._throttle()
+                    if mail_session.send_message(db_obj.receivers, db_obj.message):
+                        done.append(db_obj.id)
+                    elif mail_session.unreachable:
+                        for db_obj_deferred in due[k:]:
+                            crud_mail_outbox.defer(db, db_obj=db_obj_deferred, error=str(mail_session.last_error))
+                        failed += len(due) - k
+                        break
+                    elif not self._stop.is_set():
+                        crud_mail_outbox.defer(db, db_obj=db_obj, error=str(mail_session.last_error))
+                        failed += 1
+                crud_mail_outbox.delete_multi(db, ids=done)
+                sent += len(done)
+                if mail_session.unreachable:
+                    break
+
+        with self._lock:
+            self.sent_total += sent
+            self.failed_total += failed
+        return sent, failed
+
+    def stats(self, db: Session) -> Dict[str, Any]:
+        """Returns the queue depth of the outbox and the counters of the worker, see `MailOutboxStatsSchema`."""
+        with self._lock:
+            counters = {"sent_total": self.sent_total, "failed_total": self.failed_total, "running": self.running}
+        return {**crud_mail_outbox.get_stats(db), **counters}
+
+    def _throttle(self) -> None:
+        """Waits until the next mail can be sent without exceeding `MAIL_OUTBOX_RATE`."""
+        delay = self._last_sent + 1 / MAIL_OUTBOX_RATE - monotonic()
+        if delay > 0:
+            self._stop.wait(delay)
+        self._last_sent = monotonic()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(MAIL_OUTBOX_POLL_INTERVAL)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                with SessionLocal() as db:
+                    sent, failed = self.send_pending(db)
+                if sent or failed:
+                    log.info(f"Mail outbox: Sent {sent} mails, {failed} failed.")
+            except Exception as e:  # pylint: disable=W0718
+                log.exception(f"Mail outbox worker failed: {e!r}")
+
+
+outbox = MailOutbox()
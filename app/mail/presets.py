@@ -4,20 +4,16 @@
 
 # pylint: disable=R0913
 
-from pathlib import Path
-
 from config import cfg
-from const import TEMPLATES
 from mail import Mail
 from mail import Receiver
+from mail.render import SAMPLE_DISC_SPACE_WARN
+from mail.render import SAMPLE_SCHEDULE_ERROR
+from mail.render import SAMPLE_WELCOME
 from mail.render import render_template
 from mail.send import send_mail
 from multilog import log
 
-SAMPLE_WELCOME = "welcome.sample.j2"
-SAMPLE_DISC_SPACE_WARN = "disc_space_warning.sample.j2"
-SAMPLE_SCHEDULE_ERROR = "schedule_error.sample.j2"
-
 
 class MailPreset:
     """The preset class. Has only static methods."""
@@ -27,11 +23,7 @@ class MailPreset:
         """Send a schedule error message to the init-systemuser."""
         log.info(f"Sending schedule error email notification to {cfg.init.mail!r}...")
 
-        if Path(TEMPLATES, cfg.templates.mail_schedule_error).exists():
-            body = render_template(template_file=Path(TEMPLATES, cfg.templates.mail_schedule_error), **locals())
-        else:
-            log.error(f"Mail template file {cfg.templates.mail_schedule_error!r} not found")
-            body = render_template(template_file=Path(TEMPLATES, SAMPLE_SCHEDULE_ERROR), **locals())
+        body = render_template(cfg.templates.mail_schedule_error, SAMPLE_SCHEDULE_ERROR, **locals())
 
         receiver = Receiver(to=[cfg.init.mail])
         mail = Mail(subject="Glados Notification Service", body=body)
@@ -51,11 +43,7 @@ class MailPreset:
         """Send a disc space warning message to the init-systemuser."""
         log.info(f"Sending disc space warning email notification to {cfg.init.mail!r}...")
 
-        if Path(TEMPLATES, cfg.templates.mail_disc_space_warning).exists():
-            body = render_template(template_file=Path(TEMPLATES, cfg.templates.mail_disc_space_warning), **locals())
-        else:
-            log.error(f"Mail template file {cfg.templates.mail_disc_space_warning!r} not found")
-            body = render_template(template_file=Path(TEMPLATES, SAMPLE_DISC_SPACE_WARN), **locals())
+        body = render_template(cfg.templates.mail_disc_space_warning, SAMPLE_DISC_SPACE_WARN, **locals())
 
         receiver = Receiver(to=[cfg.init.mail])
         mail = Mail(subject="Glados Notification Service", body=body)
@@ -67,11 +55,7 @@ class MailPreset:
         local_url = cfg.server.domain
         log.info(f"Sending welcome email to {email!r}...")
 
-        if Path(TEMPLATES, cfg.templates.mail_welcome).exists():
-            body = render_template(template_file=Path(TEMPLATES, cfg.templates.mail_welcome), **locals())
-        else:
-            log.error(f"Mail template file {cfg.templates.mail_welcome!r} not found")
-            body = render_template(template_file=Path(TEMPLATES, SAMPLE_WELCOME), **locals())
+        body = render_template(cfg.templates.mail_welcome, SAMPLE_WELCOME, **locals())
 
         receiver = Receiver(to=[email])
         mail = Mail(subject="Glados Notification Service", body=body)
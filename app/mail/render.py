@@ -1,17 +1,66 @@
 """
     Mail body render submodule.
+
+    All templates are loaded by one environment from the templates folder. A compiled template is kept in memory and
+    recompiled when its file changes, the bytecode is cached on disc for the next start of the app. If a configured
+    template doesn't exist its sample template is used, this is resolved once per template.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import jinja2
+from config import cfg
+from const import TEMPLATES
+from multilog import log
+
+SAMPLE_ITEM_NOTIFICATION = "item_notification.sample.j2"
+SAMPLE_WELCOME = "welcome.sample.j2"
+SAMPLE_DISC_SPACE_WARN = "disc_space_warning.sample.j2"
+SAMPLE_SCHEDULE_ERROR = "schedule_error.sample.j2"
+
+environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(searchpath=TEMPLATES),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    auto_reload=True,
+)
+
+
+@lru_cache
+def resolve_template(template_name: str, sample_name: Optional[str] = None) -> str:
+    """Returns the name of the template, or the name of the sample template if the template file doesn't exist.
+
+    Args:
+        template_name (str): The j2 template file in the templates folder.
+        sample_name (Optional[str], optional): The sample template to use instead. Defaults to None.
+
+    Raises:
+        FileNotFoundError: Raised if neither the template file nor the sample template file exists.
+
+    Returns:
+        str: The name of the template to render.
+    """
+    if Path(TEMPLATES, template_name).is_file():
+        return template_name
+    if sample_name and Path(TEMPLATES, sample_name).is_file():
+        log.error(f"Mail template file {template_name!r} not found, using {sample_name!r}")
+        return sample_name
+    raise FileNotFoundError(f"Template not found at: {str(Path(TEMPLATES, template_name))!r}.")
 
 
-def render_template(template_file: Path, **kwargs) -> str:
+def get_template(template_name: str, sample_name: Optional[str] = None) -> jinja2.Template:
+    """Returns the compiled template, see `resolve_template`."""
+    return environment.get_template(resolve_template(template_name, sample_name))
+
+
+def render_template(template_name: str, sample_name: Optional[str] = None, /, **kwargs) -> str:
     """Renders a Jinja template into HTML.
 
     Args:
-        template_file (Path): The j2 template file to use.
+        template_name (str): The j2 template file in the templates folder.
+        sample_name (Optional[str], optional): The sample template to use if the template file doesn't exist. \
+            Defaults to None.
         kwargs: The keyword arguments to pass to the template.
 
     Raises:
@@ -20,9 +69,19 @@ def render_template(template_file: Path, **kwargs) -> str:
     Returns:
         str: The rendered html template as string.
     """
-    if not template_file.exists():
-        raise FileNotFoundError(f"Template not found at: {str(template_file)!r}.")
-    template_loader = jinja2.FileSystemLoader(searchpath="/")
-    template_env = jinja2.Environment(loader=template_loader)
-    template = template_env.get_template(str(template_file))
-    return template.render(**kwargs)
+    return get_template(template_name, sample_name).render(**kwargs)
+
+
+def precompile_templates() -> None:
+    """Compiles the configured mail templates, so that the first mail isn't delayed by the compilation."""
+    for template_name, sample_name in (
+        (cfg.templates.mail_item_notification, SAMPLE_ITEM_NOTIFICATION),
+        (cfg.templates.mail_welcome, SAMPLE_WELCOME),
+        (cfg.templates.mail_disc_space_warning, SAMPLE_DISC_SPACE_WARN),
+        (cfg.templates.mail_schedule_error, SAMPLE_SCHEDULE_ERROR),
+    ):
+        try:
+            get_template(template_name, sample_name)
+        except (FileNotFoundError, jinja2.TemplateError) as e:
+            log.error(f"Failed to compile mail template {template_name!r}: {e!r}")
+    log.info("Mail templates compiled.")
@@ -5,85 +5,242 @@
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from multiprocessing import Process
+from threading import Event
+from types import TracebackType
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
 
-import dill
 from config import cfg
+from const import MAIL_RETRIES
+from const import MAIL_RETRY_DELAY
+from const import MAIL_TIMEOUT
 from mail import Mail
 from mail import Receiver
 from multilog import log
 
 
-class SendProcess(Process):
-    """Middleman class for serializing closure function send_mail."""
+class MailSession:
+    """A single SMTP session for many mails. Connects with the first mail, reconnects if the server hangs up.
+    If the server can't be reached after all attempts of a mail, the session is `unreachable` and all further mails
+    fail immediately, instead of waiting for the timeouts again. Use as context manager, the connection is closed on
+    exit.
+    """
+
+    def __init__(
+        self,
+        server: str | None = None,
+        port: int | None = None,
+        account: str | None = None,
+        password: str | None = None,
+        starttls: bool = True,
+        force: bool = False,
+        retries: int = MAIL_RETRIES,
+        retry_delay: float = MAIL_RETRY_DELAY,
+        stop: Optional[Event] = None,
+    ) -> None:
+        """Initializes the session, defaults to the mailing config.
+
+        Args:
+            server (str | None, optional): The SMTP server. Defaults to None.
+            port (int | None, optional): The SMTP port. Defaults to None.
+            account (str | None, optional): The account, also the sender. Defaults to None.
+            password (str | None, optional): The password of the account. Defaults to None.
+            starttls (bool, optional): Whether to upgrade the connection with STARTTLS. Defaults to True.
+            force (bool, optional): Send in debug mode, without redirect. Defaults to False.
+            retries (int, optional): Attempts per mail. Defaults to MAIL_RETRIES.
+            retry_delay (float, optional): Seconds before the second attempt, doubled after each failed attempt. \
+                Defaults to MAIL_RETRY_DELAY.
+            stop (Optional[Event], optional): Interrupts the delay between two attempts, no further attempt is made \
+                once it's set. Defaults to None.
+        """
+        self.server = server or cfg.mailing.server
+        self.port = port or cfg.mailing.port
+        self.account = account or cfg.mailing.account
+        self.password = password or cfg.mailing.password
+        self.starttls = starttls
+        self.force = force
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.stop = stop or Event()
+        self.last_error: Optional[str] = None  # of the last mail that couldn't be sent
+        self.unreachable = False  # whether connecting to the server failed, further mails aren't attempted
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def __enter__(self) -> "MailSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether all information to send mails is given."""
+        return bool(self.server and self.port and self.account and self.password)
+
+    def send(self, receiver: Receiver, mail: Mail) -> bool:
+        """Sends the mail, see `send_message`.
+
+        Args:
+            receiver (Receiver): The receiver object.
+            mail (Mail): The mail object.
+
+        Returns:
+            bool: False if sending failed, True if the mail was sent or isn't sent by intention (mailing disabled or \
+                debug mode).
+        """
+        if not self.enabled:
+            log.warning("Mailing is disabled: Missing required information in the config file")
+            return True
+
+        message = prepare_message(receiver, mail, sender=str(self.account), force=self.force)
+        if not message:
+            return True
+        return self.send_message(*message)
+
+    def send_message(self, to_list: List[str], message: str) -> bool:
+        """Sends the message, retries on connection errors and temporary errors of the server (4xx). Fails
+        immediately if the server is `unreachable`.
+
+        Args:
+            to_list (List[str]): All receivers (to, cc and bcc).
+            message (str): The message as string.
+
+        Returns:
+            bool: True if sent.
+        """
+        if self.unreachable:
+            log.error(f"Failed sending mail to {to_list!r}: Mail server is unreachable.")
+            return False
+
+        error: Optional[Exception] = None
+        connect_failed = False
+        for attempt in range(1, self.retries + 1):
+            connect_failed = False
+            try:
+                if self._smtp is None:
+                    connect_failed = True
+                    self._connect()
+                    connect_failed = False
+                assert self._smtp
+                self._smtp.sendmail(str(self.account), to_list, message)
+                log.info(f"Sent mail to {to_list!r}")
+                return True
+            except smtplib.SMTPRecipientsRefused as e:
+                log.error(f"Failed sending mail, all receivers refused: {e!r}")
+                self.last_error = repr(e)
+                return False
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code >= 500:
+                    log.error(f"Failed sending mail to {to_list!r}: {e!r}")
+                    self.last_error = repr(e)
+                    self.close()
+                    return False
+                error = e
+            except OSError as e:  # includes a lost connection (SMTPServerDisconnected)
+                error = e
+                self.close()
+
+            if attempt < self.retries:
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                log.warning(f"Failed sending mail to {to_list!r} ({error!r}), retrying in {delay}s...")
+                if self.stop.wait(delay):
+                    break
+
+        log.error(f"Failed sending mail to {to_list!r} after {attempt} attempts: {error!r}")
+        self.last_error = repr(error)
+        if connect_failed and isinstance(error, OSError) and not self.stop.is_set():
+            log.error(f"Mail server {self.server}:{self.port} is unreachable, further mails of the session fail.")
+            self.unreachable = True
+        return False
+
+    def close(self) -> None:
+        """Closes the connection, if open."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                self._smtp.close()
+            self._smtp = None
+
+    def _connect(self) -> None:
+        smtp = smtplib.SMTP(str(self.server), self.port or 0, timeout=MAIL_TIMEOUT)
+        try:
+            smtp.ehlo("mylowercasehost")
+            if self.starttls:
+                smtp.starttls()
+                smtp.ehlo("mylowercasehost")
+            smtp.login(str(self.account), str(self.password))
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        log.info(f"Connected to mail server {self.server}:{self.port}.")
+
+
+def prepare_message(
+    receiver: Receiver, mail: Mail, sender: str, force: bool = False
+) -> Optional[Tuple[List[str], str]]:
+    """Builds the message, redirects it to the debug receiver in debug mode.
+
+    Args:
+        receiver (Receiver): The receiver object.
+        mail (Mail): The mail object.
+        sender (str): The sender of the mail.
+        force (bool, optional): Send in debug mode, without redirect. Defaults to False.
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._target = dill.dumps(self._target)  # Save the target function as bytes
+    Returns:
+        Optional[Tuple[List[str], str]]: All receivers and the message, None if the mail must not be sent.
+    """
+    to, cc, bcc = receiver.to, receiver.cc or [], receiver.bcc or []
+    if cfg.debug and not force:
+        if cfg.mailing.debug_no_send or not cfg.mailing.debug_receiver:
+            log.warning("Debug-Mode: Mails are not sent.")
+            return None
+        to, cc, bcc = [cfg.mailing.debug_receiver], [], []
+        log.warning(f"Debug-Mode: Redirecting mail to {cfg.mailing.debug_receiver!r}.")
+
+    msg = MIMEMultipart("alternative")
+    msg["From"] = sender
+    msg["Subject"] = f"DEBUG | {mail.subject}" if cfg.debug else mail.subject
+    msg["To"] = ", ".join(to)
+    msg["Cc"] = ", ".join(cc)
+    msg["Bcc"] = ", ".join(bcc)
+    msg.attach(MIMEText(mail.body, "html"))
 
-    def run(self):
-        if self._target:
-            self._target = dill.loads(self._target)  # Unpickle the target function before executing
-            self._target(*self._args, **self._kwargs)  # type: ignore
+    return list(filter(None, to + cc + bcc)), msg.as_string()
 
 
 def send_mail(receiver: Receiver, mail: Mail, force: bool = False) -> None:
-    """Sends email using SMTP.
+    """Queues the mail in the outbox and returns, the mail is sent by the outbox worker. For many mails that must be
+    sent right now use a `MailSession`.
 
     Args:
         receiver (Receiver): The receiver object.
         mail (Mail): The mail object.
+        force (bool, optional): Send in debug mode, without redirect. Defaults to False.
     """
 
     if not (cfg.mailing.server and cfg.mailing.port and cfg.mailing.account and cfg.mailing.password):
         log.warning("Mailing is disabled: Missing required information in the config file")
         return
 
-    if cfg.debug and not force:
-        if cfg.mailing.debug_no_send or not cfg.mailing.debug_receiver:
-            log.warning("Debug-Mode: Mails are not sent.")
-            return
-        receiver.to = [cfg.mailing.debug_receiver]
-        receiver.cc = []
-        receiver.bcc = []
-        log.warning(f"Debug-Mode: Redirecting mail to {cfg.mailing.debug_receiver!r}.")
-
-    if receiver.cc is None:
-        receiver.cc = []
-
-    if receiver.bcc is None:
-        receiver.bcc = []
-
-    to_list = list(filter(None, receiver.to + receiver.cc + receiver.bcc))
-
-    msg = MIMEMultipart("alternative")
-    msg["From"] = cfg.mailing.account
-    msg["Subject"] = f"DEBUG | {mail.subject}" if cfg.debug else mail.subject
-    msg["To"] = ", ".join(receiver.to)
-    msg["Cc"] = ", ".join(receiver.cc)
-    msg["Bcc"] = ", ".join(receiver.bcc)
-    msg.attach(MIMEText(mail.body, "html"))
+    message = prepare_message(receiver, mail, sender=cfg.mailing.account, force=force)
+    if not message:
+        return
 
-    def send():  # TODO: Refactor this.
-        if not (cfg.mailing.server and cfg.mailing.port and cfg.mailing.account and cfg.mailing.password):
-            log.error("Mailing is disabled")
-            return
+    # Late import to prevent circular import error
+    from db.session import SessionLocal
+    from mail.outbox import outbox
 
-        smtp = smtplib.SMTP(cfg.mailing.server, cfg.mailing.port)
-        try:
-            smtp.ehlo("mylowercasehost")
-            smtp.starttls()
-            smtp.ehlo("mylowercasehost")
-            smtp.login(cfg.mailing.account, cfg.mailing.password)
-            smtp.sendmail(cfg.mailing.account, to_list, msg.as_string())
-            log.info(f"Sent mail to {to_list!r}")
-        except Exception as e:
-            log.error(f"Failed sending mail: {e!r}")
-        finally:
-            smtp.quit()
-
-    process = SendProcess(target=send)
-    process.start()
+    with SessionLocal() as db:
+        outbox.enqueue(db, *message)
 
 
 def send_test_mail(receiver_mail: str) -> None:
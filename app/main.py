@@ -6,6 +6,7 @@ GLADOS Backend
 
 import server
 from db import session
+from mail.render import precompile_templates
 from multilog import log
 from schedules.database_schedules import DatabaseSchedules
 from schedules.file_schedules import FileSchedules
@@ -21,6 +22,7 @@ def main() -> None:
     log.info("Application started.")
 
     session.InitDatabase()
+    precompile_templates()
 
     system_schedule = SystemSchedules()
     system_schedule.start()
@@ -3,8 +3,7 @@
 """
 
 from datetime import date
-from datetime import datetime
-from datetime import timedelta
+from time import perf_counter
 
 from config import cfg
 from const import SYSTEM_USER
@@ -64,20 +63,13 @@ class DatabaseSchedules(BaseSchedules):
             log.info(f"Deleted API key #{key.id} ({key.name})")
 
     def _user_time_past_midnight(self) -> None:
-        today = datetime.today()
-        yesterday = today - timedelta(days=1)
+        log.info("Running database schedule: Logging out users of the previous days")
+        time = perf_counter()
 
-        items = crud_user_time.get_logged_in(db=self.db)
-        for user, entry in items:
-            # Set the new login timestamp for today
-            # This is only needed when the user want to be logged in after midnight
-            login_timestamp = today.replace(hour=0, minute=0, second=0, microsecond=0)
-            # Set the logout timestamp for the same day as the login timestamp
-            logout_timestamp = entry.login.replace(hour=23, minute=59, second=59, microsecond=0)
-
-            crud_user_time.logout(db=self.db, db_obj_user=user, timestamp=logout_timestamp)
-
-            # Only log the user back in if they want it and if their last login date was yesterday
-            # This prevents wrong entries after a longer server-downtime
-            if not user.auto_logout and entry.login.date() == yesterday.date():
-                crud_user_time.login(db=self.db, db_obj_user=user, timestamp=login_timestamp)
+        # Users who want to be logged in after midnight are logged in again, if their last login date was yesterday.
+        # This prevents wrong entries after a longer server-downtime.
+        logged_out, logged_in = crud_user_time.rollover(db=self.db, today=date.today())
+        log.info(
+            f"Logged out {logged_out} users and logged in {logged_in} users again "
+            f"in {(perf_counter() - time) * 1000:.1f} ms."
+        )
@@ -4,7 +4,9 @@
 
 import os
 import shutil
+from datetime import date
 from datetime import datetime
+from datetime import timedelta
 from pathlib import Path
 
 from config import cfg
@@ -12,6 +14,7 @@ from const import DB_DEVELOPMENT
 from const import DB_PRODUCTION
 from const import TEMP
 from const import UPLOADS
+from excel.xlsx_export.user_time import UserTimeExcelExport
 from mail.presets import MailPreset
 from multilog import log
 from schedules.base_schedules import BaseSchedules
@@ -31,6 +34,11 @@ class FileSchedules(BaseSchedules):
         self.add(function=self._delete_temp, hour=cfg.schedules.delete_temp_hour)
         self.add(function=self._delete_uploads, hour=cfg.schedules.delete_uploads_hour)
         self.add(function=self._backup_database, hour=cfg.schedules.backup_db_hour)
+        self.add(
+            function=self._export_timesheets,
+            hour=cfg.schedules.timesheet_export_hour,
+            day=cfg.schedules.timesheet_export_day,
+        )
 
         if cfg.debug:
             self._delete_temp()
@@ -79,6 +87,30 @@ class FileSchedules(BaseSchedules):
             log.error(f"Could not create database backup: {e}")
             MailPreset.send_schedule_error("Database Backup", str(e))
 
+    def _export_timesheets(self) -> None:
+        log.info("Running file schedule: Exporting timesheets of the previous month.")
+
+        export_dir = Path(cfg.filesystem.timesheets.path)
+        if not export_dir.exists():
+            log.error(msg := f"Timesheet destination {str(export_dir)!r} does not exist.")
+            MailPreset.send_schedule_error("Timesheet Export", msg)
+            return
+
+        if cfg.filesystem.timesheets.is_mount and not export_dir.is_mount():
+            log.error(msg := f"Timesheet destination {str(export_dir)!r} is not mounted.")
+            MailPreset.send_schedule_error("Timesheet Export", msg)
+            return
+
+        last_of_previous_month = date.today().replace(day=1) - timedelta(days=1)
+        try:
+            path = UserTimeExcelExport(
+                self.db, date_from=last_of_previous_month.replace(day=1), date_to=last_of_previous_month
+            ).save()
+            Files.copy_file(src=path, dst=export_dir)
+        except Exception as e:
+            log.error(f"Could not export timesheets: {e}")
+            MailPreset.send_schedule_error("Timesheet Export", str(e))
+
 
 class Files:
     """File handler (helper for the schedules)."""
@@ -2,9 +2,16 @@
     PWD Crypt module
 """
 
+import hmac
+from hashlib import sha256
+
 from bcrypt import checkpw
 from bcrypt import gensalt
 from bcrypt import hashpw
+from const import SECRET_KEY_PERSISTENT
+
+# identifies the key of a lookup hash, lookup hashes of a previous persistent key don't start with it
+LOOKUP_HASH_PREFIX = f"{sha256(SECRET_KEY_PERSISTENT.encode('utf-8')).hexdigest()[:8]}:"
 
 
 def verify_hash(plain_password: str, hashed_password: str) -> bool:
@@ -20,3 +27,12 @@ def get_hash(password: str) -> str:
     salt = gensalt()
     hashed_password = hashpw(password=pwd_bytes, salt=salt).decode("utf-8")
     return hashed_password
+
+
+def get_lookup_hash(value: str) -> str:
+    """
+    Returns a deterministic hash of the given value (HMAC-SHA256 with the persistent secret key), which can be looked
+    up by a database index. Unlike the salted hash, which has to be verified against every stored hash.
+    """
+    digest = hmac.new(SECRET_KEY_PERSISTENT.encode("utf-8"), value.encode("utf-8"), sha256).hexdigest()
+    return f"{LOOKUP_HASH_PREFIX}{digest}"
@@ -2,20 +2,35 @@
     The fastapi init.
 """
 
+from contextlib import asynccontextmanager
+
 import uvicorn
+from api.middleware import MetricsMiddleware
+from api.middleware import StreamingGZipMiddleware
+from api.responses import FastJSONResponse
 from api.v1.key import api_key
 from api.v1.pat import api_pat
 from api.v1.web import api_web
 from config import cfg
 from const import VERSION
+from crud.user_time import crud_user_time
+from db.session import SessionLocal
 from fastapi.applications import FastAPI
 from fastapi.staticfiles import StaticFiles
+from mail.outbox import outbox
 from multilog import log
 from starlette.middleware.cors import CORSMiddleware
+from tools.pool import solver_pool
+from tools.stock_cut_1d.cache import result_cache
+from utilities.presence import presence
 
 # from starlette.responses import RedirectResponse
 
-web_api = FastAPI(title="GLADOS WEB API", openapi_url="/docs.json" if cfg.debug else None)
+web_api = FastAPI(
+    title="GLADOS WEB API",
+    openapi_url="/docs.json" if cfg.debug else None,
+    default_response_class=FastJSONResponse,
+)
 web_api.include_router(api_web.api_router)
 web_api.add_middleware(
     CORSMiddleware,
@@ -24,8 +39,19 @@ web_api.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if cfg.server.compression.web:
+    web_api.add_middleware(
+        StreamingGZipMiddleware,
+        minimum_size=cfg.server.compression.minimum_size,
+        compresslevel=cfg.server.compression.level,
+    )
+web_api.add_middleware(MetricsMiddleware, api="web")
 
-pat_api = FastAPI(title="GLADOS PAT API", openapi_url="/docs.json" if cfg.debug else None)
+pat_api = FastAPI(
+    title="GLADOS PAT API",
+    openapi_url="/docs.json" if cfg.debug else None,
+    default_response_class=FastJSONResponse,
+)
 pat_api.include_router(api_pat.api_router)
 pat_api.add_middleware(
     CORSMiddleware,
@@ -34,8 +60,19 @@ pat_api.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if cfg.server.compression.pat:
+    pat_api.add_middleware(
+        StreamingGZipMiddleware,
+        minimum_size=cfg.server.compression.minimum_size,
+        compresslevel=cfg.server.compression.level,
+    )
+pat_api.add_middleware(MetricsMiddleware, api="pat")
 
-key_api = FastAPI(title="GLADOS KEY API", openapi_url="/docs.json" if cfg.debug else None)
+key_api = FastAPI(
+    title="GLADOS KEY API",
+    openapi_url="/docs.json" if cfg.debug else None,
+    default_response_class=FastJSONResponse,
+)
 key_api.include_router(api_key.api_router)
 key_api.add_middleware(
     CORSMiddleware,
@@ -44,6 +81,13 @@ key_api.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if cfg.server.compression.key:
+    key_api.add_middleware(
+        StreamingGZipMiddleware,
+        minimum_size=cfg.server.compression.minimum_size,
+        compresslevel=cfg.server.compression.level,
+    )
+key_api.add_middleware(MetricsMiddleware, api="key")
 
 DESC_PROD = "API documentation is not available in production."
 description_debug = f"""
@@ -55,8 +99,24 @@ GLADOS API:
 
 """
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Builds the presence index and starts the mail outbox worker on startup, stops the mail outbox worker and the
+    worker processes of the solver pool on shutdown and writes the access times of the result cache."""
+    with SessionLocal() as db:
+        presence.rebuild(crud_user_time.get_logged_in(db))
+    log.info(f"Presence index built, {len(presence.present())} users are logged in.")
+    outbox.start()
+    yield
+    outbox.stop()
+    solver_pool.shutdown()
+    result_cache.flush()
+
+
 app = FastAPI(
     title="GLADOS",
+    lifespan=lifespan,
     version=VERSION,
     description=DESC_PROD if not cfg.debug else description_debug,
     servers=[
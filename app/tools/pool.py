@@ -0,0 +1,174 @@
+"""
+    Process pool for the CPU-bound solvers of the tools.
+
+    Solvers run in worker processes, so a large job doesn't hold the GIL of the server process. The number of jobs in
+    the pool (running and waiting) is bounded, further jobs are rejected instead of queued.
+
+    A job that waits for a worker is cancelled on timeout or if the client disconnects. A job that is already running
+    can't be interrupted by the executor: the executor is retired, new jobs go to a new executor, and the workers of
+    the retired executor are killed as soon as its other jobs are done. If a worker dies (e.g. it's killed by the OOM
+    killer) the executor is broken for good, it's replaced with the next job.
+"""
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+from const import SOLVER_QUEUE_SIZE
+from const import SOLVER_WORKERS
+from exceptions import SolverCancelledError
+from exceptions import SolverPoolSaturatedError
+from exceptions import SolverTimeoutError
+from multilog import log
+
+# seconds between two checks for a disconnected client
+POLL_INTERVAL = 0.1
+
+
+class SolverPool:
+    """Bounded process pool. The executor is started with the first job."""
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+        self._jobs = 0
+        self._owners: Dict[Future, ProcessPoolExecutor] = {}  # unfinished jobs and their executor
+        self._abandoned: Set[Future] = set()  # running jobs nobody waits for anymore
+        self._retired: Dict[ProcessPoolExecutor, List[BaseProcess]] = {}  # workers to kill when all jobs are abandoned
+
+    @property
+    def jobs(self) -> int:
+        """Number of jobs that are running or waiting for a worker."""
+        return self._jobs
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Submits a job to the pool.
+
+        Raises:
+            SolverPoolSaturatedError: All workers are busy and the queue is full.
+        """
+        with self._lock:
+            if self._jobs >= self.capacity:
+                raise SolverPoolSaturatedError(f"Solver pool is saturated ({self._jobs} jobs).")
+            if self._executor is None:
+                # spawn instead of fork: the server process runs threads, which must not be forked
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+            try:
+                future = self._executor.submit(fn, *args)
+            except BrokenProcessPool:
+                log.warning("Solver pool is broken, a worker died. Restarting the workers.")
+                self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+                future = self._executor.submit(fn, *args)
+            self._owners[future] = self._executor
+            self._jobs += 1
+
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(
+        self,
+        fn: Callable,
+        *args: Any,
+        timeout: float,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> Any:
+        """Runs a job in the pool and returns its result. Exceptions of the job are raised.
+
+        Args:
+            fn (Callable): The function to run, must be picklable.
+            timeout (float): Time limit in seconds, including the time the job waits for a worker.
+            is_disconnected (Optional[Callable[[], Awaitable[bool]]], optional): Returns True if the client is gone,
+                e.g. `Request.is_disconnected`. Defaults to None.
+
+        Raises:
+            SolverPoolSaturatedError: All workers are busy and the queue is full.
+            SolverTimeoutError: The job didn't finish within the time limit.
+            SolverCancelledError: The client disconnected before the job finished.
+        """
+        future = self.submit(fn, *args)
+        waiter = asyncio.wrap_future(future)
+        deadline = monotonic() + timeout
+        try:
+            while not waiter.done():
+                await asyncio.wait({waiter}, timeout=POLL_INTERVAL)
+                if waiter.done():
+                    break
+                if monotonic() > deadline:
+                    raise SolverTimeoutError(f"Solver job exceeded the time limit of {timeout}s.")
+                if is_disconnected is not None and await is_disconnected():
+                    raise SolverCancelledError("Client disconnected, solver job cancelled.")
+            return waiter.result()
+        finally:
+            if not future.cancel() and not future.done():
+                waiter.cancel()  # the outcome of the job isn't of interest anymore
+                self._abandon(future)
+
+    def shutdown(self) -> None:
+        """Stops the workers, waiting jobs are cancelled."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            for processes in self._retired.values():
+                self._kill(processes)
+            self._retired.clear()
+
+    def _abandon(self, future: Future) -> None:
+        """Retires the executor of a running job nobody waits for, its worker is killed as soon as possible."""
+        with self._lock:
+            executor = self._owners.get(future)
+            if executor is None:
+                return
+            self._abandoned.add(future)
+            if executor is self._executor:
+                self._retire(executor)
+                self._executor = None
+            self._reap()
+
+    def _retire(self, executor: ProcessPoolExecutor) -> None:
+        # the executor can't kill its workers, the processes are private and cleared by shutdown
+        self._retired[executor] = list((executor._processes or {}).values())  # type: ignore[attr-defined]
+        executor.shutdown(wait=False)
+
+    def _reap(self) -> None:
+        """Kills the workers of retired executors whose unfinished jobs are all abandoned."""
+        for executor, processes in list(self._retired.items()):
+            jobs = [future for future, owner in self._owners.items() if owner is executor]
+            if all(future in self._abandoned for future in jobs):
+                self._kill(processes)
+                del self._retired[executor]
+                for future in jobs:
+                    self._abandoned.discard(future)
+                    del self._owners[future]
+                    self._jobs -= 1
+
+    @staticmethod
+    def _kill(processes: List[BaseProcess]) -> None:
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            if self._owners.pop(future, None) is not None:
+                self._abandoned.discard(future)
+                self._jobs -= 1
+                self._reap()
+
+
+solver_pool = SolverPool(workers=SOLVER_WORKERS, queue_size=SOLVER_QUEUE_SIZE)
@@ -0,0 +1,60 @@
+"""
+    Stock Cutting 1D: Anytime solver
+
+    Starts from the best fit decreasing solution and improves it until the time limit is reached or the lower bound is
+    met. Every iteration dissolves some random stocks, cuts their pieces from new stocks (best fit decreasing) and runs
+    the local search on the result. Like in simulated annealing at zero temperature, a result with as many stocks as the
+    current solution is accepted as well, so the search can move across solutions of equal length.
+"""
+
+import random
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+from tools.stock_cut_1d.core import Pieces
+from tools.stock_cut_1d.exact import lower_bound
+from tools.stock_cut_1d.heuristics import improve_packing
+from tools.stock_cut_1d.heuristics import pack_BFD
+from tools.stock_cut_1d.models import JobModel
+
+# share of the time limit that is spent on the lower bound
+BOUND_SHARE = 0.25
+# number of local search rounds per iteration
+ROUNDS = 5
+
+
+def solve_anytime(job: JobModel, time_limit: float, seed: int = 0) -> Tuple[List[List[int]], int]:
+    """Solves the job within the time limit.
+
+    Args:
+        job (JobModel): The job to solve.
+        time_limit (float): Time limit in seconds.
+        seed (int, optional): Seed of the random choice of stocks. Defaults to 0.
+
+    Returns:
+        Tuple[List[List[int]], int]: The best found list of lists of cuts and the lower bound of the job.
+    """
+    deadline = perf_counter() + time_limit
+    bound = lower_bound(job, timeout=time_limit * BOUND_SHARE)
+    pieces = Pieces.from_job(job)
+    best = improve_packing(pieces, pack_BFD(pieces), deadline=deadline)
+
+    rng = random.Random(seed)
+    current = best
+    while len(best) > bound and perf_counter() < deadline:
+        candidate = improve_packing(pieces, _perturb(pieces, current, rng), max_rounds=ROUNDS, deadline=deadline)
+        if len(candidate) <= len(current):
+            current = candidate
+        if len(candidate) < len(best):
+            best = candidate
+
+    return pieces.lengths(best), bound
+
+
+def _perturb(pieces: Pieces, stocks: List[List[int]], rng: random.Random) -> List[List[int]]:
+    """Dissolves about a tenth of the stocks (at least two) and cuts their pieces from new stocks."""
+    size = min(len(stocks), max(2, len(stocks) // 10))
+    dissolved = set(rng.sample(range(len(stocks)), size))
+    sub_pieces = Pieces.from_weights(pieces.capacity, pieces.cut_width, (w for i in dissolved for w in stocks[i]))
+    return [stock for i, stock in enumerate(stocks) if i not in dissolved] + pack_BFD(sub_pieces)
@@ -0,0 +1,122 @@
+"""
+    Stock Cutting 1D: Result cache
+
+    Solved jobs are kept in a bounded LRU cache, keyed on the canonical form of the job (see `JobModel.canonical`) and
+    the time limit. If persistence is enabled, the results are also written to a sqlite file, so they survive a restart.
+    The file holds the same number of results as the memory, the least recently used are deleted. A cache hit doesn't
+    write to the file, the access times are kept in memory and written with the next result or on shutdown (`flush`).
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Dict
+from typing import Optional
+
+from config import cfg
+from const import DB_STOCK_CUT_1D_CACHE
+from tools.stock_cut_1d.models import JobModel
+from tools.stock_cut_1d.models import ResultModel
+
+
+class ResultCache:
+    """Thread safe LRU cache for the results of the solver."""
+
+    def __init__(self, size: int, path: Optional[Path] = None) -> None:
+        self.size = size
+        self._results: OrderedDict[str, ResultModel] = OrderedDict()
+        self._lock = Lock()
+        self._accessed: Dict[str, float] = {}  # access times, that aren't written to the file yet
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None and size > 0:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS result (key TEXT PRIMARY KEY, result TEXT NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def key(job: JobModel, time_limit_ms: Optional[int]) -> str:
+        return json.dumps([job.canonical(), time_limit_ms])
+
+    def get(self, job: JobModel, time_limit_ms: Optional[int]) -> Optional[ResultModel]:
+        """Returns the cached result of the job, marked as cached, or None if the job hasn't been solved yet."""
+        if self.size <= 0:
+            return None
+
+        key = self.key(job, time_limit_ms)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            elif self._connection is not None:
+                row = self._connection.execute("SELECT result FROM result WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    result = ResultModel.model_validate_json(row[0])
+                    self._store(key, result)
+            if result is not None and self._connection is not None:
+                self._accessed[key] = time()
+
+        if result is None:
+            return None
+        # the job of the request may list the same sizes in another order
+        return result.model_copy(update={"job": job, "cached": True})
+
+    def put(self, job: JobModel, time_limit_ms: Optional[int], result: ResultModel) -> None:
+        """Caches the result of the job."""
+        if self.size <= 0:
+            return
+
+        key = self.key(job, time_limit_ms)
+        with self._lock:
+            self._store(key, result)
+            if self._connection is not None:
+                self._accessed.pop(key, None)
+                self._write_accessed()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO result (key, result, accessed) VALUES (?, ?, ?)",
+                    (key, result.model_dump_json(), time()),
+                )
+                self._connection.execute(
+                    "DELETE FROM result WHERE key NOT IN (SELECT key FROM result ORDER BY accessed DESC LIMIT ?)",
+                    (self.size,),
+                )
+                self._connection.commit()
+
+    def flush(self) -> None:
+        """Writes the access times of the cached results to the file."""
+        with self._lock:
+            if self._connection is not None and self._accessed:
+                self._write_accessed()
+                self._connection.commit()
+
+    def clear(self) -> None:
+        """Drops all cached results, also the persisted ones."""
+        with self._lock:
+            self._results.clear()
+            self._accessed.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM result")
+                self._connection.commit()
+
+    def _write_accessed(self) -> None:
+        self._connection.executemany(  # type: ignore[union-attr]
+            "UPDATE result SET accessed = ? WHERE key = ?",
+            [(accessed, key) for key, accessed in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _store(self, key: str, result: ResultModel) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.size:
+            self._results.popitem(last=False)
+
+
+result_cache = ResultCache(
+    size=cfg.tools.stock_cut_1d.cache_size,
+    path=DB_STOCK_CUT_1D_CACHE if cfg.tools.stock_cut_1d.cache_persist else None,
+)
@@ -8,5 +8,14 @@ from enum import unique
 
 @unique
 class SolverType(str, Enum):
-    bruteforce = "bruteforce"
+    exact = "exact"
     FFD = "FFD"
+    BFD = "BFD"
+    local_search = "local_search"
+    best_fill = "best_fill"
+
+
+@unique
+class Objective(str, Enum):
+    cost = "cost"
+    waste = "waste"
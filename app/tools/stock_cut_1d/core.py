@@ -0,0 +1,65 @@
+"""
+    Stock Cutting 1D: Core
+
+    The solvers don't work on the pydantic models of the job, but on a compact form of its pieces: The distinct weights
+    (length plus cut width) sorted descending and their quantities, as arrays of C ints. A cut list of 50000 pieces with
+    50 distinct lengths is two arrays of 50 ints, instead of a list of 50000 python ints.
+
+    Stocks are lists of weights, the weights of a stock are the int objects of the weights array, so no int is created
+    per piece. Only the result is converted back to lengths, when the ResultModel is built.
+"""
+
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+from tools.stock_cut_1d.models import JobModel
+
+
+class Pieces:
+    """The pieces of a job: Distinct weights, sorted descending, and their quantities."""
+
+    __slots__ = ("capacity", "cut_width", "weights", "counts")
+
+    def __init__(self, capacity: int, cut_width: int, quantities: Dict[int, int]) -> None:
+        self.capacity = capacity
+        self.cut_width = cut_width
+        weights = sorted(quantities, reverse=True)
+        self.weights = array("i", weights)
+        self.counts = array("i", (quantities[weight] for weight in weights))
+
+    @classmethod
+    def from_job(cls, job: JobModel) -> "Pieces":
+        quantities: Dict[int, int] = {}
+        for item in job.target_sizes:
+            weight = item.length + job.cut_width
+            quantities[weight] = quantities.get(weight, 0) + item.quantity
+        return cls(job.max_length, job.cut_width, quantities)
+
+    @classmethod
+    def from_weights(cls, capacity: int, cut_width: int, weights: Iterable[int]) -> "Pieces":
+        quantities: Dict[int, int] = {}
+        for weight in weights:
+            quantities[weight] = quantities.get(weight, 0) + 1
+        return cls(capacity, cut_width, quantities)
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the weights of all pieces, sorted descending."""
+        for weight, count in zip(self.weights.tolist(), self.counts):
+            for _ in range(count):
+                yield weight
+
+    def lengths(self, stocks: Iterable[Iterable[int]]) -> List[List[int]]:
+        """Converts stocks of weights to stocks of lengths, the form of the result."""
+        cut_width = self.cut_width
+        return [[weight - cut_width for weight in stock] for stock in stocks]
+
+    def weights_of(self, lengths: Iterable[Iterable[int]]) -> List[List[int]]:
+        """Converts stocks of lengths to stocks of weights."""
+        cut_width = self.cut_width
+        return [[length + cut_width for length in stock] for stock in lengths]
@@ -0,0 +1,283 @@
+"""
+    Stock Cutting 1D: Exact solver
+
+    Bin completion branch-and-bound on the multiset of target sizes: Every piece consumes its length plus the cut width
+    of the stock, a stock is a bin with the capacity of max length. Instead of the pieces the solver works on the
+    quantities per distinct length, so identical lengths are never permuted.
+
+    The largest remaining piece is placed into a new stock, which is then completed with every undominated (no other
+    remaining piece fits into the leftover) combination of the remaining pieces, fullest first. A branch is cut off as
+    soon as the lower bound of the remaining pieces exceeds the number of stocks left. States that are proven to
+    require more stocks are memorized, so they are not explored twice.
+
+    The search starts at the linear programming bound of Gilmore and Gomory (solved by column generation), which is
+    equal to the optimum for almost every cut list. Thus the search mostly has to find a packing, not to prove that
+    there's none.
+"""
+
+from math import ceil
+from time import perf_counter
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tools.stock_cut_1d.core import Pieces
+from tools.stock_cut_1d.models import JobModel
+
+Counts = Tuple[int, ...]
+
+_EPSILON = 1e-9
+# nodes of the pricing knapsack between two checks of the deadline
+_DEADLINE_CHECK_NODES = 1024
+
+
+def solve_exact(job: JobModel, timeout: float) -> List[List[int]]:
+    """Solves the job with the least number of stocks.
+    Starting at the lower bound, the number of stocks is increased until a packing exists.
+
+    Args:
+        job (JobModel): The job to solve.
+        timeout (float): Time limit in seconds.
+
+    Raises:
+        TimeoutError: Raised if the optimum couldn't be proven within the time limit.
+
+    Returns:
+        List[List[int]]: The resulting list of lists of cuts.
+    """
+    pieces = Pieces.from_job(job)
+    counts = tuple(pieces.counts)
+    solver = _BinCompletion(
+        weights=pieces.weights.tolist(), capacity=pieces.capacity, deadline=perf_counter() + timeout
+    )
+    stocks = max(solver.lower_bound(counts), solver.lp_bound(counts))
+    while (packing := solver.pack(counts, stocks)) is None:
+        stocks += 1
+    return pieces.lengths([solver.weights[i] for i, n in enumerate(stock) for _ in range(n)] for stock in packing)
+
+
+def lower_bound(job: JobModel, timeout: float = float("inf")) -> int:
+    """
+    Returns the lower bound for the number of stocks of the job: The maximum of the L2 bound of Martello and Toth and
+    the linear programming bound. The linear programming bound is weaker, if it isn't solved within the time limit.
+    """
+    pieces = Pieces.from_job(job)
+    counts = tuple(pieces.counts)
+    solver = _BinCompletion(
+        weights=pieces.weights.tolist(), capacity=pieces.capacity, deadline=perf_counter() + timeout
+    )
+    return max(solver.lower_bound(counts), solver.lp_bound(counts))
+
+
+class _BinCompletion:
+    """Branch-and-bound on the quantities per weight. Weights must be sorted descending."""
+
+    def __init__(self, weights: List[int], capacity: int, deadline: float) -> None:
+        self.weights = weights
+        self.capacity = capacity
+        self.deadline = deadline
+        # maximum number of stocks, for which a state has been proven infeasible
+        self.infeasible: Dict[Counts, int] = {}
+
+    def lower_bound(self, counts: Counts) -> int:
+        """L2 bound of Martello and Toth, which is at least the continuous bound ceil(sum / capacity)."""
+        c = self.capacity
+        total = sum(n * w for n, w in zip(counts, self.weights))
+        bound = -(-total // c)
+        for k in [0] + [w for n, w in zip(counts, self.weights) if n and w <= c // 2]:
+            n_large = s_medium = n_medium = s_small = 0
+            for n, w in zip(counts, self.weights):
+                if not n or w < k:
+                    continue
+                if w > c - k:
+                    n_large += n
+                elif w * 2 > c:
+                    n_medium += n
+                    s_medium += n * w
+                else:
+                    s_small += n * w
+            overflow = s_small - (n_medium * c - s_medium)
+            bound = max(bound, n_large + n_medium + max(0, -(-overflow // c)))
+        return bound
+
+    def lp_bound(self, counts: Counts, max_iterations: int = 500) -> int:
+        """
+        Linear programming bound: The linear relaxation of the cutting stock problem (minimize the number of cutting
+        patterns, so that every quantity is met) is solved with column generation. The bound of Farley is used, so that
+        the result is a valid bound even if the iterations or the time are exhausted before the relaxation is solved.
+        """
+        size = len(counts)
+        # the initial basis consists of the patterns, that cut a single length as often as possible
+        basis_costs = [1.0] * size
+        inverse = [[0.0] * size for _ in range(size)]
+        for i, (n, w) in enumerate(zip(counts, self.weights)):
+            inverse[i][i] = 1.0 / min(n, self.capacity // w)
+
+        bound = 0.0
+        for _ in range(max_iterations):
+            if perf_counter() > self.deadline:
+                break
+            duals = [sum(basis_costs[r] * inverse[r][j] for r in range(size)) for j in range(size)]
+            values = [sum(row[j] * counts[j] for j in range(size)) for row in inverse]
+            objective = sum(c * v for c, v in zip(basis_costs, values))
+
+            negative = next((i for i, d in enumerate(duals) if d < -_EPSILON), None)
+            if negative is not None:
+                # the surplus of this length enters the basis
+                column, cost = [-1 if i == negative else 0 for i in range(size)], 0.0
+            else:
+                try:
+                    price, pattern = self._knapsack(duals, counts, 1.0)
+                except TimeoutError:
+                    # without the best pattern, the bound of this iteration isn't proven
+                    break
+                bound = max(bound, objective / max(1.0, price))
+                if price <= 1.0 + _EPSILON:
+                    break
+                column, cost = list(pattern), 1.0
+
+            direction = [sum(row[j] * column[j] for j in range(size)) for row in inverse]
+            ratios = [(values[r] / direction[r], r) for r in range(size) if direction[r] > _EPSILON]
+            if not ratios:
+                break
+            _, leaving = min(ratios)
+
+            pivot = direction[leaving]
+            inverse[leaving] = [x / pivot for x in inverse[leaving]]
+            for r in range(size):
+                if r != leaving and direction[r]:
+                    factor = direction[r]
+                    inverse[r] = [x - factor * y for x, y in zip(inverse[r], inverse[leaving])]
+            basis_costs[leaving] = cost
+
+        # tolerance for the rounding errors of the simplex
+        return int(ceil(bound - 1e-6))
+
+    def _knapsack(self, values: List[float], counts: Counts, minimum: float) -> Tuple[float, Counts]:
+        """
+        Returns the cutting pattern with the highest total value and its value, if the value exceeds the minimum.
+        Otherwise the minimum and an empty pattern are returned. Branch-and-bound over the lengths, ordered by value
+        per weight, with the bound of the fractional knapsack. Raises a TimeoutError at the deadline.
+        """
+        order = sorted(
+            (i for i, v in enumerate(values) if v > _EPSILON and counts[i]),
+            key=lambda i: values[i] / self.weights[i],
+            reverse=True,
+        )
+        best_value, best_pattern = minimum, tuple(0 for _ in counts)
+        pattern = [0] * len(counts)
+        nodes = 0
+
+        def fractional(k: int, space: int, value: float) -> float:
+            for i in order[k:]:
+                n = min(counts[i], space // self.weights[i])
+                if n < counts[i]:
+                    return (
+                        value
+                        + min(counts[i] - n, (space - n * self.weights[i]) / self.weights[i]) * values[i]
+                        + (n * values[i])
+                    )
+                value += n * values[i]
+                space -= n * self.weights[i]
+            return value
+
+        def search(k: int, space: int, value: float) -> None:
+            nonlocal best_value, best_pattern, nodes
+            nodes += 1
+            if nodes % _DEADLINE_CHECK_NODES == 0 and perf_counter() > self.deadline:
+                raise TimeoutError
+            if value > best_value + _EPSILON:
+                best_value, best_pattern = value, tuple(pattern)
+            if k == len(order) or fractional(k, space, value) <= best_value + _EPSILON:
+                return
+            i = order[k]
+            for n in range(min(counts[i], space // self.weights[i]), -1, -1):
+                pattern[i] = n
+                search(k + 1, space - n * self.weights[i], value + n * values[i])
+            pattern[i] = 0
+
+        search(0, self.capacity, 0.0)
+        return best_value, best_pattern
+
+    def pack(self, counts: Counts, stocks: int) -> Optional[List[Counts]]:
+        """Returns a packing of the counts into the given number of stocks, or None if there's none."""
+        waste = stocks * self.capacity - sum(n * w for n, w in zip(counts, self.weights))
+        return self._pack(counts, stocks, waste)
+
+    def _pack(self, counts: Counts, stocks: int, waste: int) -> Optional[List[Counts]]:
+        """
+        Recursive part of `pack`. The waste is the total leftover, that all stocks together may have.
+        Every completion with a larger leftover is skipped.
+        """
+        if perf_counter() > self.deadline:
+            raise TimeoutError("Exact solver exceeded its time limit")
+        if not any(counts):
+            return []
+        if stocks < self.lower_bound(counts) or self.infeasible.get(counts, -1) >= stocks:
+            return None
+
+        first = next(i for i, n in enumerate(counts) if n)
+        remaining = counts[:first] + (counts[first] - 1,) + counts[first + 1 :]
+        for completion, left in self._completions(remaining, self.capacity - self.weights[first], waste):
+            packing = self._pack(tuple(n - x for n, x in zip(remaining, completion)), stocks - 1, waste - left)
+            if packing is not None:
+                stock = completion[:first] + (completion[first] + 1,) + completion[first + 1 :]
+                return [stock] + packing
+
+        self.infeasible[counts] = stocks
+        return None
+
+    def _completions(self, counts: Counts, space: int, waste: int) -> List[Tuple[Counts, int]]:
+        """
+        Returns all completions of a stock with the given free space and at most the given leftover, fullest first.
+        Only undominated completions are returned: No other remaining piece fits into the leftover, and the pieces
+        can't be grouped into the pieces of a fuller completion.
+        """
+        # total weight of the remaining pieces from the i-th length on
+        totals = [0] * (len(counts) + 1)
+        for i in range(len(counts) - 1, -1, -1):
+            totals[i] = totals[i + 1] + counts[i] * self.weights[i]
+
+        candidates = []
+        for completion, left in self._enumerate(counts, totals, space, waste, 0):
+            if all(w > left for n, x, w in zip(counts, completion, self.weights) if n > x):
+                candidates.append((completion, left))
+        candidates.sort(key=lambda item: item[1])
+
+        completions: List[Tuple[Counts, int]] = []
+        for completion, left in candidates:
+            if not any(self._dominates(other, completion) for other, _ in completions):
+                completions.append((completion, left))
+        return completions
+
+    def _enumerate(
+        self, counts: Counts, totals: List[int], space: int, waste: int, i: int
+    ) -> Iterator[Tuple[Counts, int]]:
+        """Yields every combination of the remaining pieces from the i-th length on, that fits into the space."""
+        if i == len(counts):
+            yield (), space
+            return
+        if space - totals[i] > waste:
+            return
+        weight = self.weights[i]
+        for take in range(min(counts[i], space // weight), -1, -1):
+            for rest, left in self._enumerate(counts, totals, space - take * weight, waste, i + 1):
+                yield (take,) + rest, left
+
+    def _dominates(self, a: Counts, b: Counts) -> bool:
+        """
+        Checks if the pieces of completion `b` can be grouped (first fit decreasing) into the pieces of completion `a`,
+        so that no group is longer than its piece of `a`. Then `b` is never better than `a` (Korf's dominance).
+        """
+        slots = [w for n, w in zip(a, self.weights) for _ in range(n)]
+        for n, w in zip(b, self.weights):
+            for _ in range(n):
+                for j, slot in enumerate(slots):
+                    if slot >= w:
+                        slots[j] = slot - w
+                        break
+                else:
+                    return False
+        return True
@@ -0,0 +1,358 @@
+"""
+    Stock Cutting 1D: Heuristics
+
+    First fit decreasing and best fit decreasing for large cut lists. Every piece consumes its length plus the cut width
+    of the stock, a stock is a bin with the capacity of max length, so a piece also fits if it fills the stock exactly.
+
+    Instead of summing up the open stocks for every piece, the remaining capacities are kept in a max segment tree, which
+    finds the stock for a piece in O(log n):
+    - First fit: The leaves are the stocks, the first leaf with a remaining capacity of at least the weight of the piece
+      is the first stock the piece fits into. Unopened stocks have the full capacity.
+    - Best fit: The leaves are the remaining capacities, a leaf is set as long as at least one stock has this remaining
+      capacity. The first set leaf that is not less than the weight of the piece is the fullest stock it fits into.
+      The tree has a leaf per possible capacity, for a large max length the remaining capacities of the open stocks are
+      kept in a sorted list instead, which grows with the number of stocks.
+"""
+
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
+from functools import lru_cache
+from math import ceil
+from time import perf_counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tools.stock_cut_1d.core import Pieces
+from tools.stock_cut_1d.models import JobModel
+
+# number of least filled stocks, whose pieces are redistributed per round of the local search
+_POOL_STOCKS = 3
+# largest capacity of the best fit tree (a leaf per capacity), larger stocks use a sorted list
+_TREE_MAX_CAPACITY = 1 << 20
+
+
+def solve_FFD(job: JobModel) -> List[List[int]]:
+    """Solves the job using first fit decreasing, O(n log n).
+
+    Args:
+        job (JobModel): The job to solve.
+
+    Returns:
+        List[List[int]]: The resulting list of lists of cuts.
+    """
+    pieces = Pieces.from_job(job)
+    return pieces.lengths(pack_FFD(pieces))
+
+
+def solve_BFD(job: JobModel) -> List[List[int]]:
+    """Solves the job using best fit decreasing, O(n log max_length).
+
+    Args:
+        job (JobModel): The job to solve.
+
+    Returns:
+        List[List[int]]: The resulting list of lists of cuts.
+    """
+    pieces = Pieces.from_job(job)
+    return pieces.lengths(pack_BFD(pieces))
+
+
+def improve(
+    job: JobModel, lengths: List[List[int]], max_rounds: int = 20, deadline: Optional[float] = None
+) -> List[List[int]]:
+    """Local search of a solution, see improve_packing.
+
+    Args:
+        job (JobModel): The job of the solution.
+        lengths (List[List[int]]): The solution to improve.
+        max_rounds (int, optional): The maximum number of rounds. Defaults to 20.
+        deadline (Optional[float], optional): No further round is started after this time (perf_counter). Defaults to
+            None.
+
+    Returns:
+        List[List[int]]: The improved solution, which never has more stocks than the given one.
+    """
+    pieces = Pieces.from_job(job)
+    return pieces.lengths(improve_packing(pieces, pieces.weights_of(lengths), max_rounds, deadline))
+
+
+def pack_FFD(pieces: Pieces) -> List[List[int]]:
+    """First fit decreasing, returns the stocks as lists of weights."""
+    remaining = _MaxTree(len(pieces), pieces.capacity)
+    stocks: List[List[int]] = []
+
+    for weight in pieces:
+        i = remaining.first(weight)
+        if i == len(stocks):
+            stocks.append([])
+        stocks[i].append(weight)
+        remaining.set(i, remaining.get(i) - weight)
+
+    return stocks
+
+
+def pack_BFD(pieces: Pieces) -> List[List[int]]:
+    """Best fit decreasing, returns the stocks as lists of weights."""
+    capacity = pieces.capacity
+    if capacity > _TREE_MAX_CAPACITY:
+        return _pack_BFD_sorted(pieces)
+    # the stocks per remaining capacity are linked lists: the top stock per capacity and the next stock per stock
+    top = array("i", [-1]) * (capacity + 1)
+    below = array("i")
+    # the tree marks the capacities that have at least one stock
+    remaining = _MaxTree(capacity + 1, -1)
+    stocks: List[List[int]] = []
+
+    for weight in pieces:
+        free = remaining.first(weight)
+        if free > capacity:
+            i = len(stocks)
+            stocks.append([])
+            below.append(-1)
+            free = capacity
+        else:
+            i = top[free]
+            top[free] = below[i]
+            if top[free] < 0:
+                remaining.set(free, -1)
+        stocks[i].append(weight)
+
+        free -= weight
+        if top[free] < 0:
+            remaining.set(free, free)
+        below[i] = top[free]
+        top[free] = i
+
+    return stocks
+
+
+def _pack_BFD_sorted(pieces: Pieces) -> List[List[int]]:
+    """Best fit decreasing for a large capacity, the open stocks are sorted by their remaining capacity."""
+    capacity = pieces.capacity
+    # (remaining capacity, stock), the stock index breaks ties
+    free: List[Tuple[int, int]] = []
+    stocks: List[List[int]] = []
+
+    for weight in pieces:
+        k = bisect_left(free, (weight, -1))
+        if k == len(free):
+            i = len(stocks)
+            stocks.append([])
+            remaining = capacity
+        else:
+            remaining, i = free.pop(k)
+        stocks[i].append(weight)
+        if remaining > weight:
+            insort(free, (remaining - weight, i))
+
+    return stocks
+
+
+def improve_packing(
+    pieces: Pieces, stocks: List[List[int]], max_rounds: int = 20, deadline: Optional[float] = None
+) -> List[List[int]]:
+    """Local search after Falkenauer, that moves the free space of the stocks into the least filled stocks.
+
+    In every round the pieces of the least filled stocks are taken out. Every other stock swaps one or two of its pieces
+    for one or two of the taken out pieces, as long as this makes the stock fuller. Then the taken out pieces are cut
+    from new stocks (best fit decreasing). A round is kept, if it saves stocks or if it leaves the stocks more unevenly
+    filled (sum of the squared stock lengths), which makes the least filled stocks easier to empty in the next round.
+
+    The loads of the stocks are kept in an array and the subsets a stock can swap out are computed once per stock. Only
+    the stocks that change in a round are copied.
+
+    Args:
+        pieces (Pieces): The pieces of the solution.
+        stocks (List[List[int]]): The solution to improve, as lists of weights.
+        max_rounds (int, optional): The maximum number of rounds. Defaults to 20.
+        deadline (Optional[float], optional): No further round is started after this time (perf_counter). Defaults to
+            None.
+
+    Returns:
+        List[List[int]]: The improved solution, which never has more stocks than the given one.
+    """
+    capacity = pieces.capacity
+    loads = array("i", (sum(stock) for stock in stocks))
+    bound = ceil(sum(loads) / capacity)
+    evenness = _evenness(loads)
+    # the swaps of a stock are computed once, when it's first refilled
+    swaps: List[Optional[array]] = [None] * len(stocks)
+
+    for _ in range(max_rounds):
+        if len(stocks) <= bound or (deadline is not None and perf_counter() > deadline):
+            break
+        order = sorted(range(len(stocks)), key=loads.__getitem__)
+        pool = _Pool([weight for i in order[:_POOL_STOCKS] for weight in stocks[i]])
+        refilled: Dict[int, List[int]] = {}
+        for i in order[_POOL_STOCKS:]:
+            if not pool.pieces:
+                break
+            if loads[i] < capacity:
+                if swaps[i] is None:
+                    swaps[i] = _swaps(stocks[i])
+                if (stock := _refill_stock(stocks[i], pool, capacity, swaps[i])) is not None:  # type: ignore
+                    refilled[i] = stock
+        new = _best_fit(sorted(pool.pieces, reverse=True), capacity)
+
+        removed = order[:_POOL_STOCKS]
+        new_evenness = (
+            evenness
+            - sum(loads[i] ** 2 for i in removed)
+            + sum(sum(stock) ** 2 - loads[i] ** 2 for i, stock in refilled.items())
+            + _evenness(sum(stock) for stock in new)
+        )
+        if len(new) > len(removed) or (len(new) == len(removed) and new_evenness <= evenness):
+            break
+
+        stocks = [refilled.get(i, stocks[i]) for i in order[_POOL_STOCKS:]] + new
+        swaps = [None if i in refilled else swaps[i] for i in order[_POOL_STOCKS:]] + [None] * len(new)
+        loads = array("i", (loads[i] if i not in refilled else sum(refilled[i]) for i in order[_POOL_STOCKS:]))
+        loads.extend(sum(stock) for stock in new)
+        evenness = new_evenness
+
+    return stocks
+
+
+def _refill_stock(stock: List[int], pool: "_Pool", capacity: int, swaps: array) -> Optional[List[int]]:
+    """Swaps up to two pieces of the stock for up to two pieces of the pool, as long as the stock gets fuller. Returns
+    the fuller stock as new list, or None if no swap makes the stock fuller."""
+    refilled: Optional[List[int]] = None
+    free = capacity - sum(stock)
+    while free and pool.pieces:
+        best: Tuple[int, Tuple[int, ...], Tuple[int, ...]] = (0, (), ())
+        subsets = _subsets(len(stock))
+        for k in range(0, len(swaps), 2):
+            total_out = swaps[k]
+            total_in, into = pool.best(total_out + free)
+            if total_in - total_out > best[0]:
+                best = (total_in - total_out, subsets[swaps[k + 1]], into)
+        gain, out, into = best
+        if not gain:
+            break
+
+        if refilled is None:
+            stock = refilled = list(stock)
+        taken = pool.take(into)
+        pool.put([stock.pop(i) for i in sorted(out, reverse=True)])
+        stock.extend(taken)
+        free -= gain
+        swaps = _swaps(stock)
+    return refilled
+
+
+def _swaps(stock: List[int]) -> array:
+    """Returns the totals of the subsets of up to two pieces of the stock, one subset per total. Every total is followed
+    by the index of its subset in _subsets."""
+    totals = set()
+    swaps = array("i")
+    for k, out in enumerate(_subsets(len(stock))):
+        total = sum(stock[i] for i in out)
+        if total not in totals:
+            totals.add(total)
+            swaps.extend((total, k))
+    return swaps
+
+
+@lru_cache(maxsize=None)
+def _subsets(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Returns all subsets of up to two indices, including the empty one."""
+    return ((),) + tuple((i,) for i in range(size)) + tuple((i, j) for i in range(size) for j in range(i + 1, size))
+
+
+def _best_fit(weights: List[int], capacity: int) -> List[List[int]]:
+    """Best fit for a few pieces, without a tree."""
+    stocks: List[List[int]] = []
+    free: List[int] = []
+    for weight in weights:
+        fitting = [i for i in range(len(stocks)) if free[i] >= weight]
+        if fitting:
+            i = min(fitting, key=lambda i: free[i])
+        else:
+            i = len(stocks)
+            stocks.append([])
+            free.append(capacity)
+        stocks[i].append(weight)
+        free[i] -= weight
+    return stocks
+
+
+def _evenness(loads: Iterable[int]) -> int:
+    return sum(load**2 for load in loads)
+
+
+class _Pool:
+    """The taken out pieces of the local search, with the totals of all combinations of up to two pieces."""
+
+    def __init__(self, pieces: List[int]) -> None:
+        self.pieces = pieces
+        self._totals: List[int] = []
+        self._combinations: Dict[int, Tuple[int, ...]] = {}
+        self._update()
+
+    def best(self, limit: int) -> Tuple[int, Tuple[int, ...]]:
+        """Returns the largest total of up to two pieces, that doesn't exceed the limit, and the indices of the pieces."""
+        k = bisect_right(self._totals, limit) - 1
+        if k < 0:
+            return 0, ()
+        return self._totals[k], self._combinations[self._totals[k]]
+
+    def take(self, indices: Tuple[int, ...]) -> List[int]:
+        taken = [self.pieces[i] for i in indices]
+        for i in sorted(indices, reverse=True):
+            self.pieces.pop(i)
+        self._update()
+        return taken
+
+    def put(self, pieces: List[int]) -> None:
+        self.pieces.extend(pieces)
+        self._update()
+
+    def _update(self) -> None:
+        # one combination per total is enough
+        self._combinations = {p: (i,) for i, p in enumerate(self.pieces)}
+        for i in range(len(self.pieces)):
+            for j in range(i + 1, len(self.pieces)):
+                self._combinations.setdefault(self.pieces[i] + self.pieces[j], (i, j))
+        self._totals = sorted(self._combinations)
+
+
+class _MaxTree:
+    """Segment tree over a fixed number of values, that finds the first value not less than a given one."""
+
+    def __init__(self, size: int, value: int) -> None:
+        self.size = 1
+        while self.size < size:
+            self.size *= 2
+        self.tree = array("i", [value]) * (2 * self.size)
+
+    def get(self, i: int) -> int:
+        return self.tree[self.size + i]
+
+    def set(self, i: int, value: int) -> None:
+        tree = self.tree
+        i += self.size
+        tree[i] = value
+        i //= 2
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            value = left if left > right else right
+            if tree[i] == value:
+                # the maxima above don't change either
+                return
+            tree[i] = value
+            i //= 2
+
+    def first(self, value: int) -> int:
+        """Returns the index of the first value not less than the given one, or the size if there's none."""
+        tree = self.tree
+        if tree[1] < value:
+            return self.size
+        i = 1
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= value else 2 * i + 1
+        return i - self.size
@@ -2,11 +2,15 @@
     Stock Cutting 1D: Model
 """
 
+from typing import Dict
 from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from pydantic import BaseModel
 from pydantic import Field
+from tools.stock_cut_1d.common import Objective
 from tools.stock_cut_1d.common import SolverType
 
 
@@ -53,15 +57,21 @@ class JobModel(BaseModel):
         """
         return sum(item.quantity for item in self.target_sizes)
 
+    def canonical(self) -> Tuple[int, int, Tuple[Tuple[int, int], ...]]:
+        """
+        Canonical form of the job: max length, cut width and the quantities merged by length, sorted descending.
+        Jobs with the same canonical form have the same solution.
+        """
+        quantities: Dict[int, int] = {}
+        for item in self.target_sizes:
+            quantities[item.length] = quantities.get(item.length, 0) + item.quantity
+        return self.max_length, self.cut_width, tuple(sorted(quantities.items(), reverse=True))
+
     def __eq__(self, other):
-        return (
-            self.max_length == other.max_length
-            and self.cut_width == other.cut_width
-            and self.target_sizes == other.target_sizes
-        )
+        return self.canonical() == other.canonical()
 
     def __hash__(self) -> int:
-        return hash((self.max_length, self.cut_width, str(sorted(self.target_sizes))))
+        return hash(self.canonical())
 
 
 class ResultModel(BaseModel):
@@ -69,6 +79,9 @@ class ResultModel(BaseModel):
     solver_type: SolverType = Field(...)
     time_us: int = Field(..., gt=0)
     lengths: List[List[int]] = Field(default_factory=list, min_length=1)
+    lower_bound: Optional[int] = Field(default=None, ge=0)
+    gap: Optional[float] = Field(default=None, ge=0)
+    cached: bool = Field(default=False)
 
     def __eq__(self, other):
         return self.job == other.job and self.solver_type == other.solver_type and self.lengths == other.lengths
@@ -85,3 +98,76 @@ class ResultModel(BaseModel):
         self.job.assert_valid()
         if self.solver_type not in SolverType:
             raise ValueError(f"Result has invalid solver type {self.solver_type!r}")
+
+
+class StockModel(BaseModel):
+    length: int = Field(..., gt=0)
+    quantity: Optional[int] = Field(default=None, gt=0)  # None: unlimited
+    cost: Optional[float] = Field(default=None, ge=0)  # None: the length, the cost of a stock is its material
+    remnant: bool = Field(default=False)
+
+    @property
+    def price(self) -> float:
+        return float(self.length) if self.cost is None else self.cost
+
+    def __str__(self):
+        return f"l:{self.length}, n:{self.quantity}, c:{self.price}"
+
+
+class MultiStockJobModel(BaseModel):
+    stocks: List[StockModel] = Field(default_factory=list)
+    cut_width: int = Field(..., ge=0)
+    target_sizes: List[TargetSizeModel] = Field(default_factory=list)
+    objective: Objective = Field(default=Objective.cost)
+    prefer_remnants: bool = Field(default=False)
+
+    def iterate_sizes(self) -> Iterator[int]:
+        """
+        yields all lengths, sorted descending
+        """
+        for item in self.target_sizes:
+            for _ in range(item.quantity):
+                yield item.length
+
+    def assert_valid(self):
+        if self.cut_width < 0:
+            raise ValueError(f"Cut width {self.cut_width!r} is not valid")
+        if len(self.stocks) <= 0:
+            raise ValueError(f"Stocks are not set")
+        if len(self.target_sizes) <= 0:
+            raise ValueError(f"Target sizes are not set")
+        max_length = max(stock.length for stock in self.stocks)
+        if any(item.length > (max_length - self.cut_width) for item in self.target_sizes):
+            raise ValueError(f"Some target sizes are longer than the longest stock")
+
+    def __len__(self) -> int:
+        """
+        Number of target sizes in job
+        """
+        return sum(item.quantity for item in self.target_sizes)
+
+
+class CutStockModel(BaseModel):
+    """A stock of the result: Its length, whether it's a remnant, its cost, the cuts and the leftover."""
+
+    length: int = Field(..., gt=0)
+    remnant: bool = Field(default=False)
+    cost: float = Field(..., ge=0)
+    lengths: List[int] = Field(default_factory=list, min_length=1)
+    waste: int = Field(..., ge=0)
+
+
+class MultiStockResultModel(BaseModel):
+    job: MultiStockJobModel = Field(...)
+    solver_type: SolverType = Field(...)
+    time_us: int = Field(..., gt=0)
+    stocks: List[CutStockModel] = Field(default_factory=list, min_length=1)
+    cost: float = Field(..., ge=0)
+    waste: int = Field(..., ge=0)
+
+    def assert_valid(self):
+        self.job.assert_valid()
+        if self.solver_type not in SolverType:
+            raise ValueError(f"Result has invalid solver type {self.solver_type!r}")
+        if any(sum(stock.lengths) + len(stock.lengths) * self.job.cut_width > stock.length for stock in self.stocks):
+            raise ValueError(f"Some stocks are overfilled")
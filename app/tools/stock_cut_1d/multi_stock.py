@@ -0,0 +1,160 @@
+"""
+    Stock Cutting 1D: Multiple stock lengths
+
+    Cuts the pieces from stocks of different lengths, each with a quantity (or unlimited) and a cost. The solver is a
+    greedy best fill: For every available stock, the fullest pattern of the remaining pieces is found with a bounded
+    subset sum. The stock with the best rate is cut, as often as the pattern, the quantity of the stock and the remaining
+    pieces allow. Cutting a pattern makes no other pattern fuller, so repeating it is the same as choosing it again,
+    without computing the subset sums again.
+
+    A greedy rate can be short sighted, so the greedy runs with every rate (cost per used length, waste per used length,
+    the fullest stock) and the result with the least total cost or waste is kept.
+
+    The subset sums are bitsets (python ints), bit i is set if a total of i can be cut. Adding a length shifts the bitset
+    in quantities of powers of two, so a length of quantity q takes O(log q) operations on a bitset of the stock length.
+    Stocks longer than `_BITSET_MAX_CAPACITY` are scaled down: the lengths are rounded up and the stock length is
+    rounded down, so every pattern still fits, but it may not be the fullest one.
+
+    If remnants are preferred, remnants are cut first, as long as any of the remaining pieces fits into one of them.
+    Finally every stock is swapped for the cheapest available stock its cuts fit into.
+"""
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from tools.stock_cut_1d.common import Objective
+from tools.stock_cut_1d.models import MultiStockJobModel
+from tools.stock_cut_1d.models import StockModel
+
+# largest bitset of the subset sums, longer stocks are scaled down
+_BITSET_MAX_CAPACITY = 1 << 16
+
+# rates of a stock and its used length, the greedy cuts the stock with the lowest rate
+_Rate = Callable[[StockModel, int], float]
+_RATES: List[_Rate] = [
+    lambda stock, used: stock.price / used,
+    lambda stock, used: (stock.length - used) / used,
+    lambda stock, used: -used,
+]
+
+
+def solve_multi_stock(job: MultiStockJobModel) -> List[Tuple[int, List[int]]]:
+    """Solves the job using greedy best fill.
+
+    Args:
+        job (MultiStockJobModel): The job to solve.
+
+    Raises:
+        OverflowError: Raised if the stocks run out before all pieces are cut.
+
+    Returns:
+        List[Tuple[int, List[int]]]: The index of the stock in the job and the cuts, for every used stock.
+    """
+
+    def total(cut: List[Tuple[int, List[int]]]) -> Tuple[float, float]:
+        cost = sum(job.stocks[i].price for i, _ in cut)
+        waste = sum(job.stocks[i].length - sum(pattern) for i, pattern in cut)
+        return (cost, waste) if job.objective == Objective.cost else (waste, cost)
+
+    best = min((_greedy(job, rate) for rate in _RATES), key=total)
+    return [(i, [weight - job.cut_width for weight in pattern]) for i, pattern in best]
+
+
+def _greedy(job: MultiStockJobModel, rate: _Rate) -> List[Tuple[int, List[int]]]:
+    """Greedy best fill with the given rate of a stock, see module docstring. Returns the weights per stock."""
+    quantities: Dict[int, int] = {}
+    for item in job.target_sizes:
+        weight = item.length + job.cut_width
+        quantities[weight] = quantities.get(weight, 0) + item.quantity
+    weights = sorted(quantities, reverse=True)
+    counts = [quantities[weight] for weight in weights]
+    available: List[Optional[int]] = [stock.quantity for stock in job.stocks]
+    cut: List[Tuple[int, List[int]]] = []
+
+    while any(counts):
+        fills: Dict[int, Tuple[int, List[int]]] = {}
+        for i, stock in enumerate(job.stocks):
+            if available[i] != 0:
+                fills[i] = _best_fill(weights, counts, stock.length)
+        candidates = [i for i, (total, _) in fills.items() if total > 0]
+        if not candidates:
+            raise OverflowError("Not enough stock for all target sizes")
+        if job.prefer_remnants and any(job.stocks[i].remnant for i in candidates):
+            candidates = [i for i in candidates if job.stocks[i].remnant]
+
+        i = min(candidates, key=lambda i: (rate(job.stocks[i], fills[i][0]), job.stocks[i].length - fills[i][0]))
+        take = fills[i][1]
+        repeat = min(counts[k] // n for k, n in enumerate(take) if n)
+        if available[i] is not None:
+            repeat = min(repeat, available[i])  # type: ignore
+            available[i] -= repeat  # type: ignore
+        for k, n in enumerate(take):
+            counts[k] -= n * repeat
+        pattern = [weights[k] for k, n in enumerate(take) for _ in range(n)]
+        cut.extend((i, list(pattern)) for _ in range(repeat))
+
+    _downsize(job, cut, available)
+    return cut
+
+
+def _best_fill(weights: List[int], counts: List[int], capacity: int) -> Tuple[int, List[int]]:
+    """Returns the largest total of the weights (in their quantities) that doesn't exceed the capacity, and how many
+    of each weight make up this total. The total is only approximated for a capacity above `_BITSET_MAX_CAPACITY`."""
+    if capacity > _BITSET_MAX_CAPACITY:
+        scale = -(-capacity // _BITSET_MAX_CAPACITY)
+        _, take = _best_fill([-(-weight // scale) for weight in weights], counts, capacity // scale)
+        if not any(take):
+            # rounding may leave no piece that fits, a single piece is better than none
+            fitting = [k for k, weight in enumerate(weights) if counts[k] and weight <= capacity]
+            if fitting:
+                take[max(fitting, key=weights.__getitem__)] = 1
+        return sum(n * weight for n, weight in zip(take, weights)), take
+
+    mask = (1 << (capacity + 1)) - 1
+    stages = [1]
+    for weight, count in zip(weights, counts):
+        reachable = stages[-1]
+        remaining = min(count, capacity // weight)
+        n = 1
+        while remaining > 0:
+            n = min(n, remaining)
+            reachable |= (reachable << (n * weight)) & mask
+            remaining -= n
+            n *= 2
+        stages.append(reachable)
+
+    total = stages[-1].bit_length() - 1
+    take = [0] * len(weights)
+    rest = total
+    for k in reversed(range(len(weights))):
+        n = 0
+        while not (stages[k] >> (rest - n * weights[k])) & 1:
+            n += 1
+        take[k] = n
+        rest -= n * weights[k]
+    return total, take
+
+
+def _downsize(job: MultiStockJobModel, cut: List[Tuple[int, List[int]]], available: List[Optional[int]]) -> None:
+    """Swaps every stock for the cheapest (or shortest) available stock, that its cuts fit into."""
+
+    def value(i: int) -> float:
+        return job.stocks[i].price if job.objective == Objective.cost else job.stocks[i].length
+
+    for n, (i, pattern) in enumerate(cut):
+        used = sum(pattern)
+        fitting = [j for j, stock in enumerate(job.stocks) if available[j] != 0 and stock.length >= used]
+        if job.prefer_remnants and job.stocks[i].remnant:
+            fitting = [j for j in fitting if job.stocks[j].remnant]
+        if not fitting:
+            continue
+        j = min(fitting, key=lambda j: (value(j), job.stocks[j].length))
+        if (value(j), job.stocks[j].length) < (value(i), job.stocks[i].length):
+            if available[i] is not None:
+                available[i] += 1  # type: ignore
+            if available[j] is not None:
+                available[j] -= 1  # type: ignore
+            cut[n] = (j, pattern)
@@ -2,174 +2,123 @@
     Stock Cutting Solver
 """
 
-import copy
-from itertools import permutations
 from time import perf_counter
-from typing import Collection
 from typing import List
-from typing import Tuple
+from typing import Optional
 
+from const import EXACT_SOLVER_TIMEOUT
+from const import LOWER_BOUND_TIMEOUT
 from const import N_MAX
-from const import N_MAX_PRECISE
+from const import N_MAX_EXACT
+from const import N_MAX_MULTI_STOCK
+from tools.stock_cut_1d.anytime import solve_anytime
 from tools.stock_cut_1d.common import SolverType
+from tools.stock_cut_1d.core import Pieces
+from tools.stock_cut_1d.exact import lower_bound
+from tools.stock_cut_1d.exact import solve_exact
+from tools.stock_cut_1d.heuristics import improve_packing
+from tools.stock_cut_1d.heuristics import pack_BFD
+from tools.stock_cut_1d.models import CutStockModel
 from tools.stock_cut_1d.models import JobModel
+from tools.stock_cut_1d.models import MultiStockJobModel
+from tools.stock_cut_1d.models import MultiStockResultModel
 from tools.stock_cut_1d.models import ResultModel
+from tools.stock_cut_1d.multi_stock import solve_multi_stock
 
 
-def distribute(job: JobModel) -> ResultModel:
+def distribute(job: JobModel, time_limit_ms: Optional[int] = None) -> ResultModel:
     """Distributes the job to a suiting solver.
+    Jobs up to N_MAX_EXACT pieces are solved to optimality, if the exact solver finishes within its time limit.
+    Otherwise (and for larger jobs) BFD with a local search pass is used, or the anytime solver, if a time limit is
+    given. With a time limit, the exact solver may use half of it.
 
     Args:
         job (Job): The incoming job
+        time_limit_ms (Optional[int], optional): The time limit in milliseconds. Defaults to None.
 
     Raises:
         OverflowError: Raised when no solver can be used due to a too large job size.
 
     Returns:
-        Result: The result as model.
+        Result: The result as model, with the lower bound and the optimality gap.
     """
     time: float = perf_counter()
 
-    lengths: List[List[int]]
+    lengths: Optional[List[List[int]]] = None
     solver_type: SolverType
+    bound: int
 
-    if len(job) <= N_MAX_PRECISE:
-        lengths = _solve_bruteforce(job)
-        solver_type = SolverType.bruteforce
-    elif len(job) <= N_MAX:
-        lengths = _solve_FFD(job)
-        solver_type = SolverType.FFD
-    else:
+    if len(job) > N_MAX:
         raise OverflowError("Input too large")
 
+    if len(job) <= N_MAX_EXACT:
+        try:
+            timeout = time_limit_ms / 1000 / 2 if time_limit_ms else EXACT_SOLVER_TIMEOUT
+            lengths = solve_exact(job, timeout=timeout)
+            solver_type = SolverType.exact
+            bound = len(lengths)
+        except TimeoutError:
+            pass
+
+    if lengths is None and time_limit_ms:
+        remaining = time_limit_ms / 1000 - (perf_counter() - time)
+        lengths, bound = solve_anytime(job, time_limit=max(0.0, remaining))
+        solver_type = SolverType.local_search
+    elif lengths is None:
+        pieces = Pieces.from_job(job)
+        lengths = pieces.lengths(improve_packing(pieces, pack_BFD(pieces)))
+        solver_type = SolverType.BFD
+        bound = lower_bound(job, timeout=LOWER_BOUND_TIMEOUT)
+
     time_us = int((perf_counter() - time) * 1000 * 1000)
 
-    return ResultModel(job=job, solver_type=solver_type, time_us=time_us, lengths=lengths)
+    return ResultModel(
+        job=job,
+        solver_type=solver_type,
+        time_us=time_us,
+        lengths=lengths,
+        lower_bound=bound,
+        gap=(len(lengths) - bound) / len(lengths),
+    )
 
 
-def _solve_bruteforce(job: JobModel) -> List[List[int]]:
-    """Solves the job using brute force approach.
-    This method is CPU-bound, O(n!).
+def distribute_multi_stock(job: MultiStockJobModel) -> MultiStockResultModel:
+    """Solves a job with stocks of different lengths, quantities and costs, see multi_stock.
 
     Args:
-        job (Job): The job to solve.
+        job (MultiStockJobModel): The incoming job
 
     Raises:
-        OverflowError: Raised if the input is too large for brute force method.
+        OverflowError: Raised when the job is too large or the stocks run out.
 
     Returns:
-        List[List[int]]: The resulting list of lists of cuts.
+        MultiStockResultModel: The result as model, with the total cost and waste.
     """
-    if len(job) > 12:
-        raise OverflowError("Input too large")
+    time: float = perf_counter()
 
-    all_orderings = permutations(job.iterate_sizes())
-    minimal_trimmings = len(job) * job.max_length
-    best_stock: List[List[int]] = []
+    if len(job) > N_MAX_MULTI_STOCK:
+        raise OverflowError("Input too large")
 
-    for combination in all_orderings:
-        stocks, trimmings = _split_combination(
-            combination=combination,  # type: ignore
-            max_length=job.max_length,
-            cut_width=job.cut_width,
+    stocks: List[CutStockModel] = []
+    for i, lengths in solve_multi_stock(job):
+        stock = job.stocks[i]
+        stocks.append(
+            CutStockModel(
+                length=stock.length,
+                remnant=stock.remnant,
+                cost=stock.price,
+                lengths=lengths,
+                waste=stock.length - sum(lengths) - len(lengths) * job.cut_width,
+            )
         )
-        if trimmings < minimal_trimmings:
-            best_stock = stocks
-            minimal_trimmings = trimmings
-
-    return best_stock
-
-
-def _split_combination(combination: Tuple[int], max_length: int, cut_width: int) -> Tuple[List[List[int]], int]:
-    """Collects sizes until length is reached, then starts another stock
-
-    Args:
-        combination (Tuple[int]): The permutation of all sizes.
-        max_length (int): The max stock length
-        cut_width (int): The cut width
-
-    Returns:
-        Tuple: stocks and trimmings (leftovers)
-    """
-    stocks: List[List[int]] = []
-    trimmings = 0
-
-    current_size = 0
-    current_stock: List[int] = []
-    for size in combination:
-        if (current_size + size + cut_width) > max_length:
-            # Begin with the next stock
-            stocks.append(current_stock)
-            trimmings += _get_trimming(max_length, current_stock, cut_width)
-            current_size = 0
-            current_stock: List[int] = []
-
-        current_size += size + cut_width
-        current_stock.append(size)
-
-    # Catch leftover lengths
-    if current_stock:
-        stocks.append(current_stock)
-        trimmings += _get_trimming(max_length, current_stock, cut_width)
-    return stocks, trimmings
-
-
-def _solve_FFD(job: JobModel) -> List[List[int]]:
-    """Solves the problem using ffd.
-
-    Args:
-        job (Job): The job to solve.
 
-    Returns:
-        List[List[int]]: The resulting list of lists of cuts.
-    """
-
-    # TODO: rewrite to use native map instead?
-    mutable_sizes = copy.deepcopy(job.target_sizes)
-    sizes = sorted(mutable_sizes, reverse=True)
-
-    stocks: List[List[int]] = [[]]
-
-    i_target = 0
-
-    while i_target < len(sizes):
-        current_size = sizes[i_target]
-
-        for i, stock in enumerate(stocks):
-            # calculate current stock length
-            stock_length = sum(stock) + (len(stock) - 1) * job.cut_width
-            # step through existing stocks until current size fits
-            if (job.max_length - stock_length) > current_size.length:
-                # add size
-                stock.append(current_size.length)
-                break
-        else:  # nothing fit, opening next bin
-            stocks.append([current_size.length])
-
-        # decrease/get next
-        if current_size.quantity <= 1:
-            i_target += 1
-        else:
-            current_size.quantity -= 1
-
-    return stocks
-
-
-def _get_trimming(max_length: int, lengths: Collection[int], cut_width: int) -> int:
-    """Gets the leftover from the stock.
-
-    Raises:
-        OverflowError: Raised if the leftover is negative
-
-    Returns:
-        int: The leftover value
-    """
-    sum_lengths = sum(lengths)
-    sum_cuts = len(lengths) * cut_width
-
-    trimmings = max_length - (sum_lengths + sum_cuts)
-
-    if trimmings < 0:
-        raise OverflowError
+    time_us = int((perf_counter() - time) * 1000 * 1000)
 
-    return trimmings
+    return MultiStockResultModel(
+        job=job,
+        solver_type=SolverType.best_fill,
+        time_us=time_us,
+        stocks=stocks,
+        cost=sum(stock.cost for stock in stocks),
+        waste=sum(stock.waste for stock in stocks),
+    )
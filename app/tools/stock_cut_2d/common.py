@@ -0,0 +1,12 @@
+"""
+    Stock Cutting 2D: Common
+"""
+
+from enum import Enum
+from enum import unique
+
+
+@unique
+class SolverType(str, Enum):
+    maxrects = "maxrects"
+    guillotine = "guillotine"
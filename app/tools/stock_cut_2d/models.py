@@ -0,0 +1,119 @@
+"""
+    Stock Cutting 2D: Model
+"""
+
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from const import N_MAX_2D
+from pydantic import BaseModel
+from pydantic import Field
+from tools.stock_cut_2d.common import SolverType
+
+
+class TargetSizeModel(BaseModel):
+    width: int = Field(..., gt=0)
+    height: int = Field(..., gt=0)
+    quantity: int = Field(..., gt=0)
+    rotatable: bool = Field(default=True)  # False if the grain of the sheet must run along the width
+
+    def __str__(self):
+        return f"w:{self.width}, h:{self.height}, n:{self.quantity}"
+
+
+class JobModel(BaseModel):
+    sheet_width: int = Field(..., gt=0)
+    sheet_height: int = Field(..., gt=0)
+    cut_width: int = Field(..., ge=0)
+    target_sizes: List[TargetSizeModel] = Field(default_factory=list)
+    guillotine: bool = Field(default=False)  # only layouts that can be cut with edge to edge cuts
+
+    def iterate_sizes(self) -> Iterator[Tuple[int, TargetSizeModel]]:
+        """
+        yields the index of the target size and the target size, once per piece
+        """
+        for i, item in enumerate(self.target_sizes):
+            for _ in range(item.quantity):
+                yield i, item
+
+    def fits(self, item: TargetSizeModel) -> bool:
+        """
+        whether the target size fits onto the sheet, every piece consumes its size plus the cut width
+        """
+        w, h = item.width + self.cut_width, item.height + self.cut_width
+        fits = w <= self.sheet_width and h <= self.sheet_height
+        return fits or (item.rotatable and h <= self.sheet_width and w <= self.sheet_height)
+
+    def assert_valid(self):
+        if self.sheet_width <= 0 or self.sheet_height <= 0:
+            raise ValueError(f"Sheet size {self.sheet_width!r}x{self.sheet_height!r} is not valid")
+        if self.cut_width < 0:
+            raise ValueError(f"Cut width {self.cut_width!r} is not valid")
+        if len(self.target_sizes) <= 0:
+            raise ValueError(f"Target sizes are not set")
+        if not all(self.fits(item) for item in self.target_sizes):
+            raise ValueError(f"Some target sizes are larger than the sheet")
+
+    def __len__(self) -> int:
+        """
+        Number of target sizes in job
+        """
+        return sum(item.quantity for item in self.target_sizes)
+
+
+class PlacementModel(BaseModel):
+    sheet: int = Field(..., ge=0)
+    target: int = Field(..., ge=0)  # index of the target size in the job
+    x: int = Field(..., ge=0)
+    y: int = Field(..., ge=0)
+    width: int = Field(..., gt=0)  # as placed, swapped with the height if rotated
+    height: int = Field(..., gt=0)
+    rotated: bool = Field(default=False)
+
+
+class ResultModel(BaseModel):
+    job: JobModel = Field(...)
+    solver_type: SolverType = Field(...)
+    time_us: int = Field(..., gt=0)
+    sheets: int = Field(..., gt=0)
+    placements: List[PlacementModel] = Field(default_factory=list, min_length=1)
+    lower_bound: int = Field(..., ge=0)
+    gap: float = Field(..., ge=0)
+    utilization: float = Field(..., ge=0, le=1)  # area of the pieces per area of the used sheets
+
+    def assert_valid(self):
+        self.job.assert_valid()
+        if self.solver_type not in SolverType:
+            raise ValueError(f"Result has invalid solver type {self.solver_type!r}")
+        # the result may come from the client, it must not render more pieces or sheets than the solver would
+        if len(self.job) > N_MAX_2D:
+            raise ValueError(f"Result has more than {N_MAX_2D} pieces")
+        if len(self.placements) != len(self.job):
+            raise ValueError(f"Result doesn't place every piece exactly once")
+        used_sheets = max(p.sheet for p in self.placements) + 1
+        if self.sheets != used_sheets:
+            raise ValueError(f"Result has {self.sheets!r} sheets, but places pieces on {used_sheets!r}")
+        counts = [0] * len(self.job.target_sizes)
+        for p in self.placements:
+            if p.sheet >= self.sheets or p.target >= len(counts):
+                raise ValueError(f"Placement {p!r} refers to an unknown sheet or target size")
+            item = self.job.target_sizes[p.target]
+            size = (item.height, item.width) if p.rotated else (item.width, item.height)
+            if (p.width, p.height) != size or (p.rotated and not item.rotatable):
+                raise ValueError(f"Placement {p!r} doesn't match its target size")
+            if p.x + p.width > self.job.sheet_width or p.y + p.height > self.job.sheet_height:
+                raise ValueError(f"Placement {p!r} exceeds the sheet")
+            counts[p.target] += 1
+        if counts != [item.quantity for item in self.job.target_sizes]:
+            raise ValueError(f"Result doesn't place every piece exactly once")
+
+        # sweep per sheet along x: only the placements that start before the end of a placement can overlap it
+        k = self.job.cut_width
+        placements = sorted(self.placements, key=lambda p: (p.sheet, p.x))
+        for i, a in enumerate(placements):
+            for b in placements[i + 1 :]:
+                if b.sheet != a.sheet or b.x >= a.x + a.width + k:
+                    break
+                if a.y < b.y + b.height + k and b.y < a.y + a.height + k:
+                    raise ValueError(f"Placements {a!r} and {b!r} overlap")
@@ -0,0 +1,177 @@
+"""
+    Stock Cutting 2D: Packer
+
+    Places rectangular pieces onto sheets, piece by piece in the given order. Every piece consumes its size plus the cut
+    width in both directions, the sheet itself keeps its size (the kerf of the last cut falls off the edge).
+
+    MaxRects keeps all maximal free rectangles of a sheet, they overlap. A placed piece splits every free rectangle it
+    intersects, free rectangles contained in others are pruned. The layout isn't guaranteed to be guillotine cuttable.
+
+    Guillotine keeps disjoint free rectangles. A placed piece splits its free rectangle into two along the shorter
+    leftover axis, so every layout can be cut with edge to edge cuts.
+"""
+
+from abc import ABC
+from abc import abstractmethod
+from enum import Enum
+from enum import unique
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+
+@unique
+class Rule(str, Enum):
+    best_short_side_fit = "BSSF"
+    best_area_fit = "BAF"
+    bottom_left = "BL"
+
+
+class Piece(NamedTuple):
+    target: int  # index of the target size in the job
+    width: int
+    height: int
+    rotatable: bool
+
+
+class Placed(NamedTuple):
+    target: int
+    x: int
+    y: int
+    width: int  # as placed, swapped with the height if rotated
+    height: int
+    rotated: bool
+
+
+# free rectangle: x, y, width, height
+_Rect = Tuple[int, int, int, int]
+# position of a piece: score (lower is better), x, y, rotated
+_Fit = Tuple[Tuple[int, int], int, int, bool]
+
+
+def _score(rule: Rule, free: _Rect, w: int, h: int) -> Tuple[int, int]:
+    x, y, fw, fh = free
+    short, long = sorted((fw - w, fh - h))
+    if rule == Rule.best_short_side_fit:
+        return short, long
+    if rule == Rule.best_area_fit:
+        return fw * fh - w * h, short
+    return y + h, x
+
+
+class _Sheet(ABC):
+    """A sheet with its free rectangles, the pieces are inflated by the cut width."""
+
+    def __init__(self, width: int, height: int, rule: Rule) -> None:
+        self.free: List[_Rect] = [(0, 0, width, height)]
+        self.placed: List[Placed] = []
+        self.rule = rule
+
+    def find(self, w: int, h: int, rotatable: bool) -> Optional[_Fit]:
+        """Returns the best position of the inflated piece, or None if it doesn't fit."""
+        best: Optional[_Fit] = None
+        for free in self.free:
+            for pw, ph, rotated in ((w, h, False), (h, w, True)) if rotatable and w != h else ((w, h, False),):
+                if pw <= free[2] and ph <= free[3]:
+                    score = _score(self.rule, free, pw, ph)
+                    if best is None or score < best[0]:
+                        best = (score, free[0], free[1], rotated)
+        return best
+
+    @abstractmethod
+    def place(self, rect: _Rect) -> None:
+        """Places the inflated piece at the position of `find`, and updates the free rectangles."""
+
+
+class _MaxRectsSheet(_Sheet):
+    def place(self, rect: _Rect) -> None:
+        x, y, w, h = rect
+        split: List[_Rect] = []
+        for free in self.free:
+            fx, fy, fw, fh = free
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                split.append(free)
+                continue
+            if x > fx:
+                split.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                split.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                split.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                split.append((fx, y + h, fw, fy + fh - y - h))
+        self.free = _prune(split)
+
+
+class _GuillotineSheet(_Sheet):
+    def place(self, rect: _Rect) -> None:
+        x, y, w, h = rect
+        i = next(
+            i for i, free in enumerate(self.free) if free[0] == x and free[1] == y and w <= free[2] and h <= free[3]
+        )
+        _, _, fw, fh = self.free.pop(i)
+        if fw - w <= fh - h:
+            # horizontal cut through the full width of the free rectangle
+            parts = ((x + w, y, fw - w, h), (x, y + h, fw, fh - h))
+        else:
+            # vertical cut through the full height of the free rectangle
+            parts = ((x + w, y, fw - w, fh), (x, y + h, w, fh - h))
+        self.free.extend(part for part in parts if part[2] > 0 and part[3] > 0)
+
+
+def _prune(rects: List[_Rect]) -> List[_Rect]:
+    """Removes duplicates and rectangles that are contained in another one."""
+    rects = sorted(set(rects), key=lambda r: r[2] * r[3], reverse=True)
+    kept: List[_Rect] = []
+    for r in rects:
+        x, y, w, h = r
+        if not any(k[0] <= x and k[1] <= y and x + w <= k[0] + k[2] and y + h <= k[1] + k[3] for k in kept):
+            kept.append(r)
+    return kept
+
+
+def pack(
+    pieces: Sequence[Piece], width: int, height: int, cut_width: int, rule: Rule, guillotine: bool
+) -> List[List[Placed]]:
+    """Places the pieces in the given order, each onto the first sheet it fits on, at the best position of the rule.
+
+    Args:
+        pieces (Sequence[Piece]): The pieces, in the order of placement. Every piece must fit onto an empty sheet.
+        width (int): The width of the sheets
+        height (int): The height of the sheets
+        cut_width (int): The cut width
+        rule (Rule): The rule to choose the position on a sheet
+        guillotine (bool): Whether the layout must be guillotine cuttable
+
+    Returns:
+        List[List[Placed]]: The pieces placed on each sheet.
+    """
+    cls = _GuillotineSheet if guillotine else _MaxRectsSheet
+    sheets: List[_Sheet] = []
+
+    for piece in pieces:
+        w, h = piece.width + cut_width, piece.height + cut_width
+        for sheet in sheets:
+            fit = sheet.find(w, h, piece.rotatable)
+            if fit is not None:
+                break
+        else:
+            sheet = cls(width, height, rule)
+            sheets.append(sheet)
+            fit = sheet.find(w, h, piece.rotatable)
+            if fit is None:
+                raise ValueError(f"Piece {piece!r} doesn't fit onto the sheet")
+
+        _, x, y, rotated = fit
+        pw, ph = (piece.height, piece.width) if rotated else (piece.width, piece.height)
+        sheet.place((x, y, pw + cut_width, ph + cut_width))
+        sheet.placed.append(Placed(piece.target, x, y, pw, ph, rotated))
+
+    return [sheet.placed for sheet in sheets]
+
+
+def used_area(sheet: Sequence[Placed], cut_width: int) -> int:
+    """The area of the sheet consumed by its pieces, including the cut width."""
+    return sum((p.width + cut_width) * (p.height + cut_width) for p in sheet)
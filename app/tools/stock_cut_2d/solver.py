@@ -0,0 +1,123 @@
+"""
+    Stock Cutting 2D Solver
+"""
+
+from itertools import product
+from math import ceil
+from random import Random
+from time import perf_counter
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from const import N_MAX_2D
+from const import PACK_TIME_LIMIT_2D
+from tools.stock_cut_2d.common import SolverType
+from tools.stock_cut_2d.models import JobModel
+from tools.stock_cut_2d.models import PlacementModel
+from tools.stock_cut_2d.models import ResultModel
+from tools.stock_cut_2d.packer import Piece
+from tools.stock_cut_2d.packer import Placed
+from tools.stock_cut_2d.packer import Rule
+from tools.stock_cut_2d.packer import pack
+from tools.stock_cut_2d.packer import used_area
+
+# sort keys of the deterministic passes, all descending
+ORDERINGS: Tuple[Callable[[Piece], Tuple[int, ...]], ...] = (
+    lambda p: (p.width * p.height, max(p.width, p.height)),
+    lambda p: (max(p.width, p.height), min(p.width, p.height)),
+    lambda p: (p.width + p.height, max(p.width, p.height)),
+    lambda p: (p.width, p.height),
+    lambda p: (p.height, p.width),
+)
+RULES = {
+    SolverType.maxrects: (Rule.best_short_side_fit, Rule.best_area_fit, Rule.bottom_left),
+    SolverType.guillotine: (Rule.best_area_fit, Rule.best_short_side_fit),
+}
+
+
+def distribute(job: JobModel, time_limit_ms: Optional[int] = None) -> ResultModel:
+    """Packs the pieces of the job onto as few sheets as possible.
+    Every ordering of the pieces is packed with every rule of the solver type, until `PACK_TIME_LIMIT_2D` or the time
+    limit is up. With a time limit, the best ordering is improved by swapping random pairs of pieces until the time is up
+    or the lower bound is reached. A pass is only started if it's expected to end in time, like the one before.
+
+    Args:
+        job (JobModel): The incoming job
+        time_limit_ms (Optional[int], optional): The time limit in milliseconds. Defaults to None.
+
+    Raises:
+        OverflowError: Raised when the job is too large.
+
+    Returns:
+        ResultModel: The result as model, with the lower bound and the optimality gap.
+    """
+    time: float = perf_counter()
+    deadline = time + time_limit_ms / 1000 if time_limit_ms else None
+
+    if len(job) > N_MAX_2D:
+        raise OverflowError("Input too large")
+
+    solver_type = SolverType.guillotine if job.guillotine else SolverType.maxrects
+    pieces = [Piece(i, item.width, item.height, item.rotatable) for i, item in job.iterate_sizes()]
+    inflated = sum((p.width + job.cut_width) * (p.height + job.cut_width) for p in pieces)
+    bound = ceil(inflated / (job.sheet_width * job.sheet_height))
+
+    passes_deadline = min(deadline or float("inf"), time + PACK_TIME_LIMIT_2D)
+    best: Optional[Tuple[Tuple[int, int], List[List[Placed]], List[Piece], Rule]] = None
+    duration = 0.0
+    for ordering, rule in product(ORDERINGS, RULES[solver_type]):
+        if best is not None and perf_counter() + duration > passes_deadline:
+            break
+        start = perf_counter()
+        ordered = sorted(pieces, key=ordering, reverse=True)
+        sheets = _pack(job, ordered, rule)
+        score = _score(job, sheets)
+        if best is None or score < best[0]:
+            best = (score, sheets, ordered, rule)
+        duration = perf_counter() - start
+    assert best is not None
+
+    random = Random(0)
+    score, sheets, ordered, rule = best
+    while deadline and len(sheets) > bound and len(ordered) > 1 and perf_counter() + duration < deadline:
+        start = perf_counter()
+        i, j = random.sample(range(len(ordered)), 2)
+        candidate = list(ordered)
+        candidate[i], candidate[j] = candidate[j], candidate[i]
+        candidate_sheets = _pack(job, candidate, rule)
+        candidate_score = _score(job, candidate_sheets)
+        if candidate_score <= score:
+            score, sheets, ordered = candidate_score, candidate_sheets, candidate
+        duration = perf_counter() - start
+
+    time_us = int((perf_counter() - time) * 1000 * 1000)
+
+    placements = [
+        PlacementModel(sheet=s, target=p.target, x=p.x, y=p.y, width=p.width, height=p.height, rotated=p.rotated)
+        for s, sheet in enumerate(sheets)
+        for p in sheet
+    ]
+    area = sum(p.width * p.height for p in pieces)
+
+    return ResultModel(
+        job=job,
+        solver_type=solver_type,
+        time_us=time_us,
+        sheets=len(sheets),
+        placements=placements,
+        lower_bound=bound,
+        gap=(len(sheets) - bound) / len(sheets),
+        utilization=area / (len(sheets) * job.sheet_width * job.sheet_height),
+    )
+
+
+def _pack(job: JobModel, pieces: Sequence[Piece], rule: Rule) -> List[List[Placed]]:
+    return pack(pieces, job.sheet_width, job.sheet_height, job.cut_width, rule, job.guillotine)
+
+
+def _score(job: JobModel, sheets: List[List[Placed]]) -> Tuple[int, int]:
+    """Fewer sheets first, then less area on the last sheet: the sheets before are filled better."""
+    return len(sheets), used_area(sheets[-1], job.cut_width)
@@ -0,0 +1,46 @@
+"""
+    Stock Cutting 2D: SVG
+
+    Renders the layout of a result as svg, the sheets are stacked vertically in the units of the job. Every piece is
+    labeled with its size and the index of its target size.
+"""
+
+from typing import List
+from xml.sax.saxutils import escape
+
+from tools.stock_cut_2d.models import ResultModel
+
+# space between two sheets, relative to the sheet height
+SHEET_GAP = 0.05
+SHEET_STYLE = 'fill="#e6e6e6" stroke="#333333"'
+PIECE_STYLE = 'fill="#9fc5e8" stroke="#1c4587"'
+
+
+def render_svg(result: ResultModel) -> str:
+    """Returns the layout of the result as svg document."""
+    width, height = result.job.sheet_width, result.job.sheet_height
+    gap = max(1, round(height * SHEET_GAP))
+    total = result.sheets * height + (result.sheets - 1) * gap
+    stroke = max(1, round(min(width, height) / 500))
+    font = max(1, round(min(width, height) / 40))
+
+    lines: List[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {total}" width="{width}" height="{total}" '
+        f'stroke-width="{stroke}" font-family="sans-serif" font-size="{font}">'
+    ]
+    for sheet in range(result.sheets):
+        lines.append(f'<rect x="0" y="{sheet * (height + gap)}" width="{width}" height="{height}" {SHEET_STYLE}/>')
+
+    for p in result.placements:
+        y = p.sheet * (height + gap) + p.y
+        item = result.job.target_sizes[p.target]
+        label = escape(f"{item.width} × {item.height} #{p.target}")
+        lines.append(f'<g><title>{label}{" (rotated)" if p.rotated else ""}</title>')
+        lines.append(f'<rect x="{p.x}" y="{y}" width="{p.width}" height="{p.height}" {PIECE_STYLE}/>')
+        lines.append(
+            f'<text x="{p.x + p.width / 2:g}" y="{y + p.height / 2:g}" text-anchor="middle" '
+            f'dominant-baseline="middle" stroke="none">{label}</text></g>'
+        )
+
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
@@ -1,29 +1,271 @@
 """
     API worker.
+
+    Log files are read in pages from a byte offset, a client continues with the `next_offset` of a page. Lines
+    without a level (e.g. a traceback) belong to the line before. The offsets of gzip compressed (rotated) log files
+    are the offsets in the uncompressed content.
 """
 
+import asyncio
+import gzip
 import os
+from collections import deque
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
+from const import LOG_FOLLOW_KEEP_ALIVE
+from const import LOG_FOLLOW_POLL_INTERVAL
+from const import LOG_SCAN_MAX_BYTES
+from const import LOG_TAIL_WINDOW
 from const import LOGS
 from multilog import log
 
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@dataclass
+class LogFilter:
+    """Keeps the lines of the given minimum level that contain the search string (case insensitive)."""
+
+    level: Optional[str] = None
+    search: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self._min_level = LOG_LEVELS.index(self.level.upper()) if self.level else 0
+        self._search = self.search.lower() if self.search else None
+        self._level_ok = True  # of the last line with a level
+        self.active = bool(self._min_level or self._search)
+
+    def __call__(self, line: str) -> bool:
+        fields = line.split("\t", 3)  # asctime, name, levelname, message
+        if len(fields) == 4 and fields[2] in LOG_LEVELS:
+            self._level_ok = LOG_LEVELS.index(fields[2]) >= self._min_level
+        return self._level_ok and (self._search is None or self._search in line.lower())
+
 
 def gather_logs() -> list:
     """Returns a list of all log files from the log-folder."""
     return os.listdir(LOGS)
 
 
+def get_logfile_path(filename: str) -> Optional[Path]:
+    """Returns the path of the log file inside the logs-folder, None if there's no such file."""
+    path = Path(LOGS, filename)
+    if path.resolve().parent != Path(LOGS).resolve() or not path.is_file():
+        log.warning(f"Could not fetch log file {filename!r}: File does not exist.")
+        return None
+    return path
+
+
+def open_logfile(path: Path) -> IO[bytes]:
+    """Opens the log file for reading bytes, decompresses gzip files."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
 def read_logfile(filename: str) -> Optional[list]:
     """
     Returns the content of a given logfile inside the logs-folder.
     Returns None is the file does not exists.
     """
+    path = get_logfile_path(filename)
+    if path is None:
+        return None
+    with open_logfile(path) as log_file:
+        return [line.decode("utf-8", errors="replace").strip() for line in log_file]
+
+
+def read_logfile_page(
+    filename: str, offset: int = 0, limit: int = 1000, level: Optional[str] = None, search: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Returns the lines of the log file from the byte offset on.
+
+    Args:
+        filename (str): The log file inside the logs-folder.
+        offset (int, optional): The byte offset to start from, moved to the start of the next line if it's inside a \
+            line. Defaults to 0.
+        limit (int, optional): The maximum number of lines. Defaults to 1000.
+        level (Optional[str], optional): The minimum level of the lines. Defaults to None.
+        search (Optional[str], optional): The substring the lines must contain. Defaults to None.
+
+    Returns:
+        Optional[Dict[str, Any]]: The lines, the offset of the first line, the offset after the last scanned line and \
+            whether the end of the file is reached, see `LogPageSchema`. None if the file doesn't exist.
+    """
+    path = get_logfile_path(filename)
+    if path is None:
+        return None
+
+    with open_logfile(path) as log_file:
+        if offset > 0:
+            log_file.seek(offset - 1)
+            if log_file.read(1) != b"\n":
+                offset += len(log_file.readline())
+
+        entries: List[Tuple[int, str]] = []
+        position = offset
+        for line_offset, line, matches in _lines(log_file, offset, LogFilter(level, search), LOG_SCAN_MAX_BYTES):
+            position = line_offset + len(line)
+            if matches:
+                entries.append((line_offset, _decode(line)))
+                if len(entries) >= limit:
+                    break
+        eof = not log_file.read(1)
+
+    return {
+        "lines": [line for _, line in entries],
+        "offset": entries[0][0] if entries else position,
+        "next_offset": position,
+        "eof": eof,
+    }
+
+
+def read_logfile_tail(
+    filename: str, lines: int, level: Optional[str] = None, search: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Returns the last lines of the log file. Plain files are read backwards from the end in a growing window, until
+    enough lines match or `LOG_SCAN_MAX_BYTES` are read. Compressed files are read from the start.
+
+    Args:
+        filename (str): The log file inside the logs-folder.
+        lines (int): The number of lines.
+        level (Optional[str], optional): The minimum level of the lines. Defaults to None.
+        search (Optional[str], optional): The substring the lines must contain. Defaults to None.
+
+    Returns:
+        Optional[Dict[str, Any]]: The lines, see `read_logfile_page`. None if the file doesn't exist.
+    """
+    path = get_logfile_path(filename)
+    if path is None:
+        return None
+
+    entries: Deque[Tuple[int, bytes]] = deque(maxlen=lines)
+    position = 0
+    if path.suffix == ".gz":
+        with open_logfile(path) as log_file:
+            for line_offset, line, matches in _lines(log_file, 0, LogFilter(level, search)):
+                position = line_offset + len(line)
+                if matches:
+                    entries.append((line_offset, line))
+    else:
+        size = path.stat().st_size
+        window = LOG_TAIL_WINDOW
+        with open_logfile(path) as log_file:
+            while True:
+                start = max(0, size - window)
+                log_file.seek(start)
+                data = log_file.read(size - start)
+                if start > 0:  # the window starts inside a line
+                    cut = data.find(b"\n") + 1 or len(data)
+                    data, start = data[cut:], start + cut
+                data = data[: data.rfind(b"\n") + 1]  # the last line may not be written completely
+                position = start + len(data)
+
+                entries.clear()
+                for line_offset, line, matches in _lines(BytesIO(data), start, LogFilter(level, search)):
+                    if matches:
+                        entries.append((line_offset, line))
+                if len(entries) >= lines or start == 0 or window >= LOG_SCAN_MAX_BYTES:
+                    break
+                window *= 4
+
+    return {
+        "lines": [_decode(line) for _, line in entries],
+        "offset": entries[0][0] if entries else position,
+        "next_offset": position,
+        "eof": True,
+    }
+
+
+async def follow_logfile(
+    filename: str,
+    offset: Optional[int] = None,
+    level: Optional[str] = None,
+    search: Optional[str] = None,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """Yields the lines that are written to the log file, only the new bytes are read. Yields a page without lines
+    first, and None at least every `LOG_FOLLOW_KEEP_ALIVE` seconds without new lines. If the file shrinks (it was
+    rotated) the new file is read from its start.
+
+    Args:
+        filename (str): The log file inside the logs-folder.
+        offset (Optional[int], optional): The byte offset to start from. Defaults to the end of the last complete \
+            line.
+        level (Optional[str], optional): The minimum level of the lines. Defaults to None.
+        search (Optional[str], optional): The substring the lines must contain. Defaults to None.
+        is_disconnected (Optional[Callable[[], Awaitable[bool]]], optional): Returns True if the client is gone, \
+            e.g. `Request.is_disconnected`. Defaults to None.
+    """
     path = Path(LOGS, filename)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as log_file:
-            value = [line.strip() for line in log_file]
-        return value
-    log.warning(f"Could not fetch log file {filename!r}: File does not exist.")
-    return None
+    position = _end_of_last_line(path) if offset is None else offset
+    log_filter = LogFilter(level, search)
+    loop = asyncio.get_running_loop()
+    yield {"lines": [], "offset": position, "next_offset": position, "eof": True}
+    sent = loop.time()
+
+    while True:
+        await asyncio.sleep(LOG_FOLLOW_POLL_INTERVAL)
+        if is_disconnected and await is_disconnected():
+            return
+
+        size = path.stat().st_size if path.exists() else 0
+        if size < position:
+            position = 0
+        if size > position:
+            with open_logfile(path) as log_file:
+                log_file.seek(position)
+                data = log_file.read(min(size - position, LOG_SCAN_MAX_BYTES))
+            data = data[: data.rfind(b"\n") + 1]
+            new_lines = [_decode(line) for _, line, matches in _lines(BytesIO(data), position, log_filter) if matches]
+            start, position = position, position + len(data)
+            if new_lines:
+                yield {"lines": new_lines, "offset": start, "next_offset": position, "eof": position >= size}
+                sent = loop.time()
+                continue
+
+        if loop.time() - sent >= LOG_FOLLOW_KEEP_ALIVE:
+            yield None
+            sent = loop.time()
+
+
+def _lines(
+    raw_lines: Iterable[bytes], offset: int, log_filter: LogFilter, max_bytes: Optional[int] = None
+) -> Iterator[Tuple[int, bytes, bool]]:
+    """Yields the offset of every complete line, the line and whether it matches the filter. Stops at a line that
+    isn't written completely and after `max_bytes`."""
+    position = offset
+    for line in raw_lines:
+        if not line.endswith(b"\n"):
+            return
+        yield position, line, log_filter(_decode(line)) if log_filter.active else True
+        position += len(line)
+        if max_bytes is not None and position - offset >= max_bytes:
+            return
+
+
+def _end_of_last_line(path: Path) -> int:
+    """Returns the offset after the last complete line of a plain log file."""
+    size = path.stat().st_size
+    with open(path, "rb") as log_file:
+        log_file.seek(max(0, size - LOG_TAIL_WINDOW))
+        data = log_file.read()
+    return size - len(data) + data.rfind(b"\n") + 1
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace").rstrip()
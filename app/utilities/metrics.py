@@ -0,0 +1,191 @@
+"""
+    Request and database metrics, kept in memory and exposed in the Prometheus text format.
+
+    The metrics middleware (api.middleware) counts the requests of the web, pat and key api per route template and
+    measures their latency. The SQLAlchemy hooks of the engine count the queries and their time per request, the
+    request is found by a context variable, which is copied into the threadpool of the sync endpoints. Queries slower
+    than `DB_SLOW_QUERY_THRESHOLD` are logged, also those outside a request (schedules, mail outbox).
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from const import DB_SLOW_QUERY_THRESHOLD
+from const import METRICS_LATENCY_BUCKETS
+from multilog import log
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+PREFIX = "glados"
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """The queries of a single request."""
+
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class Histogram:
+    """Cumulative buckets, the sum and the count of the observed values."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """Thread safe registry of the metrics."""
+
+    def __init__(self, buckets: Tuple[float, ...] = METRICS_LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = Lock()
+        self._requests: Dict[Tuple[str, str, str, int], int] = defaultdict(int)
+        self._latency: Dict[Tuple[str, str, str], Histogram] = {}
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._queries: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._query_seconds: Dict[Tuple[str, str, str], float] = defaultdict(float)
+        self._slow_queries = 0
+
+    def request_started(self, api: str) -> None:
+        with self._lock:
+            self._in_flight[api] += 1
+
+    def request_finished(
+        self, api: str, method: str, route: str, status_code: int, duration: float, stats: RequestStats
+    ) -> None:
+        """Counts the finished request and its queries.
+
+        Args:
+            api (str): The api of the request: web, pat or key.
+            method (str): The http method.
+            route (str): The route template, e.g. `/users/{user_id}`.
+            status_code (int): The status code of the response.
+            duration (float): The seconds from the request to the last byte of the response.
+            stats (RequestStats): The queries of the request.
+        """
+        with self._lock:
+            self._in_flight[api] -= 1
+            self._requests[(api, method, route, status_code)] += 1
+            key = (api, method, route)
+            if key not in self._latency:
+                self._latency[key] = Histogram(self.buckets)
+            self._latency[key].observe(duration)
+            self._queries[key] += stats.queries
+            self._query_seconds[key] += stats.query_seconds
+
+    def query_finished(self, duration: float, statement: str) -> None:
+        """Adds the query to the stats of the current request, logs the query if it's slow."""
+        stats = request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.query_seconds += duration
+        if duration >= DB_SLOW_QUERY_THRESHOLD:
+            with self._lock:
+                self._slow_queries += 1
+            log.warning(f"Slow query ({duration * 1000:.0f}ms): {' '.join(statement.split())[:500]}")
+
+    def render(self, gauges: Iterable[Tuple[str, str, float]] = ()) -> str:
+        """Returns all metrics in the Prometheus text format.
+
+        Args:
+            gauges (Iterable[Tuple[str, str, float]], optional): Additional gauges as name (without prefix), help \
+                text and value. Defaults to ().
+        """
+        lines: List[str] = []
+        with self._lock:
+            self._family(lines, "http_requests_total", "counter", "Finished requests.")
+            for (api, method, route, status_code), value in sorted(self._requests.items()):
+                lines.append(
+                    self._sample("http_requests_total", value, api=api, method=method, route=route, status=status_code)
+                )
+
+            self._family(lines, "http_request_duration_seconds", "histogram", "Request latency per route template.")
+            for (api, method, route), histogram in sorted(self._latency.items()):
+                labels = {"api": api, "method": method, "route": route}
+                cumulative = 0
+                for bucket, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(self._sample("http_request_duration_seconds_bucket", cumulative, **labels, le=bucket))
+                lines.append(self._sample("http_request_duration_seconds_bucket", histogram.count, **labels, le="+Inf"))
+                lines.append(self._sample("http_request_duration_seconds_sum", histogram.sum, **labels))
+                lines.append(self._sample("http_request_duration_seconds_count", histogram.count, **labels))
+
+            self._family(lines, "http_requests_in_flight", "gauge", "Requests that are being handled.")
+            for api, value in sorted(self._in_flight.items()):
+                lines.append(self._sample("http_requests_in_flight", value, api=api))
+
+            self._family(lines, "db_queries_total", "counter", "Database queries of the requests per route template.")
+            for (api, method, route), value in sorted(self._queries.items()):
+                lines.append(self._sample("db_queries_total", value, api=api, method=method, route=route))
+
+            self._family(lines, "db_query_seconds_total", "counter", "Time of the database queries of the requests.")
+            for (api, method, route), seconds in sorted(self._query_seconds.items()):
+                lines.append(self._sample("db_query_seconds_total", seconds, api=api, method=method, route=route))
+
+            self._family(lines, "db_slow_queries_total", "counter", "Queries slower than the threshold.")
+            lines.append(self._sample("db_slow_queries_total", self._slow_queries))
+
+        for name, help_text, value in gauges:
+            self._family(lines, name, "gauge", help_text)
+            lines.append(self._sample(name, value))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _family(lines: List[str], name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+
+    @staticmethod
+    def _sample(name: str, value: float, **labels: Any) -> str:
+        if not labels:
+            return f"{PREFIX}_{name} {value}"
+        escaped = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        return f"{PREFIX}_{name}{{{escaped}}} {value}"
+
+
+def _escape(label: Any) -> str:
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Times every query of the engine, see `Metrics.query_finished`."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=W0613
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # pylint: disable=W0613
+        metrics.query_finished(perf_counter() - conn.info["query_start"].pop(), statement)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        if context.connection is not None and context.connection.info.get("query_start"):
+            context.connection.info["query_start"].pop()
+
+
+metrics = Metrics()
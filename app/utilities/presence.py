@@ -0,0 +1,113 @@
+"""
+    Presence index: The users who are logged in right now (have an open user time entry), kept in memory.
+
+    The index is rebuilt from the database at startup and updated by the user time CRUD after every commit that opens
+    or closes an entry. Reading the roster never hits the database. The index lives in the server process, the server
+    runs as a single process.
+"""
+
+import asyncio
+from threading import Lock
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from const import PRESENCE_KEEP_ALIVE
+from const import PRESENCE_POLL_INTERVAL
+from db.models import UserModel
+from db.models import UserTimeModel
+
+
+class PresenceIndex:
+    """The open user time entry per user. Every change increments the version."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._present: Dict[int, Dict[str, Any]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change of the index."""
+        return self._version
+
+    def rebuild(self, logged_in: Iterable[Tuple[UserModel, UserTimeModel]]) -> None:
+        """Replaces the index, see `CRUDUserTime.get_logged_in`.
+
+        Args:
+            logged_in (Iterable[Tuple[UserModel, UserTimeModel]]): All logged in users and their open entry.
+        """
+        present = {user.id: self._item(user, entry) for user, entry in logged_in}
+        with self._lock:
+            self._present = present
+            self._version += 1
+
+    def update(self, db_obj_user: UserModel, db_obj: UserTimeModel) -> None:
+        """Adds the user if the entry is open, removes the user if the entry was their open entry and is closed now.
+
+        Args:
+            db_obj_user (UserModel): The user of the entry.
+            db_obj (UserTimeModel): The created, updated or closed entry, as committed.
+        """
+        if db_obj.logout is None:
+            with self._lock:
+                self._present[db_obj_user.id] = self._item(db_obj_user, db_obj)
+                self._version += 1
+        else:
+            self.remove(db_obj)
+
+    def remove(self, db_obj: UserTimeModel) -> None:
+        """Removes the user of the entry, if the entry is their open entry.
+
+        Args:
+            db_obj (UserTimeModel): The closed or deleted entry.
+        """
+        with self._lock:
+            item = self._present.get(db_obj.user_id)
+            if item and item["entry_id"] == db_obj.id:
+                del self._present[db_obj.user_id]
+                self._version += 1
+
+    def present(self) -> List[Dict[str, Any]]:
+        """Returns the logged in users, ordered by their login time."""
+        with self._lock:
+            return sorted(self._present.values(), key=lambda item: item["login"])
+
+    async def changes(
+        self, is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yields the logged in users immediately, on every change and at least every `PRESENCE_KEEP_ALIVE` seconds.
+
+        Args:
+            is_disconnected (Optional[Callable[[], Awaitable[bool]]], optional): Returns True if the client is gone,
+                e.g. `Request.is_disconnected`. Defaults to None.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            version = self._version
+            sent = loop.time()
+            yield self.present()
+
+            while self._version == version and loop.time() - sent < PRESENCE_KEEP_ALIVE:
+                await asyncio.sleep(PRESENCE_POLL_INTERVAL)
+                if is_disconnected and await is_disconnected():
+                    return
+
+    @staticmethod
+    def _item(db_obj_user: UserModel, db_obj: UserTimeModel) -> Dict[str, Any]:
+        return {
+            "user_id": db_obj_user.id,
+            "username": db_obj_user.username,
+            "full_name": db_obj_user.full_name,
+            "entry_id": db_obj.id,
+            "login": db_obj.login,
+        }
+
+
+presence = PresenceIndex()
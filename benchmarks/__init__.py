@@ -0,0 +1,4 @@
+"""
+    Benchmarks for the glados backend. Run them from the repository root, e.g.:
+    python -m benchmarks.bench_compression
+"""
@@ -0,0 +1,68 @@
+"""
+    Benchmark: Payload size and latency of a large bought item listing, with and without gzip compression.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_compression --items 5000 --bandwidth 10
+"""
+
+import argparse
+
+from benchmarks.utils import fake_bought_item
+from benchmarks.utils import timeit
+
+from api.schemas import PageSchema  # isort:skip
+from api.schemas.bought_item import BoughtItemSchema  # isort:skip
+from config import cfg  # isort:skip
+from fastapi.applications import FastAPI  # isort:skip
+from fastapi.testclient import TestClient  # isort:skip
+from starlette.middleware.gzip import GZipMiddleware  # isort:skip
+
+
+def build_api(items: int, compress: bool) -> FastAPI:
+    """Builds an api with a single listing route, optionally compressed like the mounted apis in server.py."""
+    page = PageSchema[BoughtItemSchema](
+        items=[BoughtItemSchema.model_validate(fake_bought_item(i)) for i in range(items)],
+        total=items,
+        limit=items,
+        skip=0,
+    )
+    api = FastAPI()
+
+    @api.get("/items/bought", response_model=PageSchema[BoughtItemSchema])
+    def read_bought_items():
+        return page
+
+    if compress:
+        api.add_middleware(
+            GZipMiddleware,
+            minimum_size=cfg.server.compression.minimum_size,
+            compresslevel=cfg.server.compression.level,
+        )
+    return api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000, help="Number of items in the listing")
+    parser.add_argument(
+        "--bandwidth", type=float, default=10, help="Link bandwidth in MBit/s for the transfer estimate"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Listing with {args.items} items, gzip level {cfg.server.compression.level}:")
+    for compress in (False, True):
+        client = TestClient(build_api(args.items, compress))
+        response = client.get("/items/bought", headers={"Accept-Encoding": "gzip"})
+        wire_bytes = response.num_bytes_downloaded
+        server_ms = timeit(lambda: client.get("/items/bought", headers={"Accept-Encoding": "gzip"}), args.repeat)
+        transfer_ms = wire_bytes * 8 / (args.bandwidth * 1_000_000) * 1000
+        print(
+            f"  {'gzip' if compress else 'none':>4}: {wire_bytes / 1024:10.1f} KiB on the wire, "
+            f"{server_ms:8.1f} ms server time, ~{transfer_ms:8.1f} ms transfer at {args.bandwidth} MBit/s, "
+            f"{server_ms + transfer_ms:8.1f} ms total"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+    Benchmark: Reading the end of a large log file as a whole vs. a page, the tail and a filtered tail. The log file is
+    written to a temporary folder, plain and gzip compressed.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_log_files --lines 500000
+"""
+
+import argparse
+import gzip
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import timeit
+
+from utilities import log_files  # isort:skip
+
+LEVELS = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+
+
+def write_logfile(folder: Path, lines: int) -> int:
+    """Writes `glados.log` and `glados.log.gz` to the folder, returns the size of the plain file."""
+    content = "".join(
+        f"2026-10-18 08:{i // 60 % 60:02d}:{i % 60:02d},000\tglados\t{LEVELS[i % len(LEVELS)]}\tRequest {i} handled.\n"
+        for i in range(lines)
+    ).encode()
+    Path(folder, "glados.log").write_bytes(content)
+    Path(folder, "glados.log.gz").write_bytes(gzip.compress(content))
+    return len(content)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=500000, help="Number of lines of the log file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        size = write_logfile(Path(folder), args.lines)
+        log_files.LOGS = Path(folder)
+
+        runs = {
+            "whole file": lambda: log_files.read_logfile("glados.log")[-100:],
+            "page at end": lambda: log_files.read_logfile_page("glados.log", offset=size - 10000, limit=100),
+            "tail 100": lambda: log_files.read_logfile_tail("glados.log", 100),
+            "tail 100 ERROR": lambda: log_files.read_logfile_tail("glados.log", 100, level="ERROR"),
+            "gz whole file": lambda: log_files.read_logfile("glados.log.gz")[-100:],
+            "gz tail 100": lambda: log_files.read_logfile_tail("glados.log.gz", 100),
+        }
+        print(f"Last 100 lines of {args.lines} lines ({size / 1024 / 1024:.1f} MiB):")
+        for name, run in runs.items():
+            print(f"  {name:<15} {timeit(run, repeat=5):9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
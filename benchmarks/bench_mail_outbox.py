@@ -0,0 +1,134 @@
+"""
+    Benchmark: Sending a burst of mails to a local SMTP server. Compares the process per mail (before the outbox, every
+    process logs in on its own) with the outbox, which queues the mails and sends them over one SMTP session.
+    Measures how long the caller is blocked and how long it takes until all mails are delivered. The rate limit of the
+    outbox is lifted for the benchmark.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_mail_outbox --mails 50
+"""
+
+import argparse
+import logging
+import socket
+from multiprocessing import Process
+from time import perf_counter
+from time import sleep
+from typing import List
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from aiosmtpd.smtp import Envelope
+from benchmarks.utils import timeit
+
+import mail.outbox  # isort:skip
+from db.base import Base  # isort:skip
+from db.models import MailOutboxModel  # isort:skip
+from mail import Mail  # isort:skip
+from mail import Receiver  # isort:skip
+from mail.outbox import outbox  # isort:skip
+from mail.send import MailSession  # isort:skip
+from mail.send import prepare_message  # isort:skip
+from sqlalchemy import create_engine  # isort:skip
+from sqlalchemy.orm import Session  # isort:skip
+from sqlalchemy.orm import sessionmaker  # isort:skip
+
+ACCOUNT = "glados@glados.local"
+
+
+class Handler:
+    """Counts the delivered mails."""
+
+    def __init__(self) -> None:
+        self.mails: List[Envelope] = []
+
+    async def handle_DATA(self, server, session, envelope):  # pylint: disable=C0103
+        self.mails.append(envelope)
+        return "250 OK"
+
+
+def start_server() -> Controller:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    controller = Controller(
+        Handler(),
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=lambda *_: AuthResult(success=True),
+        auth_require_tls=False,
+    )
+    controller.start()
+    return controller
+
+
+def build_db() -> Session:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[MailOutboxModel.__table__])  # type: ignore
+    return sessionmaker(bind=engine)()
+
+
+def run_processes(controller: Controller, messages: list) -> float:
+    """The process per mail, as before the outbox. Returns the ms the caller was blocked."""
+    processes: List[Process] = []
+
+    def send(message: tuple) -> None:
+        with MailSession(
+            server=controller.hostname, port=controller.port, account=ACCOUNT, password="-", starttls=False
+        ) as session:
+            session.send_message(*message)
+
+    start = perf_counter()
+    for message in messages:
+        process = Process(target=send, args=(message,))
+        process.start()
+        processes.append(process)
+    blocked = (perf_counter() - start) * 1000
+    for process in processes:
+        process.join()
+    return blocked
+
+
+def run_outbox(controller: Controller, db: Session, messages: list) -> float:
+    """Queues the mails and sends them over one session. Returns the ms the caller was blocked."""
+    start = perf_counter()
+    for message in messages:
+        outbox.enqueue(db, *message)
+    blocked = (perf_counter() - start) * 1000
+    session = MailSession(
+        server=controller.hostname, port=controller.port, account=ACCOUNT, password="-", starttls=False
+    )
+    outbox.send_pending(db, session=session)
+    return blocked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mails", type=int, default=50, help="Number of mails in the burst")
+    args = parser.parse_args()
+
+    logging.getLogger("mail.log").setLevel(logging.WARNING)  # the log of aiosmtpd
+    mail.outbox.MAIL_OUTBOX_RATE = 1_000_000  # type: ignore
+    controller = start_server()
+    db = build_db()
+    message = prepare_message(
+        Receiver(to=["user@glados.local"]), Mail(subject="Benchmark", body="<p>Benchmark</p>"), ACCOUNT, force=True
+    )
+    messages = [message] * args.mails
+
+    print(f"Burst of {args.mails} mails:")
+    for name, run in {
+        "process per mail": lambda: run_processes(controller, messages),
+        "outbox": lambda: run_outbox(controller, db, messages),
+    }.items():
+        blocked: List[float] = []
+        total = timeit(lambda: blocked.append(run()), repeat=3)  # pylint: disable=W0640
+        print(f"  {name:<17} caller blocked {min(blocked):9.1f} ms, all delivered {total:9.1f} ms")
+        sleep(0.5)
+
+    db.close()
+    controller.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+    Benchmark: Rendering the item notification mail. Compares a new environment per mail (the template is compiled for
+    every mail) with the module environment of mail.render, which keeps the compiled template.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_mail_render --items 20
+"""
+
+import argparse
+from pathlib import Path
+
+import jinja2
+from benchmarks.utils import fake_bought_item
+from benchmarks.utils import timeit
+
+from const import TEMPLATES  # isort:skip
+from mail.render import SAMPLE_ITEM_NOTIFICATION  # isort:skip
+from mail.render import render_template  # isort:skip
+
+
+def render_old(template_file: Path, **kwargs) -> str:
+    """The render function before the module environment."""
+    template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(searchpath="/"))
+    return template_env.get_template(str(template_file)).render(**kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20, help="Number of items per mail")
+    args = parser.parse_args()
+
+    items = [fake_bought_item(i) for i in range(args.items)]
+    user = {"full_name": "User", "email": "user@glados.local"}
+    template_file = Path(TEMPLATES, SAMPLE_ITEM_NOTIFICATION)
+
+    print(f"Item notification mail with {args.items} items:")
+    old = timeit(lambda: render_old(template_file, items=items, user=user), repeat=20)
+    new = timeit(lambda: render_template(SAMPLE_ITEM_NOTIFICATION, items=items, user=user), repeat=20)
+    print(f"  {'new environment':<18} {old:9.3f} ms")
+    print(f"  {'cached template':<18} {new:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+    Benchmark: Overhead of the metrics middleware per request and of the query hooks per query. The requests are sent
+    to a minimal ASGI app directly, without a server, so that the overhead isn't hidden by the noise of the transport.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_metrics --requests 20000 --queries 20000
+"""
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+
+from benchmarks.utils import timeit
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+from api.middleware import MetricsMiddleware  # isort:skip
+from utilities.metrics import instrument_engine  # isort:skip
+
+SCOPE = {"type": "http", "method": "GET", "path": "/items/1", "route": SimpleNamespace(path="/items/{item_id}")}
+
+
+async def app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message: dict) -> None:
+    pass
+
+
+def run_requests(asgi_app, requests: int) -> None:
+    async def run() -> None:
+        for _ in range(requests):
+            await asgi_app(dict(SCOPE), receive, send)
+
+    asyncio.run(run())
+
+
+def run_queries(instrumented: bool, queries: int) -> float:
+    engine = create_engine("sqlite://")
+    if instrumented:
+        instrument_engine(engine)
+    with engine.connect() as connection:
+        statement = text("SELECT 1")
+        return timeit(lambda: [connection.execute(statement) for _ in range(queries)], repeat=3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Number of requests per run")
+    parser.add_argument("--queries", type=int, default=20000, help="Number of queries per run")
+    args = parser.parse_args()
+
+    plain = timeit(lambda: run_requests(app, args.requests), repeat=3)
+    instrumented = timeit(lambda: run_requests(MetricsMiddleware(app, api="bench"), args.requests), repeat=3)
+    print(f"Middleware, {args.requests} requests:")
+    print(f"  {'plain':<13} {plain / args.requests * 1000:8.2f} µs per request")
+    print(f"  {'instrumented':<13} {instrumented / args.requests * 1000:8.2f} µs per request")
+
+    plain = run_queries(False, args.queries)
+    instrumented = run_queries(True, args.queries)
+    print(f"Query hooks, {args.queries} queries:")
+    print(f"  {'plain':<13} {plain / args.queries * 1000:8.2f} µs per query")
+    print(f"  {'instrumented':<13} {instrumented / args.queries * 1000:8.2f} µs per query")
+
+
+if __name__ == "__main__":
+    main()
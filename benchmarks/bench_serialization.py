@@ -0,0 +1,68 @@
+"""
+    Benchmark: Serialization of a large bought item page, the old path (validation of the return value against the
+    response model and rendering with the json module) versus the new path (single validation and rendering with the
+    native serializer of pydantic-core).
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_serialization --items 5000
+"""
+
+import argparse
+from types import SimpleNamespace
+
+from benchmarks.utils import fake_bought_item
+from benchmarks.utils import timeit
+
+from api.responses import FastJSONResponse  # isort:skip
+from api.schemas import PageSchema  # isort:skip
+from api.schemas.bought_item import BoughtItemSchema  # isort:skip
+from fastapi.applications import FastAPI  # isort:skip
+from fastapi.responses import JSONResponse  # isort:skip
+from fastapi.testclient import TestClient  # isort:skip
+
+
+def build_api(items: int) -> FastAPI:
+    """Builds an api with the old and the new listing route. Items are attribute objects, like rows from the db."""
+    rows = [SimpleNamespace(**fake_bought_item(i)) for i in range(items)]
+    api = FastAPI()
+
+    @api.get("/old", response_model=PageSchema[BoughtItemSchema], response_class=JSONResponse)
+    def read_old():
+        return PageSchema(
+            items=[BoughtItemSchema.model_validate(i) for i in rows],
+            total=items,
+            limit=items,
+            skip=0,
+        )
+
+    @api.get("/new", response_model=PageSchema[BoughtItemSchema], response_class=FastJSONResponse)
+    def read_new():
+        page = PageSchema[BoughtItemSchema](
+            items=[BoughtItemSchema.model_validate(i) for i in rows],
+            total=items,
+            limit=items,
+            skip=0,
+        )
+        return FastJSONResponse(page)
+
+    return api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000, help="Number of items in the page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = TestClient(build_api(args.items))
+    assert client.get("/old").json() == client.get("/new").json(), "Old and new path produce different payloads"
+
+    print(f"Page with {args.items} items:")
+    results = {path: timeit(lambda: client.get(f"/{path}"), args.repeat) for path in ("old", "new")}
+    for path, ms in results.items():
+        print(f"  {path}: {ms:8.1f} ms")
+    print(f"  speedup: {results['old'] / results['new']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
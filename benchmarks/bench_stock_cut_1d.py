@@ -0,0 +1,90 @@
+"""
+    Benchmark: Heuristics of the 1D stock cutting tool, the old first fit decreasing (sums up every open stock for every
+    piece) versus first fit and best fit decreasing with a segment tree, and the local search pass.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_stock_cut_1d --pieces 500 5000 50000
+"""
+
+import argparse
+import copy
+import random
+from typing import List
+
+from benchmarks.utils import timeit
+
+from tools.stock_cut_1d.heuristics import improve  # isort:skip
+from tools.stock_cut_1d.heuristics import solve_BFD  # isort:skip
+from tools.stock_cut_1d.heuristics import solve_FFD  # isort:skip
+from tools.stock_cut_1d.models import JobModel  # isort:skip
+from tools.stock_cut_1d.models import TargetSizeModel  # isort:skip
+
+
+def solve_FFD_old(job: JobModel) -> List[List[int]]:
+    """The first fit decreasing of the solver before the heuristics module."""
+    sizes = sorted(copy.deepcopy(job.target_sizes), reverse=True)
+    stocks: List[List[int]] = [[]]
+    i_target = 0
+    while i_target < len(sizes):
+        current_size = sizes[i_target]
+        for stock in stocks:
+            stock_length = sum(stock) + (len(stock) - 1) * job.cut_width
+            if (job.max_length - stock_length) > current_size.length:
+                stock.append(current_size.length)
+                break
+        else:
+            stocks.append([current_size.length])
+        if current_size.quantity <= 1:
+            i_target += 1
+        else:
+            current_size.quantity -= 1
+    return stocks
+
+
+def overfilled(job: JobModel, stocks: List[List[int]]) -> int:
+    """Returns the number of stocks, whose pieces and cuts are longer than the stock."""
+    return sum(1 for stock in stocks if sum(stock) + len(stock) * job.cut_width > job.max_length)
+
+
+def random_job(pieces: int, seed: int = 0) -> JobModel:
+    """Returns a cut list with 50 distinct lengths on stocks of 6m."""
+    rng = random.Random(seed)
+    lengths = rng.sample(range(150, 3000), 50)
+    quantities = [1] * len(lengths)
+    for _ in range(pieces - len(lengths)):
+        quantities[rng.randrange(len(lengths))] += 1
+    return JobModel(
+        max_length=6000,
+        cut_width=3,
+        target_sizes=[TargetSizeModel(length=l, quantity=q) for l, q in zip(lengths, quantities)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pieces", type=int, nargs="+", default=[500, 5000, 50000], help="Number of pieces")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-old", type=int, default=5000, help="Skip the old FFD above this number of pieces")
+    args = parser.parse_args()
+
+    for pieces in args.pieces:
+        job = random_job(pieces)
+        bfd = solve_BFD(job)
+        solvers = {
+            "FFD (old)": lambda: solve_FFD_old(job),
+            "FFD": lambda: solve_FFD(job),
+            "BFD": lambda: solve_BFD(job),
+            "local search": lambda: improve(job, bfd),
+        }
+
+        print(f"Cut list with {pieces} pieces:")
+        for name, solver in solvers.items():
+            if name == "FFD (old)" and pieces > args.max_old:
+                continue
+            ms = timeit(solver, args.repeat)
+            stocks = solver()
+            print(f"  {name:<13} {len(stocks):6d} stocks {overfilled(job, stocks):4d} overfilled {ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
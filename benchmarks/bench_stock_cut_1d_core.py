@@ -0,0 +1,163 @@
+"""
+    Benchmark: The compact core of the 1D stock cutting heuristics (distinct weights and quantities as arrays, linked
+    lists in arrays for best fit, cached swaps in the local search) versus the list based implementation before. Measures
+    the runtime and the peak of the allocated memory (tracemalloc) of best fit decreasing with the local search, from
+    the job to the lists of lengths of the result.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_stock_cut_1d_core --pieces 500 5000 50000
+"""
+
+import argparse
+import tracemalloc
+from math import ceil
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from benchmarks.stock_cut_1d_instances import cut_list
+from benchmarks.utils import timeit
+
+from tools.stock_cut_1d.core import Pieces  # isort:skip
+from tools.stock_cut_1d.heuristics import _best_fit  # isort:skip
+from tools.stock_cut_1d.heuristics import _Pool  # isort:skip
+from tools.stock_cut_1d.heuristics import _subsets  # isort:skip
+from tools.stock_cut_1d.heuristics import improve_packing  # isort:skip
+from tools.stock_cut_1d.heuristics import pack_BFD  # isort:skip
+from tools.stock_cut_1d.heuristics import solve_BFD  # isort:skip
+from tools.stock_cut_1d.models import JobModel  # isort:skip
+
+
+class _ListMaxTree:
+    """The segment tree before the core, on a python list."""
+
+    def __init__(self, size: int, value: int) -> None:
+        self.size = 1
+        while self.size < size:
+            self.size *= 2
+        self.tree = [value] * (2 * self.size)
+
+    def set(self, i: int, value: int) -> None:
+        i += self.size
+        self.tree[i] = value
+        i //= 2
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+    def first(self, value: int) -> int:
+        if self.tree[1] < value:
+            return self.size
+        i = 1
+        while i < self.size:
+            i = 2 * i if self.tree[2 * i] >= value else 2 * i + 1
+        return i - self.size
+
+
+def solve_BFD_old(job: JobModel) -> List[List[int]]:
+    """Best fit decreasing before the core: one python int per piece and a list of stocks per remaining capacity."""
+    weights = [length + job.cut_width for length in sorted(job.iterate_sizes(), reverse=True)]
+    by_remaining: List[List[int]] = [[] for _ in range(job.max_length + 1)]
+    remaining = _ListMaxTree(job.max_length + 1, -1)
+    stocks: List[List[int]] = []
+
+    for weight in weights:
+        capacity = remaining.first(weight)
+        if capacity > job.max_length:
+            i = len(stocks)
+            stocks.append([])
+            capacity = job.max_length
+        else:
+            i = by_remaining[capacity].pop()
+            if not by_remaining[capacity]:
+                remaining.set(capacity, -1)
+        stocks[i].append(weight)
+
+        capacity -= weight
+        by_remaining[capacity].append(i)
+        remaining.set(capacity, capacity)
+
+    return [[weight - job.cut_width for weight in stock] for stock in stocks]
+
+
+def improve_old(job: JobModel, lengths: List[List[int]], max_rounds: int = 20) -> List[List[int]]:
+    """Local search before the core: sums and copies all stocks in every round."""
+    stocks = [[length + job.cut_width for length in stock] for stock in lengths]
+    bound = ceil(sum(sum(stock) for stock in stocks) / job.max_length)
+
+    for _ in range(max_rounds):
+        if len(stocks) <= bound:
+            break
+        stocks.sort(key=sum)
+        pool = _Pool([weight for stock in stocks[:3] for weight in stock])
+        refilled = [list(stock) for stock in stocks[3:]]
+        for stock in refilled:
+            _refill_stock_old(stock, pool, job.max_length)
+        refilled.extend(_best_fit(sorted(pool.pieces, reverse=True), job.max_length))
+
+        evenness = lambda stocks: sum(sum(stock) ** 2 for stock in stocks)  # noqa: E731
+        if len(refilled) > len(stocks) or (len(refilled) == len(stocks) and evenness(refilled) <= evenness(stocks)):
+            break
+        stocks = refilled
+
+    return [[weight - job.cut_width for weight in stock] for stock in stocks]
+
+
+def _refill_stock_old(stock: List[int], pool: _Pool, capacity: int) -> None:
+    free = capacity - sum(stock)
+    while free and pool.pieces:
+        best: Tuple[int, Tuple[int, ...], Tuple[int, ...]] = (0, (), ())
+        for out in _subsets(len(stock)):
+            total_out = sum(stock[i] for i in out)
+            total_in, into = pool.best(total_out + free)
+            if total_in - total_out > best[0]:
+                best = (total_in - total_out, out, into)
+        gain, out, into = best
+        if not gain:
+            return
+        taken = pool.take(into)
+        pool.put([stock.pop(i) for i in sorted(out, reverse=True)])
+        stock.extend(taken)
+        free -= gain
+
+
+def solve_core(job: JobModel) -> List[List[int]]:
+    """The path of the solver since the core."""
+    pieces = Pieces.from_job(job)
+    return pieces.lengths(improve_packing(pieces, pack_BFD(pieces)))
+
+
+def peak_kib(function: Callable) -> Tuple[float, Optional[list]]:
+    """Returns the peak of the allocated memory in KiB while the function runs, and its result."""
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pieces", type=int, nargs="+", default=[500, 5000, 50000], help="Number of pieces")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for pieces in args.pieces:
+        job = cut_list(pieces)
+        solvers = {
+            "BFD (old)": lambda: solve_BFD_old(job),
+            "BFD": lambda: solve_BFD(job),
+            "BFD + LS (old)": lambda: improve_old(job, solve_BFD_old(job)),
+            "BFD + LS": lambda: solve_core(job),
+        }
+
+        print(f"Cut list with {pieces} pieces:")
+        for name, solver in solvers.items():
+            ms = timeit(solver, args.repeat)
+            kib, stocks = peak_kib(solver)
+            print(f"  {name:<15} {len(stocks):6d} stocks {ms:10.1f} ms {kib:10.0f} KiB peak")  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
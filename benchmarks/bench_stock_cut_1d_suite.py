@@ -0,0 +1,71 @@
+"""
+    Benchmark: All solvers of the 1D stock cutting tool on the reference instances (Falkenauer u/t, Scholl 1 and our
+    own cut lists). Prints the number of stocks, the gap to the lower bound and the runtime of every solver.
+
+    With --update the results become the new baseline of the regression test, run it after an intended change of a
+    solver. With --check the script exits with 1 if a solver uses more stocks or is slower than in the baseline.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_stock_cut_1d_suite [--update | --check]
+"""
+
+import argparse
+import json
+import sys
+from statistics import median
+from typing import Dict
+
+from benchmarks.stock_cut_1d_instances import BASELINE
+from benchmarks.stock_cut_1d_instances import SOLVERS
+from benchmarks.stock_cut_1d_instances import gap
+from benchmarks.stock_cut_1d_instances import known_optimum
+from benchmarks.stock_cut_1d_instances import load_baseline
+from benchmarks.stock_cut_1d_instances import reference_instances
+from benchmarks.stock_cut_1d_instances import regressions
+from benchmarks.stock_cut_1d_instances import run_solver
+
+from const import N_MAX_EXACT  # isort:skip
+from tools.stock_cut_1d.exact import lower_bound  # isort:skip
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--bound-timeout", type=float, default=5, help="Time limit of the lower bound in seconds")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--update", action="store_true", help="Write the results as new baseline")
+    group.add_argument("--check", action="store_true", help="Exit with 1 on a regression against the baseline")
+    args = parser.parse_args()
+
+    results: Dict[str, dict] = {"instances": {}}
+    print(f"{'instance':<14} {'pieces':>6} {'bound':>5}  {'solver':<12} {'stocks':>6} {'gap':>7} {'ms':>9}")
+    for name, job in reference_instances().items():
+        bound = known_optimum(name, job) or lower_bound(job, timeout=args.bound_timeout)
+        instance: dict = {"pieces": len(job), "bound": bound, "solvers": {}}
+        for solver in SOLVERS:
+            if solver == "exact" and len(job) > N_MAX_EXACT:
+                continue
+            runs = [run_solver(solver, job) for _ in range(args.repeat)]
+            run = {"stocks": runs[0]["stocks"], "ms": median(r["ms"] for r in runs)}
+            instance["solvers"][solver] = run
+
+            run_gap = gap(run["stocks"], bound)
+            stocks = "-" if run["stocks"] is None else str(run["stocks"])
+            gap_str = "-" if run_gap is None else f"{run_gap:.2%}"
+            print(f"{name:<14} {len(job):6d} {bound:5d}  {solver:<12} {stocks:>6} {gap_str:>7} {run['ms']:9.1f}")
+        results["instances"][name] = instance
+
+    if args.update:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE}")
+    elif args.check:
+        messages = regressions(results, load_baseline())
+        for message in messages:
+            print(f"REGRESSION {message}")
+        sys.exit(1 if messages else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+    Benchmark: Lookups of the user time table on a realistic amount of entries (two entries per workday, 5 years, 200
+    users), without the indexes of the user time table versus with them. Compares the overlap check before (two
+    queries that load all overlapping entries) with the single EXISTS query, and the lookup of the open entry of a user,
+    which every clock-in and clock-out does.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_user_time --users 200 --years 5
+"""
+
+import argparse
+import random
+from datetime import datetime
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Callable
+from typing import Iterator
+from typing import List
+
+from benchmarks.utils import timeit
+
+from crud.user_time import crud_user_time  # isort:skip
+from db.base import Base  # isort:skip
+from db.models import UserTimeModel  # isort:skip
+from sqlalchemy import create_engine  # isort:skip
+from sqlalchemy import insert  # isort:skip
+from sqlalchemy import text  # isort:skip
+from sqlalchemy.orm import Session  # isort:skip
+from sqlalchemy.orm import sessionmaker  # isort:skip
+
+INDEXES = ("ix_user_time_table_user_id_login", "ix_user_time_table_user_id_logged_in")
+
+
+def entries(users: int, years: int) -> Iterator[dict]:
+    """Yields two entries per workday and user (before and after lunch), the last day every user is logged in."""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    day = today - timedelta(days=365 * years)
+    while day < today:
+        if day.weekday() < 5:
+            for user_id in range(1, users + 1):
+                for start, end in ((7, 12), (12.5, 16)):
+                    login = day + timedelta(hours=start, minutes=user_id % 30)
+                    logout = day + timedelta(hours=end, minutes=user_id % 30)
+                    yield {
+                        "user_id": user_id,
+                        "login": login,
+                        "logout": logout,
+                        "duration_minutes": (logout - login).total_seconds() / 60,
+                    }
+        day += timedelta(days=1)
+    for user_id in range(1, users + 1):
+        yield {"user_id": user_id, "login": today + timedelta(hours=7), "logout": None, "duration_minutes": None}
+
+
+def build_db(rows: List[dict], indexes: bool) -> Session:
+    """Creates an in-memory database with all tables and the given entries, optionally without the indexes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        if not indexes:
+            for index in INDEXES:
+                connection.execute(text(f"DROP INDEX {index}"))
+        connection.execute(insert(UserTimeModel), rows)
+        connection.execute(text("ANALYZE"))
+    return sessionmaker(bind=engine)()
+
+
+def overlaps_old(db: Session, user: SimpleNamespace, login: datetime, logout: datetime) -> bool:
+    """The overlap check before the EXISTS query."""
+    model = UserTimeModel
+    return bool(
+        db.query(model).filter_by(user_id=user.id).filter(login > model.login, login < model.logout).all()
+        or db.query(model).filter_by(user_id=user.id).filter(logout < model.logout, logout > model.login).all()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200, help="Number of users")
+    parser.add_argument("--years", type=int, default=5, help="Years of entries per user")
+    parser.add_argument("--lookups", type=int, default=200, help="Lookups per measurement")
+    args = parser.parse_args()
+
+    rows = list(entries(args.users, args.years))
+    print(f"User time table with {len(rows)} entries ({args.users} users, {args.years} years):")
+
+    rng = random.Random(0)
+    now = datetime.now()
+    lookups = []
+    for _ in range(args.lookups):
+        login = now - timedelta(days=rng.randint(1, 365 * args.years), hours=rng.randint(0, 23))
+        lookups.append((SimpleNamespace(id=rng.randint(1, args.users)), login, login + timedelta(hours=2)))
+
+    for indexes in (False, True):
+        db = build_db(rows, indexes)
+        runs: dict[str, Callable] = {
+            "overlap, two queries": lambda: [overlaps_old(db, *lookup) for lookup in lookups],
+            "overlap, EXISTS": lambda: [
+                crud_user_time.overlaps(db, db_obj_user=u, login=login, logout=logout) for u, login, logout in lookups
+            ],
+            "open entry": lambda: [crud_user_time.get_last_login(db, db_obj_user=u) for u, _, _ in lookups],
+        }
+        assert [overlaps_old(db, *lookup) for lookup in lookups] == runs["overlap, EXISTS"]()
+
+        print(f"  {'with' if indexes else 'without'} indexes:")
+        for name, run in runs.items():
+            ms = timeit(run, repeat=3) / len(lookups)
+            print(f"    {name:<22} {ms:9.3f} ms per lookup")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+    Benchmark: The roster of the logged in users. Compares the query before (all open entries, every user lazy-loaded
+    on its own) with the open entries joined with their users, and with the presence index, which is kept in memory.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_user_time_present --users 300
+"""
+
+import argparse
+from datetime import datetime
+from typing import Callable
+
+from benchmarks.utils import timeit
+
+from crud.user_time import crud_user_time  # isort:skip
+from db.base import Base  # isort:skip
+from db.models import UserModel  # isort:skip
+from db.models import UserTimeModel  # isort:skip
+from sqlalchemy import create_engine  # isort:skip
+from sqlalchemy import insert  # isort:skip
+from sqlalchemy.orm import Session  # isort:skip
+from sqlalchemy.orm import sessionmaker  # isort:skip
+from utilities.presence import presence  # isort:skip
+
+
+def build_db(users: int) -> Session:
+    """Creates an in-memory database with the given number of users, all logged in."""
+    now = datetime.now()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": i,
+                    "created": now,
+                    "username": f"user{i}",
+                    "full_name": f"User {i}",
+                    "email": f"user{i}@glados.local",
+                    "hashed_password": "-",
+                }
+                for i in range(1, users + 1)
+            ],
+        )
+        connection.execute(insert(UserTimeModel), [{"user_id": i, "login": now} for i in range(1, users + 1)])
+    return sessionmaker(bind=engine)()
+
+
+def present_old(db: Session) -> list:
+    """The logged in users before the users were joined: A query per user."""
+    return [(entry.user.full_name, entry.login) for entry in db.query(UserTimeModel).filter_by(logout=None).all()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=300, help="Number of logged in users")
+    args = parser.parse_args()
+
+    db = build_db(args.users)
+    presence.rebuild(crud_user_time.get_logged_in(db))
+    runs: dict[str, Callable[[], object]] = {
+        "lazy-loaded users": lambda: (db.expire_all(), present_old(db)),
+        "joined users": lambda: (db.expire_all(), crud_user_time.get_logged_in(db)),
+        "presence index": presence.present,
+    }
+
+    print(f"Roster of {args.users} logged in users:")
+    for name, run in runs.items():
+        print(f"  {name:<18} {timeit(run, repeat=5):9.3f} ms")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
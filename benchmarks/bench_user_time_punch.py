@@ -0,0 +1,110 @@
+"""
+    Benchmark: A punch of a time-clock terminal with an rfid card. Compares the flow before (the rfid is verified
+    against the salted hash of every user, then the open entry is read and the user is logged in or out) with the
+    lookup hash of the rfid and `crud_user_time.punch`.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_user_time_punch --users 20
+"""
+
+import argparse
+from datetime import datetime
+from datetime import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from benchmarks.utils import timeit
+
+from crud.user import crud_user  # isort:skip
+from crud.user_time import crud_user_time  # isort:skip
+from db.base import Base  # isort:skip
+from db.models import UserModel  # isort:skip
+from security.pwd import get_hash  # isort:skip
+from security.pwd import get_lookup_hash  # isort:skip
+from security.pwd import verify_hash  # isort:skip
+from sqlalchemy import create_engine  # isort:skip
+from sqlalchemy import insert  # isort:skip
+from sqlalchemy.orm import Session  # isort:skip
+from sqlalchemy.orm import sessionmaker  # isort:skip
+
+
+def build_db(hashes: List[str]) -> Session:
+    """Creates an in-memory database with a user per salted rfid hash."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": i,
+                    "created": datetime.now(),
+                    "username": f"user{i}",
+                    "full_name": f"User {i}",
+                    "email": f"user{i}@glados.local",
+                    "hashed_password": "-",
+                    "hashed_rfid": hashed_rfid,
+                    "rfid_lookup": get_lookup_hash(f"rfid{i}"),
+                }
+                for i, hashed_rfid in enumerate(hashes, start=1)
+            ],
+        )
+    return sessionmaker(bind=engine)()
+
+
+def get_by_rfid_old(db: Session, rfid: str) -> Optional[UserModel]:
+    """The rfid lookup before the lookup hash."""
+    for user in db.query(UserModel).filter(UserModel.hashed_rfid != None, UserModel.is_active).all():
+        if verify_hash(rfid, user.hashed_rfid):
+            return user
+    return None
+
+
+def punch_old(db: Session, rfid: str, timestamp: datetime) -> None:
+    """The rfid login of the terminal, followed by the user time login or logout."""
+    user = get_by_rfid_old(db, rfid)
+    assert user
+    if crud_user_time.get_last_login(db, db_obj_user=user):
+        crud_user_time.logout(db, db_obj_user=user, timestamp=timestamp)
+    else:
+        crud_user_time.login(db, db_obj_user=user, timestamp=timestamp)
+
+
+def punch_new(db: Session, rfid: str, timestamp: datetime) -> None:
+    user = crud_user.get_by_rfid(db, rfid=rfid)
+    assert user
+    crud_user_time.punch(db, db_obj_user=user, timestamp=timestamp)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20, help="Number of users with an rfid")
+    parser.add_argument("--punches", type=int, default=4, help="Punches per measurement")
+    args = parser.parse_args()
+
+    # the users at the end of the table: the old flow verifies all users before them
+    punched = list(range(args.users - args.punches + 1, args.users + 1))
+    runs: dict[str, Callable[[Session, str, datetime], None]] = {
+        "verify all, two calls": punch_old,
+        "lookup hash, punch": punch_new,
+    }
+
+    hashes = [get_hash(f"rfid{i}") for i in range(1, args.users + 1)]
+    print(f"Punch of {args.punches} users (in and out) of {args.users} users with an rfid:")
+    for name, run in runs.items():
+        db = build_db(hashes)
+        day = datetime.combine(datetime.now().date(), time(7))
+        hour = iter(range(1000))
+
+        def punch_all() -> None:
+            for i in punched:
+                run(db, f"rfid{i}", day.replace(hour=7 + next(hour) % 12))
+
+        ms = timeit(punch_all, repeat=2) / len(punched)
+        print(f"  {name:<22} {ms:9.2f} ms per punch")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+    Benchmark: The midnight rollover of the user time, with all users logged in since yesterday. Compares the loop
+    before (logout and login per user, each with its own queries and commits) with the single transaction of
+    `crud_user_time.rollover`. Half of the users have an automatic break, half stay logged in after midnight.
+
+    Usage (from the repository root):
+    python -m benchmarks.bench_user_time_rollover --users 500
+"""
+
+import argparse
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from typing import Callable
+
+from benchmarks.utils import timeit
+
+from crud.user_time import crud_user_time  # isort:skip
+from db.base import Base  # isort:skip
+from db.models import UserModel  # isort:skip
+from db.models import UserTimeModel  # isort:skip
+from sqlalchemy import create_engine  # isort:skip
+from sqlalchemy import insert  # isort:skip
+from sqlalchemy.orm import Session  # isort:skip
+from sqlalchemy.orm import sessionmaker  # isort:skip
+
+REPEAT = 3
+
+
+def build_db(users: int, today: date) -> Session:
+    """Creates an in-memory database with the given number of users, all logged in since yesterday morning."""
+    yesterday = datetime.combine(today - timedelta(days=1), time(7))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": i,
+                    "created": yesterday,
+                    "username": f"user{i}",
+                    "full_name": f"User {i}",
+                    "email": f"user{i}@glados.local",
+                    "hashed_password": "-",
+                    "auto_logout": i % 2 == 0,
+                    "auto_break_from": time(12) if i % 2 == 0 else None,
+                    "auto_break_to": time(12, 30) if i % 2 == 0 else None,
+                }
+                for i in range(1, users + 1)
+            ],
+        )
+        connection.execute(
+            insert(UserTimeModel),
+            [{"user_id": i, "login": yesterday, "logout": None, "duration_minutes": None} for i in range(1, users + 1)],
+        )
+    return sessionmaker(bind=engine)()
+
+
+def rollover_old(db: Session, today: date) -> None:
+    """The rollover before the single transaction."""
+    login_timestamp = datetime.combine(today, time())
+    for user, entry in crud_user_time.get_logged_in(db=db):
+        logout_timestamp = entry.login.replace(hour=23, minute=59, second=59, microsecond=0)
+        crud_user_time.logout(db=db, db_obj_user=user, timestamp=logout_timestamp)
+        if not user.auto_logout and entry.login.date() == today - timedelta(days=1):
+            crud_user_time.login(db=db, db_obj_user=user, timestamp=login_timestamp)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=500, help="Number of logged in users")
+    args = parser.parse_args()
+
+    today = date.today()
+    runs: dict[str, Callable[[Session], object]] = {
+        "per user": lambda db: rollover_old(db, today),
+        "single transaction": lambda db: crud_user_time.rollover(db, today=today),
+    }
+
+    print(f"Rollover of {args.users} logged in users:")
+    results = {}
+    for name, run in runs.items():
+        sessions = [build_db(args.users, today) for _ in range(REPEAT)]
+        ms = timeit(lambda: run(sessions.pop()), repeat=REPEAT)
+        db = build_db(args.users, today)
+        run(db)
+        results[name] = sorted((e.user_id, e.login, e.logout, e.duration_minutes) for e in db.query(UserTimeModel))
+        print(f"  {name:<20} {ms:9.1f} ms")
+    assert results["per user"] == results["single transaction"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+    Reference instances and solver runs of the 1D stock cutting benchmark, shared by the benchmark script and the
+    regression test.
+
+    The bin packing instances are generated like the published sets, with a fixed seed:
+    - Falkenauer u: Items uniform in [20, 100], capacity 150.
+    - Falkenauer t: Triplets of items in [250, 500], each triplet fills a capacity of 1000 exactly, the optimum is n/3.
+    - Scholl 1: Items uniform in [w_min, 100], capacity 100, 120 or 150.
+    Our own cut lists are bars of 6m with a cut width of 3mm and up to 50 distinct lengths.
+
+    The baseline holds the lower bound of every instance and the stocks and runtime of every solver, it's written by
+    `python -m benchmarks.bench_stock_cut_1d_suite --update`. The regression test checks the stocks, the runtime is
+    only checked by the benchmark script with --check.
+"""
+
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import benchmarks.utils  # noqa: F401 # pylint: disable=unused-import # adds the app to the path
+
+from tools.stock_cut_1d.anytime import solve_anytime  # isort:skip
+from tools.stock_cut_1d.exact import solve_exact  # isort:skip
+from tools.stock_cut_1d.heuristics import improve  # isort:skip
+from tools.stock_cut_1d.heuristics import solve_BFD  # isort:skip
+from tools.stock_cut_1d.heuristics import solve_FFD  # isort:skip
+from tools.stock_cut_1d.models import JobModel  # isort:skip
+from tools.stock_cut_1d.models import TargetSizeModel  # isort:skip
+
+BASELINE = Path(__file__).parent / "stock_cut_1d_baseline.json"
+EXACT_TIME_LIMIT = 5  # seconds, above the timeout of the api, so slower machines still solve the baseline instances
+ANYTIME_TIME_LIMIT = 0.2  # seconds
+# a solver regresses, if it uses more stocks or if it's slower than the baseline by this factor plus the slack
+TIME_FACTOR = 3
+TIME_SLACK_MS = 20
+# the result of a time limited solver depends on the speed of the machine, it must not be worse than its start solution
+REFERENCE_SOLVER = {"anytime": "local_search"}
+# a time limited solver regresses, if it returns later than its time limit plus the slack, its runtime isn't compared
+# with the baseline
+TIME_LIMITS = {"anytime": ANYTIME_TIME_LIMIT}
+TIME_LIMIT_SLACK_MS = 100
+
+# the solvers return the cuts and the lower bound they proved, if any
+SOLVERS: Dict[str, Callable[[JobModel], Tuple[List[List[int]], Optional[int]]]] = {
+    "exact": lambda job: (solve_exact(job, timeout=EXACT_TIME_LIMIT), None),
+    "FFD": lambda job: (solve_FFD(job), None),
+    "BFD": lambda job: (solve_BFD(job), None),
+    "local_search": lambda job: (improve(job, solve_BFD(job)), None),
+    "anytime": lambda job: solve_anytime(job, time_limit=ANYTIME_TIME_LIMIT),
+}
+
+
+def bin_packing_job(capacity: int, items: List[int]) -> JobModel:
+    return JobModel(
+        max_length=capacity,
+        cut_width=0,
+        target_sizes=[TargetSizeModel(length=l, quantity=q) for l, q in sorted(Counter(items).items(), reverse=True)],
+    )
+
+
+def falkenauer_u(n: int, seed: int = 0) -> JobModel:
+    rng = random.Random(seed)
+    return bin_packing_job(150, [rng.randint(20, 100) for _ in range(n)])
+
+
+def falkenauer_t(n: int, seed: int = 0) -> JobModel:
+    rng = random.Random(seed)
+    items: List[int] = []
+    for _ in range(n // 3):
+        first = rng.randint(380, 490)
+        second = rng.randint(250, (1000 - first) // 2)
+        items.extend([first, second, 1000 - first - second])
+    return bin_packing_job(1000, items)
+
+
+def scholl_1(n: int, capacity: int, w_min: int, seed: int = 0) -> JobModel:
+    rng = random.Random(seed)
+    return bin_packing_job(capacity, [rng.randint(w_min, 100) for _ in range(n)])
+
+
+def cut_list(pieces: int, seed: int = 0) -> JobModel:
+    rng = random.Random(seed)
+    lengths = rng.sample(range(150, 3000), min(50, pieces))
+    quantities = [1] * len(lengths)
+    for _ in range(pieces - len(lengths)):
+        quantities[rng.randrange(len(lengths))] += 1
+    return JobModel(
+        max_length=6000,
+        cut_width=3,
+        target_sizes=[TargetSizeModel(length=l, quantity=q) for l, q in zip(lengths, quantities)],
+    )
+
+
+def reference_instances() -> Dict[str, JobModel]:
+    """Returns the instances of the benchmark by name."""
+    return {
+        "u120": falkenauer_u(120),
+        "u250": falkenauer_u(250),
+        "u500": falkenauer_u(500),
+        "t60": falkenauer_t(60),
+        "t120": falkenauer_t(120),
+        "t249": falkenauer_t(249),
+        "N1C1W1": scholl_1(50, 100, 1),
+        "N2C2W2": scholl_1(100, 120, 20),
+        "N3C3W4": scholl_1(200, 150, 30),
+        "N4C1W1": scholl_1(500, 100, 1),
+        "cut_list_40": cut_list(40),
+        "cut_list_500": cut_list(500),
+        "cut_list_5000": cut_list(5000),
+    }
+
+
+def known_optimum(name: str, job: JobModel) -> Optional[int]:
+    """The optimum of the triplet instances is known by construction."""
+    return len(job) // 3 if name.startswith("t") else None
+
+
+def run_solver(solver: str, job: JobModel) -> Dict[str, Optional[float]]:
+    """Runs the solver on the job and returns the number of stocks (None if the exact solver timed out), the lower
+    bound of the solver and the runtime in milliseconds."""
+    start = perf_counter()
+    try:
+        lengths, bound = SOLVERS[solver](job)
+        stocks: Optional[int] = len(lengths)
+    except TimeoutError:
+        stocks, bound = None, None
+    return {"stocks": stocks, "bound": bound, "ms": (perf_counter() - start) * 1000}
+
+
+def gap(stocks: Optional[int], bound: int) -> Optional[float]:
+    return None if stocks is None else (stocks - bound) / stocks
+
+
+def regressions(results: dict, baseline: dict, timing: bool = True) -> List[str]:
+    """Returns a message for every solver that uses more stocks or more time than in the baseline, or that exceeds its
+    time limit. Results and baseline map the instance names to the runs per solver, see the benchmark script.
+    Without timing only the stocks are compared, a run of the exact solver that timed out is skipped: The runtime
+    depends on the machine, the baseline is recorded on another one."""
+    messages: List[str] = []
+    for name, instance in results["instances"].items():
+        base_runs = baseline["instances"][name]["solvers"]
+        for solver, run in instance["solvers"].items():
+            base = base_runs.get(solver)
+            if base is None or base["stocks"] is None or (run["stocks"] is None and not timing):
+                continue
+            stocks = base_runs[REFERENCE_SOLVER.get(solver, solver)]["stocks"]
+            if run["stocks"] is None or run["stocks"] > stocks:
+                messages.append(f"{name}/{solver}: {run['stocks']} stocks, baseline {stocks}")
+            if not timing:
+                continue
+            if solver in TIME_LIMITS:
+                if run["ms"] > TIME_LIMITS[solver] * 1000 + TIME_LIMIT_SLACK_MS:
+                    messages.append(f"{name}/{solver}: {run['ms']:.1f} ms, time limit {TIME_LIMITS[solver] * 1000} ms")
+            elif run["ms"] > TIME_FACTOR * base["ms"] + TIME_SLACK_MS:
+                messages.append(f"{name}/{solver}: {run['ms']:.1f} ms, baseline {base['ms']:.1f} ms")
+    return messages
+
+
+def load_baseline() -> dict:
+    with open(BASELINE, "r", encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,65 @@
+"""
+    Shared helpers for the benchmark scripts.
+"""
+
+import os
+import sys
+from datetime import date
+from statistics import median
+from time import perf_counter
+from typing import Callable
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app"))
+
+
+def timeit(function: Callable, repeat: int = 5) -> float:
+    """Returns the median runtime of the given function in milliseconds."""
+    runs: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        runs.append((perf_counter() - start) * 1000)
+    return median(runs)
+
+
+def fake_bought_item(index: int) -> dict:
+    """Returns a dict that validates against the BoughtItemSchema, with realistic field lengths."""
+    return {
+        "id": index,
+        "status": "ordered",
+        "created": date(2024, 1, 1 + index % 28),
+        "creator_id": 1 + index % 20,
+        "high_priority": index % 7 == 0,
+        "notify_on_delivery": False,
+        "project_id": 1 + index % 50,
+        "project_number": f"P{24000 + index % 50:05d}",
+        "project_customer": "Aperture Science Inc.",
+        "project_description": "Assembly line retrofit for the test chamber conveyors",
+        "project_is_active": True,
+        "product_number": f"M{24000 + index % 50:05d}",
+        "quantity": float(1 + index % 12),
+        "unit": "PCS",
+        "partnumber": f"Linear guide rail {index % 300} - size 25",
+        "order_number": f"LGR-25-{index:08d}",
+        "manufacturer": "Bosch Rexroth",
+        "supplier": "Industrial Supplies Ltd.",
+        "weblink": None,
+        "group_1": "Mechanics",
+        "note_general": "Deliver to hall 3, gate B",
+        "note_supplier": None,
+        "desired_delivery_date": date(2024, 3, 1),
+        "creator_full_name": "Cave Johnson",
+        "requester_id": 2,
+        "requester_full_name": "Caroline",
+        "requested_date": date(2024, 1, 20),
+        "orderer_id": 3,
+        "orderer_full_name": "Doug Rattmann",
+        "ordered_date": date(2024, 1, 22),
+        "expected_delivery_date": date(2024, 2, 15),
+        "receiver_id": None,
+        "receiver_full_name": None,
+        "delivery_date": None,
+        "storage_place": None,
+    }
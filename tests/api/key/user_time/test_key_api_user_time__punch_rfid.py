@@ -0,0 +1,145 @@
+"""
+    TEST KEY API -- USER TIME -- PUNCH RFID
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from typing import Dict
+from typing import Tuple
+
+import pytest
+from api.schemas.api_key import APIKeyCreateSchema
+from config import cfg
+from crud.api_key import crud_api_key
+from crud.user import crud_user
+from db.models import UserModel
+from db.models import UserTimeModel
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_user
+from tests.utils.utils import random_email
+from tests.utils.utils import random_lower_string
+from tests.utils.utils import random_name
+from tests.utils.utils import random_username
+
+PUNCH_RFID_API = f"{cfg.server.api.key}/user-time/punch/rfid"
+
+
+@pytest.fixture(scope="module")
+def api_key_headers(db: Session) -> Dict[str, str]:
+    obj_in = APIKeyCreateSchema(name=random_lower_string(), expiration_date=datetime.now() + timedelta(days=1))
+    return {"api_key_header": crud_api_key.create(db, obj_in=obj_in).api_key}
+
+
+def create_rfid_user(db: Session) -> Tuple[UserModel, str]:
+    username, email, rfid = random_username(), random_email(), random_lower_string()
+    while crud_user.get_by_email(db, email=email) or crud_user.get_by_username(db, username=username):
+        username, email = random_username(), random_email()
+
+    user = create_user(
+        db, username=username, email=email, full_name=random_name(), password=random_lower_string(), rfid=rfid
+    )
+    return user, rfid
+
+
+def test_punch_rfid__unauthorized(client: TestClient, db: Session, api_key_headers: dict) -> None:
+    """
+    Test the punch rfid API endpoint without api key, and with an unknown rfid.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized) without api key.
+        - The response status code is 401 (Unauthorized) for an unknown rfid.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(f"{PUNCH_RFID_API}/{random_lower_string()}", headers={})
+    response_unknown = client.post(f"{PUNCH_RFID_API}/{random_lower_string()}", headers=api_key_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+    assert response_unknown.status_code == 401
+
+
+def test_punch_rfid(client: TestClient, db: Session, api_key_headers: dict) -> None:
+    """
+    Test the punch rfid API endpoint: The first punch logs the user in, the second logs them out.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The first punch returns the open entry, the second the same entry closed.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_user, t_rfid = create_rfid_user(db)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response_in = client.post(f"{PUNCH_RFID_API}/{t_rfid}", headers=api_key_headers)
+    response_out = client.post(f"{PUNCH_RFID_API}/{t_rfid}", headers=api_key_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_in.status_code == 200
+    assert response_out.status_code == 200
+
+    punch_in, punch_out = response_in.json(), response_out.json()
+    assert punch_in["user_id"] == punch_out["user_id"] == t_user.id
+    assert punch_in["full_name"] == t_user.full_name
+    assert punch_in["logged_in"] is True
+    assert punch_in["entry"]["logout"] is None
+    assert punch_out["logged_in"] is False
+    assert punch_out["entry"]["id"] == punch_in["entry"]["id"]
+    assert punch_out["entry"]["logout"] is not None
+
+
+def test_punch_rfid__concurrent(client: TestClient, db: Session, api_key_headers: dict) -> None:
+    """
+    Test the punch rfid API endpoint with 50 simultaneous punches, 10 for each of 5 users.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - Every user has toggled 10 times: Five closed entries and no open entry.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_users = [create_rfid_user(db) for _ in range(5)]
+    t_rfids = [rfid for _, rfid in t_users for _ in range(10)]
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    with ThreadPoolExecutor(max_workers=len(t_rfids)) as executor:
+        responses = list(
+            executor.map(lambda rfid: client.post(f"{PUNCH_RFID_API}/{rfid}", headers=api_key_headers), t_rfids)
+        )
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert all(response.status_code == 200 for response in responses)
+
+    db.expire_all()
+    for t_user, _ in t_users:
+        entries = db.query(UserTimeModel).filter_by(user_id=t_user.id).all()
+        assert len(entries) == 5
+        assert all(entry.logout is not None for entry in entries)
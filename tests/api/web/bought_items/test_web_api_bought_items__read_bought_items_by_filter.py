@@ -0,0 +1,159 @@
+"""
+    TEST WEB API -- BOUGHT ITEMS -- READ BY FILTER
+"""
+
+from api.schemas import PageSchema
+from api.schemas.host import HostConfigItemsBoughtFilterAddSchema
+from config import cfg
+from crud.bought_item_filter import crud_bought_item_filter
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.utils.bought_item import create_random_item
+from tests.utils.utils import random_lower_string
+
+READ_ITEMS_BY_FILTER_API = f"{cfg.server.api.web}/items/bought/filters"
+
+
+def test_read_items_by_filter__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the read items by filter API endpoint.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+        - The response JSON contains the expected error message.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(f"{READ_ITEMS_BY_FILTER_API}/default/items", headers={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid access token"
+
+
+def test_read_items_by_filter__not_found(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the read items by filter API endpoint with a filter that doesn't exist.
+
+    Assertions:
+        - The response status code is 404 (Not Found).
+        - The response JSON contains the expected error message.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(
+        f"{READ_ITEMS_BY_FILTER_API}/{random_lower_string()}/items", headers=normal_user_token_headers
+    )
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "This filter doesn't exist"
+
+
+def test_read_items_by_filter__normal_user(client: TestClient, db: Session, normal_user_token_headers: dict) -> None:
+    """
+    Test the read items by filter API endpoint for a normal user.
+    The filter result is cached, a new matching item must invalidate the cached result.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The filter matches only the items with the filtered manufacturer.
+        - A new item is part of the result of the next request.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    manufacturer = random_lower_string()
+    item_1 = create_random_item(db, test_fn_name=test_read_items_by_filter__normal_user.__name__)
+    item_1.manufacturer = manufacturer
+    db.commit()
+
+    filter_name = random_lower_string()
+    crud_bought_item_filter.create(
+        db, name=filter_name, obj_in=HostConfigItemsBoughtFilterAddSchema(manufacturer=manufacturer)
+    )
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response_1 = client.get(f"{READ_ITEMS_BY_FILTER_API}/{filter_name}/items", headers=normal_user_token_headers)
+
+    item_2 = create_random_item(db, test_fn_name=test_read_items_by_filter__normal_user.__name__)
+    item_2.manufacturer = manufacturer
+    db.commit()
+
+    response_2 = client.get(f"{READ_ITEMS_BY_FILTER_API}/{filter_name}/items", headers=normal_user_token_headers)
+    response_2_schema = PageSchema(**response_2.json())
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_1.status_code == 200
+    assert response_1.json()["total"] == 1
+    assert [i["id"] for i in response_1.json()["items"]] == [item_1.id]
+
+    assert response_2.status_code == 200
+    assert response_2_schema.total == 2
+    assert response_2_schema.pages == 1
+    assert [i["id"] for i in response_2.json()["items"]] == [item_2.id, item_1.id]
+
+    # ----------------------------------------------
+    # CLEANUP
+    # ----------------------------------------------
+
+    crud_bought_item_filter.delete(db, name=filter_name)
+
+
+def test_read_items_by_filter__invalid(client: TestClient, db: Session, normal_user_token_headers: dict) -> None:
+    """
+    Test the read items by filter API endpoint with a filter that contains invalid values.
+
+    Assertions:
+        - The response status code is 422 (Unprocessable Entity).
+        - The response JSON contains the expected error message.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    filter_name = random_lower_string()
+    crud_bought_item_filter.create(
+        db, name=filter_name, obj_in=HostConfigItemsBoughtFilterAddSchema(creatorId="not-a-number")
+    )
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(f"{READ_ITEMS_BY_FILTER_API}/{filter_name}/items", headers=normal_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "This filter contains invalid values"
+
+    # ----------------------------------------------
+    # CLEANUP
+    # ----------------------------------------------
+
+    crud_bought_item_filter.delete(db, name=filter_name)
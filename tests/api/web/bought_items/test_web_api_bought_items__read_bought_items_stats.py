@@ -0,0 +1,134 @@
+"""
+    TEST WEB API -- BOUGHT ITEMS -- READ STATS
+"""
+
+from datetime import date
+from datetime import timedelta
+
+from config import cfg
+from crud.bought_item import crud_bought_item
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.utils.bought_item import create_random_item
+from tests.utils.utils import random_lower_string
+
+READ_STATS_API = f"{cfg.server.api.web}/items/bought/stats"
+
+
+def test_read_stats__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the read stats API endpoint.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(f"{READ_STATS_API}/supplier", headers={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+
+
+def test_read_stats__normal_user(client: TestClient, db: Session, normal_user_token_headers: dict) -> None:
+    """
+    Test the read stats and read lead time stats API endpoints for a normal user.
+    Items of a unique supplier are created, the stats are filtered by this supplier.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The counts, sums and lead time percentiles match the created items.
+        - A new item is part of the stats of the next request (the cached stats are invalidated).
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    supplier = random_lower_string()
+    ordered = date.today() - timedelta(days=30)
+    lead_times = [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
+    for lead_time in lead_times:
+        item = create_random_item(db, test_fn_name=test_read_stats__normal_user.__name__)
+        item.supplier = supplier
+        item.status = cfg.items.bought.status.delivered
+        item.ordered_date = ordered
+        item.expected_delivery_date = ordered + timedelta(days=10)
+        item.delivery_date = ordered + timedelta(days=lead_time)
+    db.commit()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    params = {"supplier": supplier}
+    response_stats_1 = client.get(f"{READ_STATS_API}/supplier", headers=normal_user_token_headers, params=params)
+    response_lead_time = client.get(
+        f"{READ_STATS_API}/supplier/lead-time", headers=normal_user_token_headers, params=params
+    )
+
+    item = create_random_item(db, test_fn_name=test_read_stats__normal_user.__name__)
+    item.supplier = supplier
+    db.commit()
+
+    response_stats_2 = client.get(f"{READ_STATS_API}/supplier", headers=normal_user_token_headers, params=params)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_stats_1.status_code == 200
+    assert response_stats_1.json() == [
+        {"key": supplier, "count": 10, "quantity": 10, "open": 0, "delivered": 10, "late": 5, "late_rate": 0.5}
+    ]
+
+    assert response_lead_time.status_code == 200
+    assert response_lead_time.json() == [
+        {"key": supplier, "count": 10, "mean": 11, "min": 2, "p50": 10, "p90": 18, "p95": 20, "max": 20}
+    ]
+
+    assert response_stats_2.status_code == 200
+    assert response_stats_2.json()[0]["count"] == 11
+    assert response_stats_2.json()[0]["open"] == 1
+
+
+def test_read_stats__cache_bound(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test that the cached stats are bounded, when the stats are requested with many different filters.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The cache holds at most `maxsize` stats, the most recently requested stats are kept.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    cache = crud_bought_item._stats
+    suppliers = [random_lower_string() for _ in range(cache.maxsize + 10)]
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    responses = [
+        client.get(f"{READ_STATS_API}/supplier", headers=normal_user_token_headers, params={"supplier": supplier})
+        for supplier in suppliers
+    ]
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(cache._values) <= cache.maxsize
+    assert any(suppliers[-1] in str(key) for key in cache._values)
+    assert not any(suppliers[0] in str(key) for key in cache._values)
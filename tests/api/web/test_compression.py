@@ -0,0 +1,69 @@
+"""
+    TEST WEB API -- RESPONSE COMPRESSION
+"""
+
+from config import cfg
+from fastapi.testclient import TestClient
+
+READ_ITEMS_API = f"{cfg.server.api.web}/items/bought"
+READ_VERSION_API = f"{cfg.server.api.web}/host/version"
+
+
+def test_compression__large_response(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test that a large listing is gzip compressed when compression is enabled for the web api.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        normal_user_token_headers (dict): The headers containing the authentication token for a normal user.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The response is gzip encoded, if the response exceeds the configured minimum size.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(READ_ITEMS_API, headers={**normal_user_token_headers, "Accept-Encoding": "gzip"})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response.json()["items"]
+    if cfg.server.compression.web and len(response.content) >= cfg.server.compression.minimum_size:
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.num_bytes_downloaded < len(response.content)
+    else:
+        assert "content-encoding" not in response.headers
+
+
+def test_compression__small_response(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test that a response below the minimum size is never compressed.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        normal_user_token_headers (dict): The headers containing the authentication token for a normal user.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The response is not encoded.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(READ_VERSION_API, headers={**normal_user_token_headers, "Accept-Encoding": "gzip"})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert len(response.content) < cfg.server.compression.minimum_size
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,208 @@
+"""
+    TEST WEB API -- LOGS
+"""
+
+import asyncio
+import gzip
+from pathlib import Path
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from config import cfg
+from const import LOGS
+from fastapi.testclient import TestClient
+from utilities import log_files
+from utilities.log_files import follow_logfile
+
+from tests.utils.utils import random_lower_string
+
+LOGS_API = f"{cfg.server.api.web}/logs"
+LINES = [
+    "2026-10-18 08:00:00,000\tglados\tDEBUG\tConnecting to the database.",
+    "2026-10-18 08:00:01,000\tglados\tINFO\tServer started.",
+    "2026-10-18 08:00:02,000\tglados\tERROR\tCould not send mail.",
+    "Traceback (most recent call last):",
+    "2026-10-18 08:00:03,000\tglados\tINFO\tMail sent.",
+    "2026-10-18 08:00:04,000\tglados\tWARNING\tDisk almost full.",
+]
+
+
+@pytest.fixture
+def logfile() -> Iterator[Path]:
+    """Creates a log file with the `LINES` and an incomplete last line, removes it afterwards."""
+    created = not LOGS.exists()
+    LOGS.mkdir(exist_ok=True)
+    path = Path(LOGS, f"test.{random_lower_string()}.log")
+    path.write_bytes(("\n".join(LINES) + "\n2026-10-18 08:00:05,000\tglados\tINFO\tWrit").encode())
+    yield path
+    for file in (path, path.with_suffix(".log.gz")):
+        file.unlink(missing_ok=True)
+    if created:
+        LOGS.rmdir()
+
+
+def test_read_log_page(client: TestClient, admin_user_token_headers: dict, logfile: Path) -> None:
+    """
+    Test reading a log file page by page.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        admin_user_token_headers (dict): The headers containing the authentication token for an admin user.
+        logfile (Path): The log file to read.
+
+    Assertions:
+        - The pages contain the complete lines, the next page continues after the last line of the page.
+        - An offset inside a line starts with the next line.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    api = f"{LOGS_API}/{logfile.name}/page"
+    response_1 = client.get(api, params={"limit": 4}, headers=admin_user_token_headers)
+    response_2 = client.get(api, params={"offset": response_1.json()["next_offset"]}, headers=admin_user_token_headers)
+    response_3 = client.get(api, params={"offset": 3}, headers=admin_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_1.status_code == 200
+    assert response_1.json()["lines"] == LINES[:4]
+    assert response_1.json()["offset"] == 0
+    assert response_1.json()["eof"] is False
+
+    assert response_2.status_code == 200
+    assert response_2.json()["lines"] == LINES[4:]  # without the incomplete line
+    assert response_2.json()["next_offset"] == len("\n".join(LINES)) + 1
+    assert response_2.json()["eof"] is True
+
+    assert response_3.json()["lines"] == LINES[1:]
+    assert response_3.json()["offset"] == len(LINES[0]) + 1
+
+
+def test_read_log_page__tail_and_filter(client: TestClient, admin_user_token_headers: dict, logfile: Path) -> None:
+    """
+    Test reading the last lines of a log file, filtered by level and substring, also from a compressed log file.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        admin_user_token_headers (dict): The headers containing the authentication token for an admin user.
+        logfile (Path): The log file to read.
+
+    Assertions:
+        - The last lines are returned, lines without a level belong to the line before.
+        - Compressed log files return the same lines.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    logfile_gz = logfile.with_suffix(".log.gz")
+    logfile_gz.write_bytes(gzip.compress(logfile.read_bytes()))
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    responses = {}
+    for path in (logfile, logfile_gz):
+        api = f"{LOGS_API}/{path.name}/page"
+        responses[path] = (
+            client.get(api, params={"tail": 2}, headers=admin_user_token_headers),
+            client.get(api, params={"tail": 10, "level": "WARNING"}, headers=admin_user_token_headers),
+            client.get(api, params={"level": "INFO", "search": "MAIL"}, headers=admin_user_token_headers),
+        )
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    for response_tail, response_level, response_search in responses.values():
+        assert response_tail.status_code == 200
+        assert response_tail.json()["lines"] == LINES[-2:]
+        assert response_tail.json()["offset"] == len("\n".join(LINES[:-2])) + 1
+        assert response_level.json()["lines"] == [LINES[2], LINES[3], LINES[5]]
+        assert response_search.json()["lines"] == [LINES[2], LINES[4]]
+
+
+def test_read_log_page__not_found(client: TestClient, admin_user_token_headers: dict, logfile: Path) -> None:
+    """
+    Test reading log files that don't exist or are outside of the logs-folder.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        admin_user_token_headers (dict): The headers containing the authentication token for an admin user.
+        logfile (Path): A log file, to ensure the logs-folder exists.
+
+    Assertions:
+        - The response status codes are 404 (Not Found).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response_missing = client.get(f"{LOGS_API}/{random_lower_string()}.log/page", headers=admin_user_token_headers)
+    response_outside = client.get(f"{LOGS_API}/..%2Fpyproject.toml/page", headers=admin_user_token_headers)
+    response_follow = client.get(f"{LOGS_API}/{random_lower_string()}.log/follow", headers=admin_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_missing.status_code == 404
+    assert response_outside.status_code == 404
+    assert response_follow.status_code == 404
+
+
+def test_follow_log(monkeypatch: pytest.MonkeyPatch, logfile: Path) -> None:
+    """
+    Test following a log file that is written and rotated.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to shorten the poll interval.
+        logfile (Path): The log file to follow.
+
+    Assertions:
+        - The stream starts at the end of the file and yields the completed and new lines that match the filter.
+        - The stream starts from the beginning after the file is rotated.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    monkeypatch.setattr(log_files, "LOG_FOLLOW_POLL_INTERVAL", 0.01)
+
+    async def follow() -> List[dict]:
+        pages = []
+        stream = follow_logfile(logfile.name, level="INFO")
+        pages.append(await anext(stream))
+        with open(logfile, "ab") as file:
+            file.write(b"ing.\n2026-10-18 08:00:06,000\tglados\tDEBUG\tHidden.\n")
+        pages.append(await anext(stream))
+        logfile.write_bytes(b"2026-10-18 08:00:07,000\tglados\tINFO\tRotated.\n")
+        pages.append(await anext(stream))
+        await stream.aclose()
+        return pages
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    start, written, rotated = asyncio.run(follow())
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert start["lines"] == []
+    assert start["offset"] == len("\n".join(LINES)) + 1  # at the start of the incomplete line
+    assert written["lines"] == ["2026-10-18 08:00:05,000\tglados\tINFO\tWriting."]
+    assert rotated["lines"] == ["2026-10-18 08:00:07,000\tglados\tINFO\tRotated."]
+    assert rotated["offset"] == 0
@@ -0,0 +1,132 @@
+"""
+    TEST WEB API -- METRICS
+"""
+
+import re
+
+import pytest
+
+from config import cfg
+from fastapi.testclient import TestClient
+from utilities.metrics import Metrics
+from utilities.metrics import RequestStats
+
+METRICS_API = f"{cfg.server.api.web}/metrics"
+READ_USER_API = f"{cfg.server.api.web}/users/1"
+
+
+def read_sample(text: str, name: str, **labels: str) -> float:
+    """Returns the value of the sample of the metric with the given labels, fails if there's none."""
+    for line in text.splitlines():
+        if line.startswith(f"glados_{name}{{") and all(f'{key}="{value}"' in line for key, value in labels.items()):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample of {name!r} with the labels {labels!r}")
+
+
+def test_read_metrics(client: TestClient, admin_user_token_headers: dict) -> None:
+    """
+    Test reading the metrics after a request.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        admin_user_token_headers (dict): The headers containing the authentication token for an admin user.
+
+    Assertions:
+        - The response status code is 200 (OK), the metrics are in the Prometheus text format.
+        - The request is counted with its route template, its latency and its queries.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    client.get(READ_USER_API, headers=admin_user_token_headers)
+    labels = {"api": "web", "method": "GET", "route": "/users/{user_id}"}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(METRICS_API, headers=admin_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE glados_http_request_duration_seconds histogram" in response.text
+
+    assert read_sample(response.text, "http_requests_total", **labels, status="200") >= 1
+    assert read_sample(response.text, "http_request_duration_seconds_count", **labels) >= 1
+    assert read_sample(response.text, "http_request_duration_seconds_bucket", **labels, le="+Inf") >= 1
+    assert read_sample(response.text, "db_queries_total", **labels) >= 1
+    assert read_sample(response.text, "http_requests_in_flight", api="web") >= 1  # the metrics request itself
+    assert not re.search(r'route="/users/1"', response.text)
+    assert re.search(r"^glados_mail_outbox_pending \d+$", response.text, re.MULTILINE)
+
+
+def test_read_metrics__unauthorized(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test reading the metrics as user without admin rights.
+
+    Args:
+        client (TestClient): The test client used to make the API request.
+        normal_user_token_headers (dict): The headers containing the authentication token for a normal user.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(METRICS_API, headers=normal_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+
+
+def test_metrics__render() -> None:
+    """
+    Test the text format of the metrics.
+
+    Assertions:
+        - The buckets of the latency histogram are cumulative.
+        - Label values are escaped, slow queries are counted.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_metrics = Metrics(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.5, 5.0):
+        t_metrics.request_started("key")
+        t_metrics.request_finished("key", "POST", '/a"b', 201, duration, RequestStats(queries=2, query_seconds=0.01))
+    t_metrics.query_finished(3600, "SELECT 1")
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    text = t_metrics.render([("test_gauge", "A gauge.", 7)])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    labels = {"api": "key", "method": "POST", "route": '/a\\"b'}
+    assert read_sample(text, "http_requests_total", **labels, status="201") == 3
+    assert read_sample(text, "http_request_duration_seconds_bucket", **labels, le="0.1") == 1
+    assert read_sample(text, "http_request_duration_seconds_bucket", **labels, le="1.0") == 2
+    assert read_sample(text, "http_request_duration_seconds_bucket", **labels, le="+Inf") == 3
+    assert read_sample(text, "http_request_duration_seconds_sum", **labels) == pytest.approx(5.55)
+    assert read_sample(text, "http_requests_in_flight", api="key") == 0
+    assert read_sample(text, "db_queries_total", **labels) == 6
+    assert "glados_db_slow_queries_total 1" in text
+    assert "glados_test_gauge 7" in text
@@ -0,0 +1,1089 @@
+"""
+    TEST WEB API -- TOOLS -- STOCK CUT 1D
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import time
+from concurrent.futures.process import BrokenProcessPool
+from itertools import permutations
+from typing import List
+from typing import Tuple
+from time import perf_counter
+
+import pytest
+from api import solver
+from benchmarks.stock_cut_1d_instances import falkenauer_t
+from config import cfg
+from const import EXACT_SOLVER_TIMEOUT
+from const import TIME_LIMIT_MAX_MS
+from exceptions import SolverPoolSaturatedError
+from exceptions import SolverTimeoutError
+from fastapi.testclient import TestClient
+from tools.pool import SolverPool
+from tools.pool import solver_pool
+from tools.stock_cut_1d import heuristics
+from tools.stock_cut_1d import multi_stock
+from tools.stock_cut_1d.cache import ResultCache
+from tools.stock_cut_1d.cache import result_cache
+from tools.stock_cut_1d.common import Objective
+from tools.stock_cut_1d.core import Pieces
+from tools.stock_cut_1d.common import SolverType
+from tools.stock_cut_1d.exact import lower_bound
+from tools.stock_cut_1d.exact import solve_exact
+from tools.stock_cut_1d.heuristics import improve
+from tools.stock_cut_1d.heuristics import solve_BFD
+from tools.stock_cut_1d.heuristics import solve_FFD
+from tools.stock_cut_1d.models import JobModel
+from tools.stock_cut_1d.models import MultiStockJobModel
+from tools.stock_cut_1d.models import StockModel
+from tools.stock_cut_1d.models import TargetSizeModel
+from tools.stock_cut_1d.solver import distribute
+from tools.stock_cut_1d.solver import distribute_multi_stock
+
+SOLVE_1D_API = f"{cfg.server.api.web}/tools/stock-cut/1d/solve"
+SOLVE_1D_BATCH_API = f"{cfg.server.api.web}/tools/stock-cut/1d/solve-batch"
+SOLVE_1D_MULTI_STOCK_API = f"{cfg.server.api.web}/tools/stock-cut/1d/solve-multi-stock"
+
+
+def assert_valid_packing(job: JobModel, lengths: list) -> None:
+    """Asserts that every piece is cut exactly once and no stock is overfilled."""
+    assert sorted(length for stock in lengths for length in stock) == sorted(job.iterate_sizes())
+    assert all(sum(stock) + len(stock) * job.cut_width <= job.max_length for stock in lengths)
+
+
+def count_stocks_bruteforce(job: JobModel) -> int:
+    """Returns the fewest stocks of all orders of the pieces, each order is cut from the stocks one after another.
+    The reference solution for small cut lists, O(n!)."""
+    weights = [length + job.cut_width for length in job.iterate_sizes()]
+    fewest = len(weights)
+    for combination in permutations(weights):
+        stocks, current = 1, 0
+        for weight in combination:
+            current += weight
+            if current > job.max_length:
+                stocks, current = stocks + 1, weight
+        fewest = min(fewest, stocks)
+    return fewest
+
+
+def test_solve_1d__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the solve 1d API endpoint.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers={}, json={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+
+
+def test_solve_1d__exact(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d API endpoint with a cut list of 48 pieces, which FFD doesn't solve optimally.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The exact solver is used and returns a valid packing with the least number of stocks.
+        - The lower bound is the number of stocks, the gap is zero.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    target_sizes = [(2394, 7), (2644, 6), (173, 7), (1721, 5), (2249, 8), (679, 7), (2274, 4), (2449, 7)]
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": length, "quantity": quantity} for length, quantity in target_sizes],
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+
+    result = response.json()
+    job = JobModel(**data)
+    assert result["solver_type"] == SolverType.exact.value
+    assert_valid_packing(job, result["lengths"])
+    assert len(result["lengths"]) == lower_bound(job) == 18
+    assert result["lower_bound"] == 18
+    assert result["gap"] == 0
+
+
+def test_solve_exact__bruteforce() -> None:
+    """
+    Test the exact solver against the brute force solver on small random cut lists.
+
+    Assertions:
+        - The packing of the exact solver is valid.
+        - The exact solver uses as few stocks as the brute force solver.
+    """
+
+    rng = random.Random(0)
+    for _ in range(100):
+        # ----------------------------------------------
+        # PREPARE TEST
+        # ----------------------------------------------
+
+        lengths = [rng.randint(50, 900) for _ in range(rng.randint(1, 7))]
+        job = JobModel(
+            max_length=1000,
+            cut_width=rng.choice([0, 3]),
+            target_sizes=[TargetSizeModel(length=length, quantity=lengths.count(length)) for length in set(lengths)],
+        )
+
+        # ----------------------------------------------
+        # METHODS TO TEST
+        # ----------------------------------------------
+
+        lengths_exact = solve_exact(job, timeout=10)
+
+        # ----------------------------------------------
+        # VALIDATION
+        # ----------------------------------------------
+
+        assert_valid_packing(job, lengths_exact)
+        assert len(lengths_exact) == count_stocks_bruteforce(job)
+
+
+def test_solve_exact__large_cut_lists() -> None:
+    """
+    Test the exact solver on random cut lists of 30 to 60 pieces.
+
+    Assertions:
+        - The packing is valid and uses as many stocks as the lower bound, or one more.
+        - Every cut list is solved within the time limit of the exact solver in `distribute`.
+    """
+
+    rng = random.Random(1)
+    for _ in range(20):
+        # ----------------------------------------------
+        # PREPARE TEST
+        # ----------------------------------------------
+
+        types = rng.randint(4, 12)
+        lengths = rng.sample(range(150, 3000), types)
+        quantities = [1] * types
+        for _ in range(rng.randint(30, 60) - types):
+            quantities[rng.randrange(types)] += 1
+        job = JobModel(
+            max_length=6000,
+            cut_width=3,
+            target_sizes=[TargetSizeModel(length=l, quantity=q) for l, q in zip(lengths, quantities)],
+        )
+
+        # ----------------------------------------------
+        # METHODS TO TEST
+        # ----------------------------------------------
+
+        start = perf_counter()
+        lengths_exact = solve_exact(job, timeout=10)
+        duration = perf_counter() - start
+
+        # ----------------------------------------------
+        # VALIDATION
+        # ----------------------------------------------
+
+        assert_valid_packing(job, lengths_exact)
+        assert lower_bound(job) <= len(lengths_exact) <= lower_bound(job) + 1
+        assert duration < EXACT_SOLVER_TIMEOUT
+
+
+def test_solve_1d__large_cut_list(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d API endpoint with a cut list that is too large for the exact solver.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - BFD is used and returns a valid packing.
+        - The lower bound and the gap are consistent with the packing.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(2)
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": rng.randint(150, 3000), "quantity": rng.randint(1, 40)} for _ in range(100)],
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["solver_type"] == SolverType.BFD.value
+    assert_valid_packing(JobModel(**data), result["lengths"])
+    assert 0 < result["lower_bound"] <= len(result["lengths"])
+    assert result["gap"] == (len(result["lengths"]) - result["lower_bound"]) / len(result["lengths"])
+
+
+def test_solve_1d__time_limit(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d API endpoint with a time limit.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The anytime solver is used and returns a valid packing within the time limit (plus some slack for the
+          request itself).
+        - The packing uses no more stocks than the packing without time limit.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(4)
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": rng.randint(150, 3000), "quantity": rng.randint(1, 40)} for _ in range(50)],
+    }
+    lengths_bfd = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data).json()["lengths"]
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    start = perf_counter()
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json={**data, "time_limit_ms": 500})
+    duration = perf_counter() - start
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["solver_type"] in (SolverType.local_search.value, SolverType.exact.value)
+    assert_valid_packing(JobModel(**data), result["lengths"])
+    assert len(result["lengths"]) <= len(lengths_bfd)
+    assert result["lower_bound"] <= len(result["lengths"])
+    assert duration < 2
+
+
+def test_solve_1d__time_limit_invalid(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d API endpoint with a time limit above the maximum.
+
+    Assertions:
+        - The response status code is 422 (Unprocessable Entity).
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": 1000, "quantity": 10}],
+        "time_limit_ms": TIME_LIMIT_MAX_MS + 1,
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 422
+
+
+def test_pieces__compact() -> None:
+    """
+    Test the compact form of the pieces of a job, which the solvers work on.
+
+    Assertions:
+        - Equal lengths are merged, the weights are the lengths plus the cut width, sorted descending.
+        - Iterating yields the weight of every piece, the pieces are counted.
+        - Stocks of weights convert back to stocks of lengths.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    job = JobModel(
+        max_length=6000,
+        cut_width=3,
+        target_sizes=[
+            TargetSizeModel(length=1000, quantity=2),
+            TargetSizeModel(length=2500, quantity=1),
+            TargetSizeModel(length=1000, quantity=3),
+        ],
+    )
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    pieces = Pieces.from_job(job)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert pieces.weights.tolist() == [2503, 1003]
+    assert pieces.counts.tolist() == [1, 5]
+    assert list(pieces) == [2503] + [1003] * 5
+    assert len(pieces) == len(job) == 6
+    assert pieces.lengths([[2503, 1003], [1003]]) == [[2500, 1000], [1000]]
+    assert pieces.weights_of([[2500, 1000]]) == [[2503, 1003]]
+
+
+def test_solve_heuristics__exact_fit() -> None:
+    """
+    Test FFD and BFD with pieces that fill the stocks exactly.
+
+    Assertions:
+        - Two pieces and their cuts are cut from one stock.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    job = JobModel(max_length=1006, cut_width=3, target_sizes=[TargetSizeModel(length=500, quantity=4)])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert solve_FFD(job) == [[500, 500], [500, 500]]
+    assert solve_BFD(job) == [[500, 500], [500, 500]]
+
+
+def test_solve_heuristics__large_cut_list() -> None:
+    """
+    Test FFD, BFD and the local search on a cut list of 20000 pieces.
+
+    Assertions:
+        - All packings are valid.
+        - The local search doesn't use more stocks than BFD.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(3)
+    job = JobModel(
+        max_length=6000,
+        cut_width=3,
+        target_sizes=[TargetSizeModel(length=rng.randint(150, 3000), quantity=200) for _ in range(100)],
+    )
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    lengths_ffd = solve_FFD(job)
+    lengths_bfd = solve_BFD(job)
+    lengths_improved = improve(job, lengths_bfd)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert_valid_packing(job, lengths_ffd)
+    assert_valid_packing(job, lengths_bfd)
+    assert_valid_packing(job, lengths_improved)
+    assert len(lengths_improved) <= len(lengths_bfd)
+
+
+def test_solve_1d__large_max_length(
+    client: TestClient, normal_user_token_headers: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the solve 1d API endpoint with a max length too large for the best fit tree.
+
+    Assertions:
+        - The response status code is 200 (OK), BFD returns a valid packing.
+        - BFD with a sorted list uses as many stocks as BFD with the tree.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(4)
+    data = {
+        "max_length": 2_000_000_000,
+        "cut_width": 3,
+        "target_sizes": [{"length": rng.randint(10**8, 9 * 10**8), "quantity": 1} for _ in range(101)],
+    }
+    job = JobModel(
+        max_length=6000,
+        cut_width=3,
+        target_sizes=[TargetSizeModel(length=rng.randint(150, 3000), quantity=20) for _ in range(100)],
+    )
+    lengths_tree = solve_BFD(job)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+    monkeypatch.setattr(heuristics, "_TREE_MAX_CAPACITY", 0)
+    lengths_sorted = solve_BFD(job)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response.json()["solver_type"] == SolverType.BFD.value
+    assert_valid_packing(JobModel(**data), response.json()["lengths"])
+
+    assert_valid_packing(job, lengths_sorted)
+    assert len(lengths_sorted) == len(lengths_tree)
+
+
+def test_solve_1d__pool_saturated(
+    client: TestClient, normal_user_token_headers: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the solve 1d API endpoint while the solver pool is saturated.
+
+    Assertions:
+        - The response status code is 503 (Service Unavailable).
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    monkeypatch.setattr(solver_pool, "capacity", 0)
+    result_cache.clear()
+    data = {"max_length": 6000, "cut_width": 3, "target_sizes": [{"length": 1000, "quantity": 10}]}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 503
+
+
+def test_solve_1d__timeout(
+    client: TestClient, normal_user_token_headers: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the solve 1d API endpoint with a job that exceeds the timeout of the solver pool.
+
+    Assertions:
+        - The response status code is 504 (Gateway Timeout).
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    monkeypatch.setattr(solver, "SOLVER_TIMEOUT", 0.2)
+    rng = random.Random(5)
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": rng.randint(150, 3000), "quantity": 400} for _ in range(100)],
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 504
+
+
+def test_solver_pool__run() -> None:
+    """
+    Test a solver pool with a single worker.
+
+    Assertions:
+        - The result of the job is returned, exceptions of the job are raised.
+        - The pool rejects jobs beyond its capacity.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    pool = SolverPool(workers=1, queue_size=0)
+    job = JobModel(max_length=6000, cut_width=3, target_sizes=[TargetSizeModel(length=1000, quantity=60000)])
+
+    # ----------------------------------------------
+    # METHODS TO TEST & VALIDATION
+    # ----------------------------------------------
+
+    assert asyncio.run(pool.run(max, 1, 2, timeout=10)) == 2
+
+    with pytest.raises(OverflowError):
+        asyncio.run(pool.run(distribute, job, None, timeout=10))
+
+    future = pool.submit(sum, range(10**7))
+    with pytest.raises(SolverPoolSaturatedError):
+        pool.submit(max, 1, 2)
+    assert future.result() == sum(range(10**7))
+
+    pool.shutdown()
+
+
+def test_solver_pool__recover() -> None:
+    """
+    Test a solver pool whose worker dies and whose running job is abandoned.
+
+    Assertions:
+        - A job whose worker dies raises BrokenProcessPool, the next jobs run on new workers.
+        - A running job that exceeds the time limit is killed and releases its slot.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    pool = SolverPool(workers=1, queue_size=0)
+
+    # ----------------------------------------------
+    # METHODS TO TEST & VALIDATION
+    # ----------------------------------------------
+
+    with pytest.raises(BrokenProcessPool):
+        asyncio.run(pool.run(os._exit, 1, timeout=10))
+    assert asyncio.run(pool.run(max, 1, 2, timeout=10)) == 2
+    assert asyncio.run(pool.run(max, 3, 4, timeout=10)) == 4
+    assert pool.jobs == 0
+
+    with pytest.raises(SolverTimeoutError):
+        asyncio.run(pool.run(time.sleep, 60, timeout=0.5))
+    assert pool.jobs == 0
+    assert asyncio.run(pool.run(max, 5, 6, timeout=10)) == 6
+
+    pool.shutdown()
+
+
+def test_solve_1d__cached(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d API endpoint with a job that has been solved before, with the sizes in another order and split.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The first result isn't cached, the second one is.
+        - Both results have the same cuts, the second one contains the job as requested.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    result_cache.clear()
+    data = {
+        "max_length": 6000,
+        "cut_width": 3,
+        "target_sizes": [{"length": 2394, "quantity": 7}, {"length": 173, "quantity": 7}],
+    }
+    data_reordered = {
+        **data,
+        "target_sizes": [
+            {"length": 173, "quantity": 7},
+            {"length": 2394, "quantity": 3},
+            {"length": 2394, "quantity": 4},
+        ],
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data)
+    response_cached = client.post(SOLVE_1D_API, headers=normal_user_token_headers, json=data_reordered)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response_cached.status_code == 200
+
+    result = response.json()
+    result_cached = response_cached.json()
+    assert result["cached"] is False
+    assert result_cached["cached"] is True
+    assert result_cached["lengths"] == result["lengths"]
+    assert result_cached["job"]["target_sizes"] == data_reordered["target_sizes"]
+
+
+def test_result_cache__persist(tmp_path) -> None:
+    """
+    Test the result cache with persistence and a size of two results.
+
+    Assertions:
+        - A result is found by a new cache on the same file.
+        - The least recently used result is dropped, also from the file.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    path = tmp_path / "cache.db"
+    jobs = [
+        JobModel(max_length=1000, cut_width=0, target_sizes=[TargetSizeModel(length=100 * i, quantity=2)])
+        for i in range(1, 4)
+    ]
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    cache = ResultCache(size=2, path=path)
+    for job in jobs:
+        cache.put(job, None, distribute(job))
+        cache.get(jobs[0], None)
+    cache_restarted = ResultCache(size=2, path=path)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert cache_restarted.get(jobs[0], None) is not None
+    assert cache_restarted.get(jobs[1], None) is None
+    assert cache_restarted.get(jobs[2], None).cached is True
+    assert cache_restarted.get(jobs[2], 1000) is None
+
+
+def test_result_cache__flush(tmp_path) -> None:
+    """
+    Test that a hit of the persisted result cache doesn't write to the file until the cache is flushed.
+
+    Assertions:
+        - The access time of a hit is only in memory, the file still holds the time of the put.
+        - After the flush the file holds the access time of the hit.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    path = tmp_path / "cache.db"
+    job = JobModel(max_length=1000, cut_width=0, target_sizes=[TargetSizeModel(length=100, quantity=2)])
+    cache = ResultCache(size=2, path=path)
+    cache.put(job, None, distribute(job))
+
+    def accessed() -> float:
+        with sqlite3.connect(path) as connection:
+            return connection.execute("SELECT accessed FROM result").fetchone()[0]
+
+    put_accessed = accessed()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    time.sleep(0.01)
+    result = cache.get(job, None)
+    hit_accessed = accessed()
+    cache.flush()
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert result is not None
+    assert hit_accessed == put_accessed
+    assert accessed() > put_accessed
+
+
+def test_solve_1d_batch__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the solve 1d batch API endpoint.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_BATCH_API, headers={}, json=[])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+
+
+def test_solve_1d_batch(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d batch API endpoint with four valid jobs and an invalid one.
+
+    Assertions:
+        - The response status code is 200 (OK), the response is newline delimited json.
+        - There's one line per job, each index is reported once.
+        - The valid jobs have valid results, the invalid job has the status code 406.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(6)
+    data = [
+        {
+            "max_length": 6000,
+            "cut_width": 3,
+            "target_sizes": [{"length": rng.randint(150, 3000), "quantity": rng.randint(1, 5)} for _ in range(8)],
+        }
+        for _ in range(4)
+    ]
+    data.insert(2, {"max_length": 1000, "cut_width": 3, "target_sizes": [{"length": 999, "quantity": 1}]})
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_BATCH_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2, 3, 4]
+    for line in lines:
+        if line["index"] == 2:
+            assert line["status_code"] == 406
+            assert line["result"] is None
+        else:
+            assert line["status_code"] == 200
+            assert_valid_packing(JobModel(**data[line["index"]]), line["result"]["lengths"])
+
+
+def test_solve_1d_batch__gzip(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d batch API endpoint with a client that accepts gzip, with an invalid job and a job that runs
+    into its time limit. The app is called directly, the test client would collect the whole response.
+
+    Assertions:
+        - The response is newline delimited json and isn't compressed.
+        - Every line is sent on its own, the line of the invalid job arrives before the other job is finished.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    # the triplet instance of a new seed isn't cached and isn't solved to optimality within the time limit
+    slow_job = falkenauer_t(249, seed=random.randrange(1 << 30)).model_dump()
+    data = [
+        {"max_length": 1000, "cut_width": 3, "target_sizes": [{"length": 999, "quantity": 1}]},
+        {**slow_job, "time_limit_ms": 1000},
+    ]
+    body = json.dumps(data).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": SOLVE_1D_BATCH_API,
+        "raw_path": SOLVE_1D_BATCH_API.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"accept-encoding", b"gzip"),
+            *[(key.lower().encode(), value.encode()) for key, value in normal_user_token_headers.items()],
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def post() -> Tuple[dict, List[Tuple[float, bytes]]]:
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent: List[Tuple[float, bytes]] = []
+        start: dict = {}
+
+        async def receive() -> dict:
+            if messages:
+                return messages.pop()
+            await asyncio.Event().wait()  # the client stays connected
+            return {}
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message.get("body"):
+                sent.append((perf_counter(), message["body"]))
+
+        await client.app(scope, receive, send)
+        return start, sent
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    start, sent = asyncio.run(post())
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    headers = {key.decode(): value.decode() for key, value in start["headers"]}
+    assert start["status"] == 200
+    assert headers["content-type"].startswith("application/x-ndjson")
+    assert "content-encoding" not in headers
+
+    assert len(sent) == 2
+    lines = [json.loads(chunk) for _, chunk in sent]
+    assert [line["index"] for line in lines] == [0, 1]
+    assert [line["status_code"] for line in lines] == [406, 200]
+    assert sent[1][0] - sent[0][0] > 0.1
+
+
+def test_solve_1d_multi_stock(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d multi stock API endpoint with two bar lengths and remnants, which are preferred.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - Every piece is cut exactly once and no stock is overfilled.
+        - The quantities of the stocks are respected, all remnants are used.
+        - The total cost and waste are the sums of the stocks.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(7)
+    data = {
+        "stocks": [
+            {"length": 6000, "cost": 10},
+            {"length": 12000, "cost": 18},
+            {"length": 2500, "quantity": 3, "cost": 0, "remnant": True},
+        ],
+        "cut_width": 3,
+        "target_sizes": [{"length": rng.randint(150, 2400), "quantity": rng.randint(1, 10)} for _ in range(40)],
+        "prefer_remnants": True,
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_MULTI_STOCK_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["solver_type"] == SolverType.best_fill
+
+    job = MultiStockJobModel(**data)
+    cuts = [length for stock in result["stocks"] for length in stock["lengths"]]
+    assert sorted(cuts) == sorted(job.iterate_sizes())
+    for stock in result["stocks"]:
+        assert sum(stock["lengths"]) + len(stock["lengths"]) * job.cut_width + stock["waste"] == stock["length"]
+    assert sum(1 for stock in result["stocks"] if stock["remnant"]) == 3
+    assert result["cost"] == sum(stock["cost"] for stock in result["stocks"])
+    assert result["waste"] == sum(stock["waste"] for stock in result["stocks"])
+
+
+def test_solve_1d_multi_stock__not_enough_stock(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 1d multi stock API endpoint with too few stocks and with a piece that fits no stock.
+
+    Assertions:
+        - The response status code is 507 if the stocks run out.
+        - The response status code is 406 if a piece is longer than the longest stock.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    data = {
+        "stocks": [{"length": 6000, "quantity": 2}],
+        "cut_width": 3,
+        "target_sizes": [{"length": 4000, "quantity": 3}],
+    }
+    data_too_long = {
+        "stocks": [{"length": 6000}],
+        "cut_width": 3,
+        "target_sizes": [{"length": 5999, "quantity": 1}],
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_1D_MULTI_STOCK_API, headers=normal_user_token_headers, json=data)
+    response_too_long = client.post(SOLVE_1D_MULTI_STOCK_API, headers=normal_user_token_headers, json=data_too_long)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 507
+    assert response_too_long.status_code == 406
+
+
+def test_solve_multi_stock__objective() -> None:
+    """
+    Test the multi stock solver with several hundred pieces, minimizing cost and minimizing waste.
+
+    Assertions:
+        - Each result cuts every piece exactly once and uses no more stocks than available.
+        - Each objective is at least as good as the other objective's result in its own measure.
+        - Each job solves in interactive time.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(8)
+    stocks = [
+        StockModel(length=6000, cost=10),
+        StockModel(length=12000, cost=18),
+        StockModel(length=4000, quantity=20, cost=8),
+        StockModel(length=1800, quantity=5, cost=0, remnant=True),
+    ]
+    target_sizes = [TargetSizeModel(length=rng.randint(150, 3000), quantity=rng.randint(1, 25)) for _ in range(50)]
+    jobs = {
+        objective: MultiStockJobModel(stocks=stocks, cut_width=3, target_sizes=target_sizes, objective=objective)
+        for objective in Objective
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    results = {}
+    durations = {}
+    for objective, job in jobs.items():
+        start = perf_counter()
+        results[objective] = distribute_multi_stock(job)
+        durations[objective] = perf_counter() - start
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    for objective, result in results.items():
+        result.assert_valid()
+        job = jobs[objective]
+        assert len(job) > 500
+        assert sorted(length for stock in result.stocks for length in stock.lengths) == sorted(job.iterate_sizes())
+        assert sum(1 for stock in result.stocks if stock.length == 4000) <= 20
+        assert sum(1 for stock in result.stocks if stock.length == 1800) <= 5
+        assert durations[objective] < 1
+
+    assert results[Objective.cost].cost <= results[Objective.waste].cost
+    assert results[Objective.waste].waste <= results[Objective.cost].waste
+
+
+def test_solve_multi_stock__large_stock_length(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the multi stock solver with stocks too long for the subset sum bitset.
+
+    Assertions:
+        - Every piece is cut exactly once, no stock is overfilled.
+        - The stocks are filled almost as well as with the full bitset.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    rng = random.Random(9)
+    target_sizes = [
+        TargetSizeModel(length=rng.randint(10**7, 3 * 10**8), quantity=rng.randint(1, 5)) for _ in range(30)
+    ]
+    job = MultiStockJobModel(
+        stocks=[StockModel(length=10**9), StockModel(length=6 * 10**8, quantity=10)],
+        cut_width=3,
+        target_sizes=target_sizes,
+    )
+    job_small = MultiStockJobModel(
+        stocks=[StockModel(length=10000), StockModel(length=6000, quantity=10)],
+        cut_width=3,
+        target_sizes=[TargetSizeModel(length=rng.randint(100, 3000), quantity=5) for _ in range(30)],
+    )
+    result_exact = distribute_multi_stock(job_small)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    result = distribute_multi_stock(job)
+    monkeypatch.setattr(multi_stock, "_BITSET_MAX_CAPACITY", 1000)
+    result_scaled = distribute_multi_stock(job_small)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    for job, result in ((job, result), (job_small, result_scaled)):
+        result.assert_valid()
+        assert sorted(length for stock in result.stocks for length in stock.lengths) == sorted(job.iterate_sizes())
+    assert result_scaled.waste <= result_exact.waste * 1.1
@@ -0,0 +1,53 @@
+"""
+    TEST WEB API -- TOOLS -- STOCK CUT 1D -- BENCHMARK
+"""
+
+from benchmarks.stock_cut_1d_instances import gap
+from benchmarks.stock_cut_1d_instances import load_baseline
+from benchmarks.stock_cut_1d_instances import reference_instances
+from benchmarks.stock_cut_1d_instances import regressions
+from benchmarks.stock_cut_1d_instances import run_solver
+
+
+def test_solvers__baseline() -> None:
+    """
+    Test all solvers on the reference instances (Falkenauer u/t, Scholl 1 and own cut lists) against the baseline,
+    see benchmarks.bench_stock_cut_1d_suite. The runtime depends on the machine and is only compared by the benchmark
+    script (--check).
+
+    Assertions:
+        - The baseline covers all reference instances.
+        - No solver uses more stocks than in the baseline, unless the exact solver runs into its time limit.
+        - The gap to the lower bound is never negative, the lower bound of the anytime solver isn't above its stocks.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    baseline = load_baseline()
+    instances = reference_instances()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    results: dict = {"instances": {}}
+    for name, job in instances.items():
+        results["instances"][name] = {"solvers": {}}
+        for solver, run in baseline["instances"][name]["solvers"].items():
+            # an instance the exact solver couldn't solve would only run into the time limit
+            if run["stocks"] is None:
+                continue
+            results["instances"][name]["solvers"][solver] = run_solver(solver, job)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert set(baseline["instances"]) == set(instances)
+    assert regressions(results, baseline, timing=False) == []
+    for name, instance in results["instances"].items():
+        bound = baseline["instances"][name]["bound"]
+        assert all(gap(run["stocks"], bound) >= 0 for run in instance["solvers"].values() if run["stocks"] is not None)
+        assert instance["solvers"]["anytime"]["bound"] <= instance["solvers"]["anytime"]["stocks"]
@@ -0,0 +1,384 @@
+"""
+    TEST WEB API -- TOOLS -- STOCK CUT 2D
+"""
+
+import random
+from itertools import combinations
+from typing import List
+from typing import Tuple
+from xml.etree import ElementTree
+
+import pytest
+from config import cfg
+from const import N_MAX_2D
+from fastapi.testclient import TestClient
+from tools.stock_cut_2d import solver
+from tools.stock_cut_2d.common import SolverType
+from tools.stock_cut_2d.models import JobModel
+from tools.stock_cut_2d.models import ResultModel
+from tools.stock_cut_2d.models import TargetSizeModel
+from tools.stock_cut_2d.solver import distribute
+
+SOLVE_2D_API = f"{cfg.server.api.web}/tools/stock-cut/2d/solve"
+GENERATE_2D_API = f"{cfg.server.api.web}/tools/stock-cut/2d/generate"
+
+
+def random_job(seed: int, guillotine: bool = False) -> dict:
+    """Returns a job of 20 target sizes on a 2800 x 2070 board, with a cut width of 4."""
+    rng = random.Random(seed)
+    target_sizes = [
+        {"width": rng.randint(100, 900), "height": rng.randint(100, 700), "quantity": rng.randint(1, 6)}
+        for _ in range(20)
+    ]
+    return {
+        "sheet_width": 2800,
+        "sheet_height": 2070,
+        "cut_width": 4,
+        "target_sizes": target_sizes,
+        "guillotine": guillotine,
+    }
+
+
+def assert_valid_layout(result: ResultModel) -> None:
+    """Asserts that every piece is placed once, within the sheet and apart from the others by the cut width."""
+    result.assert_valid()
+    k = result.job.cut_width
+    for a, b in combinations(result.placements, 2):
+        if a.sheet == b.sheet:
+            assert (
+                a.x + a.width + k <= b.x
+                or b.x + b.width + k <= a.x
+                or a.y + a.height + k <= b.y
+                or b.y + b.height + k <= a.y
+            )
+
+
+def is_guillotine(rects: List[Tuple[int, int, int, int]]) -> bool:
+    """Whether the rectangles (x, y, w, h) can be separated by edge to edge cuts, recursively."""
+    if len(rects) <= 1:
+        return True
+    for axis in (0, 1):
+        for cut in sorted({r[axis] + r[axis + 2] for r in rects}):
+            before = [r for r in rects if r[axis] + r[axis + 2] <= cut]
+            after = [r for r in rects if r[axis] >= cut]
+            if before and after and len(before) + len(after) == len(rects):
+                return is_guillotine(before) and is_guillotine(after)
+    return False
+
+
+def test_solve_2d__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the solve 2d API endpoint.
+
+    Assertions:
+        - The response status code is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_2D_API, headers={}, json={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+
+
+def test_solve_2d(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 2d API endpoint with MaxRects.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - Every piece is placed exactly once, within its sheet and apart from the others by the cut width.
+        - The number of sheets is at least the lower bound, the gap and the utilization are consistent.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    data = random_job(seed=1)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_2D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    result = ResultModel(**response.json())
+    assert result.solver_type == SolverType.maxrects
+    assert_valid_layout(result)
+
+    area = sum(item.width * item.height * item.quantity for item in result.job.target_sizes)
+    assert result.sheets >= result.lower_bound
+    assert result.gap == (result.sheets - result.lower_bound) / result.sheets
+    assert result.utilization == area / (result.sheets * 2800 * 2070)
+
+
+def test_solve_2d__guillotine(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 2d API endpoint with guillotine cuts and a time limit.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The layout is valid and every sheet can be cut with edge to edge cuts.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    data = {**random_job(seed=2, guillotine=True), "time_limit_ms": 300}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_2D_API, headers=normal_user_token_headers, json=data)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    result = ResultModel(**response.json())
+    assert result.solver_type == SolverType.guillotine
+    assert_valid_layout(result)
+
+    k = result.job.cut_width
+    for sheet in range(result.sheets):
+        rects = [(p.x, p.y, p.width + k, p.height + k) for p in result.placements if p.sheet == sheet]
+        assert is_guillotine(rects)
+
+
+def test_solve_2d__rotation(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the solve 2d API endpoint with pieces that only fit rotated, and with a piece that isn't rotatable.
+
+    Assertions:
+        - The response status code is 200 (OK) if the pieces may be rotated, they are placed rotated.
+        - The response status code is 406 if a piece only fits rotated, but isn't rotatable.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    data = {
+        "sheet_width": 1000,
+        "sheet_height": 850,
+        "cut_width": 0,
+        "target_sizes": [{"width": 400, "height": 900, "quantity": 2}],
+    }
+    data_fixed = {**data, "target_sizes": [{"width": 400, "height": 900, "quantity": 2, "rotatable": False}]}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(SOLVE_2D_API, headers=normal_user_token_headers, json=data)
+    response_fixed = client.post(SOLVE_2D_API, headers=normal_user_token_headers, json=data_fixed)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    result = ResultModel(**response.json())
+    assert_valid_layout(result)
+    assert result.sheets == 1
+    assert all(p.rotated and (p.width, p.height) == (900, 400) for p in result.placements)
+
+    assert response_fixed.status_code == 406
+
+
+def test_distribute_2d__kerf() -> None:
+    """
+    Test the 2d solver with pieces that fill the sheet exactly, with and without the cut width.
+
+    Assertions:
+        - Without cut width four pieces of a quarter of the sheet fit onto one sheet.
+        - With cut width they don't, the kerf is respected.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    job = JobModel(
+        sheet_width=1000,
+        sheet_height=800,
+        cut_width=0,
+        target_sizes=[TargetSizeModel(width=500, height=400, quantity=4)],
+    )
+    job_kerf = JobModel(**{**job.model_dump(), "cut_width": 3})
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    result = distribute(job)
+    result_kerf = distribute(job_kerf)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert_valid_layout(result)
+    assert_valid_layout(result_kerf)
+    assert result.sheets == 1
+    assert result.utilization == 1
+    assert result_kerf.sheets == 2
+    assert result_kerf.lower_bound == 2
+
+
+def test_distribute_2d__time_limit() -> None:
+    """
+    Test the 2d solver with a time limit against the deterministic passes only.
+
+    Assertions:
+        - The result with a time limit never uses more sheets.
+        - The layout is valid.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    job = JobModel(**random_job(seed=3))
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    result = distribute(job)
+    result_limited = distribute(job, time_limit_ms=300)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert_valid_layout(result_limited)
+    assert result_limited.sheets <= result.sheets
+    assert result_limited.time_us < 2 * 1000 * 1000
+
+
+def test_distribute_2d__pass_time_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the 2d solver without a time limit, after the time for the deterministic passes is up.
+
+    Assertions:
+        - The best layout of the passes so far is returned, the layout is valid.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    monkeypatch.setattr(solver, "PACK_TIME_LIMIT_2D", 0)
+    job = JobModel(**random_job(seed=4))
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    result = distribute(job)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert_valid_layout(result)
+    assert result.sheets >= result.lower_bound
+
+
+def test_result_2d__assert_valid() -> None:
+    """
+    Test the validation of a 2d result with broken layouts.
+
+    Assertions:
+        - Placements that overlap (including the cut width) or exceed the sheet are rejected.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    job = JobModel(
+        sheet_width=1000,
+        sheet_height=500,
+        cut_width=4,
+        target_sizes=[TargetSizeModel(width=400, height=300, quantity=2)],
+    )
+    result = distribute(job)
+    a, b = result.placements
+
+    # ----------------------------------------------
+    # METHODS TO TEST & VALIDATION
+    # ----------------------------------------------
+
+    result.assert_valid()
+    for x, y in ((a.x + a.width + 2, a.y), (a.x + 100, a.y + 100), (job.sheet_width - b.width + 1, 0)):
+        broken = result.model_copy(update={"placements": [a, b.model_copy(update={"sheet": a.sheet, "x": x, "y": y})]})
+        with pytest.raises(ValueError):
+            broken.assert_valid()
+
+
+def test_generate_2d(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the generate 2d API endpoint with the result of the solve 2d API endpoint, and with an invalid result.
+
+    Assertions:
+        - The response status code is 200 (OK), the response is a svg document.
+        - The svg has a rectangle per sheet and per piece.
+        - The response status code is 406 if a placement exceeds the sheet, if the number of sheets doesn't match the
+          placements, or if the job has more pieces than the solver accepts.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    result = client.post(SOLVE_2D_API, headers=normal_user_token_headers, json=random_job(seed=4)).json()
+    invalid = {**result, "placements": [{**result["placements"][0], "x": 2800}, *result["placements"][1:]]}
+    too_many_sheets = {**result, "sheets": 10**9}
+    job = result["job"]
+    too_many_pieces = {
+        **result,
+        "job": {**job, "target_sizes": [{**job["target_sizes"][0], "quantity": N_MAX_2D + 1}]},
+        "placements": [{**result["placements"][0], "target": 0}],
+        "sheets": 1,
+    }
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.post(GENERATE_2D_API, headers=normal_user_token_headers, json=result)
+    response_invalid = client.post(GENERATE_2D_API, headers=normal_user_token_headers, json=invalid)
+    response_sheets = client.post(GENERATE_2D_API, headers=normal_user_token_headers, json=too_many_sheets)
+    response_pieces = client.post(GENERATE_2D_API, headers=normal_user_token_headers, json=too_many_pieces)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("image/svg+xml")
+    svg = ElementTree.fromstring(response.content)
+    rects = svg.findall(".//{http://www.w3.org/2000/svg}rect")
+    assert len(rects) == result["sheets"] + len(result["placements"])
+
+    assert response_invalid.status_code == 406
+    assert response_sheets.status_code == 406
+    assert response_pieces.status_code == 406
+    assert "pieces" in response_pieces.json()["detail"]
@@ -0,0 +1,102 @@
+"""
+    TEST WEB API -- USER TIME -- READ EXPORT
+"""
+
+import csv
+import io
+from datetime import datetime
+
+from api.schemas.user_time import UserTimeCreateSchema
+from config import cfg
+from crud.user_time import crud_user_time
+from fastapi.testclient import TestClient
+from openpyxl import load_workbook
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_random_user
+
+EXPORT_API = f"{cfg.server.api.web}/user-time/export"
+
+
+def test_read_export__unauthorized(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the access to the read export API endpoints without a user and with a normal user.
+
+    Assertions:
+        - The response status codes are 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    responses = [
+        client.get(f"{EXPORT_API}/{file_type}", headers=headers)
+        for file_type in ("xlsx", "csv")
+        for headers in ({}, normal_user_token_headers)
+    ]
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert all(response.status_code == 401 for response in responses)
+
+
+def test_read_export__admin_user(client: TestClient, db: Session, admin_user_token_headers: dict) -> None:
+    """
+    Test the read export API endpoints for an admin user, with the timesheet of a single user.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The xlsx has a sheet for the user, with a row per entry and workday and a total row.
+        - The csv has the same rows as the sheet without the total row, with the username in every row.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+    t_user.work_hours_per_week = 40
+    db.commit()
+    for day in (7, 8):
+        crud_user_time.create(
+            db,
+            db_obj_user=t_user,
+            obj_in=UserTimeCreateSchema(login=datetime(2026, 9, day, 8), logout=datetime(2026, 9, day, 17), note=None),
+        )
+    params = {"date_from": "2026-09-07", "date_to": "2026-09-13", "user_id": t_user.id}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response_xlsx = client.get(f"{EXPORT_API}/xlsx", headers=admin_user_token_headers, params=params)
+    response_csv = client.get(f"{EXPORT_API}/csv", headers=admin_user_token_headers, params=params)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_xlsx.status_code == 200
+    workbook = load_workbook(io.BytesIO(response_xlsx.content))
+    assert workbook.sheetnames == [t_user.username]
+    sheet_rows = list(workbook.active.iter_rows(values_only=True))
+    assert sheet_rows[0][0] == "Day"
+    assert [row[5:] for row in sheet_rows[1:]] == [
+        (540, 480, 60),
+        (540, 480, 60),
+        (0, 480, -480),
+        (0, 480, -480),
+        (0, 480, -480),
+        (1080, 2400, -1320),
+    ]
+    assert sheet_rows[-1][0] == "Total"
+
+    assert response_csv.status_code == 200
+    assert response_csv.headers["content-type"].startswith("text/csv")
+    csv_rows = list(csv.DictReader(io.StringIO(response_csv.text)))
+    assert len(csv_rows) == len(sheet_rows) - 2
+    assert all(row["username"] == t_user.username for row in csv_rows)
+    assert [row["overtime_minutes"] for row in csv_rows] == ["60.0", "60.0", "-480.0", "-480.0", "-480.0"]
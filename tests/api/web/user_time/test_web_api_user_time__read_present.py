@@ -0,0 +1,73 @@
+"""
+    TEST WEB API -- USER TIME -- READ PRESENT
+"""
+
+from config import cfg
+from crud.user_time import crud_user_time
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_random_user
+
+READ_PRESENT_API = f"{cfg.server.api.web}/user-time/present"
+
+
+def test_read_present__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the read present API endpoints.
+
+    Assertions:
+        - The response status codes are 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(READ_PRESENT_API, headers={})
+    response_stream = client.get(f"{READ_PRESENT_API}/stream", headers={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+    assert response_stream.status_code == 401
+
+
+def test_read_present(client: TestClient, db: Session, normal_user_token_headers: dict) -> None:
+    """
+    Test the read present API endpoint with a user who logs in and out.
+
+    Assertions:
+        - The response status codes are 200 (OK).
+        - The user is present with their open entry while logged in, and not present after the logout.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    t_entry = crud_user_time.login(db, db_obj_user=t_user)
+    response_login = client.get(READ_PRESENT_API, headers=normal_user_token_headers)
+    crud_user_time.logout(db, db_obj_user=t_user)
+    response_logout = client.get(READ_PRESENT_API, headers=normal_user_token_headers)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response_login.status_code == 200
+    assert response_logout.status_code == 200
+
+    present = {item["user_id"]: item for item in response_login.json()}
+    assert present[t_user.id]["full_name"] == t_user.full_name
+    assert present[t_user.id]["entry_id"] == t_entry.id
+    assert [item["login"] for item in response_login.json()] == sorted(item["login"] for item in response_login.json())
+    assert t_user.id not in [item["user_id"] for item in response_logout.json()]
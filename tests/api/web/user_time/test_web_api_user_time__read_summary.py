@@ -0,0 +1,93 @@
+"""
+    TEST WEB API -- USER TIME -- READ SUMMARY
+"""
+
+from config import cfg
+from fastapi.testclient import TestClient
+
+READ_SUMMARY_API = f"{cfg.server.api.web}/user-time/summary"
+
+
+def test_read_summary__unauthorized(client: TestClient) -> None:
+    """
+    Test the unauthorized access to the read summary API endpoints.
+
+    Assertions:
+        - The response status codes are 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(READ_SUMMARY_API, headers={})
+    response_all = client.get(f"{READ_SUMMARY_API}/all", headers={})
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 401
+    assert response_all.status_code == 401
+
+
+def test_read_summary__normal_user(client: TestClient, normal_user_token_headers: dict) -> None:
+    """
+    Test the read summary API endpoints for a normal user.
+
+    Assertions:
+        - The response status code of the own summary is 200 (OK), every period lies within the date range.
+        - The response status code of the summary of all users is 401 (Unauthorized).
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    params = {"group_by": "month", "date_from": "2026-01-01", "date_to": "2026-12-31"}
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(READ_SUMMARY_API, headers=normal_user_token_headers, params=params)
+    response_all = client.get(f"{READ_SUMMARY_API}/all", headers=normal_user_token_headers, params=params)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert len({summary["user_id"] for summary in response.json()}) <= 1
+    assert all(
+        "2026-01-01" <= summary["period_from"] <= summary["period_to"] <= "2026-12-31" for summary in response.json()
+    )
+
+    assert response_all.status_code == 401
+
+
+def test_read_summary__admin_user(client: TestClient, admin_user_token_headers: dict) -> None:
+    """
+    Test the read summary of all users API endpoint for an admin user, with an invalid grouping.
+
+    Assertions:
+        - The response status code is 200 (OK).
+        - The response status code is 422 (Unprocessable Entity) for an unknown grouping.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    response = client.get(f"{READ_SUMMARY_API}/all", headers=admin_user_token_headers, params={"group_by": "day"})
+    response_invalid = client.get(
+        f"{READ_SUMMARY_API}/all", headers=admin_user_token_headers, params={"group_by": "year"}
+    )
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+    assert response_invalid.status_code == 422
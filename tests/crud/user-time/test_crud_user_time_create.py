@@ -2,12 +2,15 @@
     CRUD tests (CREATE ONLY) for the user time model
 """
 
+from datetime import date
 from datetime import datetime
+from datetime import time
 from datetime import timedelta
 
 import pytest
 from api.schemas.user_time import UserTimeCreateSchema
 from crud.user_time import crud_user_time
+from exceptions import EntryOverlapsError
 from exceptions import LoginNotTodayError
 from exceptions import LogoutBeforeLoginError
 from sqlalchemy.orm import Session
@@ -142,3 +145,51 @@ def test_create_user_time__login_not_today(db: Session) -> None:
 
     with pytest.raises(LoginNotTodayError):
         crud_user_time.create(db, db_obj_user=t_user, obj_in=t_obj_in)
+
+
+def test_create_user_time__overlaps(db: Session) -> None:
+    """
+    Test case for creating user time entries that overlap with an existing entry.
+
+    Steps:
+    1. Create a random user and an entry from 8:00 to 12:00 yesterday.
+    2. Attempt to create entries that start inside, end inside, contain or equal the existing entry.
+    3. Create an entry that starts when the existing entry ends.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Raises:
+        EntryOverlapsError: For every entry that overlaps with the existing entry.
+    """
+
+    # ----------------------------------------------
+    # CREATE USER TIME: PREPARATION
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+    t_day = datetime.combine(date.today() - timedelta(days=1), time())
+    t_entry = UserTimeCreateSchema(login=t_day.replace(hour=8), logout=t_day.replace(hour=12), note=None)
+    crud_user_time.create(db, db_obj_user=t_user, obj_in=t_entry)
+
+    t_overlapping = [(7, 9), (11, 13), (7, 13), (9, 11), (8, 12)]
+
+    # ----------------------------------------------
+    # CREATE USER TIME: METHODS TO TEST
+    # ----------------------------------------------
+
+    for login, logout in t_overlapping:
+        t_obj_in = UserTimeCreateSchema(login=t_day.replace(hour=login), logout=t_day.replace(hour=logout), note=None)
+        with pytest.raises(EntryOverlapsError):
+            crud_user_time.create(db, db_obj_user=t_user, obj_in=t_obj_in)
+
+    t_obj_in = UserTimeCreateSchema(login=t_day.replace(hour=12), logout=t_day.replace(hour=16), note=None)
+    entry = crud_user_time.create(db, db_obj_user=t_user, obj_in=t_obj_in)
+
+    # ----------------------------------------------
+    # CREATE USER TIME: VALIDATION
+    # ----------------------------------------------
+
+    assert entry.login == t_day.replace(hour=12)
+    assert crud_user_time.overlaps(db, db_obj_user=t_user, login=t_day.replace(hour=10))
+    assert not crud_user_time.overlaps(db, db_obj_user=t_user, login=t_day.replace(hour=17))
@@ -0,0 +1,154 @@
+"""
+    CRUD tests (PRESENCE ONLY) for the user time model
+"""
+
+import asyncio
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import time
+
+from api.schemas.user_time import UserTimeCreateSchema
+from api.schemas.user_time import UserTimeUpdateSchema
+from crud.user_time import crud_user_time
+from sqlalchemy.orm import Session
+from utilities.presence import presence
+
+from tests.utils.user import create_random_user
+
+
+def present_user_ids() -> list:
+    return [item["user_id"] for item in presence.present()]
+
+
+def test_user_time_presence(db: Session) -> None:
+    """
+    Test the presence index, that it follows every change of the open entries.
+
+    Steps:
+    1. Build the index as on startup, create a random user and a user with an automatic break.
+    2. Log in and out, create and delete an open entry, update a closed entry while the user is logged in.
+    3. Rebuild the index from the database.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The users are present while they have an open entry, with this entry.
+        Closing an entry by the automatic break removes the user, updating an old entry doesn't.
+        The rebuilt index is the same as the updated one.
+    """
+
+    # ----------------------------------------------
+    # PRESENCE: PREPARATION
+    # ----------------------------------------------
+
+    presence.rebuild(crud_user_time.get_logged_in(db))
+
+    t_user = create_random_user(db)
+    t_user_break = create_random_user(db)
+    t_user_break.auto_break_from = time(0)
+    t_user_break.auto_break_to = time(0, 1)
+    db.commit()
+
+    t_closed = crud_user_time.create(
+        db,
+        db_obj_user=t_user,
+        obj_in=UserTimeCreateSchema(login=datetime(2026, 1, 5, 8), logout=datetime(2026, 1, 5, 9), note=None),
+    )
+
+    # ----------------------------------------------
+    # PRESENCE: METHODS TO TEST
+    # ----------------------------------------------
+
+    t_entry = crud_user_time.login(db, db_obj_user=t_user)
+    present_login = presence.present()
+
+    crud_user_time.update(
+        db,
+        db_obj_user=t_user,
+        db_obj=t_closed,
+        obj_in=UserTimeUpdateSchema(login=datetime(2026, 1, 5, 8), logout=datetime(2026, 1, 5, 10), note=None),
+    )
+    present_update = present_user_ids()
+
+    crud_user_time.login(db, db_obj_user=t_user_break, timestamp=datetime.combine(date.today(), time(), tzinfo=UTC))
+    present_both = present_user_ids()
+    crud_user_time.logout(db, db_obj_user=t_user_break)
+    present_break = present_user_ids()
+
+    crud_user_time.logout(db, db_obj_user=t_user)
+    present_logout = present_user_ids()
+
+    t_open = crud_user_time.create(
+        db, db_obj_user=t_user, obj_in=UserTimeCreateSchema(login=datetime.now(), logout=None, note=None)
+    )
+    present_create = present_user_ids()
+    present_rebuild_before = presence.present()
+    presence.rebuild(crud_user_time.get_logged_in(db))
+    present_rebuild = presence.present()
+
+    crud_user_time.delete(db, db_obj_user=t_user, db_obj=t_open)
+    present_delete = present_user_ids()
+
+    # ----------------------------------------------
+    # PRESENCE: VALIDATION
+    # ----------------------------------------------
+
+    item = next(item for item in present_login if item["user_id"] == t_user.id)
+    assert item == {
+        "user_id": t_user.id,
+        "username": t_user.username,
+        "full_name": t_user.full_name,
+        "entry_id": t_entry.id,
+        "login": t_entry.login,
+    }
+    assert t_user.id in present_update
+
+    assert t_user.id in present_both and t_user_break.id in present_both
+    assert t_user.id in present_break and t_user_break.id not in present_break
+
+    assert t_user.id not in present_logout
+    assert t_user.id in present_create
+    assert present_rebuild == present_rebuild_before
+    assert t_user.id not in present_delete
+
+
+def test_user_time_presence_changes(db: Session) -> None:
+    """
+    Test the changes of the presence index, which feed the stream of the present users.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The present users are yielded immediately, and again after a login.
+    """
+
+    # ----------------------------------------------
+    # PRESENCE CHANGES: PREPARATION
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+
+    async def collect() -> tuple:
+        changes = presence.changes()
+        first = await anext(changes)
+        crud_user_time.login(db, db_obj_user=t_user)
+        second = await asyncio.wait_for(anext(changes), timeout=5)
+        await changes.aclose()
+        return first, second
+
+    # ----------------------------------------------
+    # PRESENCE CHANGES: METHODS TO TEST
+    # ----------------------------------------------
+
+    first, second = asyncio.run(collect())
+
+    # ----------------------------------------------
+    # PRESENCE CHANGES: VALIDATION
+    # ----------------------------------------------
+
+    assert t_user.id not in [item["user_id"] for item in first]
+    assert t_user.id in [item["user_id"] for item in second]
+    assert len(second) == len(first) + 1
@@ -0,0 +1,90 @@
+"""
+    CRUD tests (ROLLOVER ONLY) for the user time model
+"""
+
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+
+from crud.user_time import crud_user_time
+from db.models import UserTimeModel
+from db.models import UserTimeSummaryModel
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_random_user
+
+
+def test_user_time_rollover(db: Session) -> None:
+    """
+    Test the rollover of logged in users at midnight.
+
+    Steps:
+    1. Create a user with an automatic break, a user without automatic logout and a user without automatic logout
+       who is logged in since three days. All are logged in, a fourth user logged in today.
+    2. Roll over to today.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The users of the previous days are logged out at the end of their login day, split by the automatic break.
+        Only the user without automatic logout, who logged in yesterday, is logged in again at midnight.
+        The user who logged in today stays logged in, the summary rows of the closed days exist.
+    """
+
+    # ----------------------------------------------
+    # ROLLOVER: PREPARATION
+    # ----------------------------------------------
+
+    today = date.today()
+    yesterday = datetime.combine(today - timedelta(days=1), time())
+
+    t_user_break = create_random_user(db)
+    t_user_break.auto_break_from = time(12)
+    t_user_break.auto_break_to = time(12, 30)
+    t_user_stay = create_random_user(db)
+    t_user_stay.auto_logout = False
+    t_user_stale = create_random_user(db)
+    t_user_stale.auto_logout = False
+    t_user_today = create_random_user(db)
+    db.commit()
+
+    crud_user_time.login(db, db_obj_user=t_user_break, timestamp=yesterday.replace(hour=8))
+    crud_user_time.login(db, db_obj_user=t_user_stay, timestamp=yesterday.replace(hour=9))
+    crud_user_time.login(db, db_obj_user=t_user_stale, timestamp=yesterday.replace(hour=9) - timedelta(days=2))
+    crud_user_time.login(db, db_obj_user=t_user_today, timestamp=datetime.combine(today, time(0, 30)))
+
+    # ----------------------------------------------
+    # ROLLOVER: METHODS TO TEST
+    # ----------------------------------------------
+
+    logged_out, logged_in = crud_user_time.rollover(db, today=today)
+
+    # ----------------------------------------------
+    # ROLLOVER: VALIDATION
+    # ----------------------------------------------
+
+    def entries(user_id: int) -> list:
+        return [
+            (e.login, e.logout, e.duration_minutes)
+            for e in db.query(UserTimeModel).filter_by(user_id=user_id).order_by(UserTimeModel.login)
+        ]
+
+    end_of_yesterday = yesterday.replace(hour=23, minute=59, second=59)
+    assert logged_out >= 3
+    assert logged_in >= 1
+    assert entries(t_user_break.id) == [
+        (yesterday.replace(hour=8), yesterday.replace(hour=12), 240),
+        (yesterday.replace(hour=12, minute=30), end_of_yesterday, (end_of_yesterday - yesterday).seconds / 60 - 750),
+    ]
+    assert entries(t_user_stay.id) == [
+        (yesterday.replace(hour=9), end_of_yesterday, (end_of_yesterday - yesterday).seconds / 60 - 540),
+        (datetime.combine(today, time()), None, None),
+    ]
+    assert [logout.date() for _, logout, _ in entries(t_user_stale.id)] == [yesterday.date() - timedelta(days=2)]
+    assert entries(t_user_today.id) == [(datetime.combine(today, time(0, 30)), None, None)]
+
+    summary = db.query(UserTimeSummaryModel).filter_by(user_id=t_user_break.id).one()
+    assert summary.day == yesterday.date()
+    assert summary.entries == 2
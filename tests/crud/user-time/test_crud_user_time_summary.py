@@ -0,0 +1,174 @@
+"""
+    CRUD tests (SUMMARY ONLY) for the user time model
+"""
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import time
+
+from api.schemas.user_time import UserTimeCreateSchema
+from api.schemas.user_time import UserTimeUpdateSchema
+from crud.user_time import crud_user_time
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_random_user
+
+
+def test_user_time_summary(db: Session) -> None:
+    """
+    Test the summary of the user time entries of a user, and that it follows every change of the entries.
+
+    Steps:
+    1. Create a random user with 40 work hours per week and an automatic break from 12:00 to 12:30.
+    2. Log in and out on monday (split by the automatic break), create an entry on tuesday.
+    3. Read the summary by day, week and month.
+    4. Move the tuesday entry to wednesday, then delete it.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The two entries of the automatic break count as one day, the break is no working time.
+        The target time is spread over the workdays of the period, the overtime is the difference.
+        Workdays without entries are reported with zero worked minutes.
+        The summary follows updates and deletions of entries.
+    """
+
+    # ----------------------------------------------
+    # SUMMARY: PREPARATION
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+    t_user.work_hours_per_week = 40
+    t_user.auto_break_from = time(12)
+    t_user.auto_break_to = time(12, 30)
+    db.commit()
+
+    crud_user_time.login(db, db_obj_user=t_user, timestamp=datetime(2026, 10, 12, 8, tzinfo=UTC))
+    crud_user_time.logout(db, db_obj_user=t_user, timestamp=datetime(2026, 10, 12, 16, 30, tzinfo=UTC))
+    t_entry = crud_user_time.create(
+        db,
+        db_obj_user=t_user,
+        obj_in=UserTimeCreateSchema(login=datetime(2026, 10, 13, 8), logout=datetime(2026, 10, 13, 14), note=None),
+    )
+
+    t_week = {"date_from": date(2026, 10, 12), "date_to": date(2026, 10, 18), "user_id": t_user.id}
+
+    # ----------------------------------------------
+    # SUMMARY: METHODS TO TEST
+    # ----------------------------------------------
+
+    by_day = crud_user_time.get_summary(db, group_by="day", **t_week)
+    by_week = crud_user_time.get_summary(db, group_by="week", **t_week)
+    by_month = crud_user_time.get_summary(
+        db, group_by="month", date_from=date(2026, 10, 1), date_to=date(2026, 10, 31), user_id=t_user.id
+    )
+
+    crud_user_time.update(
+        db,
+        db_obj_user=t_user,
+        db_obj=t_entry,
+        obj_in=UserTimeUpdateSchema(login=datetime(2026, 10, 14, 8), logout=datetime(2026, 10, 14, 10), note=None),
+    )
+    by_day_updated = crud_user_time.get_summary(db, group_by="day", **t_week)
+
+    crud_user_time.delete(db, db_obj_user=t_user, db_obj=t_entry)
+    by_day_deleted = crud_user_time.get_summary(db, group_by="day", **t_week)
+
+    # ----------------------------------------------
+    # SUMMARY: VALIDATION
+    # ----------------------------------------------
+
+    assert [(s["period_from"], s["entries"], s["worked_minutes"]) for s in by_day] == [
+        (date(2026, 10, 12), 2, 480),
+        (date(2026, 10, 13), 1, 360),
+        (date(2026, 10, 14), 0, 0),
+        (date(2026, 10, 15), 0, 0),
+        (date(2026, 10, 16), 0, 0),
+    ]
+    assert all(s["target_minutes"] == 480 for s in by_day)
+    assert [s["overtime_minutes"] for s in by_day] == [0, -120, -480, -480, -480]
+
+    assert len(by_week) == 1
+    assert by_week[0]["period_from"] == date(2026, 10, 12)
+    assert by_week[0]["period_to"] == date(2026, 10, 18)
+    assert by_week[0]["days"] == 2
+    assert by_week[0]["entries"] == 3
+    assert by_week[0]["worked_minutes"] == 840
+    assert by_week[0]["target_minutes"] == 40 * 60
+    assert by_week[0]["overtime_minutes"] == 840 - 40 * 60
+
+    assert len(by_month) == 1
+    assert (by_month[0]["period_from"], by_month[0]["period_to"]) == (date(2026, 10, 1), date(2026, 10, 31))
+    assert by_month[0]["target_minutes"] == 22 * 8 * 60  # october 2026 has 22 workdays
+
+    assert [(s["period_from"], s["worked_minutes"]) for s in by_day_updated] == [
+        (date(2026, 10, 12), 480),
+        (date(2026, 10, 13), 0),
+        (date(2026, 10, 14), 120),
+        (date(2026, 10, 15), 0),
+        (date(2026, 10, 16), 0),
+    ]
+    assert [(s["period_from"], s["worked_minutes"]) for s in by_day_deleted] == [
+        (date(2026, 10, 12), 480),
+        (date(2026, 10, 13), 0),
+        (date(2026, 10, 14), 0),
+        (date(2026, 10, 15), 0),
+        (date(2026, 10, 16), 0),
+    ]
+
+
+def test_user_time_summary__empty_period(db: Session) -> None:
+    """
+    Test that the summary and the timesheet agree on periods without entries.
+
+    Steps:
+    1. Create a random user with 40 work hours per week.
+    2. Create an entry on monday of the first week, the second week has no entries.
+    3. Read the summary by day and by week, and the timesheet of both weeks.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The week without entries is reported with zero worked minutes and the full target time.
+        The worked, target and overtime minutes of the summary add up to those of the timesheet.
+        Weekend days without entries are omitted, as in the timesheet.
+    """
+
+    # ----------------------------------------------
+    # SUMMARY (EMPTY PERIOD): PREPARATION
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+    t_user.work_hours_per_week = 40
+    db.commit()
+
+    crud_user_time.create(
+        db,
+        db_obj_user=t_user,
+        obj_in=UserTimeCreateSchema(login=datetime(2026, 10, 12, 8), logout=datetime(2026, 10, 12, 12), note=None),
+    )
+
+    t_weeks = {"date_from": date(2026, 10, 12), "date_to": date(2026, 10, 25), "user_id": t_user.id}
+
+    # ----------------------------------------------
+    # SUMMARY (EMPTY PERIOD): METHODS TO TEST
+    # ----------------------------------------------
+
+    by_day = crud_user_time.get_summary(db, group_by="day", **t_weeks)
+    by_week = crud_user_time.get_summary(db, group_by="week", **t_weeks)
+    timesheet = [row for row in crud_user_time.iterate_timesheet(db, **t_weeks) if row["worked_minutes"] is not None]
+
+    # ----------------------------------------------
+    # SUMMARY (EMPTY PERIOD): VALIDATION
+    # ----------------------------------------------
+
+    assert [(s["period_from"], s["worked_minutes"], s["target_minutes"]) for s in by_week] == [
+        (date(2026, 10, 12), 240, 40 * 60),
+        (date(2026, 10, 19), 0, 40 * 60),
+    ]
+    assert [s["period_from"] for s in by_day] == [row["day"] for row in timesheet]
+    for key in ("worked_minutes", "target_minutes", "overtime_minutes"):
+        assert sum(s[key] for s in by_day) == sum(s[key] for s in by_week) == sum(row[key] for row in timesheet)
@@ -0,0 +1,84 @@
+"""
+    CRUD tests (TIMESHEET ONLY) for the user time model
+"""
+
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from datetime import time
+
+from api.schemas.user_time import UserTimeCreateSchema
+from crud.user_time import crud_user_time
+from sqlalchemy.orm import Session
+
+from tests.utils.user import create_random_user
+
+
+def test_user_time_timesheet(db: Session) -> None:
+    """
+    Test the timesheet rows of a user over a week.
+
+    Steps:
+    1. Create a random user with 40 work hours per week and an automatic break from 12:00 to 12:30.
+    2. Log in and out on monday (split by the automatic break), create an entry on wednesday and on saturday.
+    3. Iterate the timesheet of the week.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        Every entry is a row, the last row of a day holds the worked, target and overtime minutes of the day.
+        Workdays without entries are a row with a negative overtime, weekend days without entries are omitted.
+    """
+
+    # ----------------------------------------------
+    # TIMESHEET: PREPARATION
+    # ----------------------------------------------
+
+    t_user = create_random_user(db)
+    t_user.work_hours_per_week = 40
+    t_user.auto_break_from = time(12)
+    t_user.auto_break_to = time(12, 30)
+    db.commit()
+
+    crud_user_time.login(db, db_obj_user=t_user, timestamp=datetime(2026, 10, 12, 8, tzinfo=UTC))
+    crud_user_time.logout(db, db_obj_user=t_user, timestamp=datetime(2026, 10, 12, 16, 30, tzinfo=UTC))
+    for day in (14, 17):
+        crud_user_time.create(
+            db,
+            db_obj_user=t_user,
+            obj_in=UserTimeCreateSchema(
+                login=datetime(2026, 10, day, 8), logout=datetime(2026, 10, day, 10), note=f"Day {day}"
+            ),
+        )
+
+    # ----------------------------------------------
+    # TIMESHEET: METHODS TO TEST
+    # ----------------------------------------------
+
+    rows = list(
+        crud_user_time.iterate_timesheet(
+            db, date_from=date(2026, 10, 12), date_to=date(2026, 10, 18), user_id=t_user.id
+        )
+    )
+
+    # ----------------------------------------------
+    # TIMESHEET: VALIDATION
+    # ----------------------------------------------
+
+    assert all(row["user_id"] == t_user.id and row["username"] == t_user.username for row in rows)
+    assert [
+        (row["day"].day, row["duration_minutes"], row["worked_minutes"], row["target_minutes"], row["overtime_minutes"])
+        for row in rows
+    ] == [
+        (12, 240, None, None, None),
+        (12, 240, 480, 480, 0),
+        (13, None, 0, 480, -480),
+        (14, 120, 120, 480, -360),
+        (15, None, 0, 480, -480),
+        (16, None, 0, 480, -480),
+        (17, 120, 120, 0, 120),
+    ]
+    assert rows[3]["login"] == datetime(2026, 10, 14, 8)
+    assert rows[3]["note"] == "Day 14"
+    assert rows[1]["login"] is not None and rows[2]["login"] is None
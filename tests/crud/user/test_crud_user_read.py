@@ -5,6 +5,7 @@
 from api.schemas.user import UserCreateSchema
 from crud.user import crud_user
 from fastapi.encoders import jsonable_encoder
+from security.pwd import get_lookup_hash
 from sqlalchemy.orm import Session
 
 from tests.utils.user import current_user_adminuser
@@ -307,6 +308,58 @@ def test_get_user_by_rfid(db: Session) -> None:
     assert jsonable_encoder(t_user) == jsonable_encoder(user_2)
 
 
+def test_get_user_by_rfid__lookup_hash(db: Session) -> None:
+    """
+    Test the retrieval of a user by RFID, whose lookup hash isn't set (a user from before the lookup hash).
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Assertions:
+        Asserts that the user is found by its salted hash, and that the lookup hash of the user is set. The lookup
+        hash is committed by `authenticate_rfid`, not by the read.
+    """
+
+    # ----------------------------------------------
+    # GET USER BY RFID (LOOKUP HASH): PREPARATION
+    # ----------------------------------------------
+
+    t_rfid = random_lower_string()
+    t_user = crud_user.create(
+        db,
+        obj_in=UserCreateSchema(
+            username=random_username(),
+            full_name=random_name(),
+            email=random_email(),
+            password=random_lower_string(),
+            rfid=t_rfid,
+        ),
+        current_user=current_user_adminuser(),
+    )
+    t_user.rfid_lookup = None
+    db.commit()
+
+    # ----------------------------------------------
+    # GET USER BY RFID (LOOKUP HASH): METHODS TO TEST
+    # ----------------------------------------------
+
+    user = crud_user.get_by_rfid(db, rfid=t_rfid)
+
+    # ----------------------------------------------
+    # GET USER BY RFID (LOOKUP HASH): VALIDATION
+    # ----------------------------------------------
+
+    assert user is t_user
+    assert user.rfid_lookup == get_lookup_hash(t_rfid)
+
+    db.rollback()
+    assert t_user.rfid_lookup is None
+
+    assert crud_user.authenticate_rfid(db, rfid=t_rfid) is t_user
+    db.rollback()
+    assert t_user.rfid_lookup == get_lookup_hash(t_rfid)
+
+
 def test_get_user_by_rfid_non_existent(db: Session) -> None:
     """
     Test the retrieval of a user by RFID when the user does not exist in the database.
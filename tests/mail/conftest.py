@@ -0,0 +1,19 @@
+from typing import Generator
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from tests.utils.smtp import Handler
+from tests.utils.smtp import authenticator
+from tests.utils.smtp import free_port
+
+
+@pytest.fixture(scope="module")
+def smtp_server() -> Generator:
+    handler = Handler()
+    controller = Controller(
+        handler, hostname="127.0.0.1", port=free_port(), authenticator=authenticator, auth_require_tls=False
+    )
+    controller.start()
+    yield controller
+    controller.stop()
@@ -0,0 +1,139 @@
+"""
+    MAIL tests for the dispatch of the pending notifications, against a local SMTP server.
+"""
+
+import email
+
+import pytest
+from aiosmtpd.controller import Controller
+from api.schemas.email_notification import EmailNotificationCreateSchema
+from crud.email_notification import crud_email_notification
+from mail.dispatch import send_item_notifications
+from mail.send import MailSession
+from sqlalchemy.orm import Session
+
+from tests.utils.bought_item import create_random_item
+from tests.utils.smtp import ACCOUNT
+from tests.utils.smtp import PASSWORD
+from tests.utils.smtp import Handler
+from tests.utils.smtp import create_mail_session
+from tests.utils.smtp import free_port
+from tests.utils.user import create_random_user
+
+
+def create_notification(db: Session, receiver_id: int, bought_item_id: int) -> int:
+    obj_in = EmailNotificationCreateSchema(reason="delivered", receiver_id=receiver_id, bought_item_id=bought_item_id)
+    return crud_email_notification.create(db, obj_in=obj_in).id
+
+
+def test_send_item_notifications(db: Session, smtp_server: Controller) -> None:
+    """
+    Test the dispatch of the pending notifications over a single SMTP session.
+
+    Steps:
+    1. Create two users with notifications about three items, a notification about an item and a notification to a
+       user that don't exist.
+    2. Send the pending notifications, the server refuses the first mail with a temporary error.
+
+    Args:
+        db (Session): The database session used for the test.
+        smtp_server (Controller): The local SMTP server.
+
+    Asserts:
+        All mails are sent over one connection, the refused mail is sent again.
+        Every user gets one mail with all their items, all notifications are deleted.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    handler: Handler = smtp_server.handler
+    t_user_1 = create_random_user(db)
+    t_user_2 = create_random_user(db)
+    t_items = [create_random_item(db, test_fn_name="test_send_item_notifications") for _ in range(3)]
+    t_ids = [
+        create_notification(db, receiver_id=t_user_1.id, bought_item_id=t_items[0].id),
+        create_notification(db, receiver_id=t_user_1.id, bought_item_id=t_items[1].id),
+        create_notification(db, receiver_id=t_user_2.id, bought_item_id=t_items[2].id),
+        create_notification(db, receiver_id=t_user_2.id, bought_item_id=999999999),
+        create_notification(db, receiver_id=999999999, bought_item_id=t_items[2].id),
+    ]
+    session = create_mail_session(smtp_server)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    sent, failed = send_item_notifications(db, session=session)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert failed == 0
+    assert sent == len(handler.mails)
+    assert handler.connections == 1
+    assert handler.refused == 1
+
+    mails = {tuple(mail.rcpt_tos): email.message_from_bytes(mail.content) for mail in handler.mails}
+    body_1 = mails[(t_user_1.email,)].get_payload()[0].get_payload(decode=True).decode()
+    body_2 = mails[(t_user_2.email,)].get_payload()[0].get_payload(decode=True).decode()
+    assert t_items[0].partnumber in body_1 and t_items[1].partnumber in body_1
+    assert t_items[2].partnumber in body_2 and t_items[0].partnumber not in body_2
+
+    pending_ids = [notification.id for notification, _, _ in crud_email_notification.get_pending(db)]
+    assert not set(t_ids) & set(pending_ids)
+
+
+def test_send_item_notifications__failed(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the dispatch of the pending notifications if the SMTP server isn't reachable.
+
+    Args:
+        db (Session): The database session used for the test.
+        monkeypatch (pytest.MonkeyPatch): Used to count the connection attempts.
+
+    Asserts:
+        The first mail fails after all attempts, the mails after it fail without connecting again. The notifications
+        are kept for the next run.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_users = [create_random_user(db), create_random_user(db)]
+    t_item = create_random_item(db, test_fn_name="test_send_item_notifications__failed")
+    t_ids = [create_notification(db, receiver_id=t_user.id, bought_item_id=t_item.id) for t_user in t_users]
+    session = MailSession(
+        server="127.0.0.1",
+        port=free_port(),
+        account=ACCOUNT,
+        password=PASSWORD,
+        starttls=False,
+        force=True,
+        retries=2,
+        retry_delay=0,
+    )
+    connects = []
+    connect = session._connect
+    monkeypatch.setattr(session, "_connect", lambda: connects.append(1) or connect())
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    sent, failed = send_item_notifications(db, session=session)
+    pending_ids = [notification.id for notification, _, _ in crud_email_notification.get_pending(db)]
+    crud_email_notification.delete_multi(db, ids=pending_ids)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert sent == 0
+    assert failed >= 2
+    assert set(t_ids) <= set(pending_ids)
+    assert session.unreachable
+    assert len(connects) == 2  # the attempts of the first mail
@@ -0,0 +1,282 @@
+"""
+    MAIL tests for the outbox, against a local SMTP server.
+"""
+
+from dataclasses import replace
+from datetime import datetime
+from threading import Timer
+from time import perf_counter
+from types import SimpleNamespace
+
+import pytest
+from aiosmtpd.controller import Controller
+from config import cfg
+from const import MAIL_OUTBOX_MAX_ATTEMPTS
+from const import MAIL_OUTBOX_RATE
+from crud.mail_outbox import crud_mail_outbox
+from db.models import MailOutboxModel
+from mail import Mail
+from mail import Receiver
+from mail.outbox import MailOutbox
+from mail.outbox import outbox
+from mail.send import MailSession
+from mail.send import prepare_message
+from mail.send import send_mail
+from sqlalchemy.orm import Session
+
+from tests.utils.smtp import ACCOUNT
+from tests.utils.smtp import PASSWORD
+from tests.utils.smtp import Handler
+from tests.utils.smtp import create_mail_session
+from tests.utils.smtp import free_port
+from tests.utils.utils import random_email
+from tests.utils.utils import random_lower_string
+
+
+def enqueue_random_mail(db: Session) -> MailOutboxModel:
+    receiver = Receiver(to=[random_email()])
+    mail = Mail(subject=random_lower_string(), body=random_lower_string())
+    message = prepare_message(receiver, mail, sender=ACCOUNT, force=True)
+    assert message
+    return outbox.enqueue(db, *message)
+
+
+def test_send_pending(db: Session, smtp_server: Controller) -> None:
+    """
+    Test sending the queued mails over a single SMTP session.
+
+    Steps:
+    1. Queue three mails.
+    2. Send the due mails, the server refuses the first mail with a temporary error.
+
+    Args:
+        db (Session): The database session used for the test.
+        smtp_server (Controller): The local SMTP server.
+
+    Asserts:
+        The queued mails are counted as pending and due.
+        All mails are sent over one connection, not faster than the rate limit, and deleted from the outbox.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    handler: Handler = smtp_server.handler
+    t_mails = [enqueue_random_mail(db) for _ in range(3)]
+    t_ids = [t_mail.id for t_mail in t_mails]
+    t_receivers = [t_mail.receivers for t_mail in t_mails]
+    stats_before = outbox.stats(db)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    start = perf_counter()
+    sent, failed = outbox.send_pending(db, session=create_mail_session(smtp_server))
+    duration = perf_counter() - start
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert stats_before["pending"] >= 3
+    assert stats_before["due"] >= 3
+    assert stats_before["oldest"] <= t_mails[0].created
+
+    assert failed == 0
+    assert sent == len(handler.mails)
+    assert handler.connections == 1
+    assert handler.refused == 1
+    assert duration >= (sent - 1) / MAIL_OUTBOX_RATE
+
+    assert all(receivers in [mail.rcpt_tos for mail in handler.mails] for receivers in t_receivers)
+    assert not db.query(MailOutboxModel).filter(MailOutboxModel.id.in_(t_ids)).all()
+    assert outbox.stats(db)["sent_total"] >= 3
+
+
+def test_send_pending__failed(db: Session) -> None:
+    """
+    Test the retry of a queued mail if the SMTP server isn't reachable.
+
+    Steps:
+    1. Queue a mail and send the due mails.
+    2. Make the mail due on its last attempt and send the due mails again.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The mail is deferred after the first failed attempt, it's marked as failed after the last attempt.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_mail = enqueue_random_mail(db)
+    t_port = free_port()
+
+    def session() -> MailSession:
+        return MailSession(
+            server="127.0.0.1", port=t_port, account=ACCOUNT, password=PASSWORD, starttls=False, retries=1
+        )
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    sent_1, failed_1 = outbox.send_pending(db, session=session())
+    db.refresh(t_mail)
+    attempts_1, next_attempt_1, failed_at_1 = t_mail.attempts, t_mail.next_attempt, t_mail.failed
+    due_ids = [db_obj.id for db_obj in crud_mail_outbox.get_due(db, limit=1000)]
+
+    t_mail.attempts = MAIL_OUTBOX_MAX_ATTEMPTS - 1
+    t_mail.next_attempt = datetime.now()
+    db.commit()
+    sent_2, failed_2 = outbox.send_pending(db, session=session())
+    db.refresh(t_mail)
+    attempts_2, failed_at_2, last_error = t_mail.attempts, t_mail.failed, t_mail.last_error
+    stats = outbox.stats(db)
+    crud_mail_outbox.delete_multi(db, ids=[t_mail.id])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert sent_1 == 0 and sent_2 == 0
+    assert failed_1 >= 1 and failed_2 >= 1
+
+    assert attempts_1 == 1
+    assert next_attempt_1 > datetime.now()
+    assert failed_at_1 is None
+    assert t_mail.id not in due_ids
+
+    assert attempts_2 == MAIL_OUTBOX_MAX_ATTEMPTS
+    assert failed_at_2 is not None
+    assert last_error
+    assert stats["failed"] >= 1
+
+
+def test_send_pending__unreachable(db: Session) -> None:
+    """
+    Test sending a batch of queued mails if the SMTP server isn't reachable.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The server is tried with the first mail only, all mails of the batch are deferred.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_mails = [enqueue_random_mail(db) for _ in range(3)]
+    session = MailSession(server="127.0.0.1", port=free_port(), account=ACCOUNT, password=PASSWORD, retries=1)
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    sent, failed = outbox.send_pending(db, session=session)
+    for t_mail in t_mails:
+        db.refresh(t_mail)
+    attempts = [t_mail.attempts for t_mail in t_mails]
+    crud_mail_outbox.delete_multi(db, ids=[t_mail.id for t_mail in t_mails])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert session.unreachable
+    assert sent == 0
+    assert failed >= len(t_mails)
+    assert attempts == [1, 1, 1]
+
+
+def test_send_pending__stop(db: Session) -> None:
+    """
+    Test stopping the outbox while it waits for the next attempt of a mail.
+
+    Args:
+        db (Session): The database session used for the test.
+
+    Asserts:
+        The delay before the next attempt is interrupted, the mail stays due.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_outbox = MailOutbox()
+    t_mail = enqueue_random_mail(db)
+    session = MailSession(
+        server="127.0.0.1",
+        port=free_port(),
+        account=ACCOUNT,
+        password=PASSWORD,
+        retries=3,
+        retry_delay=60,
+        stop=t_outbox._stop,
+    )
+    Timer(0.5, t_outbox._stop.set).start()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    start = perf_counter()
+    t_outbox.send_pending(db, session=session)
+    duration = perf_counter() - start
+    db.refresh(t_mail)
+    attempts = t_mail.attempts
+    crud_mail_outbox.delete_multi(db, ids=[t_mail.id])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert duration < 10
+    assert attempts == 0
+    assert not session.unreachable
+
+
+def test_send_mail(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that sending a mail queues it in the outbox.
+
+    Args:
+        db (Session): The database session used for the test.
+        monkeypatch (pytest.MonkeyPatch): Enables the mailing config.
+
+    Asserts:
+        The mail is queued, the caller doesn't wait for the SMTP server.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    mailing = replace(cfg.mailing, server="127.0.0.1", port=free_port(), account=ACCOUNT, password=PASSWORD)
+    monkeypatch.setattr("mail.send.cfg", SimpleNamespace(debug=cfg.debug, mailing=mailing))
+    t_email = random_email()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    send_mail(Receiver(to=[t_email]), Mail(subject="Glados test mail", body="This is a test mail."), force=True)
+    queued = [db_obj for db_obj in db.query(MailOutboxModel).all() if db_obj.receivers == [t_email]]
+    crud_mail_outbox.delete_multi(db, ids=[db_obj.id for db_obj in queued])
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert len(queued) == 1
+    assert queued[0].attempts == 0
+    assert queued[0].failed is None
+    assert "Glados test mail" in queued[0].message
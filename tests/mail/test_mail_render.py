@@ -0,0 +1,137 @@
+"""
+    MAIL tests for the rendering of templates.
+"""
+
+import os
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from const import TEMPLATES
+from mail.render import get_template
+from mail.render import precompile_templates
+from mail.render import render_template
+
+from tests.utils.utils import random_lower_string
+
+
+@pytest.fixture()
+def template_file() -> Generator:
+    path = Path(TEMPLATES, f"test_{random_lower_string()}.j2")
+    path.write_text("Hello {{ name }}!")
+    yield path
+    path.unlink()
+
+
+def test_render_template(template_file: Path) -> None:
+    """
+    Test rendering a template twice.
+
+    Args:
+        template_file (Path): A template in the templates folder.
+
+    Asserts:
+        The template is rendered, it's compiled only once.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_name = random_lower_string()
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    rendered = render_template(template_file.name, name=t_name)
+    template_1 = get_template(template_file.name)
+    template_2 = get_template(template_file.name)
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert rendered == f"Hello {t_name}!"
+    assert template_1 is template_2
+
+
+def test_render_template__changed(template_file: Path) -> None:
+    """
+    Test rendering a template after its file has changed.
+
+    Args:
+        template_file (Path): A template in the templates folder.
+
+    Asserts:
+        The changed template is rendered.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    render_template(template_file.name, name="GLaDOS")
+    template_file.write_text("Goodbye {{ name }}!")
+    mtime = template_file.stat().st_mtime + 2
+    os.utime(template_file, (mtime, mtime))
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    rendered = render_template(template_file.name, name="GLaDOS")
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert rendered == "Goodbye GLaDOS!"
+
+
+def test_render_template__sample(template_file: Path) -> None:
+    """
+    Test rendering a template that doesn't exist.
+
+    Args:
+        template_file (Path): A template in the templates folder, used as sample.
+
+    Asserts:
+        The sample template is rendered if the template doesn't exist.
+        An error is raised if neither the template nor the sample exists.
+    """
+
+    # ----------------------------------------------
+    # PREPARE TEST
+    # ----------------------------------------------
+
+    t_missing = f"{random_lower_string()}.j2"
+
+    # ----------------------------------------------
+    # METHODS TO TEST
+    # ----------------------------------------------
+
+    rendered = render_template(t_missing, template_file.name, name="GLaDOS")
+
+    # ----------------------------------------------
+    # VALIDATION
+    # ----------------------------------------------
+
+    assert rendered == "Hello GLaDOS!"
+    with pytest.raises(FileNotFoundError):
+        render_template(t_missing)
+
+
+def test_precompile_templates() -> None:
+    """
+    Test compiling the configured mail templates.
+
+    Asserts:
+        All configured mail templates (or their samples) compile.
+    """
+
+    # ----------------------------------------------
+    # METHODS TO TEST & VALIDATION
+    # ----------------------------------------------
+
+    precompile_templates()
@@ -0,0 +1,47 @@
+import socket
+from typing import List
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+from aiosmtpd.smtp import Envelope
+from mail.send import MailSession
+
+ACCOUNT = "glados@glados.com"
+PASSWORD = "secret"
+
+
+class Handler:
+    """Collects the mails, refuses the first mail with a temporary error."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.refused = 0
+        self.mails: List[Envelope] = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):  # pylint: disable=C0103
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):  # pylint: disable=C0103
+        if not self.refused:
+            self.refused += 1
+            return "451 Try again later"
+        self.mails.append(envelope)
+        return "250 OK"
+
+
+def authenticator(server, session, envelope, mechanism, auth_data) -> AuthResult:
+    return AuthResult(success=auth_data.login.decode() == ACCOUNT and auth_data.password.decode() == PASSWORD)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def create_mail_session(controller: Controller, **kwargs) -> MailSession:
+    """Returns a session to the local SMTP server, without STARTTLS and without retry delay."""
+    options = {"account": ACCOUNT, "password": PASSWORD, "starttls": False, "force": True, "retry_delay": 0}
+    return MailSession(server=controller.hostname, port=controller.port, **{**options, **kwargs})